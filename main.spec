@@ -1,4 +1,6 @@
 import shutil
+import subprocess
+import sys
 from pathlib import Path
 from typing import cast
 
@@ -9,6 +11,9 @@ from PyInstaller.utils.hooks import collect_data_files
 
 DISTPATH = cast("str", CONF["distpath"])
 
+# 构建预编译模板包，识别器启动时直接映射其中的模板，无需解码模板 PNG
+subprocess.run([sys.executable, "scripts/build_template_pack.py"], check=True)
+
 
 a = Analysis(
     ["src/endfield_essence_recognizer/__main__.py"],
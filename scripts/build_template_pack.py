@@ -0,0 +1,48 @@
+"""
+Build the precompiled template pack.
+
+Decodes and preprocesses the templates of every template-matching recognizer and writes
+them into a single file that recognizers memory-map at startup. Rebuild the pack after
+changing a template image or a template preprocessing function; until then the affected
+recognizers fall back to loading their PNG files.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from endfield_essence_recognizer.core.recognition import (
+    build_template_pack,
+    build_template_recognizer_profiles,
+)
+from endfield_essence_recognizer.core.recognition.template_pack import (
+    default_template_pack_path,
+)
+from endfield_essence_recognizer.dependencies.services import get_static_game_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the template pack.")
+    parser.add_argument(
+        "output",
+        type=Path,
+        nargs="?",
+        default=default_template_pack_path(),
+        help="Path of the template pack file.",
+    )
+    args = parser.parse_args()
+    if args.output is None:
+        parser.error("The package is not installed on the file system.")
+
+    start = time.perf_counter()
+    profiles = build_template_recognizer_profiles(get_static_game_data())
+    count = build_template_pack(args.output, profiles)
+    elapsed = time.perf_counter() - start
+    print(
+        f"Packed {count} templates of {len(profiles)} recognizers "
+        f"into {args.output} in {elapsed:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,11 @@
 from fastapi import APIRouter
 
-from .routes import config, scanner, screenshot, static_data, system
-from .websockets import logs
+from .routes import config, inventory, scanner, screenshot, static_data, system
+from .websockets import logs, readiness
 
 api_router = APIRouter(prefix="/api")
 api_router.include_router(config.router)
+api_router.include_router(inventory.router)
 api_router.include_router(scanner.router)
 api_router.include_router(screenshot.router)
 api_router.include_router(static_data.router)
@@ -12,3 +13,4 @@ api_router.include_router(system.router)
 
 ws_router = APIRouter(prefix="/ws")
 ws_router.include_router(logs.router)
+ws_router.include_router(readiness.router)
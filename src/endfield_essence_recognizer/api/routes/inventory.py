@@ -0,0 +1,72 @@
+from fastapi import APIRouter, Depends, Query
+
+from endfield_essence_recognizer.core.recognition import RarityLabel
+from endfield_essence_recognizer.core.scanner.models import EssenceQuality
+from endfield_essence_recognizer.core.scanner.result_store import EssenceQuery
+from endfield_essence_recognizer.dependencies.services import get_inventory_service
+from endfield_essence_recognizer.schemas.inventory import (
+    EssenceRecordListResponse,
+    ScanListResponse,
+)
+from endfield_essence_recognizer.services.inventory_service import InventoryService
+
+router = APIRouter(prefix="/inventory", tags=["inventory"])
+
+
+@router.get("/scans")
+def list_scans(
+    limit: int = Query(default=20, ge=1, le=1000),
+    service: InventoryService = Depends(get_inventory_service),
+) -> ScanListResponse:
+    """
+    List the most recent scans recorded in the local database, newest first.
+    """
+    return service.list_scans(limit=limit)
+
+
+@router.get("/essences")
+def query_essences(
+    scan_id: int | None = None,
+    weapon_id: str | None = None,
+    quality: EssenceQuality | None = None,
+    rarity: RarityLabel | None = None,
+    stat_id: str | None = None,
+    min_attribute_level: int | None = None,
+    min_secondary_level: int | None = None,
+    min_skill_level: int | None = None,
+    locked: bool | None = None,
+    abandoned: bool | None = None,
+    limit: int = Query(default=100, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
+    service: InventoryService = Depends(get_inventory_service),
+) -> EssenceRecordListResponse:
+    """
+    Query the essences recorded by a scan (the latest completed scan by default).
+
+    Examples: all treasures suitable for a weapon
+    (`?quality=treasure&weapon_id=...`), or all essences whose attribute stat
+    is at least +3 (`?min_attribute_level=3`).
+
+    Stats and levels of five-star essences are always recorded. Non-five-star
+    essences skipped by the user settings are stored without stats and levels
+    (see `EER_SAVE_SCAN_RESULTS`), so stat and level filters never match them.
+    Scans recorded by older versions may have no levels at all; the response
+    reports this in `levelsRecognized`, so an empty result of a level query over
+    such a scan can be told apart from "no essence reaches that level".
+    """
+    return service.query_essences(
+        EssenceQuery(
+            scan_id=scan_id,
+            weapon_id=weapon_id,
+            quality=quality,
+            rarity=rarity,
+            stat_id=stat_id,
+            min_attribute_level=min_attribute_level,
+            min_secondary_level=min_secondary_level,
+            min_skill_level=min_skill_level,
+            locked=locked,
+            abandoned=abandoned,
+            limit=limit,
+            offset=offset,
+        )
+    )
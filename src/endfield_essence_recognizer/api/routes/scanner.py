@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
 from endfield_essence_recognizer.core.interfaces import AutomationEngine
@@ -7,6 +7,7 @@ from endfield_essence_recognizer.core.scanner.engine import (
     ScannerEngine,
 )
 from endfield_essence_recognizer.dependencies import (
+    get_action_plan_service,
     get_delivery_claimer_engine_dep,
     get_one_time_recognition_engine_dep,
     get_scanner_engine_dep,
@@ -14,7 +15,8 @@ from endfield_essence_recognizer.dependencies import (
     require_game_or_webview_is_active,
     require_game_window_exists,
 )
-from endfield_essence_recognizer.schemas.scanner import TaskType
+from endfield_essence_recognizer.schemas.scanner import ActionPlanInfo, TaskType
+from endfield_essence_recognizer.services.action_plan_service import ActionPlanService
 from endfield_essence_recognizer.services.scanner_service import ScannerService
 
 router = APIRouter(prefix="", tags=["scanner"])
@@ -22,6 +24,8 @@ router = APIRouter(prefix="", tags=["scanner"])
 
 class ToggleScanningRequest(BaseModel):
     task_type: TaskType
+    resume: bool = False
+    """扫描基质时，是否从上次被中断的扫描进度继续扫描。"""
 
 
 @router.post(
@@ -68,6 +72,7 @@ async def toggle_scanning(
     def get_engine() -> AutomationEngine:
         match request.task_type:
             case TaskType.ESSENCE:
+                essence_engine.resume = request.resume
                 return essence_engine
             case TaskType.DELIVERY_CLAIM:
                 return delivery_engine
@@ -75,3 +80,41 @@ async def toggle_scanning(
                 raise ValueError(f"Unsupported task type: {request.task_type}")
 
     scanner_service.toggle_scan(scanner_factory=get_engine)
+
+
+@router.get("/action_plan")
+async def get_action_plan(
+    service: ActionPlanService = Depends(get_action_plan_service),
+) -> ActionPlanInfo | None:
+    """
+    Get the most recent lock/abandon plan of the planned scan mode, or null if none.
+    """
+    return service.get_current_plan()
+
+
+@router.post("/action_plan/{plan_id}/confirm")
+async def confirm_action_plan(
+    plan_id: int,
+    service: ActionPlanService = Depends(get_action_plan_service),
+) -> None:
+    """
+    Confirm a plan that is awaiting confirmation, so that the scanner executes it.
+    """
+    if not service.confirm(plan_id):
+        raise HTTPException(
+            status_code=409, detail="Action plan is not awaiting confirmation"
+        )
+
+
+@router.post("/action_plan/{plan_id}/reject")
+async def reject_action_plan(
+    plan_id: int,
+    service: ActionPlanService = Depends(get_action_plan_service),
+) -> None:
+    """
+    Reject a plan that is awaiting confirmation; none of its actions are executed.
+    """
+    if not service.reject(plan_id):
+        raise HTTPException(
+            status_code=409, detail="Action plan is not awaiting confirmation"
+        )
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from endfield_essence_recognizer.dependencies.services import get_static_data_service
 from endfield_essence_recognizer.schemas.static_data import (
@@ -39,6 +39,23 @@ async def list_weapons(
     return service.list_weapons(weapon_type_id=weapon_type_id)
 
 
+@router.get("/weapon_matches")
+async def match_weapons(
+    attribute_stat_id: str | None = None,
+    secondary_stat_id: str | None = None,
+    skill_stat_id: str | None = None,
+    min_matches: int = Query(default=3, ge=1, le=3),
+    service: StaticDataService = Depends(get_static_data_service),
+) -> WeaponListResponse:
+    """
+    List weapons whose stats match at least `min_matches` of the given stats,
+    e.g. min_matches=2 for the weapons an essence misses by one stat.
+    """
+    return service.match_weapons(
+        attribute_stat_id, secondary_stat_id, skill_stat_id, min_matches
+    )
+
+
 @router.get("/weapon_types")
 async def list_weapon_types(
     service: StaticDataService = Depends(get_static_data_service),
@@ -81,3 +98,17 @@ async def list_essences(
     List all available essences.
     """
     return service.list_essences()
+
+
+@router.get("/essences/{stat_id}/weapons")
+async def list_weapons_with_essence(
+    stat_id: str,
+    service: StaticDataService = Depends(get_static_data_service),
+) -> WeaponListResponse:
+    """
+    List all weapons that use a specific essence (stat) in any slot.
+    """
+    weapons = service.list_weapons_with_essence(stat_id)
+    if weapons is None:
+        raise HTTPException(status_code=404, detail="Stat not found")
+    return weapons
@@ -5,8 +5,13 @@ import platform
 from fastapi import APIRouter, Depends
 
 from endfield_essence_recognizer.core.path import get_logs_dir
-from endfield_essence_recognizer.dependencies import get_system_service
+from endfield_essence_recognizer.dependencies import (
+    get_system_service,
+    get_warmup_service,
+)
+from endfield_essence_recognizer.schemas.system import ReadinessInfo
 from endfield_essence_recognizer.services.system_service import SystemService
+from endfield_essence_recognizer.services.warmup_service import WarmupService
 from endfield_essence_recognizer.utils.log import logger
 from endfield_essence_recognizer.version import __version__
 
@@ -18,6 +23,17 @@ async def get_version() -> str | None:
     return __version__
 
 
+@router.get("/system/ready")
+async def get_readiness(
+    warmup_service: WarmupService = Depends(get_warmup_service),
+) -> ReadinessInfo:
+    """
+    Whether the recognizers, static data and layout warmed up at startup are loaded,
+    with the load time of every component.
+    """
+    return warmup_service.status()
+
+
 @router.post("/exit")
 async def exit_app(
     system_service: SystemService = Depends(get_system_service),
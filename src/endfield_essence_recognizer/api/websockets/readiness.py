@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
+
+from endfield_essence_recognizer.dependencies import get_warmup_service
+from endfield_essence_recognizer.services.warmup_service import WarmupService
+
+router = APIRouter(prefix="", tags=["system"])
+
+
+@router.websocket("/system/ready")
+async def websocket_readiness(
+    websocket: WebSocket,
+    warmup_service: WarmupService = Depends(get_warmup_service),
+):
+    """
+    Send the readiness of the startup warm-up (same payload as GET /api/system/ready)
+    now and every time a component finishes loading. Closes once everything is ready.
+    """
+    await websocket.accept()
+    queue = warmup_service.subscribe()
+    try:
+        info = warmup_service.status()
+        while True:
+            await websocket.send_json(info.model_dump(mode="json", by_alias=True))
+            if info.ready:
+                break
+            info = await queue.get()
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        warmup_service.unsubscribe(queue)
@@ -85,6 +85,74 @@ class ServerConfig(BaseSettings):
     EER_API_PORT: 服务器端口号。
     """
 
+    pipelined_scan: bool = Field(
+        default=False,
+    )
+    """
+    EER_PIPELINED_SCAN: 是否使用流水线方式扫描基质（识别与下一个基质的点击、等待重叠进行）。
+    """
+
+    planned_scan: bool = Field(
+        default=False,
+    )
+    """
+    EER_PLANNED_SCAN: 是否先只读扫描并生成锁定/弃用操作计划，再批量执行（优先于流水线方式）。
+    """
+
+    confirm_action_plan: bool = Field(
+        default=True,
+    )
+    """
+    EER_CONFIRM_ACTION_PLAN: 先计划后执行时，是否等待通过 /action_plan/confirm 接口确认后再执行操作计划。
+    """
+
+    multi_page_scan: bool = Field(
+        default=False,
+    )
+    """
+    EER_MULTI_PAGE_SCAN: 是否在扫描完当前页后滚动基质网格，继续扫描后续页面。
+    """
+
+    skip_empty_cells: bool = Field(
+        default=True,
+    )
+    """
+    EER_SKIP_EMPTY_CELLS: 扫描前是否根据网格截图找出空格子，只扫描第一个空格子之前的基质。
+    """
+
+    incremental_scan: bool = Field(
+        default=False,
+    )
+    """
+    EER_INCREMENTAL_SCAN: 是否跳过卡片外观与上次扫描时相同的基质（用户设置或静态数据变化后会重新扫描）。
+    """
+
+    save_scan_results: bool = Field(
+        default=True,
+    )
+    """
+    EER_SAVE_SCAN_RESULTS: 是否把每次扫描的结果保存到本地数据库，以便通过 /inventory 接口查询。
+
+    保存结果时总是识别无瑕基质的词条与等级；跳过非无瑕基质时不识别它们的词条与等级，
+    保存的结果中这些字段为 NULL，按等级或词条查询时这些基质不会出现在结果中。
+    """
+
+    uncertain_recapture_frames: int = Field(
+        default=5,
+        ge=0,
+    )
+    """
+    EER_UNCERTAIN_RECAPTURE_FRAMES: 锁定/弃用状态识别不确定时，最多重新截取按钮区域的帧数；为 0 时直接跳过该基质。
+    """
+
+    warmup_workers: int = Field(
+        default=4,
+        ge=0,
+    )
+    """
+    EER_WARMUP_WORKERS: 启动时在后台并行预加载识别器、静态数据与布局配置的线程数；为 0 时不预加载，首次使用时再加载。
+    """
+
     def _get_webview_prod_url(self) -> str:
         """生产环境 Webview URL"""
         return f"http://localhost:{self.api_port}"
@@ -1,4 +1,5 @@
 import threading
+from collections.abc import Sequence
 from typing import Protocol, runtime_checkable
 
 from cv2.typing import MatLike
@@ -41,6 +42,22 @@ class ImageSource(Protocol):
         """
         ...
 
+    def screenshot_many(self, relative_regions: Sequence[Region]) -> list[MatLike]:
+        """
+        Capture several regions in as few underlying captures as possible.
+
+        Implementations plan a small number of bounding rectangles covering all
+        regions, capture each rectangle once and return views into them.
+
+        Args:
+            relative_regions: The regions to capture, relative to the source's client area.
+
+        Returns:
+            One image per region, in the same order. The images may be views of a
+            shared buffer; consumers MUST NOT modify them.
+        """
+        ...
+
     def get_client_size(self) -> tuple[int, int]:
         """
         Get the dimensions of the source's client area.
@@ -51,6 +68,32 @@ class ImageSource(Protocol):
         ...
 
 
+@runtime_checkable
+class CaptureSession(Protocol):
+    """
+    Protocol for a reusable screen capture backend.
+
+    A session may keep OS resources (device contexts, bitmaps, buffers) alive
+    between captures, so repeated captures do not pay setup costs.
+    """
+
+    def capture(self, scope: Region) -> MatLike:
+        """
+        Capture a rectangle of the screen.
+
+        Args:
+            scope: The rectangle to capture, in screen coordinates.
+
+        Returns:
+            The captured image as a MatLike (OpenCV BGR array) owned by the caller.
+        """
+        ...
+
+    def close(self) -> None:
+        """Release all resources held by the session. The session may be reused afterwards."""
+        ...
+
+
 @runtime_checkable
 class WindowActions(Protocol):
     """
@@ -104,6 +147,17 @@ class WindowActions(Protocol):
         """
         ...
 
+    def scroll(self, relative_x: int, relative_y: int, clicks: int) -> None:
+        """
+        Scroll the mouse wheel at the specified relative coordinates.
+
+        Args:
+            relative_x: X coordinate relative to the client area.
+            relative_y: Y coordinate relative to the client area.
+            clicks: Number of wheel notches. Positive scrolls up, negative scrolls down.
+        """
+        ...
+
     def wait(self, seconds: float) -> None:
         """
         Wait for a specified duration.
@@ -58,6 +58,11 @@ class ResolutionProfile(Protocol):
         """
         ...
 
+    @property
+    def ESSENCE_CARD_SIZE(self) -> int:
+        """基质网格中卡片的边长。卡片以图标坐标为中心。"""
+        ...
+
     @property
     def ESSENCE_UI_ROI(self) -> Region:
         """用于判定是否在基质界面的 ROI 区域。"""
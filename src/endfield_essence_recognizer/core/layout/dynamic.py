@@ -163,6 +163,10 @@ class DynamicResolutionProfile(ResolutionProfile):
     def essence_icon_y_list(self) -> Sequence[int]:
         return self._icon_y
 
+    @property
+    def ESSENCE_CARD_SIZE(self) -> int:
+        return _CARD_SIZE
+
     # 左侧固定元素 — 坐标不变
 
     @property
@@ -2,13 +2,13 @@
 Generate layout configurations for different screen resolutions.
 """
 
-from functools import lru_cache
+from endfield_essence_recognizer.utils.cache import locked_cache
 
 from .base import ResolutionProfile
 from .dynamic import DynamicResolutionProfile
 
 
-@lru_cache(maxsize=16)
+@locked_cache(maxsize=16)
 def build_resolution_profile(
     width: int,
     height: int,
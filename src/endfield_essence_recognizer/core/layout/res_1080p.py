@@ -18,6 +18,10 @@ class Resolution1080p(ResolutionProfile):
     def essence_icon_y_list(self) -> Sequence[int]:
         return np.linspace(196, 819, 5).astype(int).tolist()
 
+    @property
+    def ESSENCE_CARD_SIZE(self) -> int:
+        return 145
+
     @property
     def ESSENCE_UI_ROI(self) -> Region:
         return Region(Point(38, 66), Point(143, 106))
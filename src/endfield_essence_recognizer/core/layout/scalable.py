@@ -75,6 +75,10 @@ class ScalableResolutionProfile(ResolutionProfile):
         base = self._ref.essence_icon_y_list
         return [round(y * self._sy) for y in base]
 
+    @property
+    def ESSENCE_CARD_SIZE(self) -> int:
+        return round(self._ref.ESSENCE_CARD_SIZE * self._sy)
+
     @property
     def ESSENCE_UI_ROI(self) -> Region:
         return _scale_region(self._ref.ESSENCE_UI_ROI, self._sx, self._sy)
@@ -34,3 +34,18 @@ def get_logs_dir() -> Path:
 def get_screenshots_dir() -> Path:
     """Get the path to the screenshots directory in the root directory."""
     return get_root_dir() / "screenshots"
+
+
+def get_fingerprint_cache_dir() -> Path:
+    """Get the path to the directory holding persisted recognition fingerprint caches."""
+    return get_root_dir() / "cache" / "fingerprints"
+
+
+def get_incremental_scan_store_path() -> Path:
+    """Get the path to the file holding the results of previous scans."""
+    return get_root_dir() / "cache" / "incremental_scan.json"
+
+
+def get_scan_results_db_path() -> Path:
+    """Get the path to the SQLite database holding the results of all scans."""
+    return get_root_dir() / "scan_results.db"
@@ -1,11 +1,11 @@
-from functools import lru_cache
-
 from endfield_essence_recognizer.game_data.static_game_data import StaticGameData
+from endfield_essence_recognizer.utils.cache import locked_cache
 
 from .brightness_detector import (
     BrightnessDetector,
     BrightnessDetectorProfile,
 )
+from .frame import FrameContext
 from .hue_recognizer import (
     ColorDescriptor,
     HueRecognitionProfile,
@@ -24,6 +24,11 @@ from .tasks.attribute_level import (
     AttributeLevelRecognizer,
     build_attribute_level_recognizer_profile,
 )
+from .tasks.card_thumbnail import (
+    CardThumbnailer,
+    CardThumbnailProfile,
+    build_card_thumbnail_profile,
+)
 from .tasks.delivery_job_reward import (
     DeliveryJobRewardLabel,
     build_delivery_job_reward_profile,
@@ -36,13 +41,24 @@ from .tasks.essence_rarity import (
     RarityLabel,
     build_rarity_profile,
 )
+from .tasks.grid_rarity import (
+    GridRarityClassifier,
+    GridRarityProfile,
+    build_grid_rarity_profile,
+)
 from .tasks.ui import (
     UISceneLabel,
     build_ui_scene_profile,
 )
+from .template_pack import (
+    TemplatePack,
+    build_template_pack,
+    load_default_template_pack,
+)
 from .template_recognizer import (
     RecognitionProfile,
     TemplateDescriptor,
+    TemplateMatchingMode,
     TemplateRecognizer,
 )
 
@@ -75,13 +91,27 @@ type RarityRecognizer = HueRecognizer[RarityLabel]
 def prepare_recognizer[LabelT](
     name: str, profile: RecognitionProfile[LabelT]
 ) -> TemplateRecognizer[LabelT]:
-    """构造并返回一个识别器实例，并加载其模板。"""
+    """构造并返回一个识别器实例，并加载其模板（优先使用包内的模板包）。"""
     recognizer = TemplateRecognizer(name, profile)
-    recognizer.load_templates()
+    recognizer.load_templates(load_default_template_pack())
     return recognizer
 
 
-@lru_cache
+def build_template_recognizer_profiles(
+    static_game_data: StaticGameData,
+) -> dict[str, RecognitionProfile]:
+    """所有基于模板匹配的识别器的名称与配置，用于构建模板包。"""
+    return {
+        "AttributeRecognizer": build_attribute_profile(static_game_data),
+        "AbandonStatusRecognizer": build_abandon_status_profile(),
+        "LockStatusRecognizer": build_lock_status_profile(),
+        "UISceneRecognizer": build_ui_scene_profile(),
+        "DeliverySceneRecognizer": build_delivery_scene_profile(),
+        "DeliveryJobRewardRecognizer": build_delivery_job_reward_profile(),
+    }
+
+
+@locked_cache
 def prepare_attribute_recognizer(
     static_game_data: StaticGameData,
 ) -> AttributeRecognizer:
@@ -90,46 +120,58 @@ def prepare_attribute_recognizer(
     )
 
 
-@lru_cache
+@locked_cache
 def prepare_abandon_status_recognizer() -> AbandonStatusRecognizer:
     return prepare_recognizer("AbandonStatusRecognizer", build_abandon_status_profile())
 
 
-@lru_cache
+@locked_cache
 def prepare_lock_status_recognizer() -> LockStatusRecognizer:
     return prepare_recognizer("LockStatusRecognizer", build_lock_status_profile())
 
 
-@lru_cache
+@locked_cache
 def prepare_ui_scene_recognizer() -> UISceneRecognizer:
     return prepare_recognizer("UISceneRecognizer", build_ui_scene_profile())
 
 
-@lru_cache
+@locked_cache
 def prepare_delivery_scene_recognizer() -> DeliverySceneRecognizer:
     return prepare_recognizer("DeliverySceneRecognizer", build_delivery_scene_profile())
 
 
-@lru_cache
+@locked_cache
 def prepare_delivery_job_reward_recognizer() -> DeliveryJobRewardRecognizer:
     return prepare_recognizer(
         "DeliveryJobRewardRecognizer", build_delivery_job_reward_profile()
     )
 
 
-@lru_cache
+@locked_cache
 def prepare_attribute_level_recognizer() -> AttributeLevelRecognizer:
     return AttributeLevelRecognizer(
         "AttributeLevelRecognizer", build_attribute_level_recognizer_profile()
     )
 
 
-@lru_cache
+@locked_cache
 def prepare_rarity_recognizer() -> RarityRecognizer:
     """构造并返回一个稀有度识别器实例。"""
     return HueRecognizer("RarityRecognizer", build_rarity_profile())
 
 
+@locked_cache
+def prepare_grid_rarity_classifier() -> GridRarityClassifier:
+    """构造并返回一个网格稀有度分类器实例。"""
+    return GridRarityClassifier("GridRarityClassifier", build_grid_rarity_profile())
+
+
+@locked_cache
+def prepare_card_thumbnailer() -> CardThumbnailer:
+    """构造并返回一个基质卡片缩略图生成器实例。"""
+    return CardThumbnailer("CardThumbnailer", build_card_thumbnail_profile())
+
+
 __all__ = [
     "AbandonStatusLabel",
     "AbandonStatusRecognizer",
@@ -137,11 +179,16 @@ __all__ = [
     "AttributeRecognizer",
     "BrightnessDetector",
     "BrightnessDetectorProfile",
+    "CardThumbnailProfile",
+    "CardThumbnailer",
     "ColorDescriptor",
     "DeliveryJobRewardLabel",
     "DeliveryJobRewardRecognizer",
     "DeliverySceneLabel",
     "DeliverySceneRecognizer",
+    "FrameContext",
+    "GridRarityClassifier",
+    "GridRarityProfile",
     "HueRecognitionProfile",
     "HueRecognizer",
     "LockStatusLabel",
@@ -150,14 +197,21 @@ __all__ = [
     "RarityRecognizer",
     "RecognitionProfile",
     "TemplateDescriptor",
+    "TemplateMatchingMode",
+    "TemplatePack",
     "TemplateRecognizer",
     "UISceneLabel",
     "UISceneRecognizer",
+    "build_template_pack",
+    "build_template_recognizer_profiles",
+    "load_default_template_pack",
     "prepare_abandon_status_recognizer",
     "prepare_attribute_level_recognizer",
     "prepare_attribute_recognizer",
+    "prepare_card_thumbnailer",
     "prepare_delivery_job_reward_recognizer",
     "prepare_delivery_scene_recognizer",
+    "prepare_grid_rarity_classifier",
     "prepare_lock_status_recognizer",
     "prepare_rarity_recognizer",
     "prepare_recognizer",
@@ -2,6 +2,7 @@
 Detect the average brightness of a region in an image.
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 import numpy as np
@@ -62,3 +63,62 @@ class BrightnessDetector:
             f"{self}坐标点 {point} 亮度={avg_brightness:.1f}, 状态={'亮色' if is_active else '暗色'}"
         )
         return is_active
+
+    def mean_brightness_many(
+        self, image: MatLike, points: Sequence[Point]
+    ) -> np.ndarray:
+        """
+        一次性计算多个坐标点周围区域的平均亮度。
+
+        所有采样区域通过一次 numpy 花式索引取出，再统一求均值，避免逐点构造区域和切片。
+
+        Args:
+            image: 灰度图像。
+            points: 待检测的中心点列表。
+
+        Returns:
+            形状为 (len(points),) 的 float 数组；采样区域超出图像范围的点为 NaN。
+        """
+        height, width = image.shape[:2]
+        radius = self.profile.sample_radius
+        centers = np.asarray(points, dtype=np.intp).reshape(-1, 2)
+        offsets = np.arange(-radius, radius + 1)
+        xs = centers[:, 0, None] + offsets
+        ys = centers[:, 1, None] + offsets
+
+        in_bounds = (
+            (xs[:, 0] >= 0)
+            & (xs[:, -1] < width)
+            & (ys[:, 0] >= 0)
+            & (ys[:, -1] < height)
+        )
+        # 越界的点先裁剪到图像内以完成索引，再将结果置为 NaN
+        patches = np.asarray(image)[
+            np.clip(ys, 0, height - 1)[:, :, None],
+            np.clip(xs, 0, width - 1)[:, None, :],
+        ]
+        means = patches.mean(axis=(1, 2))
+        means[~in_bounds] = np.nan
+        return means
+
+    def is_bright_many(self, image: MatLike, points: Sequence[Point]) -> np.ndarray:
+        """
+        批量检测多个坐标点周围区域是否激活，语义与逐点调用 `is_bright` 相同。
+
+        Args:
+            image: 灰度图像。
+            points: 待检测的中心点列表。
+
+        Returns:
+            形状为 (len(points),) 的 bool 数组；超出图像范围的点视为暗色。
+        """
+        means = self.mean_brightness_many(image, points)
+        out_of_bounds = np.isnan(means)
+        if out_of_bounds.any():
+            outside = [p for p, flag in zip(points, out_of_bounds, strict=True) if flag]
+            logger.warning(f"{self}坐标点 {outside} 超出图像范围")
+
+        is_active = np.zeros(means.shape, dtype=bool)
+        np.greater(means, self.profile.threshold, out=is_active, where=~out_of_bounds)
+        logger.trace(f"{self}批量亮度={np.round(means, 1).tolist()}")
+        return is_active
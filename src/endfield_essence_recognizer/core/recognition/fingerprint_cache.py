@@ -0,0 +1,188 @@
+"""
+Exact-hit fingerprint cache in front of template matching.
+
+UI text and icons render pixel-identically at a given logical resolution, so most ROIs
+a recognizer sees are repeats. The cache maps a fingerprint of the (preprocessed) ROI
+to the label and score previously computed by full template matching.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+import cv2
+import numpy as np
+from cv2.typing import MatLike
+
+from endfield_essence_recognizer.utils.log import logger
+
+FINGERPRINT_CACHE_FORMAT_VERSION = 1
+"""持久化文件格式版本，格式变化时旧文件会被忽略。"""
+
+
+@dataclass(frozen=True)
+class FingerprintCacheProfile:
+    """实例化指纹缓存所需的配置。"""
+
+    max_entries: int = 1024
+    """最多缓存的指纹数量，超出后淘汰最久未使用的条目。"""
+    min_score: float = 0.9
+    """只记录分数不低于此值的识别结果（同时不低于识别器的 high_threshold）。"""
+    downsample: int = 2
+    """计算指纹前的降采样倍数。"""
+    persist_path: Path | None = None
+    """持久化文件路径。为 None 时仅在内存中缓存。"""
+    save_every: int = 32
+    """新增多少条记录后自动写入磁盘。"""
+
+
+def compute_fingerprint(image: MatLike, downsample: int = 2) -> str:
+    """
+    计算 ROI 的指纹：降采样后按均值二值化，再对尺寸与二值化结果取哈希。
+
+    Args:
+        image: 灰度 ROI 图像。
+        downsample: 降采样倍数。
+
+    Returns:
+        十六进制指纹字符串。
+    """
+    height, width = image.shape[:2]
+    factor = max(1, downsample)
+    size = (max(1, width // factor), max(1, height // factor))
+    thumbnail = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+    bits = np.packbits(thumbnail > thumbnail.mean())
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.asarray(image.shape, dtype=np.int32).tobytes())
+    digest.update(bits.tobytes())
+    return digest.hexdigest()
+
+
+class FingerprintCache[LabelT]:
+    """
+    带 LRU 上限、可选持久化的指纹 → (标签, 分数) 缓存。线程安全。
+    """
+
+    def __init__(
+        self,
+        name: str,
+        profile: FingerprintCacheProfile,
+        labels: Iterable[LabelT],
+        signature: str,
+    ) -> None:
+        """
+        Args:
+            name: 名称，用于日志。
+            profile: 缓存配置。
+            labels: 所有可能的标签，用于从持久化文件还原标签对象。
+            signature: 模板集合的签名。持久化文件中的签名不一致时（例如模板更新），丢弃旧数据。
+        """
+        self.name = name
+        self.profile = profile
+        self._labels = {str(label): label for label in labels}
+        self._signature = signature
+        self._entries: OrderedDict[str, tuple[LabelT, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._unsaved = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __str__(self) -> str:
+        return f"[{self.name}]"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def fingerprint(self, image: MatLike) -> str:
+        """计算 ROI 的指纹。"""
+        return compute_fingerprint(image, self.profile.downsample)
+
+    def get(self, key: str) -> tuple[LabelT, float] | None:
+        """查询指纹；命中时返回 (标签, 分数)。"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, label: LabelT | None, score: float) -> bool:
+        """
+        记录一次完整模板匹配的结果。只有高置信度的结果会被记录。
+
+        Returns:
+            是否记录。
+        """
+        if label is None or score < self.profile.min_score:
+            return False
+        with self._lock:
+            self._entries[key] = (label, score)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.profile.max_entries:
+                self._entries.popitem(last=False)
+            self._unsaved += 1
+            should_save = (
+                self.profile.persist_path is not None
+                and self._unsaved >= self.profile.save_every
+            )
+        if should_save:
+            self.save()
+        return True
+
+    def load(self) -> None:
+        """从持久化文件加载缓存。文件不存在、损坏或签名不一致时忽略。"""
+        path = self.profile.persist_path
+        if path is None or not path.exists():
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"{self} 无法读取指纹缓存文件 {path}: {e}")
+            return
+        if (
+            data.get("version") != FINGERPRINT_CACHE_FORMAT_VERSION
+            or data.get("signature") != self._signature
+        ):
+            logger.debug(f"{self} 指纹缓存文件已过期，忽略: {path}")
+            return
+
+        with self._lock:
+            for key, label_text, score in data.get("entries", []):
+                label = self._labels.get(label_text)
+                if label is not None:
+                    self._entries[key] = (label, float(score))
+            while len(self._entries) > self.profile.max_entries:
+                self._entries.popitem(last=False)
+        logger.debug(f"{self} 已加载 {len(self._entries)} 条指纹缓存")
+
+    def save(self) -> None:
+        """将缓存写入持久化文件（若已配置且有未保存的记录）。"""
+        path = self.profile.persist_path
+        if path is None:
+            return
+        with self._lock:
+            if self._unsaved == 0:
+                return
+            data = {
+                "version": FINGERPRINT_CACHE_FORMAT_VERSION,
+                "signature": self._signature,
+                "entries": [
+                    [key, str(label), score]
+                    for key, (label, score) in self._entries.items()
+                ],
+            }
+            self._unsaved = 0
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"{self} 无法写入指纹缓存文件 {path}: {e}")
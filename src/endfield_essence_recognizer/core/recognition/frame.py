@@ -0,0 +1,114 @@
+"""
+Per-frame cache of derived images shared by all recognizers.
+"""
+
+from collections.abc import Callable, Hashable
+from typing import Any
+
+import cv2
+from cv2.typing import MatLike
+
+from endfield_essence_recognizer.core.layout.base import Point, Region
+from endfield_essence_recognizer.utils.image import (
+    crop_relative,
+    region_out_of_bounds,
+    to_gray_image,
+)
+
+
+class FrameContext:
+    """
+    一帧截图及其派生图像（灰度图、HSV 图、预处理后的 ROI 等）的惰性缓存。
+
+    派生图像在首次访问时计算并缓存，同一帧内每种转换至多计算一次。
+    帧图像与所有派生结果均为只读，调用方不得修改。
+    """
+
+    def __init__(
+        self,
+        image: MatLike,
+        origin: Point = Point(0, 0),
+        parent: "FrameContext | None" = None,
+    ) -> None:
+        """
+        Args:
+            image: 截图（BGR）。
+            origin: 图像左上角在客户区中的坐标。
+            parent: 由 `crop` 创建时的父帧，用于复用父帧已计算的派生图像。
+        """
+        self._image = image
+        self._origin = origin
+        self._parent = parent
+        self._cache: dict[Hashable, Any] = {}
+
+    @classmethod
+    def of(cls, image: "MatLike | FrameContext") -> "FrameContext":
+        """将图像包装为 FrameContext；若已是 FrameContext 则原样返回。"""
+        if isinstance(image, FrameContext):
+            return image
+        return cls(image)
+
+    @property
+    def image(self) -> MatLike:
+        """原始帧图像（BGR）。"""
+        return self._image
+
+    @property
+    def origin(self) -> Point:
+        """图像左上角在客户区中的坐标。"""
+        return self._origin
+
+    @property
+    def region(self) -> Region:
+        """帧在客户区中覆盖的区域。"""
+        height, width = self._image.shape[:2]
+        return Region(
+            self._origin, Point(self._origin.x + width, self._origin.y + height)
+        )
+
+    def derive[T](self, key: Hashable, compute: Callable[[MatLike], T]) -> T:
+        """
+        返回以 `key` 缓存的派生结果；若不存在，则以原始帧图像调用 `compute` 计算并缓存。
+        """
+        if key not in self._cache:
+            self._cache[key] = compute(self._image)
+        return self._cache[key]
+
+    @property
+    def gray(self) -> MatLike:
+        """灰度图。若父帧已计算灰度图，则直接裁剪父帧的结果。"""
+        return self.derive("gray", self._compute_gray)
+
+    @property
+    def hsv(self) -> MatLike:
+        """HSV 图。"""
+        return self.derive("hsv", lambda image: cv2.cvtColor(image, cv2.COLOR_BGR2HSV))
+
+    def _compute_gray(self, image: MatLike) -> MatLike:
+        parent = self._parent
+        if parent is not None and "gray" in parent._cache:
+            return crop_relative(parent._cache["gray"], self.region, parent.origin)
+        return to_gray_image(image)
+
+    def crop(self, region: Region) -> "FrameContext":
+        """
+        截取客户区坐标下的子区域，返回共享同一帧数据的子 FrameContext（结果被缓存）。
+
+        Raises:
+            ValueError: 区域超出当前帧范围。
+        """
+        key = ("crop", region)
+        if key not in self._cache:
+            height, width = self._image.shape[:2]
+            local = Region(
+                Point(region.x0 - self._origin.x, region.y0 - self._origin.y),
+                Point(region.x1 - self._origin.x, region.y1 - self._origin.y),
+            )
+            if region_out_of_bounds(local, width, height):
+                raise ValueError(f"Region {region} is out of frame {self.region}")
+            self._cache[key] = FrameContext(
+                crop_relative(self._image, region, self._origin),
+                origin=region.p0,
+                parent=self,
+            )
+        return self._cache[key]
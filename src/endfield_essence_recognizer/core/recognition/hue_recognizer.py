@@ -4,6 +4,7 @@ import cv2
 import numpy as np
 from cv2.typing import MatLike
 
+from endfield_essence_recognizer.core.recognition.frame import FrameContext
 from endfield_essence_recognizer.utils.log import logger
 
 
@@ -93,16 +94,22 @@ class HueRecognizer[LabelT]:
                         f"are too close (dist={dist:.1f}° < min={min_dist_deg:.1f}°)"
                     )
 
-    def recognize_roi(self, roi_image: MatLike) -> tuple[LabelT | None, float]:
+    def recognize_roi(
+        self, roi_image: MatLike | FrameContext
+    ) -> tuple[LabelT | None, float]:
         """
         Recognizes the color in the ROI.
         Returns (Label, SimilarityScore).
         """
-        if not self._target_hues or roi_image.size == 0:
+        frame = FrameContext.of(roi_image)
+        if not self._target_hues or frame.image.size == 0:
             return None, 0.0
 
         # Calculate average color
-        avg_bgr = np.mean(roi_image, axis=(0, 1))  # type: ignore
+        avg_bgr = frame.derive(
+            "mean_bgr",
+            lambda image: np.mean(image, axis=(0, 1)),  # type: ignore
+        )
         h, s, _ = bgr_to_hsv(avg_bgr)
 
         if s < self.profile.min_saturation:
@@ -134,7 +141,7 @@ class HueRecognizer[LabelT]:
         return None, score
 
     def recognize_roi_fallback(
-        self, roi_image: MatLike, fallback_label: LabelT
+        self, roi_image: MatLike | FrameContext, fallback_label: LabelT
     ) -> tuple[LabelT, float]:
         """Recognizes the color, returning a fallback label if no match is found."""
         label, score = self.recognize_roi(roi_image)
@@ -1,6 +1,9 @@
 import importlib.resources
 from enum import StrEnum
 
+from endfield_essence_recognizer.core.recognition.fingerprint_cache import (
+    FingerprintCacheProfile,
+)
 from endfield_essence_recognizer.core.recognition.template_recognizer import (
     RecognitionProfile,
     TemplateDescriptor,
@@ -43,6 +46,7 @@ def build_abandon_status_profile() -> RecognitionProfile[AbandonStatusLabel]:
         templates=templates,
         high_threshold=0.75,
         low_threshold=0.50,
+        fingerprint_cache=FingerprintCacheProfile(max_entries=64),
     )
 
 
@@ -66,4 +70,5 @@ def build_lock_status_profile() -> RecognitionProfile[LockStatusLabel]:
         templates=templates,
         high_threshold=0.75,
         low_threshold=0.50,
+        fingerprint_cache=FingerprintCacheProfile(max_entries=64),
     )
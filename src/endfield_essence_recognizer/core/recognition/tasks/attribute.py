@@ -2,9 +2,14 @@ import importlib.resources
 
 from cv2.typing import MatLike
 
+from endfield_essence_recognizer.core.path import get_fingerprint_cache_dir
+from endfield_essence_recognizer.core.recognition.fingerprint_cache import (
+    FingerprintCacheProfile,
+)
 from endfield_essence_recognizer.core.recognition.template_recognizer import (
     RecognitionProfile,
     TemplateDescriptor,
+    TemplateMatchingMode,
 )
 from endfield_essence_recognizer.game_data.static_game_data import StaticGameData
 from endfield_essence_recognizer.utils.image import (
@@ -52,4 +57,10 @@ def build_attribute_profile(
         low_threshold=0.50,
         # preprocess_roi=preprocess_text_roi,
         # preprocess_template=preprocess_text_template,
+        # ~30 same-sized templates against one ROI: score them all in one pass
+        matching_mode=TemplateMatchingMode.BATCHED,
+        # Stat text renders identically every time: answer repeats from the cache
+        fingerprint_cache=FingerprintCacheProfile(
+            persist_path=get_fingerprint_cache_dir() / "attribute.json",
+        ),
     )
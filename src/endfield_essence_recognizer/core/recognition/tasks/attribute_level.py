@@ -1,13 +1,19 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
 
+import numpy as np
 from cv2.typing import MatLike
 
-from endfield_essence_recognizer.core.layout.base import ResolutionProfile
+from endfield_essence_recognizer.core.layout.base import (
+    Point,
+    Region,
+    ResolutionProfile,
+)
 from endfield_essence_recognizer.core.recognition.brightness_detector import (
     BrightnessDetector,
     BrightnessDetectorProfile,
 )
-from endfield_essence_recognizer.utils.image import to_gray_image
+from endfield_essence_recognizer.core.recognition.frame import FrameContext
 from endfield_essence_recognizer.utils.log import logger
 
 
@@ -28,6 +34,24 @@ def build_attribute_level_recognizer_profile() -> AttributeLevelRecognizerProfil
     return AttributeLevelRecognizerProfile(brightness_profile=brightness_profile)
 
 
+def level_icons_region(
+    resolution_profile: ResolutionProfile, margin: int = 8
+) -> Region:
+    """
+    包含所有等级图标采样点的最小矩形（向外扩展 `margin` 像素以容纳采样半径）。
+
+    截取此区域而非整个客户区即可完成等级识别（以 `FrameContext.origin` 标明其位置）。
+    """
+    points = [p for row in resolution_profile.STATS_LEVEL_ICON_POINTS for p in row]
+    return Region(
+        Point(min(p.x for p in points) - margin, min(p.y for p in points) - margin),
+        Point(
+            max(p.x for p in points) + margin + 1,
+            max(p.y for p in points) + margin + 1,
+        ),
+    )
+
+
 class AttributeLevelRecognizer:
     """
     Recognizes the level of an attribute based on the brightness of
@@ -46,9 +70,31 @@ class AttributeLevelRecognizer:
     def __str__(self) -> str:
         return f"[{self.name}]"
 
+    def recognize_levels(
+        self,
+        image: MatLike | FrameContext,
+        resolution_profile: ResolutionProfile,
+    ) -> list[int | None]:
+        """
+        一次性识别所有属性的等级。
+
+        所有等级图标的亮度通过一次批量采样得到；每个属性从第一个图标开始计数，
+        遇到第一个暗色图标即停止（假设白色图标是连续的）。
+
+        Args:
+            image: 全局图像（客户区截图），或包含等级图标的局部帧（FrameContext，带有 origin）。
+            resolution_profile: 当前分辨率的布局配置，提供等级图标坐标。
+
+        Returns:
+            每个属性的等级 (1-6) 或 None（识别失败），顺序与 `STATS_LEVEL_ICON_POINTS` 一致。
+        """
+        return self._count_active_icons(
+            image, resolution_profile.STATS_LEVEL_ICON_POINTS
+        )
+
     def recognize_level(
         self,
-        image: MatLike,
+        image: MatLike | FrameContext,
         stat_index: int,
         resolution_profile: ResolutionProfile,
     ) -> int | None:
@@ -56,27 +102,34 @@ class AttributeLevelRecognizer:
         根据属性索引识别等级。
 
         Args:
-            image: 全局图像（客户区截图）。
+            image: 全局图像（客户区截图），或包含等级图标的局部帧（FrameContext，带有 origin）。
+                传入 FrameContext 时灰度图只计算一次，可在多个属性之间复用。
             stat_index: 属性索引 (0, 1, 2)。
             resolution_profile: 当前分辨率的布局配置，提供等级图标坐标。
 
         Returns:
             等级 (1-6) 或 None（识别失败）。
         """
-        gray = to_gray_image(image)
         icon_points = resolution_profile.STATS_LEVEL_ICON_POINTS[stat_index]
-
-        # 检测每个图标的状态
-        active_count = 0
-        for p in icon_points:
-            is_active = self._brightness_detector.is_bright(gray, p)
-            if is_active:
-                active_count += 1
-            else:
-                # 假设白色图标是连续的，遇到暗色后停止计数
-                break
-
-        # 根据激活图标数量返回等级
-        if active_count > 0:
-            return active_count
-        return None
+        return self._count_active_icons(image, [icon_points])[0]
+
+    def _count_active_icons(
+        self, image: MatLike | FrameContext, icon_rows: Sequence[Sequence[Point]]
+    ) -> list[int | None]:
+        frame = FrameContext.of(image)
+        origin = frame.origin
+        local_points = [
+            Point(p.x - origin.x, p.y - origin.y) for row in icon_rows for p in row
+        ]
+        is_active = self._brightness_detector.is_bright_many(frame.gray, local_points)
+
+        levels: list[int | None] = []
+        start = 0
+        for row in icon_rows:
+            row_active = is_active[start : start + len(row)]
+            start += len(row)
+            # 遇到第一个暗色图标后停止计数
+            active_count = int(np.cumprod(row_active).sum())
+            # 根据激活图标数量返回等级
+            levels.append(active_count if active_count > 0 else None)
+        return levels
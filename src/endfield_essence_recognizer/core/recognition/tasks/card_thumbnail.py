@@ -0,0 +1,115 @@
+"""
+Fingerprint the cards of the essence grid with small thumbnails.
+
+The scanner compares thumbnails to line up consecutive pages after scrolling and to
+tell empty slots (a flat background) from occupied cards.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+from cv2.typing import MatLike
+
+from endfield_essence_recognizer.core.layout.base import (
+    Point,
+    Region,
+    ResolutionProfile,
+)
+from endfield_essence_recognizer.core.recognition.frame import FrameContext
+from endfield_essence_recognizer.core.recognition.tasks.grid_rarity import (
+    grid_centers,
+)
+from endfield_essence_recognizer.utils.image import union_region
+
+
+@dataclass(frozen=True)
+class CardThumbnailProfile:
+    """
+    Configuration for CardThumbnailer.
+    """
+
+    size: int = 16
+    """缩略图边长。"""
+    inset_ratio: float = 0.1
+    """裁掉卡片每条边的比例，避开选中卡片时出现的高亮边框。"""
+    empty_std_threshold: float = 4.0
+    """缩略图像素标准差低于此值时视为空格子（只有背景）。"""
+    match_threshold: int = 24
+    """
+    两张缩略图逐像素的最大差值低于此值时视为同一张卡片。
+    使用最大值而不是平均值，使锁定标记等局部变化不会被其余相同的像素掩盖。
+    """
+
+
+def build_card_thumbnail_profile() -> CardThumbnailProfile:
+    """
+    Build the configuration for card thumbnails.
+    """
+    return CardThumbnailProfile()
+
+
+class CardThumbnailer:
+    """
+    为网格中的基质卡片生成缩略图指纹。
+    """
+
+    def __init__(self, name: str, profile: CardThumbnailProfile) -> None:
+        self.name = name
+        self.profile = profile
+
+    def __str__(self) -> str:
+        return f"[{self.name}]"
+
+    def card_regions(self, centers: Sequence[Point], card_size: int) -> list[Region]:
+        """每张卡片去掉边框后的区域。"""
+        half = card_size // 2 - int(card_size * self.profile.inset_ratio)
+        return [
+            Region(
+                Point(center.x - half, center.y - half),
+                Point(center.x + half, center.y + half),
+            )
+            for center in centers
+        ]
+
+    def grid_region(self, resolution_profile: ResolutionProfile) -> Region:
+        """包含网格中所有卡片区域的最小矩形，截取此区域即可生成整页缩略图。"""
+        return union_region(
+            self.card_regions(
+                grid_centers(resolution_profile), resolution_profile.ESSENCE_CARD_SIZE
+            )
+        )
+
+    def thumbnails(
+        self,
+        image: MatLike | FrameContext,
+        centers: Sequence[Point],
+        card_size: int,
+    ) -> np.ndarray:
+        """
+        生成每张卡片的缩略图，形状为 (卡片数, size, size, 3)。
+
+        Args:
+            image: 截图。传入 FrameContext 时使用其 origin 将坐标换算到图像内。
+            centers: 卡片中心点（客户区坐标），卡片区域必须完整地位于截图内。
+            card_size: 卡片边长。
+        """
+        frame = FrameContext.of(image)
+        size = self.profile.size
+        result = np.empty((len(centers), size, size, 3), dtype=np.uint8)
+        for k, region in enumerate(self.card_regions(centers, card_size)):
+            result[k] = cv2.resize(
+                frame.crop(region).image, (size, size), interpolation=cv2.INTER_AREA
+            )
+        return result
+
+    def is_empty(self, thumbnails: np.ndarray) -> np.ndarray:
+        """每张缩略图是否为空格子。"""
+        flat = thumbnails.reshape(len(thumbnails), -1).astype(np.float32)
+        return flat.std(axis=1) < self.profile.empty_std_threshold
+
+    def matches(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """逐张比较两组形状相同的缩略图，返回每对是否为同一张卡片。"""
+        diff = np.abs(a.astype(np.int16) - b.astype(np.int16))
+        return diff.reshape(len(a), -1).max(axis=1) < self.profile.match_threshold
@@ -0,0 +1,191 @@
+"""
+Read the rarity of every card in the essence grid from a single frame.
+
+Each card has a colored strip along its bottom edge. The classifier samples that strip
+for all cards at once, keeps the most saturated pixels of each strip and assigns the
+nearest rarity color, so the scanner can skip cards without clicking them.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+from cv2.typing import MatLike
+
+from endfield_essence_recognizer.core.layout.base import (
+    Point,
+    Region,
+    ResolutionProfile,
+)
+from endfield_essence_recognizer.core.recognition.frame import FrameContext
+from endfield_essence_recognizer.core.recognition.tasks.essence_rarity import (
+    RarityLabel,
+)
+from endfield_essence_recognizer.utils.image import union_region
+from endfield_essence_recognizer.utils.log import logger
+
+
+@dataclass(frozen=True)
+class GridRarityProfile:
+    """
+    Configuration for GridRarityClassifier.
+
+    参数与 `scripts/test_layout_anchoring.py` 中验证过的采样方式一致。
+    """
+
+    colors: dict[int, tuple[int, int, int]]
+    """各星级卡片底部颜色条的颜色 (BGR)。"""
+    strip_height: int = 6
+    """采样条高度。"""
+    inset_bottom: int = -1
+    """采样条底边距卡片底边的内缩距离（正值向上）。"""
+    width_ratio: float = 0.5
+    """采样条宽度占卡片宽度的比例（居中）。"""
+    saturation_top_ratio: float = 0.3
+    """只取饱和度最高的这部分像素计算平均颜色。"""
+    max_distance: float = 80.0
+    """平均颜色与最近的星级颜色的距离超过此值时视为无法识别。"""
+
+
+def build_grid_rarity_profile() -> GridRarityProfile:
+    """
+    Build the configuration for grid rarity classification.
+    """
+    return GridRarityProfile(
+        colors={
+            1: (155, 155, 155),  # #9B9B9B gray
+            2: (66, 206, 171),  # #ABCE42 green
+            3: (253, 187, 38),  # #26BBFD blue
+            4: (250, 82, 148),  # #9452FA purple
+            5: (3, 187, 255),  # #FFBB03 gold
+            6: (0, 113, 255),  # #FF7100 orange
+        }
+    )
+
+
+class GridRarityClassifier:
+    """
+    一次性识别网格中所有基质卡片的稀有度。
+    """
+
+    def __init__(self, name: str, profile: GridRarityProfile) -> None:
+        self.name = name
+        self.profile = profile
+        self._stars = list(profile.colors)
+        self._palette = np.array(list(profile.colors.values()), dtype=np.float32)
+
+    def __str__(self) -> str:
+        return f"[{self.name}]"
+
+    def strip_regions(self, centers: Sequence[Point], card_size: int) -> list[Region]:
+        """每张卡片底部的采样区域。"""
+        profile = self.profile
+        half = card_size // 2
+        half_width = int(card_size * profile.width_ratio / 2)
+        regions: list[Region] = []
+        for center in centers:
+            y1 = center.y + half - profile.inset_bottom
+            regions.append(
+                Region(
+                    Point(center.x - half_width, y1 - profile.strip_height),
+                    Point(center.x + half_width, y1),
+                )
+            )
+        return regions
+
+    def grid_region(self, resolution_profile: ResolutionProfile) -> Region:
+        """包含网格中所有卡片采样区域的最小矩形，截取此区域即可完成分类。"""
+        return union_region(
+            self.strip_regions(
+                grid_centers(resolution_profile), resolution_profile.ESSENCE_CARD_SIZE
+            )
+        )
+
+    def classify_stars(
+        self,
+        image: MatLike | FrameContext,
+        centers: Sequence[Point],
+        card_size: int,
+    ) -> list[int | None]:
+        """
+        识别每张卡片的星级；采样区域超出图像或颜色不接近任何星级时为 None。
+
+        Args:
+            image: 截图。传入 FrameContext 时使用其 origin 将坐标换算到图像内。
+            centers: 卡片中心点（客户区坐标）。
+            card_size: 卡片边长。
+        """
+        frame = FrameContext.of(image)
+        if not centers:
+            return []
+
+        regions = self.strip_regions(centers, card_size)
+        height, width = frame.image.shape[:2]
+        x0 = np.array([r.x0 for r in regions]) - frame.origin.x
+        y0 = np.array([r.y0 for r in regions]) - frame.origin.y
+        strip_w = regions[0].x1 - regions[0].x0
+        strip_h = regions[0].y1 - regions[0].y0
+        in_bounds = (
+            (x0 >= 0) & (y0 >= 0) & (x0 + strip_w <= width) & (y0 + strip_h <= height)
+        )
+
+        # 以花式索引一次性取出所有采样条：(卡片数, 高, 宽, 3)
+        ys = np.clip(y0[:, None] + np.arange(strip_h)[None, :], 0, height - 1)
+        xs = np.clip(x0[:, None] + np.arange(strip_w)[None, :], 0, width - 1)
+        strips = frame.image[ys[:, :, None], xs[:, None, :]]
+
+        count = len(regions)
+        pixels = strips.reshape(count, strip_h * strip_w, 3)
+        saturation = cv2.cvtColor(
+            strips.reshape(count * strip_h, strip_w, 3), cv2.COLOR_BGR2HSV
+        )[..., 1].reshape(count, strip_h * strip_w)
+
+        keep = max(1, int(strip_h * strip_w * self.profile.saturation_top_ratio))
+        top = np.argpartition(saturation, -keep, axis=1)[:, -keep:]
+        mean_bgr = np.take_along_axis(pixels, top[..., None], axis=1).mean(axis=1)
+
+        distances = np.linalg.norm(
+            mean_bgr[:, None, :] - self._palette[None, :, :], axis=2
+        )
+        nearest = distances.argmin(axis=1)
+        nearest_distance = distances[np.arange(count), nearest]
+
+        stars: list[int | None] = []
+        for k in range(count):
+            if not in_bounds[k] or nearest_distance[k] > self.profile.max_distance:
+                stars.append(None)
+            else:
+                stars.append(self._stars[nearest[k]])
+        logger.trace(f"{self} 网格星级: {stars}")
+        return stars
+
+    def classify(
+        self,
+        image: MatLike | FrameContext,
+        centers: Sequence[Point],
+        card_size: int,
+    ) -> list[RarityLabel | None]:
+        """识别每张卡片的稀有度标签；无法识别时为 None。"""
+        return [
+            None if star is None else star_to_rarity(star)
+            for star in self.classify_stars(image, centers, card_size)
+        ]
+
+
+def grid_centers(resolution_profile: ResolutionProfile) -> list[Point]:
+    """网格中所有卡片的中心点，逐行排列（与扫描顺序一致）。"""
+    return [
+        Point(x, y)
+        for y in resolution_profile.essence_icon_y_list
+        for x in resolution_profile.essence_icon_x_list
+    ]
+
+
+def star_to_rarity(star: int) -> RarityLabel:
+    """星级 → 稀有度标签。"""
+    if star == 5:
+        return RarityLabel.FIVE
+    if star == 4:
+        return RarityLabel.FOUR
+    return RarityLabel.OTHER
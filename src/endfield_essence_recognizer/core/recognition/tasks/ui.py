@@ -5,6 +5,9 @@ Detect which UI scene we are currently in.
 import importlib.resources
 from enum import StrEnum
 
+from endfield_essence_recognizer.core.recognition.fingerprint_cache import (
+    FingerprintCacheProfile,
+)
 from endfield_essence_recognizer.core.recognition.template_recognizer import (
     RecognitionProfile,
     TemplateDescriptor,
@@ -36,4 +39,5 @@ def build_ui_scene_profile() -> RecognitionProfile[UISceneLabel]:
         templates=templates,
         high_threshold=0.8,
         low_threshold=0.8,
+        fingerprint_cache=FingerprintCacheProfile(max_entries=64),
     )
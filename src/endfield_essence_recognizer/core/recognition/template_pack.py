@@ -0,0 +1,258 @@
+"""
+Precompiled template pack for fast recognizer startup.
+
+Loading a recognizer decodes every template PNG and runs the profile's template
+preprocessing on it. The template pack stores the decoded, preprocessed templates of all
+recognizers in a single binary file, built once at build time. Recognizers map the file
+into memory and use views of it as their templates, so startup needs neither PNG
+decoding nor preprocessing.
+
+File layout: `MAGIC`, the format version and the index length (two little-endian
+uint32), the JSON index, then the template pixels. Pixel data starts at an aligned
+offset and every template within it is aligned as well. For every recognizer the index
+records one digest of its template set (labels and source PNGs) and one of the
+preprocessing function; a recognizer whose templates or preprocessing changed since the
+pack was built falls back to loading its PNG files. Frozen builds ship the pack and the
+PNG files together, so they trust the pack without reading the PNG files.
+"""
+
+import hashlib
+import importlib.resources
+import json
+import struct
+import sys
+from collections.abc import Callable, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+import cv2
+import numpy as np
+from cv2.typing import MatLike
+
+from endfield_essence_recognizer.core.recognition.template_recognizer import (
+    RecognitionProfile,
+    TemplateDescriptor,
+)
+from endfield_essence_recognizer.utils.cache import locked_cache
+from endfield_essence_recognizer.utils.image import load_image
+from endfield_essence_recognizer.utils.log import logger
+
+TEMPLATE_PACK_FORMAT_VERSION = 2
+"""模板包文件格式版本，格式变化时旧文件会被忽略。"""
+
+MAGIC = b"EERTPACK"
+"""模板包文件头。"""
+
+_HEADER = struct.Struct("<8sII")
+_ALIGNMENT = 64
+
+
+def _data_start(index_size: int) -> int:
+    """模板像素数据在文件中的起始位置（对齐到 `_ALIGNMENT`）。"""
+    end = _HEADER.size + index_size
+    return end + -end % _ALIGNMENT
+
+
+def default_template_pack_path() -> Path | None:
+    """
+    包内模板包文件的路径。包不在文件系统中（无法内存映射）时返回 None。
+    """
+    path = importlib.resources.files("endfield_essence_recognizer") / "templates"
+    if not isinstance(path, Path):
+        return None
+    return path / "templates.pack"
+
+
+def sources_digest(templates: Sequence[TemplateDescriptor[Any]]) -> str:
+    """一组模板的标签与源文件内容的摘要。"""
+    digest = hashlib.blake2b(digest_size=16)
+    for descriptor in templates:
+        content = descriptor.path.read_bytes()
+        digest.update(f"{descriptor.label}\0{len(content)}\0".encode())
+        digest.update(content)
+    return digest.hexdigest()
+
+
+def preprocess_digest(preprocess: Callable[[MatLike], MatLike]) -> str:
+    """
+    预处理函数的摘要（限定名与字节码），预处理函数被修改后摘要随之变化。
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(getattr(preprocess, "__module__", "").encode())
+    digest.update(getattr(preprocess, "__qualname__", repr(preprocess)).encode())
+    code = getattr(preprocess, "__code__", None)
+    if code is not None:
+        digest.update(code.co_code)
+        consts = [c for c in code.co_consts if not hasattr(c, "co_code")]
+        digest.update(repr(consts).encode())
+    return digest.hexdigest()
+
+
+class TemplatePack:
+    """
+    内存映射的模板包。模板以只读视图的形式返回，不复制像素数据。
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        index: dict[str, Any],
+        data: np.ndarray,
+        verify_sources: bool = True,
+    ) -> None:
+        """
+        Args:
+            path: 模板包文件路径。
+            index: 模板包的索引。
+            data: 模板像素数据（内存映射）。
+            verify_sources: 是否读取模板源文件，确认模板在构建模板包后没有变化。
+        """
+        self.path = path
+        self.verify_sources = verify_sources
+        self._recognizers: dict[str, Any] = index["recognizers"]
+        self._data = data
+
+    def __str__(self) -> str:
+        return f"[TemplatePack {self.path.name}]"
+
+    @classmethod
+    def load(cls, path: Path, verify_sources: bool = True) -> "TemplatePack | None":
+        """
+        打开模板包文件。文件不存在、损坏或版本不一致时返回 None。
+
+        Args:
+            path: 模板包文件路径。
+            verify_sources: 是否读取模板源文件，确认模板在构建模板包后没有变化。
+        """
+        if not path.exists():
+            return None
+        try:
+            data = np.memmap(path, dtype=np.uint8, mode="r")
+            magic, version, index_size = _HEADER.unpack_from(data)
+            if magic != MAGIC or version != TEMPLATE_PACK_FORMAT_VERSION:
+                logger.debug(f"模板包版本不一致，忽略: {path}")
+                return None
+            start = _HEADER.size
+            index = json.loads(bytes(data[start : start + index_size]))
+        except (OSError, ValueError, struct.error) as e:
+            logger.warning(f"无法读取模板包 {path}: {e}")
+            return None
+        return cls(
+            path,
+            index,
+            data[_data_start(index_size) :].view(np.ndarray),
+            verify_sources,
+        )
+
+    def templates_for[LabelT](
+        self, name: str, profile: RecognitionProfile[LabelT]
+    ) -> list[tuple[LabelT, np.ndarray]] | None:
+        """
+        取出识别器的预处理后模板。
+
+        Args:
+            name: 识别器名称。
+            profile: 识别器的配置，用于确认模板包中的模板没有过期。
+
+        Returns:
+            与 `profile.templates` 顺序一致的 (标签, 模板) 列表；模板包中没有该识别器，
+            或模板源文件、预处理函数在构建模板包后有变化时返回 None。
+        """
+        entry = self._recognizers.get(name)
+        if entry is None:
+            return None
+        if entry["preprocess"] != preprocess_digest(profile.preprocess_template):
+            logger.debug(f"{self} {name} 的模板预处理已变化")
+            return None
+        records = entry["templates"]
+        if [record["label"] for record in records] != [
+            str(descriptor.label) for descriptor in profile.templates
+        ]:
+            logger.debug(f"{self} {name} 的模板列表已变化")
+            return None
+        if self.verify_sources:
+            try:
+                digest = sources_digest(profile.templates)
+            except OSError:
+                return None
+            if entry["sources"] != digest:
+                logger.debug(f"{self} {name} 的模板已变化")
+                return None
+
+        templates: list[tuple[LabelT, np.ndarray]] = []
+        for descriptor, record in zip(profile.templates, records, strict=True):
+            dtype = np.dtype(record["dtype"])
+            shape = tuple(record["shape"])
+            size = int(np.prod(shape)) * dtype.itemsize
+            offset = record["offset"]
+            if offset + size > self._data.size:
+                return None
+            view = self._data[offset : offset + size].view(dtype).reshape(shape)
+            templates.append((descriptor.label, view))
+        return templates
+
+
+def build_template_pack(
+    path: Path, profiles: Mapping[str, RecognitionProfile[Any]]
+) -> int:
+    """
+    构建模板包：解码并预处理所有识别器的模板，写入单个文件。
+
+    Args:
+        path: 模板包文件路径。
+        profiles: 识别器名称 → 识别器配置。
+
+    Returns:
+        写入的模板数量。
+    """
+    recognizers: dict[str, Any] = {}
+    blobs: list[bytes] = []
+    offset = 0
+    for name, profile in profiles.items():
+        records: list[dict[str, Any]] = []
+        for descriptor in profile.templates:
+            image = load_image(descriptor.path.read_bytes(), cv2.IMREAD_GRAYSCALE)
+            template = np.ascontiguousarray(profile.preprocess_template(image))
+            records.append(
+                {
+                    "label": str(descriptor.label),
+                    "offset": offset,
+                    "shape": list(template.shape),
+                    "dtype": template.dtype.str,
+                }
+            )
+            blob = template.tobytes()
+            blobs.append(blob + bytes(-len(blob) % _ALIGNMENT))
+            offset += len(blobs[-1])
+        recognizers[name] = {
+            "preprocess": preprocess_digest(profile.preprocess_template),
+            "sources": sources_digest(profile.templates),
+            "templates": records,
+        }
+
+    index = json.dumps({"recognizers": recognizers}).encode()
+    data_start = _data_start(len(index))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("wb") as f:
+        f.write(_HEADER.pack(MAGIC, TEMPLATE_PACK_FORMAT_VERSION, len(index)))
+        f.write(index)
+        f.write(bytes(data_start - _HEADER.size - len(index)))
+        for blob in blobs:
+            f.write(blob)
+    tmp_path.replace(path)
+    return len(blobs)
+
+
+@locked_cache
+def load_default_template_pack() -> TemplatePack | None:
+    """
+    打开包内的模板包；尚未构建时返回 None，识别器从 PNG 文件加载模板。
+
+    打包后的程序中模板包与模板源文件在同一次构建中生成，不再读取源文件核对。
+    """
+    path = default_template_pack_path()
+    if path is None:
+        return None
+    return TemplatePack.load(path, verify_sources=not getattr(sys, "frozen", False))
@@ -1,16 +1,32 @@
+import hashlib
 import importlib.resources
 import importlib.resources.abc as importlib_abc
 from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass, field
+from enum import StrEnum
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import cv2
 from cv2.typing import MatLike
 
+from endfield_essence_recognizer.core.recognition.batched_matcher import (
+    BatchedTemplateMatcher,
+)
+from endfield_essence_recognizer.core.recognition.fingerprint_cache import (
+    FingerprintCache,
+    FingerprintCacheProfile,
+)
+from endfield_essence_recognizer.core.recognition.frame import FrameContext
 from endfield_essence_recognizer.utils.image import load_image
 from endfield_essence_recognizer.utils.log import logger, str_properties_and_attrs
 
+if TYPE_CHECKING:
+    from endfield_essence_recognizer.core.recognition.template_pack import (
+        TemplatePack,
+    )
+
 
 @dataclass(frozen=True)
 class TemplateDescriptor[LabelT]:
@@ -22,6 +38,15 @@ class TemplateDescriptor[LabelT]:
     """The label associated with this template."""
 
 
+class TemplateMatchingMode(StrEnum):
+    """模板匹配引擎。"""
+
+    SEQUENTIAL = "sequential"
+    """逐个模板调用 `cv2.matchTemplate`。"""
+    BATCHED = "batched"
+    """使用 `BatchedTemplateMatcher` 一次性匹配所有模板，适合大量同尺寸模板。"""
+
+
 @dataclass
 class RecognitionProfile[LabelT]:
     """实例化 TemplateRecognizer 所需的配置。"""
@@ -40,6 +65,10 @@ class RecognitionProfile[LabelT]:
         default_factory=lambda: lambda x: x
     )
     """Preprocessing function for template images."""
+    matching_mode: TemplateMatchingMode = TemplateMatchingMode.SEQUENTIAL
+    """Template matching engine. Both engines return the same labels and scores."""
+    fingerprint_cache: FingerprintCacheProfile | None = None
+    """Exact-hit fingerprint cache in front of template matching. None disables it."""
 
 
 class TemplateRecognizer[LabelT]:
@@ -54,6 +83,8 @@ class TemplateRecognizer[LabelT]:
         self.name = name
         self.profile = profile
         self._templates: defaultdict[LabelT, list[MatLike]] = defaultdict(list)
+        self._batched_matcher: BatchedTemplateMatcher[LabelT] | None = None
+        self._fingerprint_cache: FingerprintCache[LabelT] | None = None
 
         logger.opt(lazy=True).debug(
             "Created {} with profile: {}",
@@ -65,8 +96,38 @@ class TemplateRecognizer[LabelT]:
     def __str__(self) -> str:
         return f"[{self.name}]"
 
-    def load_templates(self) -> None:
-        """从 profile 中加载所有模板。"""
+    def load_templates(self, pack: "TemplatePack | None" = None) -> None:
+        """
+        从 profile 中加载所有模板。
+
+        Args:
+            pack: 预编译的模板包。包中有该识别器且模板没有过期时直接使用包中的模板，
+                否则从 PNG 文件解码并预处理。
+        """
+        packed = (
+            pack.templates_for(self.name, self.profile) if pack is not None else None
+        )
+        if packed is not None:
+            logger.debug(f"{self} 从模板包加载 {len(packed)} 个模板")
+            for label, template in packed:
+                self._templates[label].append(template)
+        else:
+            self._load_template_images()
+
+        # 模板发生变化，批量匹配引擎需要重新构建
+        self._batched_matcher = None
+
+        if self.profile.fingerprint_cache is not None:
+            self._fingerprint_cache = FingerprintCache(
+                f"{self.name}.FingerprintCache",
+                self.profile.fingerprint_cache,
+                labels=list(self._templates),
+                signature=self.templates_signature(),
+            )
+            self._fingerprint_cache.load()
+
+    def _load_template_images(self) -> None:
+        """从 PNG 文件解码并预处理所有模板。"""
         logger.debug(f"{self} 正在加载 {len(self.profile.templates)} 个模板...")
         for descriptor in self.profile.templates:
             try:
@@ -82,19 +143,87 @@ class TemplateRecognizer[LabelT]:
             except Exception as e:
                 logger.error(f"{self} 加载模板图像失败 {descriptor.path}: {e}")
 
-    def recognize_roi(self, roi_image: MatLike) -> tuple[LabelT | None, float]:
+    def templates_signature(self) -> str:
+        """已加载模板（标签与像素）的签名，模板变化时签名随之变化。"""
+        digest = hashlib.blake2b(digest_size=16)
+        for label, templates in self._templates.items():
+            digest.update(str(label).encode())
+            for template in templates:
+                digest.update(str(template.shape).encode())
+                digest.update(template.tobytes())
+        return digest.hexdigest()
+
+    def save_fingerprint_cache(self) -> None:
+        """将指纹缓存写入磁盘（若启用了持久化）。"""
+        if self._fingerprint_cache is not None:
+            self._fingerprint_cache.save()
+
+    def _prepare_roi(self, roi_image: MatLike) -> MatLike:
+        """对 ROI 执行预处理，并转换为用于匹配的灰度图。"""
+        processed_roi = self.profile.preprocess_roi(roi_image)
+
+        # 如果处理后的 ROI 不是灰度图，则转换为灰度图以进行匹配
+        if len(processed_roi.shape) == 3:
+            processed_roi = cv2.cvtColor(processed_roi, cv2.COLOR_BGR2GRAY)
+        return processed_roi
+
+    def recognize_roi(
+        self, roi_image: MatLike | FrameContext
+    ) -> tuple[LabelT | None, float]:
         """
         识别 ROI 图像中的目标，返回 (标签, 分数)。
+
+        传入 FrameContext 时，预处理结果缓存在帧上，使用相同预处理的识别器之间共享。
         """
         if not self._templates:
             return None, 0.0
 
-        processed_roi = self.profile.preprocess_roi(roi_image)
+        if isinstance(roi_image, FrameContext):
+            processed_roi = roi_image.derive(
+                ("template_roi", self.profile.preprocess_roi), self._prepare_roi
+            )
+        else:
+            processed_roi = self._prepare_roi(roi_image)
 
-        # 如果处理后的 ROI 不是灰度图，则转换为灰度图以进行匹配
-        if len(processed_roi.shape) == 3:
-            processed_roi = cv2.cvtColor(processed_roi, cv2.COLOR_BGR2GRAY)
+        # 快速路径：完全相同的 ROI 直接返回之前的高置信度结果
+        fingerprint: str | None = None
+        if self._fingerprint_cache is not None:
+            fingerprint = self._fingerprint_cache.fingerprint(processed_roi)
+            cached = self._fingerprint_cache.get(fingerprint)
+            if cached is not None:
+                return cached
+
+        if self.profile.matching_mode == TemplateMatchingMode.BATCHED:
+            if self._batched_matcher is None:
+                self._batched_matcher = BatchedTemplateMatcher(
+                    f"{self.name}.BatchedTemplateMatcher", self._templates
+                )
+            best_label, best_score = self._batched_matcher.match(processed_roi)
+        else:
+            best_label, best_score = self._match_sequential(processed_roi)
+
+        if (
+            self._fingerprint_cache is not None
+            and fingerprint is not None
+            and best_score >= self.profile.high_threshold
+        ):
+            self._fingerprint_cache.put(fingerprint, best_label, best_score)
 
+        if best_score >= self.profile.high_threshold:
+            return best_label, best_score
+        elif best_score >= self.profile.low_threshold:
+            logger.warning(
+                f"{self} 匹配分数较低: 最佳匹配={best_label} 分数={best_score:.3f}"
+            )
+            return best_label, best_score
+        else:
+            logger.warning(
+                f"{self} 匹配分数很低: 最佳匹配={best_label} 分数={best_score:.3f}"
+            )
+            return None, best_score
+
+    def _match_sequential(self, processed_roi: MatLike) -> tuple[LabelT | None, float]:
+        """逐个模板匹配，返回最佳 (标签, 分数)。"""
         best_score = -1.0
         best_label: LabelT | None = None
 
@@ -118,21 +247,10 @@ class TemplateRecognizer[LabelT]:
                     best_score = max_val
                     best_label = label
 
-        if best_score >= self.profile.high_threshold:
-            return best_label, best_score
-        elif best_score >= self.profile.low_threshold:
-            logger.warning(
-                f"{self} 匹配分数较低: 最佳匹配={best_label} 分数={best_score:.3f}"
-            )
-            return best_label, best_score
-        else:
-            logger.warning(
-                f"{self} 匹配分数很低: 最佳匹配={best_label} 分数={best_score:.3f}"
-            )
-            return None, best_score
+        return best_label, best_score
 
     def recognize_roi_fallback(
-        self, roi_image: MatLike, fallback_label: LabelT
+        self, roi_image: MatLike | FrameContext, fallback_label: LabelT
     ) -> tuple[LabelT, float]:
         """
         识别 ROI 图像中的目标，若无匹配则返回 fallback_label。
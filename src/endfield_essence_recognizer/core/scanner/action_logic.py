@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from enum import Enum, auto
+from dataclasses import dataclass, replace
+from enum import Enum, StrEnum, auto
 
 from endfield_essence_recognizer.core.recognition import (
     AbandonStatusLabel,
@@ -18,12 +18,27 @@ class ActionType(Enum):
     CLICK_ABANDON = auto()
 
 
+class ActionOutcome(StrEnum):
+    """The verified result of performing an action."""
+
+    CONFIRMED = "confirmed"
+    """The button state flipped after the first click."""
+
+    RETRIED = "retried"
+    """The first click was dropped; the state flipped after clicking again."""
+
+    FAILED = "failed"
+    """The button state never reached the expected state."""
+
+
 @dataclass
 class ScannerAction:
     """Represents a physical action to take and the feedback to give."""
 
     type: ActionType
     log_message: str
+    outcome: ActionOutcome | None = None
+    """Set after the action was performed with verification."""
 
 
 def decide_actions(
@@ -119,3 +134,36 @@ def decide_actions(
         )
 
     return actions
+
+
+def apply_actions(data: EssenceData, actions: list[ScannerAction]) -> EssenceData:
+    """
+    Predict the state of the essence after the given actions have been performed.
+
+    Each CLICK_LOCK toggles the lock state and each CLICK_ABANDON toggles the abandon
+    state; uncertain ("maybe") labels are left as they are.
+
+    Args:
+        data: State of the essence before the actions.
+        actions: Actions returned by `decide_actions` for this essence.
+
+    Returns:
+        A copy of `data` with the lock and abandon labels updated.
+    """
+    lock_label, abandon_label = data.lock_label, data.abandon_label
+    for action in actions:
+        if action.type == ActionType.CLICK_LOCK:
+            lock_label = _TOGGLED_LOCK.get(lock_label, lock_label)
+        elif action.type == ActionType.CLICK_ABANDON:
+            abandon_label = _TOGGLED_ABANDON.get(abandon_label, abandon_label)
+    return replace(data, lock_label=lock_label, abandon_label=abandon_label)
+
+
+_TOGGLED_LOCK = {
+    LockStatusLabel.LOCKED: LockStatusLabel.NOT_LOCKED,
+    LockStatusLabel.NOT_LOCKED: LockStatusLabel.LOCKED,
+}
+_TOGGLED_ABANDON = {
+    AbandonStatusLabel.ABANDONED: AbandonStatusLabel.NOT_ABANDONED,
+    AbandonStatusLabel.NOT_ABANDONED: AbandonStatusLabel.ABANDONED,
+}
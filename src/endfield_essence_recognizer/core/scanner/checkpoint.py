@@ -0,0 +1,70 @@
+"""
+Checkpoints of interrupted scans.
+
+When a scan stops before reaching the end of the grid (the user pressed the hotkey or
+the game window lost focus), the scanner saves which essences were already processed
+together with the card thumbnails of the page it stopped on. A scan started with the
+resume option continues from there, provided the user settings are unchanged and the
+visible grid still matches the saved thumbnails.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from endfield_essence_recognizer.core.scanner.incremental import ScanRecord
+
+
+@dataclass
+class ScanCheckpoint:
+    """一次扫描的进度。"""
+
+    signature: str
+    """扫描签名（见 `compute_scan_signature`），用户设置或静态数据变化后进度失效。"""
+    paged: bool
+    """是否为翻页扫描。"""
+    scan_id: int | None = None
+    """扫描结果在 `ScanResultStore` 中的扫描 ID，继续扫描时写入同一次扫描。"""
+    page: int = 0
+    """当前页的页序号，从 0 开始。"""
+    row_offset: int = 0
+    """当前页第一行在整个库存中的行号。"""
+    records: dict[tuple[int, int], ScanRecord] = field(default_factory=dict)
+    """已处理的基质的结果，键为 (行, 列)，行为整个库存中的行号。"""
+    thumbnails: np.ndarray | None = None
+    """中断时当前页所有卡片的缩略图，用于确认继续扫描时网格没有变化。"""
+    updated_at: float = field(default_factory=time.time)
+
+    @property
+    def last_cell(self) -> tuple[int, int] | None:
+        """最后一个已处理的基质的 (行, 列)。"""
+        return max(self.records, default=None)
+
+
+class ScanCheckpointStore:
+    """
+    保存最近一次被中断的扫描的进度，供下一次扫描继续。
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._checkpoint: ScanCheckpoint | None = None
+
+    @property
+    def current(self) -> ScanCheckpoint | None:
+        """最近一次被中断的扫描的进度；没有时为 None。"""
+        with self._lock:
+            return self._checkpoint
+
+    def save(self, checkpoint: ScanCheckpoint) -> None:
+        """保存进度，替换之前的进度。"""
+        checkpoint.updated_at = time.time()
+        with self._lock:
+            self._checkpoint = checkpoint
+
+    def clear(self) -> None:
+        """清除进度（扫描完成后调用）。"""
+        with self._lock:
+            self._checkpoint = None
@@ -2,18 +2,22 @@
 Provides ScannerContext dataclass to hold Recognizers for the scanner.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from endfield_essence_recognizer.core.recognition import (
     AbandonStatusRecognizer,
     AttributeLevelRecognizer,
     AttributeRecognizer,
+    CardThumbnailer,
+    GridRarityClassifier,
     LockStatusRecognizer,
     RarityRecognizer,
     UISceneRecognizer,
     prepare_abandon_status_recognizer,
     prepare_attribute_level_recognizer,
     prepare_attribute_recognizer,
+    prepare_card_thumbnailer,
+    prepare_grid_rarity_classifier,
     prepare_lock_status_recognizer,
     prepare_rarity_recognizer,
     prepare_ui_scene_recognizer,
@@ -36,6 +40,20 @@ class ScannerContext:
     rarity_recognizer: RarityRecognizer
     ui_scene_recognizer: UISceneRecognizer
     static_game_data: StaticGameData
+    grid_rarity_classifier: GridRarityClassifier = field(
+        default_factory=prepare_grid_rarity_classifier
+    )
+    card_thumbnailer: CardThumbnailer = field(default_factory=prepare_card_thumbnailer)
+
+    def save_caches(self) -> None:
+        """Persist the recognizers' fingerprint caches (where persistence is enabled)."""
+        for recognizer in (
+            self.attr_recognizer,
+            self.abandon_status_recognizer,
+            self.lock_status_recognizer,
+            self.ui_scene_recognizer,
+        ):
+            recognizer.save_fingerprint_cache()
 
 
 def build_scanner_context(static_game_data: StaticGameData) -> ScannerContext:
@@ -50,4 +68,6 @@ def build_scanner_context(static_game_data: StaticGameData) -> ScannerContext:
         rarity_recognizer=prepare_rarity_recognizer(),
         ui_scene_recognizer=prepare_ui_scene_recognizer(),
         static_game_data=static_game_data,
+        grid_rarity_classifier=prepare_grid_rarity_classifier(),
+        card_thumbnailer=prepare_card_thumbnailer(),
     )
@@ -1,31 +1,95 @@
 import itertools
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from enum import StrEnum
+
+import numpy as np
 
 from endfield_essence_recognizer.core.interfaces import ImageSource, WindowActions
-from endfield_essence_recognizer.core.layout.base import ResolutionProfile
+from endfield_essence_recognizer.core.layout.base import (
+    Point,
+    Region,
+    ResolutionProfile,
+)
 from endfield_essence_recognizer.core.recognition import (
     AbandonStatusLabel,
     LockStatusLabel,
     RarityLabel,
 )
+from endfield_essence_recognizer.core.recognition.frame import FrameContext
+from endfield_essence_recognizer.core.recognition.tasks.attribute_level import (
+    level_icons_region,
+)
 from endfield_essence_recognizer.core.recognition.tasks.ui import UISceneLabel
 from endfield_essence_recognizer.core.scanner.action_logic import (
+    ActionOutcome,
     ActionType,
+    ScannerAction,
+    apply_actions,
     decide_actions,
 )
+from endfield_essence_recognizer.core.scanner.checkpoint import (
+    ScanCheckpoint,
+    ScanCheckpointStore,
+)
 from endfield_essence_recognizer.core.scanner.context import (
     ScannerContext,
 )
-from endfield_essence_recognizer.core.scanner.evaluate import evaluate_essence
+from endfield_essence_recognizer.core.scanner.evaluate import (
+    CompiledRules,
+    compile_rules,
+    plan_recognition,
+)
+from endfield_essence_recognizer.core.scanner.incremental import (
+    IncrementalScanStore,
+    ScanRecord,
+    compute_scan_signature,
+)
 from endfield_essence_recognizer.core.scanner.models import (
     EssenceData,
     EssenceQuality,
+    EvaluationResult,
+    RecognitionPlan,
+)
+from endfield_essence_recognizer.core.scanner.paging import (
+    PagingProfile,
+    choose_row_overlap,
+    expected_row_overlap,
+    row_overlap_candidates,
+)
+from endfield_essence_recognizer.core.scanner.plan import (
+    ActionPlan,
+    ActionPlanBoard,
+    PlanEntry,
+    PlanEntryStatus,
+    PlanStatus,
+)
+from endfield_essence_recognizer.core.scanner.recapture import (
+    RecaptureProfile,
+    RecaptureStats,
+    vote,
+)
+from endfield_essence_recognizer.core.scanner.result_store import ScanResultStore
+from endfield_essence_recognizer.core.scanner.settle import (
+    PanelSettleDetector,
+    PanelSettleProfile,
+)
+from endfield_essence_recognizer.core.scanner.verify import (
+    ActionVerifier,
+    ActionVerifyProfile,
 )
 from endfield_essence_recognizer.core.window.adapter import InMemoryImageSource
-from endfield_essence_recognizer.schemas.user_setting import UserSetting
+from endfield_essence_recognizer.schemas.user_setting import (
+    NonFiveStarBehavior,
+    UserSetting,
+)
 from endfield_essence_recognizer.services.user_setting_manager import UserSettingManager
 from endfield_essence_recognizer.utils.log import logger
 
+_FULL_RECOGNITION = RecognitionPlan()
+"""识别基质的所有字段。"""
+
 
 def check_scene(
     image_source: ImageSource, ctx: ScannerContext, profile: ResolutionProfile
@@ -57,54 +121,134 @@ def check_scene(
     return True
 
 
+@dataclass(frozen=True)
+class EssenceFrames:
+    """识别一个基质所需的全部截图区域。截取后即可脱离窗口独立识别。"""
+
+    stats: list[FrameContext]
+    """三个属性词条区域。"""
+    level: FrameContext
+    """属性等级图标区域。"""
+    rarity: FrameContext
+    """稀有度区域。"""
+    deprecate: FrameContext
+    """弃用按钮区域。"""
+    lock: FrameContext
+    """锁定按钮区域。"""
+
+
+def capture_essence_frames(
+    image_source: ImageSource, profile: ResolutionProfile
+) -> EssenceFrames:
+    """一次性批量截取识别基质所需的所有区域（规划器会把相邻区域合并为少量截图）。"""
+    level_region = level_icons_region(profile)
+    regions = [
+        profile.STATS_0_ROI,
+        profile.STATS_1_ROI,
+        profile.STATS_2_ROI,
+        profile.RARITY_ROI,
+        profile.DEPRECATE_BUTTON_ROI,
+        profile.LOCK_BUTTON_ROI,
+        level_region,
+    ]
+    (
+        *stat_frames,
+        rarity_frame,
+        deprecate_frame,
+        lock_frame,
+        level_frame,
+    ) = [
+        FrameContext(image, origin=region.p0)
+        for image, region in zip(
+            image_source.screenshot_many(regions), regions, strict=True
+        )
+    ]
+    return EssenceFrames(
+        stats=stat_frames,
+        level=level_frame,
+        rarity=rarity_frame,
+        deprecate=deprecate_frame,
+        lock=lock_frame,
+    )
+
+
 def recognize_essence(
     image_source: ImageSource,
     ctx: ScannerContext,
     profile: ResolutionProfile,
+    plan: RecognitionPlan = _FULL_RECOGNITION,
 ) -> EssenceData:
-    stats: list[str | None] = []
-    levels: list[int | None] = []
-
-    # 截取客户区全局截图用于等级检测和子区域裁剪
-    mem_source = InMemoryImageSource.cache_from(image_source)
-    full_screenshot = mem_source.screenshot()
-
-    rois = [profile.STATS_0_ROI, profile.STATS_1_ROI, profile.STATS_2_ROI]
+    return recognize_essence_frames(
+        capture_essence_frames(image_source, profile), ctx, profile, plan
+    )
 
-    for k, roi in enumerate(rois):
-        screenshot_image = mem_source.screenshot(roi)
-        attr, max_val = ctx.attr_recognizer.recognize_roi(screenshot_image)
-        stats.append(attr)
-        logger.debug(f"属性 {k} 识别结果: {attr} (分数: {max_val:.3f})")
 
-        # 识别等级（通过检测坐标点状态）
-        level_value = ctx.attr_level_recognizer.recognize_level(
-            full_screenshot, k, profile
+def recognize_button_states(
+    image_source: ImageSource,
+    ctx: ScannerContext,
+    profile: ResolutionProfile,
+) -> tuple[AbandonStatusLabel, LockStatusLabel]:
+    """只识别当前基质的弃用与锁定状态，用于在操作前后核对基质状态。"""
+    regions = [profile.DEPRECATE_BUTTON_ROI, profile.LOCK_BUTTON_ROI]
+    deprecate_frame, lock_frame = [
+        FrameContext(image, origin=region.p0)
+        for image, region in zip(
+            image_source.screenshot_many(regions), regions, strict=True
         )
-        levels.append(level_value)
+    ]
+    abandon_label, _ = ctx.abandon_status_recognizer.recognize_roi_fallback(
+        deprecate_frame, fallback_label=AbandonStatusLabel.MAYBE_ABANDONED
+    )
+    lock_label, _ = ctx.lock_status_recognizer.recognize_roi_fallback(
+        lock_frame, fallback_label=LockStatusLabel.MAYBE_LOCKED
+    )
+    return abandon_label, lock_label
 
-        if level_value is not None:
-            logger.debug(f"属性 {k} 等级识别结果: +{level_value}")
-        else:
-            logger.debug(f"属性 {k} 等级识别结果: 无法识别")
 
-    # 识别稀有度（通过检测颜色）
-    rarity_screenshot = mem_source.screenshot(profile.RARITY_ROI)
+def recognize_essence_frames(
+    frames: EssenceFrames,
+    ctx: ScannerContext,
+    profile: ResolutionProfile,
+    plan: RecognitionPlan = _FULL_RECOGNITION,
+) -> EssenceData:
+    """
+    识别已截取的基质区域。不访问窗口，可在后台线程中调用。
+
+    只识别 `plan` 要求的字段，其余字段为 None。
+    """
+    # 识别稀有度（通过检测颜色），以决定是否需要识别属性词条
     rarity_label, score = ctx.rarity_recognizer.recognize_roi_fallback(
-        rarity_screenshot, fallback_label=RarityLabel.OTHER
+        frames.rarity, fallback_label=RarityLabel.OTHER
     )
     logger.debug(f"稀有度识别结果: {rarity_label.value} (分数: {score:.3f})")
 
-    screenshot_image = mem_source.screenshot(profile.DEPRECATE_BUTTON_ROI)
+    recognize_stats = plan.non_five_star_stats or rarity_label == RarityLabel.FIVE
+    stats: list[str | None] = [None] * len(frames.stats)
+    levels: list[int | None] = [None] * len(frames.stats)
+
+    if recognize_stats and plan.levels:
+        # 识别等级（通过批量检测坐标点状态）
+        levels = ctx.attr_level_recognizer.recognize_levels(frames.level, profile)
+
+    for k, stat_frame in enumerate(frames.stats if recognize_stats else []):
+        attr, max_val = ctx.attr_recognizer.recognize_roi(stat_frame)
+        stats[k] = attr
+        logger.debug(f"属性 {k} 识别结果: {attr} (分数: {max_val:.3f})")
+
+        level_value = levels[k]
+        if level_value is not None:
+            logger.debug(f"属性 {k} 等级识别结果: +{level_value}")
+        elif plan.levels:
+            logger.debug(f"属性 {k} 等级识别结果: 无法识别")
+
     abandon_label, max_val = ctx.abandon_status_recognizer.recognize_roi_fallback(
-        screenshot_image,
+        frames.deprecate,
         fallback_label=AbandonStatusLabel.MAYBE_ABANDONED,
     )
     logger.debug(f"弃用按钮识别结果: {abandon_label.value} (分数: {max_val:.3f})")
 
-    screenshot_image = mem_source.screenshot(profile.LOCK_BUTTON_ROI)
     locked_label, max_val = ctx.lock_status_recognizer.recognize_roi_fallback(
-        screenshot_image,
+        frames.lock,
         fallback_label=LockStatusLabel.MAYBE_LOCKED,
     )
     logger.debug(f"锁定按钮识别结果: {locked_label.value} (分数: {max_val:.3f})")
@@ -124,8 +268,8 @@ def recognize_essence(
             if i < len(levels) and levels[i] is not None:
                 stats_name_parts.append(f"{stat_name}+{levels[i]}")
             else:
-                stats_name_parts.append(stat_name)
-    stats_name = "、".join(stats_name_parts)
+                stats_name_parts.append(f"{stat_name}")
+    stats_name = "、".join(stats_name_parts) if recognize_stats else "未识别"
 
     rarity_text = {
         RarityLabel.FIVE: "<yellow>无瑕</>",
@@ -164,7 +308,7 @@ def recognize_once(
     ):
         return
 
-    evaluation = evaluate_essence(data, user_setting, ctx.static_game_data)
+    evaluation = compile_rules(user_setting, ctx.static_game_data).evaluate(data)
     # all logs use success for simplicity
     logger.opt(colors=True).success(evaluation.log_message)
 
@@ -218,12 +362,64 @@ class OneTimeRecognitionEngine:
         )
 
 
+type _PendingResult = tuple[Point, Future[tuple[EssenceData, EvaluationResult | None]]]
+"""已提交识别的基质：(基质图标位置, 识别与评估结果)。"""
+
+
+class ScanMode(StrEnum):
+    """基质扫描的执行方式。"""
+
+    SEQUENTIAL = "sequential"
+    """逐个基质依次执行 点击 → 等待 → 截图 → 识别 → 评估 → 操作。"""
+    PIPELINED = "pipelined"
+    """
+    流水线：截图后在后台线程识别与评估，同时点击并等待下一个基质；
+    需要锁定/弃用的基质在结果出来后按顺序回到该基质执行操作。
+    """
+    PLANNED = "planned"
+    """
+    先计划后执行：先以只读方式扫描所有基质并生成操作计划（可等待用户确认），
+    再只回到需要操作的基质批量执行锁定/弃用，并核对操作后的状态。
+    """
+
+
 class ScannerEngine:
     """
     基质图标扫描器引擎。
 
     此引擎负责自动遍历游戏界面中的 45 个基质图标位置，
     对每个位置执行"点击 -> 截图 -> 识别"的流程。
+
+    若提供 `settle_profile`，每次点击后会轮询右侧面板直到其变化并稳定，
+    而不是固定等待 0.3 秒；否则使用固定等待。
+
+    若提供 `action_verify_profile`，点击锁定/弃用按钮后会轮询按钮状态直到其变化，
+    状态没有变化时重新点击一次，并把结果记录在操作的 `outcome` 上。
+
+    若提供 `recapture_profile`，锁定/弃用状态识别不确定时会重新截取不确定的按钮区域，
+    在多帧之间投票确定状态，而不是直接跳过该基质。
+
+    `scan_mode` 为 `ScanMode.PIPELINED` 时，识别与评估在后台线程中进行，
+    与下一个基质的点击和等待重叠，吞吐量只受游戏界面刷新速度限制。
+
+    `scan_mode` 为 `ScanMode.PLANNED` 时，先只读扫描并把操作计划发布到
+    `action_plan_board`；若 `confirm_action_plan` 为 True，等待用户通过 API 确认后再执行。
+    翻页扫描时每页生成一个计划。
+
+    若提供 `paging_profile`，扫描完当前页后会滚动网格继续扫描，
+    直到遇到空格子或滚动后网格不再变化；翻页前后重叠的行不会重复扫描。
+
+    `skip_empty_cells` 为 True 时，扫描单页前先截取一次网格，根据卡片缩略图找出空格子，
+    只扫描第一个空格子之前的基质（翻页扫描总是如此）。
+
+    若提供 `incremental_store`，网格位置、卡片外观与库存数量都与上次扫描时相同的基质
+    直接沿用上次的结果，不再点击识别；只有新出现、移动或外观变化的基质会被完整扫描。
+
+    若提供 `result_store`，每次扫描的结果（包括沿用的结果）会在后台批量写入该存储，
+    以便之后按条件查询库存。
+
+    若提供 `checkpoint_store`，扫描中断时会保存已处理的基质与当前页的卡片缩略图；
+    `resume` 为 True 时，若用户设置未变化且网格与中断时一致，则跳过已处理的基质继续扫描。
     """
 
     def __init__(
@@ -233,12 +429,57 @@ class ScannerEngine:
         window_actions: WindowActions,
         user_setting_manager: UserSettingManager,
         profile: ResolutionProfile,
+        settle_profile: PanelSettleProfile | None = None,
+        fixed_delay: float = 0.3,
+        scan_mode: ScanMode = ScanMode.SEQUENTIAL,
+        paging_profile: PagingProfile | None = None,
+        incremental_store: IncrementalScanStore | None = None,
+        result_store: ScanResultStore | None = None,
+        action_plan_board: ActionPlanBoard | None = None,
+        confirm_action_plan: bool = False,
+        action_verify_profile: ActionVerifyProfile | None = None,
+        recapture_profile: RecaptureProfile | None = None,
+        checkpoint_store: ScanCheckpointStore | None = None,
+        resume: bool = False,
+        skip_empty_cells: bool = False,
     ) -> None:
         self.ctx: ScannerContext = ctx
         self._image_source = image_source
         self._window_actions = window_actions
         self._user_setting_manager: UserSettingManager = user_setting_manager
         self._profile: ResolutionProfile = profile
+        self._fixed_delay = fixed_delay
+        self._scan_mode = scan_mode
+        self._paging_profile = paging_profile
+        self._skip_empty_cells = skip_empty_cells
+        self._incremental_store = incremental_store
+        self._result_store = result_store
+        self._scan_id: int | None = None
+        """当前扫描在 `result_store` 中的 ID。"""
+        self._rules: CompiledRules | None = None
+        """根据当前扫描的用户设置快照编译的评估规则。"""
+        self._checkpoint_store = checkpoint_store
+        self._checkpoint: ScanCheckpoint | None = None
+        """当前扫描的进度。"""
+        self.resume = resume
+        """是否从 `checkpoint_store` 中保存的进度继续扫描。"""
+        self._action_plan_board = (
+            action_plan_board if action_plan_board is not None else ActionPlanBoard()
+        )
+        self._confirm_action_plan = confirm_action_plan
+        self._settle_detector: PanelSettleDetector | None = (
+            PanelSettleDetector("PanelSettleDetector", settle_profile)
+            if settle_profile is not None
+            else None
+        )
+        self._action_verifier: ActionVerifier | None = (
+            ActionVerifier("ActionVerifier", action_verify_profile)
+            if action_verify_profile is not None
+            else None
+        )
+        self._recapture_profile = recapture_profile
+        self.recapture_stats = RecaptureStats()
+        """最近一次扫描中重新截取的统计。"""
 
         from endfield_essence_recognizer.utils.log import str_properties_and_attrs
 
@@ -252,9 +493,258 @@ class ScannerEngine:
         Run the 9*5 grid scanning process with start/end logging.
         """
         logger.debug("ScannerEngine started execution.")
-        self._execute_grid_scan(stop_event)
+        try:
+            self._execute_grid_scan(stop_event)
+        finally:
+            self.ctx.save_caches()
+            if self._incremental_store is not None:
+                self._incremental_store.save()
         logger.debug("ScannerEngine finished execution.")
 
+    def _click_and_settle(
+        self, relative_x: int, relative_y: int, region: Region | None = None
+    ) -> None:
+        """
+        点击指定位置，并等待右侧面板完成刷新。
+
+        未启用面板稳定检测时，退化为点击后固定等待 `fixed_delay` 秒。
+
+        Args:
+            relative_x: 点击位置的 x 坐标。
+            relative_y: 点击位置的 y 坐标。
+            region: 需要监视的区域，默认为整个面板。点击锁定/弃用按钮时应只监视该按钮，
+                按钮图标的变化在整个面板的签名中几乎看不出来。
+        """
+        if self._settle_detector is None:
+            self._window_actions.click(relative_x, relative_y)
+            self._window_actions.wait(self._fixed_delay)
+            return
+
+        if region is None:
+            region = self._profile.AREA
+        baseline = self._settle_detector.capture_signature(self._image_source, region)
+        self._window_actions.click(relative_x, relative_y)
+        self._settle_detector.wait_until_settled(
+            self._image_source, self._window_actions, region, baseline
+        )
+
+    def _should_stop(self, stop_event: threading.Event) -> bool:
+        if not self._window_actions.target_is_active:
+            logger.info("终末地窗口不在前台，停止基质扫描。")
+            return True
+
+        if stop_event.is_set():
+            logger.info("基质扫描被中断。")
+            return True
+
+        return False
+
+    def _evaluate(
+        self, data: EssenceData, user_setting: UserSetting
+    ) -> EvaluationResult | None:
+        """评估识别结果；识别结果不确定时返回 None。"""
+        if (
+            data.abandon_label == AbandonStatusLabel.MAYBE_ABANDONED
+            or data.lock_label == LockStatusLabel.MAYBE_LOCKED
+        ):
+            # early continue on uncertain recognition
+            return None
+        return self._compiled_rules(user_setting).evaluate(data)
+
+    def _compiled_rules(self, user_setting: UserSetting) -> CompiledRules:
+        """用户设置快照对应的评估规则，每次扫描只编译一次。"""
+        rules = self._rules
+        if rules is None or rules.setting is not user_setting:
+            rules = compile_rules(user_setting, self.ctx.static_game_data)
+            self._rules = rules
+        return rules
+
+    def _needs_recapture(self, data: EssenceData) -> bool:
+        return self._recapture_profile is not None and (
+            data.abandon_label == AbandonStatusLabel.MAYBE_ABANDONED
+            or data.lock_label == LockStatusLabel.MAYBE_LOCKED
+        )
+
+    def _recapture_uncertain(self, data: EssenceData) -> EssenceData:
+        """
+        锁定/弃用状态识别不确定时，只重新截取不确定的按钮区域，并在多帧之间投票。
+        须在面板显示该基质时调用。仍无法确定时保留不确定的标签。
+        """
+        profile = self._recapture_profile
+        if profile is None or not self._needs_recapture(data):
+            return data
+
+        stats = self.recapture_stats
+        stats.essences += 1
+        abandon_label, lock_label = data.abandon_label, data.lock_label
+        abandon_readings: list[AbandonStatusLabel] = []
+        lock_readings: list[LockStatusLabel] = []
+        for _ in range(profile.max_frames):
+            abandon_uncertain = abandon_label == AbandonStatusLabel.MAYBE_ABANDONED
+            lock_uncertain = lock_label == LockStatusLabel.MAYBE_LOCKED
+            if not (abandon_uncertain or lock_uncertain):
+                break
+
+            self._window_actions.wait(profile.interval)
+            regions = [
+                roi
+                for roi, uncertain in (
+                    (self._profile.DEPRECATE_BUTTON_ROI, abandon_uncertain),
+                    (self._profile.LOCK_BUTTON_ROI, lock_uncertain),
+                )
+                if uncertain
+            ]
+            frames = iter(
+                FrameContext(image, origin=region.p0)
+                for image, region in zip(
+                    self._image_source.screenshot_many(regions), regions, strict=True
+                )
+            )
+            stats.frames += 1
+            if abandon_uncertain:
+                label, _ = self.ctx.abandon_status_recognizer.recognize_roi_fallback(
+                    next(frames), fallback_label=AbandonStatusLabel.MAYBE_ABANDONED
+                )
+                abandon_readings.append(label)
+                abandon_label = vote(
+                    abandon_readings, AbandonStatusLabel.MAYBE_ABANDONED, profile.votes
+                )
+            if lock_uncertain:
+                label, _ = self.ctx.lock_status_recognizer.recognize_roi_fallback(
+                    next(frames), fallback_label=LockStatusLabel.MAYBE_LOCKED
+                )
+                lock_readings.append(label)
+                lock_label = vote(
+                    lock_readings, LockStatusLabel.MAYBE_LOCKED, profile.votes
+                )
+
+        if (
+            abandon_label == AbandonStatusLabel.MAYBE_ABANDONED
+            or lock_label == LockStatusLabel.MAYBE_LOCKED
+        ):
+            logger.debug(
+                f"重新截取 {profile.max_frames} 帧后仍无法确定基质的锁定/弃用状态。"
+            )
+        else:
+            stats.recovered += 1
+
+        logger.opt(colors=True).info(
+            f"重新截图后的基质状态: <magenta>{abandon_label.value}</>, <magenta>{lock_label.value}</>"
+        )
+        return replace(data, abandon_label=abandon_label, lock_label=lock_label)
+
+    def _recognize_and_evaluate(
+        self, frames: EssenceFrames, user_setting: UserSetting
+    ) -> tuple[EssenceData, EvaluationResult | None]:
+        data = recognize_essence_frames(
+            frames, self.ctx, self._profile, self._recognition_plan(user_setting)
+        )
+        return data, self._evaluate(data, user_setting)
+
+    def _recognition_plan(self, user_setting: UserSetting) -> RecognitionPlan:
+        """
+        扫描时需要识别的字段：只识别评估与操作会用到的字段。
+        保存扫描结果时总是识别词条等级，以便之后按等级查询；等级只需一次批量亮度采样。
+        未识别的字段在保存的扫描结果中记为 NULL。
+        """
+        plan = plan_recognition(user_setting)
+        if self._result_store is not None:
+            plan = replace(plan, levels=True)
+        return plan
+
+    def _report(
+        self,
+        data: EssenceData,
+        evaluation: EvaluationResult | None,
+        user_setting: UserSetting,
+    ) -> list[ScannerAction]:
+        """输出评估结果，并返回需要执行的操作。"""
+        if evaluation is None:
+            return []
+
+        # Log the result
+        if evaluation.quality == EssenceQuality.TRASH and evaluation.matched_weapons:
+            logger.opt(colors=True).warning(evaluation.log_message)
+        else:
+            logger.opt(colors=True).success(evaluation.log_message)
+
+        # Decide actions
+        return decide_actions(data, evaluation, user_setting)
+
+    def _execute_actions(self, actions: list[ScannerAction], data: EssenceData) -> bool:
+        """
+        依次执行基质 `data` 的操作。返回是否所有操作都已生效（未核对时视为生效）。
+        """
+        succeeded = True
+        for action in actions:
+            if action.type == ActionType.CLICK_LOCK:
+                pos, roi = self._profile.LOCK_BUTTON_POS, self._profile.LOCK_BUTTON_ROI
+            elif action.type == ActionType.CLICK_ABANDON:
+                pos = self._profile.DEPRECATE_BUTTON_POS
+                roi = self._profile.DEPRECATE_BUTTON_ROI
+            else:
+                continue
+
+            verifier = self._action_verifier
+            if verifier is None:
+                self._click_and_settle(pos.x, pos.y, roi)
+                logger.success(action.log_message)
+                continue
+
+            expected = apply_actions(data, [action])
+            action.outcome = self._perform_verified(
+                verifier, action, pos, data, expected
+            )
+            if action.outcome == ActionOutcome.FAILED:
+                logger.warning(
+                    f"点击{'锁定' if action.type == ActionType.CLICK_LOCK else '弃用'}"
+                    "按钮后状态没有变化，操作可能没有生效。"
+                )
+                succeeded = False
+                break
+            if action.outcome == ActionOutcome.RETRIED:
+                logger.debug("第一次点击没有生效，已重新点击。")
+            logger.success(action.log_message)
+            data = expected
+        return succeeded
+
+    def _perform_verified(
+        self,
+        verifier: ActionVerifier,
+        action: ScannerAction,
+        pos: Point,
+        data: EssenceData,
+        expected: EssenceData,
+    ) -> ActionOutcome:
+        """点击操作对应的按钮，并轮询该按钮的状态直到其变为预期状态。"""
+
+        def click() -> None:
+            self._window_actions.click(pos.x, pos.y)
+
+        if action.type == ActionType.CLICK_LOCK:
+            lock_roi = self._profile.LOCK_BUTTON_ROI
+            return verifier.perform(
+                self._window_actions,
+                click,
+                lambda: self.ctx.lock_status_recognizer.recognize_roi_fallback(
+                    self._image_source.screenshot(lock_roi),
+                    fallback_label=LockStatusLabel.MAYBE_LOCKED,
+                )[0],
+                data.lock_label,
+                expected.lock_label,
+            )
+        deprecate_roi = self._profile.DEPRECATE_BUTTON_ROI
+        return verifier.perform(
+            self._window_actions,
+            click,
+            lambda: self.ctx.abandon_status_recognizer.recognize_roi_fallback(
+                self._image_source.screenshot(deprecate_roi),
+                fallback_label=AbandonStatusLabel.MAYBE_ABANDONED,
+            )[0],
+            data.abandon_label,
+            expected.abandon_label,
+        )
+
     def _execute_grid_scan(self, stop_event: threading.Event) -> None:
         """
         Actual execution logic for a 9*5 grid pass.
@@ -281,69 +771,739 @@ class ScannerEngine:
 
         # 获取当前用户设置的快照，用于接下来的判断
         user_setting = self._user_setting_manager.get_user_setting()
+        self._rules = compile_rules(user_setting, self.ctx.static_game_data)
+        self.recapture_stats = RecaptureStats()
+        if self._incremental_store is not None:
+            self._incremental_store.bind(
+                compute_scan_signature(user_setting, self.ctx.static_game_data)
+            )
+        self._checkpoint = checkpoint = self._start_checkpoint(user_setting)
 
-        icon_x_list = self._profile.essence_icon_x_list
-        icon_y_list = self._profile.essence_icon_y_list
+        completed = False
+        if self._result_store is not None:
+            if checkpoint is not None and checkpoint.scan_id is not None:
+                # 继续扫描时写入同一次扫描
+                self._scan_id = checkpoint.scan_id
+            else:
+                self._scan_id = self._result_store.begin_scan(
+                    levels_recognized=self._recognition_plan(user_setting).levels
+                )
+            if checkpoint is not None:
+                checkpoint.scan_id = self._scan_id
+        try:
+            if self._paging_profile is None:
+                completed = self._scan_page(user_setting, stop_event)
+            else:
+                completed = self._scan_pages(
+                    self._paging_profile, user_setting, stop_event
+                )
+        finally:
+            if self._result_store is not None and self._scan_id is not None:
+                self._result_store.finish_scan(self._scan_id, completed)
+                self._scan_id = None
+            if checkpoint is not None:
+                self._save_checkpoint(checkpoint, completed)
+                self._checkpoint = None
+
+        stats = self.recapture_stats
+        if stats.essences > 0:
+            logger.info(
+                f"有 {stats.essences} 个基质的锁定/弃用状态识别不确定，"
+                f"重新截取 {stats.frames} 帧后确定了其中 {stats.recovered} 个。"
+            )
 
-        for (i, relative_y), (j, relative_x) in itertools.product(
-            enumerate(icon_y_list), enumerate(icon_x_list)
+        if completed:
+            # 扫描完成
+            logger.info("基质扫描完成。")
+
+    def _start_checkpoint(self, user_setting: UserSetting) -> ScanCheckpoint | None:
+        """
+        开始记录本次扫描的进度。`resume` 为 True 且上次的进度仍然有效时沿用上次的进度。
+        未提供 `checkpoint_store` 时返回 None。
+        """
+        if self._checkpoint_store is None:
+            return None
+        signature = compute_scan_signature(user_setting, self.ctx.static_game_data)
+        paged = self._paging_profile is not None
+        if self.resume:
+            checkpoint = self._resume_checkpoint(self._checkpoint_store, signature)
+            if checkpoint is not None:
+                return checkpoint
+        return ScanCheckpoint(signature, paged)
+
+    def _resume_checkpoint(
+        self, store: ScanCheckpointStore, signature: str
+    ) -> ScanCheckpoint | None:
+        """取出可以继续的扫描进度；进度不存在或已失效时返回 None。"""
+        checkpoint = store.current
+        if checkpoint is None:
+            logger.info("没有可以继续的扫描进度，从头开始扫描。")
+            return None
+        if checkpoint.signature != signature or checkpoint.paged != (
+            self._paging_profile is not None
         ):
-            if not self._window_actions.target_is_active:
-                logger.info("终末地窗口不在前台，停止基质扫描。")
-                break
+            logger.info("用户设置、静态数据或扫描方式已变化，从头开始扫描。")
+            return None
+        if checkpoint.thumbnails is None or not bool(
+            self.ctx.card_thumbnailer.matches(
+                checkpoint.thumbnails, self._capture_thumbnails()
+            ).all()
+        ):
+            logger.warning(
+                "基质网格与上次中断时不一致（可能已滚动或库存已变化），从头开始扫描。"
+            )
+            return None
 
-            if stop_event.is_set():
-                logger.info("基质扫描被中断。")
-                break
+        message = f"继续上次的扫描，已处理 {len(checkpoint.records)} 个基质"
+        if (last := checkpoint.last_cell) is not None:
+            message += f"，上次处理到第 {last[0] + 1} 行第 {last[1] + 1} 列"
+        logger.info(f"{message}。")
+        return checkpoint
 
-            logger.info(f"正在扫描第 {i + 1} 行第 {j + 1} 列的基质...")
+    def _save_checkpoint(self, checkpoint: ScanCheckpoint, completed: bool) -> None:
+        """扫描完成时清除进度；中断时保存进度与当前页的卡片缩略图。"""
+        store = self._checkpoint_store
+        if store is None:
+            return
+        if completed:
+            store.clear()
+            return
+        checkpoint.thumbnails = self._capture_thumbnails()
+        store.save(checkpoint)
+        logger.info(
+            f"已保存扫描进度（已处理 {len(checkpoint.records)} 个基质），"
+            "下次可以选择继续扫描。"
+        )
 
-            # 点击基质图标位置
-            self._window_actions.click(relative_x, relative_y)
+    def _page_cells(self) -> list[tuple[int, int, Point]]:
+        """当前页所有基质图标的 (行, 列, 位置)，逐行排列。"""
+        return [
+            (i, j, Point(relative_x, relative_y))
+            for (i, relative_y), (j, relative_x) in itertools.product(
+                enumerate(self._profile.essence_icon_y_list),
+                enumerate(self._profile.essence_icon_x_list),
+            )
+        ]
+
+    def _scan_page(
+        self, user_setting: UserSetting, stop_event: threading.Event
+    ) -> bool:
+        """扫描当前页的基质。返回是否扫描了全部基质。"""
+        cells = self._page_cells()
+        inventory_count: int | None = None
+        if self._skip_empty_cells or self._incremental_store is not None:
+            before_empty, reached_end = self._cells_before_empty(
+                cells, self._capture_thumbnails()
+            )
+            if reached_end:
+                # 只有看到空格子时才能确定库存中的基质数量；满页之后可能还有基质
+                inventory_count = len(before_empty)
+            if self._skip_empty_cells:
+                cells = before_empty
+                if reached_end:
+                    logger.info(
+                        f"当前页只有 {len(cells)} 个基质，不再扫描之后的空格子。"
+                    )
+        return self._scan_cells(cells, inventory_count, user_setting, stop_event)
 
-            # 等待短暂时间以确保界面更新
-            self._window_actions.wait(0.3)
+    def _cells_before_empty(
+        self, cells: list[tuple[int, int, Point]], thumbnails: np.ndarray
+    ) -> tuple[list[tuple[int, int, Point]], bool]:
+        """
+        根据卡片缩略图截断到第一个空格子之前；库存按顺序排列，空格子之后不会再有基质。
 
-            # 识别基质信息
+        Args:
+            cells: 按网格顺序排列的 (行, 列, 位置)。
+            thumbnails: 与 `cells` 一一对应的卡片缩略图。
+
+        Returns:
+            (第一个空格子之前的基质, 是否遇到了空格子)。
+        """
+        empty = self.ctx.card_thumbnailer.is_empty(thumbnails)
+        if not empty.any():
+            return cells, False
+        return cells[: int(np.argmax(empty))], True
+
+    def _scan_cells(
+        self,
+        cells: list[tuple[int, int, Point]],
+        inventory_count: int | None,
+        user_setting: UserSetting,
+        stop_event: threading.Event,
+        scanned: dict[tuple[int, int], ScanRecord] | None = None,
+    ) -> bool:
+        """
+        按扫描方式扫描给定的基质。返回是否扫描了全部基质。
+
+        Args:
+            cells: 要扫描的 (行, 列, 位置)。
+            inventory_count: 库存中的基质数量，增量扫描以此确认库存没有变化；
+                尚未到达库存末尾、无法确定数量时为 None，此时不沿用上次扫描的结果。
+            user_setting: 用户设置。
+            stop_event: 停止事件。
+            scanned: 若提供，以 (行, 列) 为键写入得到的结果（包括沿用的结果）。
+
+        按设置跳过的非无瑕基质，以及操作计划中被拒绝、跳过或操作失败的基质，
+        只以扫描时的状态写入扫描结果数据库，下次扫描时仍会重新处理。
+        """
+        checkpoint = self._checkpoint
+        if checkpoint is not None and checkpoint.records:
+            remaining = [
+                (i, j, pos) for i, j, pos in cells if (i, j) not in checkpoint.records
+            ]
+            if len(remaining) < len(cells):
+                logger.info(
+                    f"跳过了 {len(cells) - len(remaining)} 个上次已处理的基质。"
+                )
+            cells = remaining
+        grid = {pos: (i, j) for i, j, pos in cells}
+        unresolved: dict[Point, tuple[EssenceData, EvaluationResult | None]] = {}
+        if user_setting.non_five_star_behavior == NonFiveStarBehavior.SKIP:
+            cells = self._skip_non_five_star_cells(cells, user_setting, unresolved)
+        reused: dict[Point, ScanRecord] = {}
+        if self._incremental_store is not None and inventory_count is not None:
+            cells = self._skip_unchanged_cells(
+                cells, inventory_count, self._incremental_store, reused
+            )
+
+        results: dict[Point, ScanRecord] = {}
+        try:
+            if self._scan_mode == ScanMode.PIPELINED:
+                return self._scan_pipelined(cells, user_setting, stop_event, results)
+            if self._scan_mode == ScanMode.PLANNED:
+                return self._scan_planned(
+                    cells, user_setting, stop_event, results, unresolved
+                )
+            return self._scan_sequential(cells, user_setting, stop_event, results)
+        finally:
+            if self._incremental_store is not None and results:
+                self._record_results(
+                    results, grid, inventory_count, self._incremental_store
+                )
+            records = reused | results
+            for pos in sorted(records.keys() | unresolved.keys(), key=grid.__getitem__):
+                i, j = grid[pos]
+                record = records.get(pos)
+                if record is None:
+                    if self._result_store is not None and self._scan_id is not None:
+                        self._result_store.add(self._scan_id, i, j, *unresolved[pos])
+                    continue
+                if checkpoint is not None:
+                    checkpoint.records[i, j] = record
+                if scanned is not None:
+                    scanned[i, j] = record
+                if self._result_store is not None and self._scan_id is not None:
+                    self._result_store.add(
+                        self._scan_id, i, j, record.data, record.evaluation
+                    )
+
+    def _capture_thumbnails(self, positions: list[Point] | None = None) -> np.ndarray:
+        """截取一次网格区域，生成指定卡片（默认为当前页所有卡片）的缩略图。"""
+        thumbnailer = self.ctx.card_thumbnailer
+        region = thumbnailer.grid_region(self._profile)
+        frame = FrameContext(self._image_source.screenshot(region), origin=region.p0)
+        if positions is None:
+            positions = [pos for _i, _j, pos in self._page_cells()]
+        return thumbnailer.thumbnails(frame, positions, self._profile.ESSENCE_CARD_SIZE)
+
+    def _skip_unchanged_cells(
+        self,
+        cells: list[tuple[int, int, Point]],
+        inventory_count: int,
+        store: IncrementalScanStore,
+        reused: dict[Point, ScanRecord],
+    ) -> list[tuple[int, int, Point]]:
+        """
+        排除位置、卡片外观与库存数量都与上次扫描时相同的基质，输出它们上次的评估结果，
+        并把沿用的结果写入 `reused`。
+
+        某个基质与上次不同时，之后的基质可能整体移动了位置，因此全部重新扫描。
+        """
+        if not cells:
+            return cells
+        thumbnails = self._capture_thumbnails([pos for _i, _j, pos in cells])
+
+        kept: list[tuple[int, int, Point]] = []
+        for (i, j, pos), thumbnail in zip(cells, thumbnails, strict=True):
+            record = None
+            if not kept:
+                record = store.lookup((i, j), thumbnail, inventory_count)
+            if record is None:
+                kept.append((i, j, pos))
+                continue
+            reused[pos] = record
+            logger.opt(colors=True).debug(
+                f"第 {i + 1} 行第 {j + 1} 列的基质与上次扫描时相同，跳过: "
+                f"{record.evaluation.log_message}"
+            )
+        logger.info(
+            f"跳过了 {len(cells) - len(kept)} 个与上次扫描时相同的基质，"
+            f"剩余 {len(kept)} 个基质需要扫描。"
+        )
+        return kept
+
+    def _record_results(
+        self,
+        results: dict[Point, ScanRecord],
+        grid: dict[Point, tuple[int, int]],
+        inventory_count: int | None,
+        store: IncrementalScanStore,
+    ) -> None:
+        """以锁定/弃用操作之后的卡片外观记录本次扫描的结果。"""
+        positions = list(results)
+        thumbnails = self._capture_thumbnails(positions)
+        for pos, thumbnail in zip(positions, thumbnails, strict=True):
+            store.record(grid[pos], thumbnail, inventory_count, results[pos])
+
+    def _scan_pages(
+        self,
+        paging_profile: PagingProfile,
+        user_setting: UserSetting,
+        stop_event: threading.Event,
+    ) -> bool:
+        """
+        逐页扫描整个库存。返回是否扫描了全部基质。
+
+        每页扫描后滚动网格，并用卡片缩略图找出新页面与上一页重叠的行，只扫描新出现的行；
+        遇到空格子或滚动后网格没有变化时结束。卡片外观相同时缩略图可能有多种对齐方式，
+        此时点击一个基质，根据识别结果确定重叠的行数。
+        """
+        thumbnailer = self.ctx.card_thumbnailer
+        rows = len(self._profile.essence_icon_y_list)
+        columns = len(self._profile.essence_icon_x_list)
+        scroll_clicks = (
+            paging_profile.scroll_clicks
+            if paging_profile.scroll_clicks is not None
+            else -max(1, rows - 1)
+        )
+        expected_overlap = expected_row_overlap(scroll_clicks, rows)
+        # 在网格中间的卡片上滚动
+        scroll_pos = Point(
+            self._profile.essence_icon_x_list[columns // 2],
+            self._profile.essence_icon_y_list[rows // 2],
+        )
+
+        checkpoint = self._checkpoint
+        row_offset = checkpoint.row_offset if checkpoint is not None else 0
+        """当前页第一行在整个库存中的行号。"""
+        first_page = checkpoint.page if checkpoint is not None else 0
+        scanned = dict(checkpoint.records) if checkpoint is not None else {}
+        previous: np.ndarray | None = None
+        for page in range(first_page, paging_profile.max_pages):
+            thumbnails = self._capture_thumbnails()
+            first_row = 0
+            if previous is not None:
+                candidates = row_overlap_candidates(
+                    thumbnailer, previous, thumbnails, columns
+                )
+                if len(candidates) > 1:
+                    candidates = self._probe_row_overlap(
+                        candidates, row_offset, scanned, user_setting
+                    )
+                overlap = choose_row_overlap(candidates, expected_overlap)
+                if overlap == rows:
+                    logger.info("滚动后网格没有变化，已到达库存末尾。")
+                    self._reached_inventory_end((row_offset + rows) * columns)
+                    return True
+                if overlap == 0:
+                    logger.warning(
+                        "滚动后未找到与上一页重叠的行，可能跳过了部分基质；"
+                        "请减小每次翻页的滚动格数。"
+                    )
+                row_offset += rows - overlap
+                first_row = overlap
+            if checkpoint is not None:
+                checkpoint.page, checkpoint.row_offset = page, row_offset
+
+            skipped = first_row * columns
+            cells, reached_end = self._cells_before_empty(
+                [(row_offset + i, j, pos) for i, j, pos in self._page_cells()][
+                    skipped:
+                ],
+                thumbnails[skipped:],
+            )
+
+            logger.info(f"正在扫描第 {page + 1} 页，共 {len(cells)} 个新基质...")
+            inventory_count = (
+                (row_offset + first_row) * columns + len(cells) if reached_end else None
+            )
+            if not self._scan_cells(
+                cells, inventory_count, user_setting, stop_event, scanned
+            ):
+                return False
+            if reached_end:
+                logger.info("已到达空格子，库存扫描完毕。")
+                self._reached_inventory_end(inventory_count)
+                return True
+
+            if self._should_stop(stop_event):
+                return False
+
+            # 锁定/弃用操作会改变卡片外观，因此在滚动前重新生成缩略图
+            previous = self._capture_thumbnails()
+            self._window_actions.scroll(scroll_pos.x, scroll_pos.y, scroll_clicks)
+            self._window_actions.wait(paging_profile.settle_delay)
+
+        logger.warning(
+            f"已扫描 {paging_profile.max_pages} 页，达到最大页数，停止翻页。"
+        )
+        return True
+
+    def _reached_inventory_end(self, inventory_count: int | None) -> None:
+        """翻页扫描到达库存末尾：之前各页记录的增量扫描结果从此可以沿用。"""
+        if self._incremental_store is not None and inventory_count is not None:
+            self._incremental_store.set_inventory_count(inventory_count)
+
+    def _probe_row_overlap(
+        self,
+        candidates: list[int],
+        row_offset: int,
+        scanned: dict[tuple[int, int], ScanRecord],
+        user_setting: UserSetting,
+    ) -> list[int]:
+        """
+        缩略图有多种对齐方式时，点击当前页第一行的一个基质并识别，
+        只保留使它与上一页对应位置的基质词条相同的重叠行数。
+
+        上一页对应位置都没有结果（例如都是跳过的非无瑕基质），或识别结果与所有候选都不符时，
+        原样返回 `candidates`。
+
+        Args:
+            candidates: 从小到大排列的能对齐的重叠行数。
+            row_offset: 上一页第一行在整个库存中的行号。
+            scanned: 已扫描的基质的结果，以 (行, 列) 为键。
+            user_setting: 用户设置。
+        """
+        rows = len(self._profile.essence_icon_y_list)
+        for j, relative_x in enumerate(self._profile.essence_icon_x_list):
+            records = {
+                overlap: record
+                for overlap in candidates
+                if (record := scanned.get((row_offset + rows - overlap, j))) is not None
+            }
+            if not records:
+                continue
+            self._click_and_settle(relative_x, self._profile.essence_icon_y_list[0])
             data = recognize_essence(
                 self._image_source,
                 self.ctx,
                 self._profile,
+                self._recognition_plan(user_setting),
             )
+            matched = [
+                overlap
+                for overlap, record in records.items()
+                if (record.data.stats, record.data.levels) == (data.stats, data.levels)
+            ]
+            logger.debug(f"滚动后网格有 {candidates} 行重叠的可能，识别后为 {matched}")
+            return matched or candidates
+        return candidates
 
-            if (
-                data.abandon_label == AbandonStatusLabel.MAYBE_ABANDONED
-                or data.lock_label == LockStatusLabel.MAYBE_LOCKED
-            ):
-                # early continue on uncertain recognition
+    def _skip_non_five_star_cells(
+        self,
+        cells: list[tuple[int, int, Point]],
+        user_setting: UserSetting,
+        skipped: dict[Point, tuple[EssenceData, EvaluationResult | None]],
+    ) -> list[tuple[int, int, Point]]:
+        """
+        根据网格中卡片底部的稀有度颜色，预先排除非无瑕基质，无需逐个点击。
+
+        只截取一次网格区域；无法识别稀有度的卡片仍会正常扫描。被跳过的基质没有词条，
+        以网格中的稀有度写入 `skipped`。
+        """
+        classifier = self.ctx.grid_rarity_classifier
+        region = classifier.grid_region(self._profile)
+        frame = FrameContext(self._image_source.screenshot(region), origin=region.p0)
+        rarities = classifier.classify(
+            frame, [pos for _i, _j, pos in cells], self._profile.ESSENCE_CARD_SIZE
+        )
+
+        kept: list[tuple[int, int, Point]] = []
+        for cell, rarity in zip(cells, rarities, strict=True):
+            if rarity is None or rarity == RarityLabel.FIVE:
+                kept.append(cell)
                 continue
+            data = EssenceData(
+                stats=[None, None, None],
+                levels=[None, None, None],
+                rarity=rarity,
+                abandon_label=AbandonStatusLabel.MAYBE_ABANDONED,
+                lock_label=LockStatusLabel.MAYBE_LOCKED,
+            )
+            skipped[cell[2]] = (data, self._compiled_rules(user_setting).evaluate(data))
+        logger.info(
+            f"根据网格中的稀有度颜色跳过了 {len(cells) - len(kept)} 个非无瑕基质，"
+            f"剩余 {len(kept)} 个基质需要扫描。"
+        )
+        return kept
 
-            evaluation = evaluate_essence(data, user_setting, self.ctx.static_game_data)
+    def _scan_sequential(
+        self,
+        cells: list[tuple[int, int, Point]],
+        user_setting: UserSetting,
+        stop_event: threading.Event,
+        results: dict[Point, ScanRecord],
+    ) -> bool:
+        """逐个扫描基质，并把评估结果写入 `results`。返回是否扫描了全部基质。"""
+        for i, j, pos in cells:
+            if self._should_stop(stop_event):
+                return False
 
-            # Log the result
-            if (
-                evaluation.quality == EssenceQuality.TRASH
-                and evaluation.matched_weapons
-            ):
-                logger.opt(colors=True).warning(evaluation.log_message)
+            logger.info(f"正在扫描第 {i + 1} 行第 {j + 1} 列的基质...")
+
+            # 点击基质图标位置，并等待界面更新
+            self._click_and_settle(pos.x, pos.y)
+
+            # 识别基质信息
+            data = recognize_essence(
+                self._image_source,
+                self.ctx,
+                self._profile,
+                self._recognition_plan(user_setting),
+            )
+            data = self._recapture_uncertain(data)
+
+            evaluation = self._evaluate(data, user_setting)
+            actions = self._report(data, evaluation, user_setting)
+            succeeded = self._execute_actions(actions, data)
+            if evaluation is not None and succeeded:
+                results[pos] = ScanRecord(apply_actions(data, actions), evaluation)
+        return True
+
+    def _scan_pipelined(
+        self,
+        cells: list[tuple[int, int, Point]],
+        user_setting: UserSetting,
+        stop_event: threading.Event,
+        results: dict[Point, ScanRecord],
+    ) -> bool:
+        """
+        流水线扫描基质，并把评估结果写入 `results`。返回是否扫描了全部基质。
+
+        截图后把识别与评估交给后台线程，立即点击下一个基质；
+        在下一个基质的面板稳定后取回上一个基质的结果，若需要锁定/弃用，
+        则先回到该基质再执行操作，从而保证操作总是作用于正确的基质且按顺序执行。
+        """
+        completed = True
+        displayed: Point | None = None
+        """当前面板显示的基质图标位置。"""
+        pending: _PendingResult | None = None
+
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ScannerRecognition"
+        ) as executor:
+            for i, j, pos in cells:
+                if self._should_stop(stop_event):
+                    completed = False
+                    break
+
+                logger.info(f"正在扫描第 {i + 1} 行第 {j + 1} 列的基质...")
+
+                self._click_and_settle(pos.x, pos.y)
+                displayed = pos
+
+                frames = capture_essence_frames(self._image_source, self._profile)
+                future = executor.submit(
+                    self._recognize_and_evaluate, frames, user_setting
+                )
+
+                # 上一个基质的识别已在本次点击与等待期间完成
+                if pending is not None:
+                    displayed = self._resolve_pending(
+                        pending, displayed, user_setting, results, act=True
+                    )
+                pending = (pos, future)
+
+            if pending is not None:
+                # 中断时仍输出已截取基质的识别结果，但不再点击
+                self._resolve_pending(
+                    pending, displayed, user_setting, results, act=completed
+                )
+        return completed
+
+    def _resolve_pending(
+        self,
+        pending: _PendingResult,
+        displayed: Point | None,
+        user_setting: UserSetting,
+        results: dict[Point, ScanRecord],
+        act: bool,
+    ) -> Point | None:
+        """
+        取回一个基质的识别结果并执行其操作。返回此后面板显示的基质图标位置。
+        """
+        pos, future = pending
+        data, evaluation = future.result()
+        if act and self._needs_recapture(data):
+            if displayed != pos:
+                self._click_and_settle(pos.x, pos.y)
+                displayed = pos
+            data = self._recapture_uncertain(data)
+            evaluation = self._evaluate(data, user_setting)
+        actions = self._report(data, evaluation, user_setting)
+        if evaluation is not None and not actions:
+            results[pos] = ScanRecord(data, evaluation)
+        if not act or not actions:
+            return displayed
+
+        if displayed != pos:
+            # 面板已切换到下一个基质，先回到该基质
+            self._click_and_settle(pos.x, pos.y)
+        if self._execute_actions(actions, data) and evaluation is not None:
+            results[pos] = ScanRecord(apply_actions(data, actions), evaluation)
+        return pos
+
+    def _scan_planned(
+        self,
+        cells: list[tuple[int, int, Point]],
+        user_setting: UserSetting,
+        stop_event: threading.Event,
+        results: dict[Point, ScanRecord],
+        unresolved: dict[Point, tuple[EssenceData, EvaluationResult | None]],
+    ) -> bool:
+        """
+        先只读扫描给定的基质并生成操作计划，确认后批量执行。返回是否扫描了全部基质。
+
+        只有无需操作或操作已核对成功的基质会被写入 `results`，
+        被拒绝或执行失败的基质在下次扫描时会重新处理；它们和识别结果不确定的基质
+        以扫描时的状态写入 `unresolved`。
+        """
+        entries, completed = self._sweep(
+            cells, user_setting, stop_event, results, unresolved
+        )
+        for entry in entries:
+            unresolved[entry.position] = (entry.data, entry.evaluation)
+        if not completed:
+            return False
+        if not entries:
+            logger.info("没有需要锁定或弃用的基质。")
+            return True
+
+        plan = self._action_plan_board.publish(
+            entries, confirmed=not self._confirm_action_plan
+        )
+        if self._confirm_action_plan:
+            logger.info(
+                f"已生成操作计划，共 {len(entries)} 个基质需要锁定或弃用，等待确认..."
+            )
+            if not plan.wait_for_decision(stop_event):
+                logger.info("操作计划未被确认，不执行任何操作。")
+                return not stop_event.is_set()
+            # 确认期间用户可能切换到了其他窗口
+            if self._window_actions.activate():
+                self._window_actions.wait(0.5)
+        return self._execute_plan(plan, stop_event, results)
+
+    def _sweep(
+        self,
+        cells: list[tuple[int, int, Point]],
+        user_setting: UserSetting,
+        stop_event: threading.Event,
+        results: dict[Point, ScanRecord],
+        unresolved: dict[Point, tuple[EssenceData, EvaluationResult | None]],
+    ) -> tuple[list[PlanEntry], bool]:
+        """
+        只读扫描：逐个点击基质并截图，在后台线程识别与评估，不执行任何操作。
+
+        Returns:
+            (需要操作的基质, 是否扫描了全部基质)。无需操作的基质直接写入 `results`，
+            识别结果不确定的基质写入 `unresolved`。
+        """
+        entries: list[PlanEntry] = []
+        completed = True
+        displayed: Point | None = None
+        """当前面板显示的基质图标位置。"""
+
+        def resolve(
+            cell: tuple[int, int, Point],
+            future: Future[tuple[EssenceData, EvaluationResult | None]],
+        ) -> None:
+            nonlocal displayed
+            i, j, pos = cell
+            data, evaluation = future.result()
+            if completed and self._needs_recapture(data):
+                if displayed != pos:
+                    self._click_and_settle(pos.x, pos.y)
+                    displayed = pos
+                data = self._recapture_uncertain(data)
+                evaluation = self._evaluate(data, user_setting)
+            actions = self._report(data, evaluation, user_setting)
+            if evaluation is None:
+                unresolved[pos] = (data, None)
+                return
+            if actions:
+                entries.append(PlanEntry(i, j, pos, data, evaluation, actions))
             else:
-                logger.opt(colors=True).success(evaluation.log_message)
+                results[pos] = ScanRecord(data, evaluation)
 
-            # Decide actions
-            actions = decide_actions(data, evaluation, user_setting)
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ScannerRecognition"
+        ) as executor:
+            pending = None
+            for cell in cells:
+                if self._should_stop(stop_event):
+                    completed = False
+                    break
+                i, j, pos = cell
+                logger.info(f"正在扫描第 {i + 1} 行第 {j + 1} 列的基质...")
+                self._click_and_settle(pos.x, pos.y)
+                displayed = pos
+                frames = capture_essence_frames(self._image_source, self._profile)
+                future = executor.submit(
+                    self._recognize_and_evaluate, frames, user_setting
+                )
+                if pending is not None:
+                    resolve(*pending)
+                pending = (cell, future)
+            if pending is not None:
+                resolve(*pending)
+        return entries, completed
 
-            # Execute actions
-            for action in actions:
-                if action.type == ActionType.CLICK_LOCK:
-                    pos = self._profile.LOCK_BUTTON_POS
-                    self._window_actions.click(pos.x, pos.y)
-                elif action.type == ActionType.CLICK_ABANDON:
-                    pos = self._profile.DEPRECATE_BUTTON_POS
-                    self._window_actions.click(pos.x, pos.y)
+    def _execute_plan(
+        self,
+        plan: ActionPlan,
+        stop_event: threading.Event,
+        results: dict[Point, ScanRecord],
+    ) -> bool:
+        """
+        依次回到计划中的基质执行操作，并核对操作前后的状态。返回是否执行完毕。
+        """
+        plan.set_status(PlanStatus.EXECUTING)
+        for entry in plan.entries:
+            if self._should_stop(stop_event):
+                plan.set_status(PlanStatus.INTERRUPTED)
+                return False
 
-                self._window_actions.wait(0.3)
-                logger.success(action.log_message)
+            pos = entry.position
+            self._click_and_settle(pos.x, pos.y)
+            before = recognize_button_states(
+                self._image_source, self.ctx, self._profile
+            )
+            if before != (entry.data.abandon_label, entry.data.lock_label):
+                logger.warning(
+                    f"第 {entry.row + 1} 行第 {entry.column + 1} 列的基质状态与扫描时不一致"
+                    f"（{before[0].value}、{before[1].value}），跳过其操作。"
+                )
+                entry.status = PlanEntryStatus.SKIPPED
+                continue
 
-        else:
-            # 扫描完成
-            logger.info("基质扫描完成。")
+            self._execute_actions(entry.actions, entry.data)
+            expected = entry.expected
+            after = recognize_button_states(self._image_source, self.ctx, self._profile)
+            if after == (expected.abandon_label, expected.lock_label):
+                entry.status = PlanEntryStatus.DONE
+                results[pos] = ScanRecord(expected, entry.evaluation)
+            else:
+                logger.warning(
+                    f"第 {entry.row + 1} 行第 {entry.column + 1} 列的基质操作后状态为"
+                    f"（{after[0].value}、{after[1].value}），与预期不一致。"
+                )
+                entry.status = PlanEntryStatus.FAILED
+
+        plan.set_status(PlanStatus.COMPLETED)
+        failed = sum(entry.status != PlanEntryStatus.DONE for entry in plan.entries)
+        logger.info(
+            f"操作计划执行完毕：{len(plan.entries) - failed} 个基质操作成功，"
+            f"{failed} 个基质被跳过或操作失败。"
+        )
+        return True
@@ -1,162 +1,271 @@
+import itertools
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+
 from endfield_essence_recognizer.core.recognition import RarityLabel
 from endfield_essence_recognizer.core.scanner.models import (
     EssenceData,
     EssenceQuality,
     EvaluationResult,
+    RecognitionPlan,
 )
 from endfield_essence_recognizer.game_data.static_game_data import StaticGameData
+from endfield_essence_recognizer.schemas.static_data import StatId
 from endfield_essence_recognizer.schemas.user_setting import (
     NonFiveStarBehavior,
     UserSetting,
 )
 
 
-def evaluate_essence(
-    data: EssenceData,
-    setting: UserSetting,
-    static_game_data: StaticGameData,
-) -> EvaluationResult:
-    """
-    Pure function to judge the quality of an essence based on settings and game data.
+def _stat_subsets(stats: list[StatId | None]) -> Iterator[frozenset[StatId | None]]:
+    """All non-empty subsets of the distinct stats (at most 7 for three stats)."""
+    distinct = list(dict.fromkeys(stats))
+    for size in range(1, len(distinct) + 1):
+        for combination in itertools.combinations(distinct, size):
+            yield frozenset(combination)
 
-    Logic:
-    1. Checks high-level attributes thresholds (if enabled).
-    2. Checks custom treasure stats (if configured).
-    3. Matches against game data (weapons).
-    4. Cross-references matched weapons with user's 'trash_weapon_ids'.
-    5. Constructs the user-facing log message with color tags.
 
-    Args:
-        data: The raw recognition data (stats, levels).
-        setting: The current user settings (thresholds, custom rules).
-        static_game_data: The static game data for reference.
-    Returns:
-        EvaluationResult containing the decision, log message, and reasoning.
+def _format_weapon_description(weapon_id: str, static_game_data: StaticGameData) -> str:
+    """格式化武器描述，如`名称（稀有度★ 类型）`"""
+    weapon = static_game_data.get_weapon(weapon_id)
+    if not weapon:
+        return f"<bold>{weapon_id}</>"
+
+    weapon_type = static_game_data.get_weapon_type(weapon.weapon_type)
+    type_name = weapon_type.name if weapon_type else "未知类型"
+
+    return f"<bold>{weapon.name}（{weapon.rarity}★ {type_name}）</>"
+
+
+@dataclass(frozen=True)
+class CompiledRules:
     """
-    if (
-        data.rarity != RarityLabel.FIVE
-        and setting.non_five_star_behavior == NonFiveStarBehavior.SKIP
-    ):
-        return EvaluationResult(
-            quality=EssenceQuality.SKIP,
-            log_message="这个基质是<dim>非无瑕基质</>，已根据设置跳过处理。",
-        )
+    Evaluation rules compiled once from a UserSetting snapshot.
 
-    stats = data.stats
-    levels = data.levels
+    Holds the lookup tables `evaluate` needs, so that judging one essence takes a few
+    dictionary and set lookups however many custom treasure rules there are.
+    Build it with `compile_rules`.
+    """
 
-    # Check attribute levels: if high-level evaluation is enabled, record whether it is a high-level treasure
-    is_high_level_treasure = False
-    high_level_info = ""
-    if setting.high_level_treasure_enabled:
-        # The order of stats is [attribute, secondary, skill], corresponding to termType [0, 1, 2]
-        thresholds = [
-            setting.high_level_treasure_attribute_threshold,  # attribute threshold
-            setting.high_level_treasure_secondary_threshold,  # secondary stat threshold
-            setting.high_level_treasure_skill_threshold,  # skill stat threshold
-        ]
-        # Mapping for V2 StatType to threshold index
-        type_to_index = {
-            "ATTRIBUTE": 0,
-            "SECONDARY": 1,
-            "SKILL": 2,
-        }
-        for stat_id, level in zip(stats, levels, strict=True):
-            if stat_id is not None and level is not None:
-                stat = static_game_data.get_stat(stat_id)
-                if stat is not None:
-                    idx = type_to_index.get(stat.type)
-                    if idx is not None:
-                        threshold = thresholds[idx]
-                        if level >= threshold:
+    setting: UserSetting
+    """The settings snapshot the rules were compiled from."""
+    static_game_data: StaticGameData
+    skip_non_five_star: bool
+    level_thresholds: Mapping[str, int]
+    """Level threshold per stat type; empty when the high-level check is disabled."""
+    treasure_stat_sets: frozenset[frozenset[StatId | None]]
+    """The stats of every custom treasure rule, as sets."""
+    trash_weapon_ids: frozenset[str]
+    weapon_descriptions: dict[str, str] = field(default_factory=dict)
+    """Formatted weapon descriptions, filled as weapons are first described."""
+
+    def describe_weapon(self, weapon_id: str) -> str:
+        description = self.weapon_descriptions.get(weapon_id)
+        if description is None:
+            description = _format_weapon_description(weapon_id, self.static_game_data)
+            self.weapon_descriptions[weapon_id] = description
+        return description
+
+    def matches_treasure_stats(self, stats: list[StatId | None]) -> bool:
+        """Whether all stats of some custom treasure rule are among `stats`."""
+        if not self.treasure_stat_sets:
+            return False
+        return any(subset in self.treasure_stat_sets for subset in _stat_subsets(stats))
+
+    def evaluate(self, data: EssenceData) -> EvaluationResult:
+        """
+        Judge the quality of an essence.
+
+        Logic:
+        1. Checks high-level attributes thresholds (if enabled).
+        2. Checks custom treasure stats (if configured).
+        3. Matches against game data (weapons).
+        4. Cross-references matched weapons with user's 'trash_weapon_ids'.
+        5. Constructs the user-facing log message with color tags.
+
+        Args:
+            data: The raw recognition data (stats, levels).
+        Returns:
+            EvaluationResult containing the decision, log message, and reasoning.
+        """
+        if data.rarity != RarityLabel.FIVE and self.skip_non_five_star:
+            return EvaluationResult(
+                quality=EssenceQuality.SKIP,
+                log_message="这个基质是<dim>非无瑕基质</>，已根据设置跳过处理。",
+            )
+
+        stats = data.stats
+        levels = data.levels
+        static_game_data = self.static_game_data
+
+        # Check attribute levels: if high-level evaluation is enabled, record whether it is a high-level treasure
+        is_high_level_treasure = False
+        high_level_info = ""
+        if self.level_thresholds:
+            for stat_id, level in zip(stats, levels, strict=True):
+                if stat_id is not None and level is not None:
+                    stat = static_game_data.get_stat(stat_id)
+                    if stat is not None:
+                        threshold = self.level_thresholds.get(stat.type)
+                        if threshold is not None and level >= threshold:
                             is_high_level_treasure = True
                             high_level_info = (
                                 f"（含高等级属性词条：{stat.name}+{level}）"
                             )
                             break
 
-    # 尝试匹配用户自定义的宝藏基质条件
-    for treasure_stat in setting.treasure_essence_stats:
-        if (
-            treasure_stat.attribute in stats
-            and treasure_stat.secondary in stats
-            and treasure_stat.skill in stats
-        ):
+        # 尝试匹配用户自定义的宝藏基质条件
+        if self.matches_treasure_stats(stats):
             return EvaluationResult(
                 quality=EssenceQuality.TREASURE,
                 log_message=f"这个基质是<green><bold><underline>宝藏</></></>，因为它符合你设定的宝藏基质条件{high_level_info}。",
                 is_high_level=is_high_level_treasure,
             )
 
-    # 尝试匹配已实装武器
-    matched_weapon_ids = set(
-        static_game_data.find_weapons_by_stats(stats[0], stats[1], stats[2])
-    )
+        # 尝试匹配已实装武器
+        matched_weapon_ids = set(
+            static_game_data.find_weapons_by_stats(stats[0], stats[1], stats[2])
+        )
+        # 只差一个词条即可匹配的武器
+        near_miss_weapon_ids = (
+            set(
+                static_game_data.find_weapons_matching(
+                    stats[0], stats[1], stats[2], min_matches=2
+                )
+            )
+            - matched_weapon_ids
+        )
+
+        if not matched_weapon_ids:
+            # 未匹配到任何已实装武器
+            if is_high_level_treasure:
+                return EvaluationResult(
+                    quality=EssenceQuality.TREASURE,
+                    log_message=f"这个基质是<green><bold><underline>宝藏</></></>，因为它有高等级属性词条{high_level_info}。<dim>（但不匹配任何已实装武器）</>",
+                    is_high_level=True,
+                    near_miss_weapons=near_miss_weapon_ids,
+                )
+            else:
+                return EvaluationResult(
+                    quality=EssenceQuality.TRASH,
+                    log_message="这个基质是<red><bold><underline>养成材料</></></>，它不匹配任何已实装武器。",
+                    is_high_level=False,
+                    near_miss_weapons=near_miss_weapon_ids,
+                )
+
+        # 检查匹配到的武器中，是否有不在 trash_weapon_ids 中的
+        non_trash_weapon_ids = matched_weapon_ids - self.trash_weapon_ids
+
+        if non_trash_weapon_ids:
+            # 只要有一个匹配武器未被拦截，就是宝藏
+
+            # 输出所有匹配到且未被拦截的武器列表
+            weapons_description_str = "、".join(
+                self.describe_weapon(wid) for wid in non_trash_weapon_ids
+            )
 
-    if not matched_weapon_ids:
-        # 未匹配到任何已实装武器
-        if is_high_level_treasure:
             return EvaluationResult(
                 quality=EssenceQuality.TREASURE,
-                log_message=f"这个基质是<green><bold><underline>宝藏</></></>，因为它有高等级属性词条{high_level_info}。<dim>（但不匹配任何已实装武器）</>",
-                is_high_level=True,
+                log_message=f"这个基质是<green><bold><underline>宝藏</></></>，它完美契合武器{weapons_description_str}{high_level_info}。",
+                matched_weapons=non_trash_weapon_ids,
+                is_high_level=is_high_level_treasure,
+                near_miss_weapons=near_miss_weapon_ids,
             )
         else:
-            return EvaluationResult(
-                quality=EssenceQuality.TRASH,
-                log_message="这个基质是<red><bold><underline>养成材料</></></>，它不匹配任何已实装武器。",
-                is_high_level=False,
+            # 所有匹配到的武器都在 trash_weapon_ids 中
+
+            # 输出所有匹配到的武器列表
+            weapons_description_str = "、".join(
+                self.describe_weapon(wid) for wid in matched_weapon_ids
             )
 
-    # 检查匹配到的武器中，是否有不在 trash_weapon_ids 中的
-    non_trash_weapon_ids = matched_weapon_ids - set(setting.trash_weapon_ids)
+            if is_high_level_treasure:
+                return EvaluationResult(
+                    quality=EssenceQuality.TREASURE,
+                    log_message=f"这个基质是<green><bold><underline>宝藏</></></>，因为它有高等级属性词条{high_level_info}。<yellow>即使它匹配的所有武器{weapons_description_str}均已被用户手动拦截。</>",
+                    matched_weapons=matched_weapon_ids,
+                    is_high_level=True,
+                    near_miss_weapons=near_miss_weapon_ids,
+                )
+            else:
+                return EvaluationResult(
+                    quality=EssenceQuality.TRASH,
+                    log_message=f"这个基质虽然匹配武器{weapons_description_str}，但匹配的所有武器均已被用户手动拦截，因此这个基质是<red><bold><underline>养成材料</></></>。",
+                    matched_weapons=matched_weapon_ids,
+                    is_high_level=False,
+                    near_miss_weapons=near_miss_weapon_ids,
+                )
 
-    def format_weapon_description(weapon_id: str) -> str:
-        """格式化武器描述，如`名称（稀有度★ 类型）`"""
-        weapon = static_game_data.get_weapon(weapon_id)
-        if not weapon:
-            return f"<bold>{weapon_id}</>"
 
-        weapon_type = static_game_data.get_weapon_type(weapon.weapon_type)
-        type_name = weapon_type.name if weapon_type else "未知类型"
+def compile_rules(
+    setting: UserSetting, static_game_data: StaticGameData
+) -> CompiledRules:
+    """
+    Compile the evaluation rules of a settings snapshot into lookup tables.
+
+    Args:
+        setting: The current user settings (thresholds, custom rules).
+        static_game_data: The static game data for reference.
+    Returns:
+        The compiled rules; build them once per scan and reuse them for every essence.
+    """
+    level_thresholds: dict[str, int] = {}
+    if setting.high_level_treasure_enabled:
+        # The order of stats is [attribute, secondary, skill], corresponding to V2 StatType
+        level_thresholds = {
+            "ATTRIBUTE": setting.high_level_treasure_attribute_threshold,
+            "SECONDARY": setting.high_level_treasure_secondary_threshold,
+            "SKILL": setting.high_level_treasure_skill_threshold,
+        }
+    return CompiledRules(
+        setting=setting,
+        static_game_data=static_game_data,
+        skip_non_five_star=setting.non_five_star_behavior == NonFiveStarBehavior.SKIP,
+        level_thresholds=level_thresholds,
+        treasure_stat_sets=frozenset(
+            frozenset((rule.attribute, rule.secondary, rule.skill))
+            for rule in setting.treasure_essence_stats
+        ),
+        trash_weapon_ids=frozenset(setting.trash_weapon_ids),
+    )
 
-        return f"<bold>{weapon.name}（{weapon.rarity}★ {type_name}）</>"
 
-    if non_trash_weapon_ids:
-        # 只要有一个匹配武器未被拦截，就是宝藏
+def evaluate_essence(
+    data: EssenceData,
+    setting: UserSetting,
+    static_game_data: StaticGameData,
+) -> EvaluationResult:
+    """
+    Pure function to judge the quality of an essence based on settings and game data.
 
-        # 输出所有匹配到且未被拦截的武器列表
-        weapon_descriptions = [
-            format_weapon_description(wid) for wid in non_trash_weapon_ids
-        ]
-        weapons_description_str = "、".join(weapon_descriptions)
+    Compiles the rules on every call, which only reads the settings; weapon
+    descriptions are formatted on demand. To judge many essences under the same
+    settings, build `compile_rules` once and call `CompiledRules.evaluate` instead.
 
-        return EvaluationResult(
-            quality=EssenceQuality.TREASURE,
-            log_message=f"这个基质是<green><bold><underline>宝藏</></></>，它完美契合武器{weapons_description_str}{high_level_info}。",
-            matched_weapons=non_trash_weapon_ids,
-            is_high_level=is_high_level_treasure,
-        )
-    else:
-        # 所有匹配到的武器都在 trash_weapon_ids 中
+    Args:
+        data: The raw recognition data (stats, levels).
+        setting: The current user settings (thresholds, custom rules).
+        static_game_data: The static game data for reference.
+    Returns:
+        EvaluationResult containing the decision, log message, and reasoning.
+    """
+    return compile_rules(setting, static_game_data).evaluate(data)
 
-        # 输出所有匹配到的武器列表
-        weapon_descriptions = [
-            format_weapon_description(wid) for wid in matched_weapon_ids
-        ]
-        weapons_description_str = "、".join(weapon_descriptions)
 
-        if is_high_level_treasure:
-            return EvaluationResult(
-                quality=EssenceQuality.TREASURE,
-                log_message=f"这个基质是<green><bold><underline>宝藏</></></>，因为它有高等级属性词条{high_level_info}。<yellow>即使它匹配的所有武器{weapons_description_str}均已被用户手动拦截。</>",
-                matched_weapons=matched_weapon_ids,
-                is_high_level=True,
-            )
-        else:
-            return EvaluationResult(
-                quality=EssenceQuality.TRASH,
-                log_message=f"这个基质虽然匹配武器{weapons_description_str}，但匹配的所有武器均已被用户手动拦截，因此这个基质是<red><bold><underline>养成材料</></></>。",
-                matched_weapons=matched_weapon_ids,
-                is_high_level=False,
-            )
+def plan_recognition(setting: UserSetting) -> RecognitionPlan:
+    """
+    Derive which fields `evaluate_essence` and `decide_actions` read under a setting.
+
+    - Levels are only read by the high-level treasure check.
+    - Stats and levels of a non-five-star essence are not read when such essences
+      are skipped, because the rarity alone decides the result.
+
+    Args:
+        setting: The current user settings.
+    Returns:
+        The fields that need to be recognized.
+    """
+    return RecognitionPlan(
+        levels=setting.high_level_treasure_enabled,
+        non_five_star_stats=setting.non_five_star_behavior != NonFiveStarBehavior.SKIP,
+    )
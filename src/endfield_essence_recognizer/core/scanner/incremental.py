@@ -0,0 +1,299 @@
+"""
+Remember processed essences across scans, keyed by the appearance of their card.
+
+Most essences in a rescanned inventory were already processed by a previous run. The
+store keeps the card thumbnail of every processed essence (taken after the scanner's
+own lock / abandon clicks) together with its grid position, the inventory size and its
+recognition and evaluation results. A card at the same position of an inventory of the
+same size whose thumbnail, including the lock / abandon overlay, still matches can be
+skipped without clicking it. The thumbnail alone is not enough: different essences can
+have identical cards, and an essence added or removed ahead of them shifts them to
+other positions. The inventory size is only known once the scan has seen the end of
+the inventory; cards scanned before that are recorded without a size and only become
+reusable when the scan reaches the end.
+"""
+
+import base64
+import hashlib
+import json
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import numpy as np
+
+from endfield_essence_recognizer.core.recognition import (
+    AbandonStatusLabel,
+    CardThumbnailer,
+    LockStatusLabel,
+    RarityLabel,
+)
+from endfield_essence_recognizer.core.scanner.models import (
+    EssenceData,
+    EssenceQuality,
+    EvaluationResult,
+)
+from endfield_essence_recognizer.game_data.static_game_data import StaticGameData
+from endfield_essence_recognizer.schemas.user_setting import UserSetting
+from endfield_essence_recognizer.utils.log import logger
+
+INCREMENTAL_SCAN_FORMAT_VERSION = 3
+"""持久化文件格式版本，格式变化时旧文件会被忽略。"""
+
+
+def compute_scan_signature(
+    user_setting: UserSetting, static_game_data: StaticGameData
+) -> str:
+    """计算决定评估结果的输入（用户设置与静态数据）的签名，任一变化时旧记录失效。"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(user_setting.model_dump_json().encode("utf-8"))
+    digest.update(static_game_data.signature.encode("utf-8"))
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class ScanRecord:
+    """一个已处理基质的识别与评估结果。"""
+
+    data: EssenceData
+    evaluation: EvaluationResult
+
+
+@dataclass(frozen=True)
+class _StoredEntry:
+    thumbnail: np.ndarray
+    inventory_count: int | None
+    """记录时库存中的基质数量；扫描尚未到达库存末尾时为 None。"""
+    record: ScanRecord
+
+
+def _record_to_json(record: ScanRecord) -> dict:
+    data, evaluation = record.data, record.evaluation
+    return {
+        "stats": data.stats,
+        "levels": data.levels,
+        "rarity": data.rarity,
+        "abandon_label": data.abandon_label,
+        "lock_label": data.lock_label,
+        "quality": evaluation.quality,
+        "log_message": evaluation.log_message,
+        "matched_weapons": sorted(evaluation.matched_weapons),
+        "is_high_level": evaluation.is_high_level,
+        "near_miss_weapons": sorted(evaluation.near_miss_weapons),
+    }
+
+
+def _record_from_json(entry: dict) -> ScanRecord:
+    return ScanRecord(
+        data=EssenceData(
+            stats=entry["stats"],
+            levels=entry["levels"],
+            rarity=RarityLabel(entry["rarity"]),
+            abandon_label=AbandonStatusLabel(entry["abandon_label"]),
+            lock_label=LockStatusLabel(entry["lock_label"]),
+        ),
+        evaluation=EvaluationResult(
+            quality=EssenceQuality(entry["quality"]),
+            log_message=entry["log_message"],
+            matched_weapons=set(entry["matched_weapons"]),
+            is_high_level=entry["is_high_level"],
+            near_miss_weapons=set(entry.get("near_miss_weapons", [])),
+        ),
+    )
+
+
+class IncrementalScanStore:
+    """
+    网格位置 → 上次扫描时该位置的卡片缩略图与结果的存储，可选持久化。
+
+    外观相同的不同基质（例如词条不同但卡片相同）无法仅凭缩略图区分，因此只有网格位置、
+    库存中的基质数量与卡片缩略图都与上次扫描时一致时才沿用上次的结果；新增或移除基质后
+    数量变化，所有基质都会重新扫描。
+
+    库存中的基质数量只有在扫描到达库存末尾后才能确定：此前记录的结果没有数量，
+    扫描到达末尾后以 `set_inventory_count` 补上；扫描中断时这些结果不会被沿用。
+
+    使用前须以 `bind` 绑定当前扫描的签名；签名与已存储的记录不一致时清空所有记录。
+    """
+
+    def __init__(
+        self,
+        name: str,
+        thumbnailer: CardThumbnailer,
+        persist_path: Path | None = None,
+        max_entries: int = 4096,
+    ) -> None:
+        """
+        Args:
+            name: 名称，用于日志。
+            thumbnailer: 生成与比较卡片缩略图的生成器。
+            persist_path: 持久化文件路径。为 None 时仅在内存中保存。
+            max_entries: 最多保存的记录数，超出后丢弃最早的记录。
+        """
+        self.name = name
+        self.thumbnailer = thumbnailer
+        self.persist_path = persist_path
+        self.max_entries = max_entries
+        self._signature: str | None = None
+        self._entries: dict[tuple[int, int], _StoredEntry] = {}
+        self._loaded = False
+        self._dirty = False
+
+    def __str__(self) -> str:
+        return f"[{self.name}]"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def _thumbnail_shape(self) -> tuple[int, int, int]:
+        size = self.thumbnailer.profile.size
+        return size, size, 3
+
+    def bind(self, signature: str) -> None:
+        """
+        绑定当前扫描的签名。首次调用时加载持久化文件。
+
+        丢弃未完成的扫描中记录的、没有库存数量的结果。
+        """
+        if not self._loaded:
+            self._loaded = True
+            self.load()
+        if signature != self._signature:
+            if self._entries:
+                logger.info(f"{self} 用户设置或静态数据已变化，清空上次扫描的记录。")
+            self._signature = signature
+            self.clear()
+            return
+        entries = {
+            cell: entry
+            for cell, entry in self._entries.items()
+            if entry.inventory_count is not None
+        }
+        if len(entries) < len(self._entries):
+            self._entries = entries
+            self._dirty = True
+
+    def clear(self) -> None:
+        """清空所有记录。"""
+        self._dirty = self._dirty or bool(self._entries)
+        self._entries.clear()
+
+    def lookup(
+        self, cell: tuple[int, int], thumbnail: np.ndarray, inventory_count: int
+    ) -> ScanRecord | None:
+        """
+        查找上次扫描时同一位置的卡片的记录。
+
+        Args:
+            cell: 基质在库存中的 (行, 列)。
+            thumbnail: 当前的卡片缩略图。
+            inventory_count: 当前库存中的基质数量（已确定的）。
+
+        Returns:
+            该位置的记录；没有记录，或卡片缩略图、基质数量与记录时不同时返回 None。
+        """
+        entry = self._entries.get(cell)
+        if entry is None or entry.inventory_count != inventory_count:
+            return None
+        if not self.thumbnailer.matches(entry.thumbnail[None], thumbnail[None])[0]:
+            return None
+        return entry.record
+
+    def record(
+        self,
+        cell: tuple[int, int],
+        thumbnail: np.ndarray,
+        inventory_count: int | None,
+        record: ScanRecord,
+    ) -> None:
+        """
+        记录一张卡片的扫描结果，替换该位置上次的记录。
+
+        Args:
+            cell: 基质在库存中的 (行, 列)。
+            thumbnail: 操作之后的卡片缩略图。
+            inventory_count: 库存中的基质数量；尚未到达库存末尾时为 None。
+            record: 扫描结果。
+        """
+        entry = _StoredEntry(
+            np.array(thumbnail, dtype=np.uint8), inventory_count, record
+        )
+        # 重新插入，使字典顺序保持为记录先后
+        self._entries.pop(cell, None)
+        self._entries[cell] = entry
+        if len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._dirty = True
+
+    def set_inventory_count(self, inventory_count: int) -> None:
+        """扫描到达库存末尾后，为本次扫描中没有库存数量的结果补上数量。"""
+        for cell, entry in self._entries.items():
+            if entry.inventory_count is None:
+                self._entries[cell] = replace(entry, inventory_count=inventory_count)
+                self._dirty = True
+
+    def load(self) -> None:
+        """从持久化文件加载记录。文件不存在、损坏或格式不一致时忽略。"""
+        path = self.persist_path
+        if path is None or not path.exists():
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            shape = tuple(data["thumbnail_shape"])
+            if (
+                data.get("version") != INCREMENTAL_SCAN_FORMAT_VERSION
+                or shape != self._thumbnail_shape
+            ):
+                logger.debug(f"{self} 增量扫描记录文件格式已过期，忽略: {path}")
+                return
+            entries = {
+                (entry["row"], entry["column"]): _StoredEntry(
+                    thumbnail=np.frombuffer(
+                        base64.b64decode(entry["thumbnail"]), np.uint8
+                    )
+                    .reshape(shape)
+                    .copy(),
+                    inventory_count=entry["inventory_count"],
+                    record=_record_from_json(entry),
+                )
+                for entry in data["entries"]
+            }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"{self} 无法读取增量扫描记录文件 {path}: {e}")
+            return
+
+        self._signature = data.get("signature")
+        self._entries = entries
+        logger.debug(f"{self} 已加载 {len(entries)} 条增量扫描记录")
+
+    def save(self) -> None:
+        """将记录写入持久化文件（若已配置且有未保存的变化）。"""
+        path = self.persist_path
+        if path is None or not self._dirty:
+            return
+        data = {
+            "version": INCREMENTAL_SCAN_FORMAT_VERSION,
+            "signature": self._signature,
+            "thumbnail_shape": list(self._thumbnail_shape),
+            "entries": [
+                {
+                    "row": row,
+                    "column": column,
+                    "inventory_count": entry.inventory_count,
+                    "thumbnail": base64.b64encode(entry.thumbnail.tobytes()).decode(
+                        "ascii"
+                    ),
+                    **_record_to_json(entry.record),
+                }
+                for (row, column), entry in self._entries.items()
+            ],
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+            tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"{self} 无法写入增量扫描记录文件 {path}: {e}")
+            return
+        self._dirty = False
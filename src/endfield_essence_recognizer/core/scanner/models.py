@@ -60,3 +60,21 @@ class EvaluationResult:
 
     is_high_level: bool = False
     """Whether any attribute on the essence exceeded a high-level threshold."""
+
+    near_miss_weapons: set[WeaponId] = field(default_factory=set)
+    """Set of weapon IDs whose stats match two of the three stats of this essence."""
+
+
+@dataclass(frozen=True)
+class RecognitionPlan:
+    """Which fields of an essence need to be recognized.
+
+    Rarity and the lock / abandon states are always recognized. Fields that are not
+    recognized are filled with None.
+    """
+
+    levels: bool = True
+    """Whether to recognize the attribute levels."""
+
+    non_five_star_stats: bool = True
+    """Whether to recognize the stats (and levels) of non-five-star essences."""
@@ -0,0 +1,105 @@
+"""
+Scroll through an essence inventory that does not fit on one page.
+
+After every scroll the scanner fingerprints the visible cards and lines the new page
+up with the previous one, so rows that are still visible are not scanned twice.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from endfield_essence_recognizer.core.recognition import CardThumbnailer
+
+
+@dataclass(frozen=True)
+class PagingProfile:
+    """
+    Configuration for multi-page scanning.
+    """
+
+    scroll_clicks: int | None = None
+    """
+    每次翻页的滚轮格数（负数向下滚动）。
+    为 None 时滚动 可见行数 - 1 格，即假设一格滚动一行，并保留一行与上一页重叠用于对齐。
+    """
+    settle_delay: float = 0.5
+    """滚动后等待网格稳定的时间（秒）。"""
+    max_pages: int = 100
+    """最多扫描的页数，防止对齐失败时无限翻页。"""
+
+
+def row_overlap_candidates(
+    thumbnailer: CardThumbnailer,
+    previous: np.ndarray,
+    current: np.ndarray,
+    columns: int,
+) -> list[int]:
+    """
+    列出当前页开头能与上一页末尾对齐的所有重叠行数，从小到大排列。
+
+    卡片外观各不相同时至多一个；外观相同的卡片可能使多个重叠行数都能对齐。
+
+    Args:
+        thumbnailer: 用于比较缩略图的生成器。
+        previous: 上一页所有卡片的缩略图。
+        current: 当前页所有卡片的缩略图。
+        columns: 每行的卡片数。
+    """
+    rows = len(current) // columns
+    return [
+        overlap
+        for overlap in range(1, rows + 1)
+        if thumbnailer.matches(
+            previous[-overlap * columns :], current[: overlap * columns]
+        ).all()
+    ]
+
+
+def choose_row_overlap(candidates: list[int], expected: int | None = None) -> int:
+    """
+    从能对齐的重叠行数中选出一个；没有能对齐的行数时返回 0。
+
+    有多个时若 `expected` 在其中则返回它，否则返回最小的一个：
+    低估重叠只会重复扫描几行，高估则会漏掉基质。
+
+    Args:
+        candidates: 从小到大排列的重叠行数。
+        expected: 按滚动格数推算的重叠行数。
+    """
+    if not candidates:
+        return 0
+    if len(candidates) > 1 and expected in candidates:
+        return expected
+    return candidates[0]
+
+
+def find_row_overlap(
+    thumbnailer: CardThumbnailer,
+    previous: np.ndarray,
+    current: np.ndarray,
+    columns: int,
+    expected: int | None = None,
+) -> int:
+    """
+    计算当前页开头有多少行与上一页末尾的行相同。
+
+    两页的缩略图均按行排列、形状相同。返回值等于总行数时说明滚动没有生效（两页相同）；
+    返回 0 时说明两页没有重叠，可能一次滚动了超过一页。
+    多个重叠行数都能对齐时按 `choose_row_overlap` 选择。
+
+    Args:
+        thumbnailer: 用于比较缩略图的生成器。
+        previous: 上一页所有卡片的缩略图。
+        current: 当前页所有卡片的缩略图。
+        columns: 每行的卡片数。
+        expected: 按滚动格数推算的重叠行数。
+    """
+    return choose_row_overlap(
+        row_overlap_candidates(thumbnailer, previous, current, columns), expected
+    )
+
+
+def expected_row_overlap(scroll_clicks: int, rows: int) -> int:
+    """按一格滚动一行推算，滚动 `scroll_clicks` 格后两页重叠的行数。"""
+    return max(0, rows - abs(scroll_clicks))
@@ -0,0 +1,167 @@
+"""
+Action plans for the plan-then-execute scan mode.
+
+In this mode the scanner first sweeps the grid without touching any lock / abandon
+button, collecting the actions `decide_actions` asks for into an `ActionPlan`. The plan
+is published on an `ActionPlanBoard`, where the API can show it and, if confirmation
+is required, approve or reject it before the scanner executes it in one batch.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+from endfield_essence_recognizer.core.layout.base import Point
+from endfield_essence_recognizer.core.scanner.action_logic import (
+    ScannerAction,
+    apply_actions,
+)
+from endfield_essence_recognizer.core.scanner.models import (
+    EssenceData,
+    EvaluationResult,
+)
+
+
+class PlanStatus(StrEnum):
+    """操作计划的状态。"""
+
+    AWAITING_CONFIRMATION = "awaiting_confirmation"
+    """等待用户确认。"""
+    CONFIRMED = "confirmed"
+    """已确认，等待执行。"""
+    REJECTED = "rejected"
+    """已被用户拒绝，不会执行。"""
+    EXECUTING = "executing"
+    """正在执行。"""
+    COMPLETED = "completed"
+    """已执行完毕。"""
+    INTERRUPTED = "interrupted"
+    """扫描被中断，计划未执行完毕。"""
+
+
+class PlanEntryStatus(StrEnum):
+    """操作计划中单个基质的执行结果。"""
+
+    PENDING = "pending"
+    """尚未执行。"""
+    DONE = "done"
+    """已执行，且操作后的状态与预期一致。"""
+    SKIPPED = "skipped"
+    """执行前发现基质状态与扫描时不一致（可能已被手动修改），未执行操作。"""
+    FAILED = "failed"
+    """已执行，但操作后的状态与预期不一致。"""
+
+
+@dataclass
+class PlanEntry:
+    """操作计划中的一个基质及其需要执行的操作。"""
+
+    row: int
+    """所在行（翻页扫描时为整个库存中的行号），从 0 开始。"""
+    column: int
+    """所在列，从 0 开始。"""
+    position: Point
+    """基质图标在当前页中的位置。"""
+    data: EssenceData
+    """扫描时的识别结果。"""
+    evaluation: EvaluationResult
+    actions: list[ScannerAction]
+    status: PlanEntryStatus = PlanEntryStatus.PENDING
+
+    @property
+    def expected(self) -> EssenceData:
+        """执行操作后基质的预期状态。"""
+        return apply_actions(self.data, self.actions)
+
+
+@dataclass
+class ActionPlan:
+    """
+    一次只读扫描生成的操作计划。
+
+    `confirm` / `reject` 可在任意线程中调用；扫描线程以 `wait_for_decision` 等待决定。
+    """
+
+    id: int
+    entries: list[PlanEntry]
+    created_at: float = field(default_factory=time.time)
+    status: PlanStatus = PlanStatus.AWAITING_CONFIRMATION
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    _decided: threading.Event = field(
+        default_factory=threading.Event, init=False, repr=False, compare=False
+    )
+
+    def confirm(self) -> bool:
+        """确认执行计划。计划不在等待确认时返回 False。"""
+        return self._decide(PlanStatus.CONFIRMED)
+
+    def reject(self) -> bool:
+        """拒绝执行计划。计划不在等待确认时返回 False。"""
+        return self._decide(PlanStatus.REJECTED)
+
+    def _decide(self, status: PlanStatus) -> bool:
+        with self._lock:
+            if self.status != PlanStatus.AWAITING_CONFIRMATION:
+                return False
+            self.status = status
+        self._decided.set()
+        return True
+
+    def wait_for_decision(
+        self, stop_event: threading.Event, poll_interval: float = 0.1
+    ) -> bool:
+        """
+        等待用户确认或拒绝计划。
+
+        Returns:
+            计划是否被确认；扫描被中断（`stop_event` 被设置）时视为拒绝。
+        """
+        while not self._decided.wait(poll_interval):
+            if stop_event.is_set():
+                self._decide(PlanStatus.REJECTED)
+                break
+        return self.status == PlanStatus.CONFIRMED
+
+    def set_status(self, status: PlanStatus) -> None:
+        """更新执行进度（由扫描线程调用）。"""
+        with self._lock:
+            self.status = status
+
+
+class ActionPlanBoard:
+    """
+    保存最近一次生成的操作计划，供扫描线程与 API 共享。
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._current: ActionPlan | None = None
+        self._next_id = 1
+
+    @property
+    def current(self) -> ActionPlan | None:
+        """最近一次生成的操作计划；尚未生成过计划时为 None。"""
+        with self._lock:
+            return self._current
+
+    def publish(self, entries: list[PlanEntry], confirmed: bool) -> ActionPlan:
+        """
+        发布新的操作计划，替换之前的计划。
+
+        Args:
+            entries: 需要执行操作的基质。
+            confirmed: 是否无需等待确认。
+        """
+        with self._lock:
+            plan = ActionPlan(id=self._next_id, entries=entries)
+            self._next_id += 1
+            previous, self._current = self._current, plan
+        if previous is not None:
+            # 未被确认的旧计划不会再被执行
+            previous.reject()
+        if confirmed:
+            plan.confirm()
+        return plan
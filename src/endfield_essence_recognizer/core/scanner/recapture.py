@@ -0,0 +1,54 @@
+"""
+Re-capture the lock / abandon buttons when their state could not be recognized.
+
+An uncertain label usually means the panel was still animating when the screenshot was
+taken. Instead of skipping the essence, the scanner re-captures only the uncertain
+button regions a few times and accepts a label once enough frames agree on it.
+"""
+
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RecaptureProfile:
+    """重新截取不确定的按钮区域所需的配置。"""
+
+    max_frames: int = 5
+    """每个基质最多重新截取的帧数。"""
+    interval: float = 0.03
+    """两次截取之间的等待时间（秒）。"""
+    votes: int = 2
+    """同一确定结果出现的帧数达到此值时采纳该结果。"""
+
+
+@dataclass
+class RecaptureStats:
+    """一次扫描中重新截取的统计。"""
+
+    essences: int = 0
+    """识别结果不确定、需要重新截取的基质数。"""
+    frames: int = 0
+    """重新截取的总帧数。"""
+    recovered: int = 0
+    """重新截取后确定了状态的基质数。"""
+
+    @property
+    def failed(self) -> int:
+        """重新截取后仍无法确定状态的基质数。"""
+        return self.essences - self.recovered
+
+
+def vote[Label](readings: Iterable[Label], uncertain: Label, votes: int) -> Label:
+    """
+    在多帧的识别结果中投票。
+
+    Returns:
+        出现次数最多、且至少出现 `votes` 次的确定结果；没有时返回 `uncertain`。
+    """
+    counts = Counter(label for label in readings if label != uncertain)
+    if not counts:
+        return uncertain
+    label, count = counts.most_common(1)[0]
+    return label if count >= votes else uncertain
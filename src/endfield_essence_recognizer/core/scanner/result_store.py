@@ -0,0 +1,484 @@
+"""
+Local SQLite store of every essence seen by the scanner.
+
+Each scan is stored as a snapshot: one row per grid cell with the recognized stats,
+levels, rarity, lock / abandon state and the evaluation. Writes are buffered and
+executed in batches on a dedicated writer thread, so the scan loop never waits for
+the disk. Queries read the database directly and default to the most recent completed
+scan, which answers "what do I own" without scanning again; a scan still in progress or
+interrupted halfway only holds part of the inventory.
+"""
+
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from endfield_essence_recognizer.core.recognition import (
+    AbandonStatusLabel,
+    LockStatusLabel,
+    RarityLabel,
+)
+from endfield_essence_recognizer.core.scanner.models import (
+    EssenceData,
+    EssenceQuality,
+    EvaluationResult,
+)
+from endfield_essence_recognizer.utils.log import logger
+
+SCHEMA_VERSION = 3
+"""数据库结构版本，写入 `PRAGMA user_version`。"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scans (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    levels_recognized INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS essences (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    scan_id INTEGER NOT NULL REFERENCES scans(id) ON DELETE CASCADE,
+    scanned_at REAL NOT NULL,
+    grid_row INTEGER NOT NULL,
+    grid_column INTEGER NOT NULL,
+    stat1_id TEXT,
+    stat2_id TEXT,
+    stat3_id TEXT,
+    level1 INTEGER,
+    level2 INTEGER,
+    level3 INTEGER,
+    rarity TEXT NOT NULL,
+    lock_label TEXT NOT NULL,
+    abandon_label TEXT NOT NULL,
+    quality TEXT,
+    is_high_level INTEGER NOT NULL DEFAULT 0,
+    log_message TEXT
+);
+CREATE TABLE IF NOT EXISTS essence_weapons (
+    essence_id INTEGER NOT NULL REFERENCES essences(id) ON DELETE CASCADE,
+    weapon_id TEXT NOT NULL,
+    PRIMARY KEY (essence_id, weapon_id)
+);
+CREATE INDEX IF NOT EXISTS idx_essences_scan ON essences(scan_id, grid_row, grid_column);
+CREATE INDEX IF NOT EXISTS idx_essences_quality ON essences(scan_id, quality);
+DROP INDEX IF EXISTS idx_essences_stat1;
+DROP INDEX IF EXISTS idx_essences_stat2;
+DROP INDEX IF EXISTS idx_essences_stat3;
+CREATE INDEX IF NOT EXISTS idx_essences_scan_stat1 ON essences(scan_id, stat1_id, level1);
+CREATE INDEX IF NOT EXISTS idx_essences_scan_stat2 ON essences(scan_id, stat2_id, level2);
+CREATE INDEX IF NOT EXISTS idx_essences_scan_stat3 ON essences(scan_id, stat3_id, level3);
+CREATE INDEX IF NOT EXISTS idx_essence_weapons_weapon ON essence_weapons(weapon_id);
+"""
+
+_SELECT_SCANS = """
+SELECT s.id, s.started_at, s.finished_at, s.completed, s.levels_recognized,
+       (SELECT COUNT(*) FROM essences e WHERE e.scan_id = s.id)
+FROM scans s"""
+
+
+def _migrate(connection: sqlite3.Connection) -> None:
+    """升级旧版本创建的数据库。"""
+    columns = {row[1] for row in connection.execute("PRAGMA table_info(scans)")}
+    if "levels_recognized" not in columns:
+        # 旧版本不一定识别了词条等级，视为未识别
+        connection.execute(
+            "ALTER TABLE scans ADD COLUMN levels_recognized INTEGER NOT NULL DEFAULT 0"
+        )
+
+
+@dataclass(frozen=True)
+class StoredScan:
+    """一次扫描的概要。"""
+
+    id: int
+    started_at: float
+    """开始时间（Unix 时间戳）。"""
+    finished_at: float | None
+    """结束时间（Unix 时间戳）；扫描仍在进行或异常退出时为 None。"""
+    completed: bool
+    """是否扫描了全部基质（未被中断）。"""
+    levels_recognized: bool
+    """是否记录了词条等级；为 False 时等级条件不会匹配这次扫描的任何基质。"""
+    essence_count: int
+
+
+@dataclass(frozen=True)
+class StoredEssence:
+    """一个被扫描过的基质。"""
+
+    id: int
+    scan_id: int
+    scanned_at: float
+    """识别时间（Unix 时间戳）。"""
+    row: int
+    """所在行（翻页扫描时为整个库存中的行号），从 0 开始。"""
+    column: int
+    """所在列，从 0 开始。"""
+    data: EssenceData
+    evaluation: EvaluationResult | None
+
+
+@dataclass(frozen=True)
+class EssenceQuery:
+    """基质查询条件；为 None 的条件不限制。"""
+
+    scan_id: int | None = None
+    """扫描 ID，为 None 时查询最近一次完成（未被中断）的扫描。"""
+    weapon_id: str | None = None
+    """只返回匹配此武器的基质。"""
+    quality: EssenceQuality | None = None
+    rarity: RarityLabel | None = None
+    stat_id: str | None = None
+    """只返回任一词条为此属性的基质。"""
+    min_attribute_level: int | None = None
+    """基础属性（第 1 个词条）的最低等级。"""
+    min_secondary_level: int | None = None
+    """附加属性（第 2 个词条）的最低等级。"""
+    min_skill_level: int | None = None
+    """技能属性（第 3 个词条）的最低等级。"""
+    locked: bool | None = None
+    abandoned: bool | None = None
+    limit: int = 100
+    offset: int = 0
+
+
+class ScanResultStore:
+    """
+    基于 SQLite 的扫描结果存储。
+
+    写操作（`begin_scan` 之外）只把记录放入缓冲区，满 `batch_size` 条或扫描结束时
+    交给单独的写线程批量写入。读操作可在任意线程中调用，只会看到已写入的记录；
+    需要立即读到刚写入的记录时先调用 `flush`。
+    """
+
+    def __init__(self, path: Path, batch_size: int = 32) -> None:
+        """
+        Args:
+            path: 数据库文件路径，不存在时自动创建。
+            batch_size: 缓冲多少条记录后写入一次。
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self._buffer: list[
+            tuple[int, float, int, int, EssenceData, EvaluationResult | None]
+        ] = []
+        self._lock = threading.Lock()
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ScanResultWriter"
+        )
+        self._pending: list[Future[None]] = []
+        self._initialized = False
+
+    def __str__(self) -> str:
+        return "[ScanResultStore]"
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=10)
+        try:
+            connection.execute("PRAGMA foreign_keys = ON")
+            if not self._initialized:
+                connection.execute("PRAGMA journal_mode = WAL")
+                connection.executescript(_SCHEMA)
+                _migrate(connection)
+                connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                self._initialized = True
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    # 写入
+
+    def begin_scan(self, levels_recognized: bool = True) -> int:
+        """
+        开始一次扫描，返回扫描 ID。
+
+        Args:
+            levels_recognized: 这次扫描是否识别词条等级。
+        """
+        return self._writer.submit(
+            self._insert_scan, time.time(), levels_recognized
+        ).result()
+
+    def add(
+        self,
+        scan_id: int,
+        row: int,
+        column: int,
+        data: EssenceData,
+        evaluation: EvaluationResult | None,
+    ) -> None:
+        """记录一个基质。只放入缓冲区，不等待写入。"""
+        with self._lock:
+            self._buffer.append((scan_id, time.time(), row, column, data, evaluation))
+            if len(self._buffer) >= self.batch_size:
+                self._submit_buffer()
+
+    def finish_scan(self, scan_id: int, completed: bool) -> None:
+        """结束一次扫描：写入缓冲区中剩余的记录并标记扫描结束。不等待写入。"""
+        with self._lock:
+            self._submit_buffer()
+            self._pending.append(
+                self._writer.submit(self._finish_scan, scan_id, time.time(), completed)
+            )
+
+    def flush(self) -> None:
+        """写入缓冲区中的记录，并等待所有写操作完成。"""
+        with self._lock:
+            self._submit_buffer()
+            pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def close(self) -> None:
+        """写入所有记录并停止写线程。"""
+        self.flush()
+        self._writer.shutdown(wait=True)
+
+    def _submit_buffer(self) -> None:
+        """调用前须持有 `_lock`。"""
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        self._pending = [future for future in self._pending if not future.done()]
+        self._pending.append(self._writer.submit(self._write_batch, batch))
+
+    def _insert_scan(self, started_at: float, levels_recognized: bool) -> int:
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "INSERT INTO scans (started_at, levels_recognized) VALUES (?, ?)",
+                (started_at, int(levels_recognized)),
+            )
+            return int(cursor.lastrowid or 0)
+
+    def _finish_scan(self, scan_id: int, finished_at: float, completed: bool) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "UPDATE scans SET finished_at = ?, completed = ? WHERE id = ?",
+                (finished_at, int(completed), scan_id),
+            )
+
+    def _write_batch(
+        self,
+        batch: list[tuple[int, float, int, int, EssenceData, EvaluationResult | None]],
+    ) -> None:
+        try:
+            with self._connect() as connection:
+                for scan_id, scanned_at, row, column, data, evaluation in batch:
+                    stats = (list(data.stats) + [None] * 3)[:3]
+                    levels = (list(data.levels) + [None] * 3)[:3]
+                    cursor = connection.execute(
+                        """
+                        INSERT INTO essences (
+                            scan_id, scanned_at, grid_row, grid_column,
+                            stat1_id, stat2_id, stat3_id, level1, level2, level3,
+                            rarity, lock_label, abandon_label,
+                            quality, is_high_level, log_message
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (
+                            scan_id,
+                            scanned_at,
+                            row,
+                            column,
+                            *stats,
+                            *levels,
+                            str(data.rarity),
+                            str(data.lock_label),
+                            str(data.abandon_label),
+                            str(evaluation.quality) if evaluation else None,
+                            int(evaluation.is_high_level) if evaluation else 0,
+                            evaluation.log_message if evaluation else None,
+                        ),
+                    )
+                    if evaluation is not None and evaluation.matched_weapons:
+                        connection.executemany(
+                            "INSERT INTO essence_weapons (essence_id, weapon_id) "
+                            "VALUES (?, ?)",
+                            [
+                                (cursor.lastrowid, weapon_id)
+                                for weapon_id in sorted(evaluation.matched_weapons)
+                            ],
+                        )
+        except sqlite3.Error as e:
+            logger.warning(f"{self} 无法写入扫描结果 {self.path}: {e}")
+
+    # 查询
+
+    def latest_scan_id(self) -> int | None:
+        """最近一次完成（未被中断）的扫描的 ID；没有完成过的扫描时为 None。"""
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT MAX(id) FROM scans WHERE completed = 1"
+            ).fetchone()
+        return row[0] if row and row[0] is not None else None
+
+    def list_scans(self, limit: int = 20) -> list[StoredScan]:
+        """最近的扫描，按时间倒序排列。"""
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"{_SELECT_SCANS} ORDER BY s.id DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [_row_to_scan(row) for row in rows]
+
+    def get_scan(self, scan_id: int) -> StoredScan | None:
+        """指定 ID 的扫描；不存在时为 None。"""
+        with self._connect() as connection:
+            row = connection.execute(
+                f"{_SELECT_SCANS} WHERE s.id = ?", (scan_id,)
+            ).fetchone()
+        return _row_to_scan(row) if row else None
+
+    def query(self, query: EssenceQuery) -> tuple[int, list[StoredEssence]]:
+        """
+        按条件查询基质。
+
+        Returns:
+            (符合条件的总数, 按位置排序并分页后的基质)。
+        """
+        scan_id = query.scan_id if query.scan_id is not None else self.latest_scan_id()
+        if scan_id is None:
+            return 0, []
+
+        conditions = ["e.scan_id = ?"]
+        params: list[object] = [scan_id]
+        if query.weapon_id is not None:
+            conditions.append(
+                "EXISTS (SELECT 1 FROM essence_weapons w "
+                "WHERE w.essence_id = e.id AND w.weapon_id = ?)"
+            )
+            params.append(query.weapon_id)
+        if query.quality is not None:
+            conditions.append("e.quality = ?")
+            params.append(str(query.quality))
+        if query.rarity is not None:
+            conditions.append("e.rarity = ?")
+            params.append(str(query.rarity))
+        if query.stat_id is not None:
+            conditions.append("? IN (e.stat1_id, e.stat2_id, e.stat3_id)")
+            params.append(query.stat_id)
+        for column, level in (
+            ("level1", query.min_attribute_level),
+            ("level2", query.min_secondary_level),
+            ("level3", query.min_skill_level),
+        ):
+            if level is not None:
+                conditions.append(f"e.{column} >= ?")
+                params.append(level)
+        if query.locked is not None:
+            conditions.append("e.lock_label = ?")
+            params.append(
+                str(
+                    LockStatusLabel.LOCKED
+                    if query.locked
+                    else LockStatusLabel.NOT_LOCKED
+                )
+            )
+        if query.abandoned is not None:
+            conditions.append("e.abandon_label = ?")
+            params.append(
+                str(
+                    AbandonStatusLabel.ABANDONED
+                    if query.abandoned
+                    else AbandonStatusLabel.NOT_ABANDONED
+                )
+            )
+        where = " AND ".join(conditions)
+
+        with self._connect() as connection:
+            total = connection.execute(
+                f"SELECT COUNT(*) FROM essences e WHERE {where}", params
+            ).fetchone()[0]
+            rows = connection.execute(
+                f"""
+                SELECT e.id, e.scan_id, e.scanned_at, e.grid_row, e.grid_column,
+                       e.stat1_id, e.stat2_id, e.stat3_id,
+                       e.level1, e.level2, e.level3,
+                       e.rarity, e.lock_label, e.abandon_label,
+                       e.quality, e.is_high_level, e.log_message
+                FROM essences e WHERE {where}
+                ORDER BY e.grid_row, e.grid_column, e.id
+                LIMIT ? OFFSET ?
+                """,
+                [*params, query.limit, query.offset],
+            ).fetchall()
+            weapons: dict[int, set[str]] = {}
+            if rows:
+                ids = [row[0] for row in rows]
+                placeholders = ", ".join("?" * len(ids))
+                for essence_id, weapon_id in connection.execute(
+                    "SELECT essence_id, weapon_id FROM essence_weapons "
+                    f"WHERE essence_id IN ({placeholders})",
+                    ids,
+                ):
+                    weapons.setdefault(essence_id, set()).add(weapon_id)
+
+        return total, [_row_to_essence(row, weapons.get(row[0], set())) for row in rows]
+
+
+def _row_to_essence(row: tuple, matched_weapons: set[str]) -> StoredEssence:
+    (
+        essence_id,
+        scan_id,
+        scanned_at,
+        grid_row,
+        grid_column,
+        stat1_id,
+        stat2_id,
+        stat3_id,
+        level1,
+        level2,
+        level3,
+        rarity,
+        lock_label,
+        abandon_label,
+        quality,
+        is_high_level,
+        log_message,
+    ) = row
+    evaluation = (
+        EvaluationResult(
+            quality=EssenceQuality(quality),
+            log_message=log_message or "",
+            matched_weapons=matched_weapons,
+            is_high_level=bool(is_high_level),
+        )
+        if quality is not None
+        else None
+    )
+    return StoredEssence(
+        id=essence_id,
+        scan_id=scan_id,
+        scanned_at=scanned_at,
+        row=grid_row,
+        column=grid_column,
+        data=EssenceData(
+            stats=[stat1_id, stat2_id, stat3_id],
+            levels=[level1, level2, level3],
+            rarity=RarityLabel(rarity),
+            abandon_label=AbandonStatusLabel(abandon_label),
+            lock_label=LockStatusLabel(lock_label),
+        ),
+        evaluation=evaluation,
+    )
+
+
+def _row_to_scan(row: tuple) -> StoredScan:
+    scan_id, started_at, finished_at, completed, levels_recognized, count = row
+    return StoredScan(
+        id=scan_id,
+        started_at=started_at,
+        finished_at=finished_at,
+        completed=bool(completed),
+        levels_recognized=bool(levels_recognized),
+        essence_count=count,
+    )
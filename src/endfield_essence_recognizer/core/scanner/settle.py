@@ -0,0 +1,122 @@
+"""
+Detect when the essence info panel has finished redrawing after a click.
+
+Instead of sleeping a fixed duration after every click, the detector polls a cheap
+signature (a heavily downsampled grayscale thumbnail) of the panel region and returns
+as soon as the panel has changed and then held steady for a few consecutive frames.
+"""
+
+import time
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+from endfield_essence_recognizer.core.interfaces import ImageSource, WindowActions
+from endfield_essence_recognizer.core.layout.base import Region
+from endfield_essence_recognizer.utils.image import to_gray_image
+from endfield_essence_recognizer.utils.log import logger
+
+type PanelSignature = np.ndarray
+
+
+@dataclass(frozen=True)
+class PanelSettleProfile:
+    """实例化面板稳定检测所需的配置。"""
+
+    poll_interval: float = 0.02
+    """两次采样之间的等待时间（秒）。"""
+    max_wait: float = 0.3
+    """
+    等待面板稳定的上限（秒）。默认与原固定等待时间一致，因此最坏情况下不会更慢。
+    按实际经过的时间计算（包括截图与计算签名的耗时），而不是按轮询次数。
+    """
+    stable_frames: int = 2
+    """面板变化后需要连续保持不变的帧数。"""
+    diff_threshold: float = 2.0
+    """两个签名之间的平均灰度差超过此值时视为“发生变化”。"""
+    downsample: int = 8
+    """签名的降采样倍数。"""
+
+
+class PanelSettleDetector:
+    """
+    面板稳定检测器：点击后轮询面板签名，面板变化并稳定后立即返回。
+    """
+
+    def __init__(self, name: str, profile: PanelSettleProfile) -> None:
+        self.name = name
+        self.profile = profile
+
+    def __str__(self) -> str:
+        return f"[{self.name}]"
+
+    def capture_signature(
+        self, image_source: ImageSource, region: Region
+    ) -> PanelSignature:
+        """
+        截取指定区域并计算其签名（降采样后的灰度缩略图）。
+        """
+        gray = to_gray_image(image_source.screenshot(region))
+        height, width = gray.shape[:2]
+        factor = max(1, self.profile.downsample)
+        size = (max(1, width // factor), max(1, height // factor))
+        thumbnail = cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+        return thumbnail.astype(np.int16)
+
+    def signature_distance(self, a: PanelSignature, b: PanelSignature) -> float:
+        """两个签名之间的平均绝对灰度差。尺寸不一致时视为完全不同。"""
+        if a.shape != b.shape:
+            return float("inf")
+        return float(np.mean(np.abs(a - b)))
+
+    def wait_until_settled(
+        self,
+        image_source: ImageSource,
+        window_actions: WindowActions,
+        region: Region,
+        baseline: PanelSignature,
+    ) -> bool:
+        """
+        轮询面板签名，直到面板相对 baseline 发生变化并连续稳定 `stable_frames` 帧。
+
+        等待时间取实际经过的时间与累计等待时间中较大的一个：截图较慢时不会超出上限，
+        注入虚拟时钟的 `window_actions` 下也能按时结束。
+
+        Args:
+            image_source: 截图来源。
+            window_actions: 用于等待的窗口操作接口。
+            region: 需要监视的面板区域。
+            baseline: 点击前采集的签名。
+
+        Returns:
+            True 表示面板已变化并稳定；False 表示达到等待上限。
+        """
+        profile = self.profile
+        start = time.monotonic()
+        waited = 0.0
+        changed = False
+        stable_count = 0
+        previous = baseline
+
+        while max(waited, time.monotonic() - start) < profile.max_wait - 1e-9:
+            window_actions.wait(profile.poll_interval)
+            waited += profile.poll_interval
+
+            current = self.capture_signature(image_source, region)
+            if not changed:
+                changed = (
+                    self.signature_distance(current, baseline) > profile.diff_threshold
+                )
+            elif self.signature_distance(current, previous) <= profile.diff_threshold:
+                stable_count += 1
+                if stable_count >= profile.stable_frames:
+                    logger.trace(f"{self} 面板已稳定，耗时 {waited:.3f}s")
+                    return True
+            else:
+                # 面板仍在变化（例如动画进行中），重新计数
+                stable_count = 0
+            previous = current
+
+        logger.trace(f"{self} 等待面板稳定超时 ({profile.max_wait:.3f}s)")
+        return False
@@ -0,0 +1,129 @@
+"""
+Confirm that a lock / abandon click took effect.
+
+Instead of sleeping a fixed duration after clicking a button, the verifier polls the
+button's state with the lock / abandon recognizer and returns as soon as the label has
+flipped and stayed flipped for consecutive polls. A click that was dropped by the game
+is retried once, but only after a grace period: a late click that flips the button after
+the deadline must not be clicked again, or the second click would toggle it back.
+"""
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from endfield_essence_recognizer.core.interfaces import WindowActions
+from endfield_essence_recognizer.core.scanner.action_logic import ActionOutcome
+from endfield_essence_recognizer.utils.log import logger
+
+
+@dataclass(frozen=True)
+class ActionVerifyProfile:
+    """核对锁定/弃用操作所需的配置。"""
+
+    poll_interval: float = 0.02
+    """两次识别按钮状态之间的等待时间（秒）。"""
+    max_wait: float = 0.3
+    """
+    每次点击后等待状态变化的上限（秒）。默认与原固定等待时间一致。
+    按实际经过的时间计算（包括识别按钮状态的耗时），而不是按轮询次数。
+    """
+    confirmations: int = 2
+    """连续多少次识别为预期状态才视为操作已生效，避免把一帧误识别当作生效。"""
+    grace_period: float = 0.2
+    """超时后重新点击前再观察的时间（秒）。游戏响应较慢时状态可能在超时后才变化。"""
+    retries: int = 1
+    """状态没有变化时重新点击的次数。"""
+
+
+class ActionVerifier:
+    """
+    操作核对器：点击按钮后轮询按钮状态，直到变为预期状态。
+    """
+
+    def __init__(self, name: str, profile: ActionVerifyProfile) -> None:
+        self.name = name
+        self.profile = profile
+
+    def __str__(self) -> str:
+        return f"[{self.name}]"
+
+    def perform[Label](
+        self,
+        window_actions: WindowActions,
+        click: Callable[[], None],
+        read_state: Callable[[], Label],
+        before: Label,
+        expected: Label,
+    ) -> ActionOutcome:
+        """
+        点击按钮并等待其状态从 `before` 变为 `expected`。
+
+        只有在等待超时、宽限期内也没有变化且按钮明确仍为 `before` 时才会重新点击；
+        识别结果不确定时不重新点击，以免把已生效的操作再次切换回去。
+
+        Args:
+            window_actions: 用于等待的窗口操作接口。
+            click: 点击按钮。
+            read_state: 识别按钮当前的状态。
+            before: 点击前的状态。
+            expected: 点击后预期的状态。
+
+        Returns:
+            `CONFIRMED` 表示第一次点击即生效；`RETRIED` 表示重新点击后生效；
+            `FAILED` 表示状态始终没有变为预期状态。
+        """
+        profile = self.profile
+
+        for attempt in range(profile.retries + 1):
+            click()
+            confirmed, state = self._poll(
+                window_actions, read_state, expected, profile.max_wait
+            )
+            if not confirmed and state in (before, expected):
+                logger.debug(
+                    f"{self} 点击后按钮状态没有变化，重新点击前再观察一段时间。"
+                )
+                confirmed, state = self._poll(
+                    window_actions, read_state, expected, profile.grace_period
+                )
+            if confirmed:
+                return (
+                    ActionOutcome.CONFIRMED if attempt == 0 else ActionOutcome.RETRIED
+                )
+            if state != before:
+                logger.debug(f"{self} 按钮状态无法确定（{state}），不再重新点击。")
+                break
+            logger.debug(f"{self} 点击后按钮状态没有变化，重新点击。")
+        return ActionOutcome.FAILED
+
+    def _poll[Label](
+        self,
+        window_actions: WindowActions,
+        read_state: Callable[[], Label],
+        expected: Label,
+        max_wait: float,
+    ) -> tuple[bool, Label]:
+        """
+        轮询按钮状态，直到连续 `confirmations` 次为 `expected`，或经过 `max_wait` 秒。
+
+        等待时间取实际经过的时间与累计等待时间中较大的一个，
+        使识别较慢时不会超出上限，虚拟时钟下也能按时结束。
+
+        Returns:
+            (是否确认为预期状态, 最后一次识别的状态)。
+        """
+        profile = self.profile
+        start = time.monotonic()
+        waited = 0.0
+        streak = 0
+        while True:
+            window_actions.wait(profile.poll_interval)
+            waited += profile.poll_interval
+            state = read_state()
+            streak = streak + 1 if state == expected else 0
+            if streak >= profile.confirmations:
+                logger.trace(f"{self} 按钮状态已变化，耗时 {waited:.3f}s")
+                return True, state
+            if max(waited, time.monotonic() - start) >= max_wait - 1e-9:
+                return False, state
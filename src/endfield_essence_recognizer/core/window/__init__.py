@@ -1,8 +1,28 @@
-from .manager import WindowManager
+"""
+Interaction with the game window.
+
+`WindowManager` depends on Windows-only libraries (pygetwindow, pywin32), so it is
+imported lazily: the platform-independent submodules (`adapter`, `scaling`) can be
+imported on any platform, e.g. by the simulator.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .manager import WindowManager
 
 SUPPORTED_WINDOW_TITLES = ["Endfield"]
 """List of window titles that the application supports interacting with."""
 
+
+def __getattr__(name: str):
+    if name == "WindowManager":
+        from .manager import WindowManager
+
+        return WindowManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "SUPPORTED_WINDOW_TITLES",
     "WindowManager",
@@ -1,11 +1,16 @@
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING
 
 from cv2.typing import MatLike
 
 from endfield_essence_recognizer.core.interfaces import ImageSource, WindowActions
 from endfield_essence_recognizer.core.layout.base import Region
-from endfield_essence_recognizer.core.window.manager import WindowManager
+from endfield_essence_recognizer.utils.image import screenshot_many_by_plan
+
+if TYPE_CHECKING:
+    # Windows-only; the adapter module itself stays importable on every platform
+    from endfield_essence_recognizer.core.window.manager import WindowManager
 
 
 class WindowActionsAdapter(WindowActions, ImageSource):
@@ -16,7 +21,7 @@ class WindowActionsAdapter(WindowActions, ImageSource):
 
     def __init__(
         self,
-        window_manager: WindowManager,
+        window_manager: "WindowManager",
         sleeper: Callable[[float], None] = time.sleep,
     ):
         self._window_manager = window_manager
@@ -42,12 +47,18 @@ class WindowActionsAdapter(WindowActions, ImageSource):
     def click(self, relative_x: int, relative_y: int) -> None:
         self._window_manager.click(relative_x, relative_y)
 
+    def scroll(self, relative_x: int, relative_y: int, clicks: int) -> None:
+        self._window_manager.scroll(relative_x, relative_y, clicks)
+
     def wait(self, seconds: float) -> None:
         self._sleeper(seconds)
 
     def screenshot(self, relative_region: Region | None = None) -> MatLike:
         return self._window_manager.screenshot(relative_region)
 
+    def screenshot_many(self, relative_regions: Sequence[Region]) -> list[MatLike]:
+        return screenshot_many_by_plan(self, relative_regions)
+
     def get_client_size(self) -> tuple[int, int]:
         return self._window_manager.get_client_size()
 
@@ -79,5 +90,9 @@ class InMemoryImageSource(ImageSource):
         p0, p1 = relative_region.p0, relative_region.p1
         return self._image[p0.y : p1.y, p0.x : p1.x]
 
+    def screenshot_many(self, relative_regions: Sequence[Region]) -> list[MatLike]:
+        # The whole image is already in memory, no planning needed
+        return [self.screenshot(region) for region in relative_regions]
+
     def get_client_size(self) -> tuple[int, int]:
         return self._width, self._height
@@ -1,17 +1,26 @@
-from collections.abc import Sequence
+from __future__ import annotations
 
-import pygetwindow
-from cv2.typing import MatLike
+from typing import TYPE_CHECKING
 
-from endfield_essence_recognizer.core.layout.base import Region
 from endfield_essence_recognizer.core.window.windows_utils import (
+    GdiCaptureSession,
     click_on_window,
     get_client_size,
     get_support_window,
     screenshot_window,
+    scroll_on_window,
 )
 from endfield_essence_recognizer.exceptions import WindowNotFoundError
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import pygetwindow
+    from cv2.typing import MatLike
+
+    from endfield_essence_recognizer.core.interfaces import CaptureSession
+    from endfield_essence_recognizer.core.layout.base import Region
+
 
 class WindowManager:
     """
@@ -24,9 +33,15 @@ class WindowManager:
     resize, minimize the window at any time. For our use case, this is acceptable.
     """
 
-    def __init__(self, supported_titles: Sequence[str]):
+    def __init__(
+        self,
+        supported_titles: Sequence[str],
+        capture_session: CaptureSession | None = None,
+    ):
         self._supported_titles = list(supported_titles)
         self._window: pygetwindow.Window | None = None
+        # GDI resources are created lazily on the first capture
+        self._capture_session = capture_session or GdiCaptureSession()
 
     def _get_window(self) -> pygetwindow.Window | None:
         """Internal helper to get the current target window with caching."""
@@ -38,6 +53,15 @@ class WindowManager:
         """Clear the cached window instance."""
         self._window = None
 
+    def close(self) -> None:
+        """Release the resources held by the capture session."""
+        self._capture_session.close()
+
+    @property
+    def capture_session(self) -> CaptureSession:
+        """The capture session reused across screenshots."""
+        return self._capture_session
+
     @property
     def supported_titles(self) -> list[str]:
         """Get the list of supported window titles."""
@@ -102,7 +126,7 @@ class WindowManager:
         window = self._get_window()
         if window is None:
             raise WindowNotFoundError(self._supported_titles)
-        return screenshot_window(window, relative_region)
+        return screenshot_window(window, relative_region, self._capture_session)
 
     def click(self, relative_x: int, relative_y: int) -> None:
         """Perform a mouse click at the relative coordinates within the client area."""
@@ -110,3 +134,10 @@ class WindowManager:
         if window is None:
             raise WindowNotFoundError(self._supported_titles)
         click_on_window(window, relative_x, relative_y)
+
+    def scroll(self, relative_x: int, relative_y: int, clicks: int) -> None:
+        """Scroll the mouse wheel at the relative coordinates within the client area."""
+        window = self._get_window()
+        if window is None:
+            raise WindowNotFoundError(self._supported_titles)
+        scroll_on_window(window, relative_x, relative_y, clicks)
@@ -13,15 +13,25 @@ as the 1080p reference layout.
 
 The scaling layer sits between the raw window capture (physical) and the scanner engine
 (logical), transparently converting images and coordinates in both directions.
+
+When downscaling (physical clients larger than the logical size), ROI captures only
+grab and resize the physical rectangle behind the requested logical region. The
+rectangle is aligned to the denominator of the (rational) scale factor, so that its pixel
+grid coincides with the full-frame grid and the resized crop is identical to cropping a
+fully resized frame. Upscaling keeps the full-frame path: INTER_LINEAR rounding is not
+tile-invariant at every ratio, and those frames are small anyway.
 """
 
 import math
+from collections.abc import Sequence
+from fractions import Fraction
 
 import cv2
 from cv2.typing import MatLike
 
 from endfield_essence_recognizer.core.interfaces import ImageSource, WindowActions
-from endfield_essence_recognizer.core.layout.base import Region
+from endfield_essence_recognizer.core.layout.base import Point, Region
+from endfield_essence_recognizer.utils.image import screenshot_many_by_plan
 from endfield_essence_recognizer.utils.log import logger
 
 # Reference resolution (16:9 baseline).
@@ -29,6 +39,9 @@ REF_WIDTH = 1920
 REF_HEIGHT = 1080
 REF_RATIO = REF_WIDTH / REF_HEIGHT
 
+ROI_CAPTURE_MARGIN = 2
+"""Extra physical pixels captured around an ROI so resize border effects stay outside it."""
+
 
 def compute_logical_size(
     physical_width: int, physical_height: int
@@ -52,6 +65,39 @@ def compute_logical_size(
     return round(physical_width * scale), round(physical_height * scale), scale
 
 
+def map_logical_span(
+    start: int,
+    end: int,
+    physical_length: int,
+    logical_length: int,
+    margin: int = ROI_CAPTURE_MARGIN,
+) -> tuple[int, int, int, int]:
+    """
+    Map a logical span ``[start, end)`` on one axis to a grid-aligned physical span.
+
+    The physical span is widened by ``margin`` pixels on both sides and then aligned
+    to multiples of the denominator of ``logical_length / physical_length``, so that
+    its start maps to an integer logical coordinate.
+
+    Returns:
+        (physical_start, physical_end, logical_start, logical_end), where the logical
+        values are the exact logical span covered by the physical span.
+    """
+    ratio = Fraction(logical_length, physical_length)
+    step = ratio.denominator
+
+    physical_start = math.floor(start / ratio) - margin
+    physical_end = math.ceil(end / ratio) + margin
+    physical_start = max(0, physical_start // step * step)
+    physical_end = min(physical_length, -(-physical_end // step) * step)
+
+    logical_start = int(physical_start * ratio)
+    logical_end = (
+        logical_length if physical_end == physical_length else int(physical_end * ratio)
+    )
+    return physical_start, physical_end, logical_start, logical_end
+
+
 class ScalingImageSource(ImageSource):
     """
     An ImageSource adapter that scales captured images to a standard logical resolution.
@@ -97,10 +143,27 @@ class ScalingImageSource(ImageSource):
         """The original physical (width, height)."""
         return self._physical_width, self._physical_height
 
+    def _resize(self, physical: MatLike, target: tuple[int, int]) -> MatLike:
+        # INTER_AREA preserves edge sharpness when downscaling, which improves
+        # template matching accuracy; INTER_LINEAR is used for upscaling.
+        interpolation = cv2.INTER_AREA if self._scale_factor < 1.0 else cv2.INTER_LINEAR
+        return cv2.resize(physical, target, interpolation=interpolation)
+
+    def _can_capture_locally(self, region: Region) -> bool:
+        """Whether the ROI-local path yields the same pixels as the full-frame path."""
+        return self._scale_factor <= 1.0 and (
+            0 <= region.x0 < region.x1 <= self._logical_width
+            and 0 <= region.y0 < region.y1 <= self._logical_height
+        )
+
     def screenshot(self, relative_region: Region | None = None) -> MatLike:
         """
-        Capture a screenshot, scale it to the logical resolution, then optionally
-        crop to the specified region.
+        Capture a screenshot scaled to the logical resolution, optionally cropped to
+        the specified region.
+
+        When downscaling, only the physical rectangle behind a region (plus a small
+        margin) is captured and resized; the result is identical to cropping the
+        fully scaled frame.
 
         Args:
             relative_region: Region in logical coordinates to crop from the
@@ -109,23 +172,63 @@ class ScalingImageSource(ImageSource):
         Returns:
             The scaled (and optionally cropped) image as a BGR MatLike.
         """
-        full_physical = self._source.screenshot()
-
-        # INTER_AREA preserves edge sharpness when downscaling, which improves
-        # template matching accuracy; INTER_LINEAR is used for upscaling.
-        target = (self._logical_width, self._logical_height)
-        interpolation = cv2.INTER_AREA if self._scale_factor < 1.0 else cv2.INTER_LINEAR
-        scaled = cv2.resize(
-            full_physical,
-            target,
-            interpolation=interpolation,
+        if relative_region is None or not self._can_capture_locally(relative_region):
+            # Full-frame path; also keeps the plain slicing semantics for regions
+            # that are not fully inside the client area
+            scaled = self._resize(
+                self._source.screenshot(),
+                (self._logical_width, self._logical_height),
+            )
+            if relative_region is None:
+                return scaled
+            p0, p1 = relative_region.p0, relative_region.p1
+            return scaled[p0.y : p1.y, p0.x : p1.x]
+
+        px0, px1, lx0, lx1 = map_logical_span(
+            relative_region.x0,
+            relative_region.x1,
+            self._physical_width,
+            self._logical_width,
         )
-
-        if relative_region is None:
-            return scaled
+        py0, py1, ly0, ly1 = map_logical_span(
+            relative_region.y0,
+            relative_region.y1,
+            self._physical_height,
+            self._logical_height,
+        )
+        physical = self._source.screenshot(Region(Point(px0, py0), Point(px1, py1)))
+        scaled = self._resize(physical, (lx1 - lx0, ly1 - ly0))
 
         p0, p1 = relative_region.p0, relative_region.p1
-        return scaled[p0.y : p1.y, p0.x : p1.x]
+        return scaled[p0.y - ly0 : p1.y - ly0, p0.x - lx0 : p1.x - lx0]
+
+    def screenshot_many(self, relative_regions: Sequence[Region]) -> list[MatLike]:
+        """
+        Capture several logical regions, scaling each planned bounding rectangle once.
+
+        Regions that cannot take the ROI-local path (when upscaling, or regions not
+        fully inside the client area) are all cropped from one scaled full frame,
+        rather than capturing and resizing the full frame for every rectangle.
+        """
+        images: list[MatLike | None] = [None] * len(relative_regions)
+        local = [
+            index
+            for index, region in enumerate(relative_regions)
+            if self._can_capture_locally(region)
+        ]
+        if local:
+            captured = screenshot_many_by_plan(
+                self, [relative_regions[index] for index in local]
+            )
+            for index, image in zip(local, captured, strict=True):
+                images[index] = image
+        if len(local) < len(relative_regions):
+            scaled = self.screenshot()
+            for index, image in enumerate(images):
+                if image is None:
+                    p0, p1 = relative_regions[index].p0, relative_regions[index].p1
+                    images[index] = scaled[p0.y : p1.y, p0.x : p1.x]
+        return images  # type: ignore[return-value]
 
     def get_client_size(self) -> tuple[int, int]:
         """Return the logical client size (after scaling)."""
@@ -177,6 +280,14 @@ class ScalingWindowActions(WindowActions):
         physical_y = round(relative_y / self._scale_factor)
         self._actions.click(physical_x, physical_y)
 
+    def scroll(self, relative_x: int, relative_y: int, clicks: int) -> None:
+        """
+        Scroll the mouse wheel at logical coordinates, mapped back to physical coordinates.
+        """
+        physical_x = round(relative_x / self._scale_factor)
+        physical_y = round(relative_y / self._scale_factor)
+        self._actions.scroll(physical_x, physical_y, clicks)
+
     def wait(self, seconds: float) -> None:
         self._actions.wait(seconds)
 
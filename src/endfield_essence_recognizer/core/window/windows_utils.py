@@ -1,19 +1,39 @@
 """
 Windows OS-specific window utilities.
+
+The Windows-only libraries are imported on Windows only, so that this module (and
+`WindowManager`) can be imported elsewhere, e.g. by unit tests that inject a capture
+session. Calling the functions off Windows fails.
 """
 
-from collections.abc import Sequence
+from __future__ import annotations
+
+import ctypes
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
+import cv2
 import numpy as np
-import pyautogui
-import pygetwindow
-import win32con
-import win32gui  # ty:ignore[unresolved-import]
-import win32ui  # ty:ignore[unresolved-import]
-from cv2.typing import MatLike
 
 from endfield_essence_recognizer.core.layout.base import Point, Region
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from cv2.typing import MatLike
+
+    from endfield_essence_recognizer.core.interfaces import CaptureSession
+
+if sys.platform == "win32":
+    import pyautogui
+    import pygetwindow
+    import win32con
+    import win32gui  # ty:ignore[unresolved-import]
+    import win32ui  # ty:ignore[unresolved-import]
+
 
 def _get_window_hwnd(window: pygetwindow.Window) -> int:
     """获取 `pygetwindow` 窗口对象的窗口句柄"""
@@ -64,83 +84,219 @@ def _get_client_rect(window: pygetwindow.Window) -> Region:
     return Region(Point(left, top), Point(right, bottom))
 
 
-def _screenshot_by_win32ui(scope: Region) -> MatLike:
-    """
-    截取屏幕指定区域，返回 BGR 格式的 numpy 图像。
+class _BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [
+        ("biSize", ctypes.c_uint32),
+        ("biWidth", ctypes.c_int32),
+        ("biHeight", ctypes.c_int32),
+        ("biPlanes", ctypes.c_uint16),
+        ("biBitCount", ctypes.c_uint16),
+        ("biCompression", ctypes.c_uint32),
+        ("biSizeImage", ctypes.c_uint32),
+        ("biXPelsPerMeter", ctypes.c_int32),
+        ("biYPelsPerMeter", ctypes.c_int32),
+        ("biClrUsed", ctypes.c_uint32),
+        ("biClrImportant", ctypes.c_uint32),
+    ]
 
-    Args:
-        scope: 屏幕区域
 
-    Returns:
-        numpy 数组（BGR 格式，OpenCV 兼容）
-    """
-    left, top, right, bottom = scope.x0, scope.y0, scope.x1, scope.y1
-    width, height = right - left, bottom - top
-    if width <= 0 or height <= 0:
-        raise ValueError(f"Try to screenshot with invalid rect: {scope}")
+class _BITMAPINFO(ctypes.Structure):
+    _fields_ = [
+        ("bmiHeader", _BITMAPINFOHEADER),
+        ("bmiColors", ctypes.c_uint32 * 3),
+    ]
 
-    # 创建设备上下文和位图
-    screen_dc = win32gui.GetDC(0)
-    img_dc = win32ui.CreateDCFromHandle(screen_dc)
-    mem_dc = img_dc.CreateCompatibleDC()
 
-    bitmap = win32ui.CreateBitmap()
-    bitmap.CreateCompatibleBitmap(img_dc, width, height)
-    mem_dc.SelectObject(bitmap)
+_BI_RGB = 0
+_DIB_RGB_COLORS = 0
 
-    # 复制屏幕区域到位图
-    mem_dc.BitBlt((0, 0), (width, height), img_dc, (left, top), win32con.SRCCOPY)
 
-    # 读取位图像素数据
-    bmpinfo = bitmap.GetInfo()
-    bpp = bmpinfo["bmBitsPixel"] // 8  # 每像素字节数（通常为3或4）
-    stride = ((width * bpp + 3) // 4) * 4  # 4字节对齐的行宽
-    raw = bitmap.GetBitmapBits(True)
+@dataclass
+class _CaptureBuffer:
+    """某一尺寸对应的 GDI 位图及其预分配的像素缓冲区。"""
 
-    # 转换为 numpy 数组
-    arr = np.frombuffer(raw, dtype=np.uint8)
-    arr = arr.reshape((height, stride))
-    arr = arr[:, : width * bpp]  # 移除对齐填充
-    arr = arr.reshape((height, width, bpp))
+    bitmap: Any
+    """win32ui 位图对象（PyCBitmap）。"""
+    bitmap_info: _BITMAPINFO
+    """GetDIBits 所需的位图描述（32 位、自上而下）。"""
+    pixels: np.ndarray
+    """预分配的 BGRA 像素缓冲区，GetDIBits 直接写入其中。"""
 
-    # 如果是 BGRA 格式，转换为 BGR
-    if bpp == 4:
-        arr = arr[:, :, :3]  # 丢弃 alpha 通道
 
-    # 释放 GDI 资源
-    mem_dc.DeleteDC()
-    img_dc.DeleteDC()
-    win32gui.ReleaseDC(0, screen_dc)
-    win32gui.DeleteObject(bitmap.GetHandle())
+class GdiCaptureSession:
+    """
+    基于 GDI 的可复用截图会话。
 
-    return arr.copy()
+    屏幕 DC 与内存 DC 在首次截图时创建并一直保留；位图及其像素缓冲区按截图尺寸缓存，
+    截取同样大小的区域时直接复用。`GetDIBits` 只能整体读取一张位图，
+    因此按尺寸缓存位图（而不是只保留一张客户区大小的位图），避免截取小 ROI 时读取整个客户区。
 
+    截图结果由调用方持有，不会被后续截图覆盖。会话可以在多个线程间共享。
+    """
 
-def screenshot_window(
+    def __init__(self, max_cached_sizes: int = 8) -> None:
+        self._max_cached_sizes = max_cached_sizes
+        self._lock = threading.Lock()
+        self._gdi32: Any = None
+        self._screen_dc: int | None = None
+        self._src_dc: Any = None
+        self._mem_dc: Any = None
+        self._buffers: OrderedDict[tuple[int, int], _CaptureBuffer] = OrderedDict()
+
+    def _ensure_dcs(self) -> None:
+        if self._mem_dc is not None:
+            return
+        if self._gdi32 is None:
+            # 使用独立的 WinDLL 实例，避免修改全局 windll.gdi32 的函数签名
+            gdi32 = ctypes.WinDLL("gdi32")  # ty:ignore[unresolved-attribute]
+            gdi32.GetDIBits.argtypes = [
+                ctypes.c_void_p,
+                ctypes.c_void_p,
+                ctypes.c_uint,
+                ctypes.c_uint,
+                ctypes.c_void_p,
+                ctypes.c_void_p,
+                ctypes.c_uint,
+            ]
+            gdi32.GetDIBits.restype = ctypes.c_int
+            self._gdi32 = gdi32
+        self._screen_dc = win32gui.GetDC(0)
+        self._src_dc = win32ui.CreateDCFromHandle(self._screen_dc)
+        self._mem_dc = self._src_dc.CreateCompatibleDC()
+
+    def _get_buffer(self, width: int, height: int) -> _CaptureBuffer:
+        key = (width, height)
+        buffer = self._buffers.get(key)
+        if buffer is not None:
+            self._buffers.move_to_end(key)
+            return buffer
+
+        bitmap = win32ui.CreateBitmap()
+        bitmap.CreateCompatibleBitmap(self._src_dc, width, height)
+
+        bitmap_info = _BITMAPINFO()
+        header = bitmap_info.bmiHeader
+        header.biSize = ctypes.sizeof(_BITMAPINFOHEADER)
+        header.biWidth = width
+        header.biHeight = -height  # 负值表示自上而下的行顺序
+        header.biPlanes = 1
+        header.biBitCount = 32
+        header.biCompression = _BI_RGB
+
+        buffer = _CaptureBuffer(
+            bitmap=bitmap,
+            bitmap_info=bitmap_info,
+            pixels=np.empty((height, width, 4), dtype=np.uint8),
+        )
+        self._buffers[key] = buffer
+
+        while len(self._buffers) > self._max_cached_sizes:
+            # 位图只在 capture 期间被选入内存 DC，此时可以安全删除
+            _key, evicted = self._buffers.popitem(last=False)
+            win32gui.DeleteObject(evicted.bitmap.GetHandle())
+        return buffer
+
+    def capture(self, scope: Region) -> MatLike:
+        """
+        截取屏幕指定区域，返回 BGR 格式的 numpy 图像。
+
+        Args:
+            scope: 屏幕区域
+
+        Returns:
+            numpy 数组（BGR 格式，OpenCV 兼容）
+        """
+        left, top = scope.x0, scope.y0
+        width, height = scope.x1 - scope.x0, scope.y1 - scope.y0
+        if width <= 0 or height <= 0:
+            raise ValueError(f"Try to screenshot with invalid rect: {scope}")
+
+        with self._lock:
+            self._ensure_dcs()
+            buffer = self._get_buffer(width, height)
+
+            # 复制屏幕区域到位图
+            previous = self._mem_dc.SelectObject(buffer.bitmap)
+            try:
+                self._mem_dc.BitBlt(
+                    (0, 0), (width, height), self._src_dc, (left, top), win32con.SRCCOPY
+                )
+            finally:
+                # GetDIBits 要求位图不能被选入任何 DC；同时保证缓存的位图随时可以删除
+                self._mem_dc.SelectObject(previous)
+
+            # 直接读取到预分配的缓冲区
+            lines = self._gdi32.GetDIBits(
+                self._mem_dc.GetSafeHdc(),
+                buffer.bitmap.GetHandle(),
+                0,
+                height,
+                buffer.pixels.ctypes.data_as(ctypes.c_void_p),
+                ctypes.byref(buffer.bitmap_info),
+                _DIB_RGB_COLORS,
+            )
+            if lines != height:
+                raise RuntimeError(f"GetDIBits failed for rect: {scope}")
+
+            # 丢弃 alpha 通道，结果为调用方独立持有的新数组
+            return cv2.cvtColor(buffer.pixels, cv2.COLOR_BGRA2BGR)
+
+    def close(self) -> None:
+        """释放所有 GDI 资源。之后再次截图会重新创建。"""
+        with self._lock:
+            # 先删除 DC（此时没有缓存的位图被选入内存 DC），再删除位图
+            if self._mem_dc is not None:
+                self._mem_dc.DeleteDC()
+                self._mem_dc = None
+            if self._src_dc is not None:
+                self._src_dc.DeleteDC()
+                self._src_dc = None
+            if self._screen_dc is not None:
+                win32gui.ReleaseDC(0, self._screen_dc)
+                self._screen_dc = None
+            for buffer in self._buffers.values():
+                win32gui.DeleteObject(buffer.bitmap.GetHandle())
+            self._buffers.clear()
+
+
+def get_screen_scope(
     window: pygetwindow.Window, relative_region: Region | None = None
+) -> Region:
+    """将客户区相对区域转换为屏幕坐标；`relative_region` 为 None 时返回整个客户区。"""
+    client_rect = _get_client_rect(window)
+    if relative_region is None:
+        return client_rect
+    return Region(
+        Point(client_rect.x0 + relative_region.x0, client_rect.y0 + relative_region.y0),
+        Point(client_rect.x0 + relative_region.x1, client_rect.y0 + relative_region.y1),
+    )
+
+
+def screenshot_window(
+    window: pygetwindow.Window,
+    relative_region: Region | None = None,
+    session: CaptureSession | None = None,
 ) -> MatLike:
     """
     截取指定窗口的客户区，返回 BGR 格式的 numpy 图像。
 
     Args:
         window: pygetwindow 窗口对象
+        relative_region: 客户区内的相对区域，None 表示整个客户区
+        session: 复用的截图会话；为 None 时创建一次性会话
 
     Returns:
         numpy 数组（BGR 格式，OpenCV 兼容）
     """
-    client_rect = _get_client_rect(window)
-    if relative_region is not None:
-        scope = Region(
-            Point(
-                client_rect.x0 + relative_region.x0, client_rect.y0 + relative_region.y0
-            ),
-            Point(
-                client_rect.x0 + relative_region.x1, client_rect.y0 + relative_region.y1
-            ),
-        )
-    else:
-        scope = client_rect
-    return _screenshot_by_win32ui(scope)
+    scope = get_screen_scope(window, relative_region)
+    if session is not None:
+        return session.capture(scope)
+
+    one_shot = GdiCaptureSession(max_cached_sizes=1)
+    try:
+        return one_shot.capture(scope)
+    finally:
+        one_shot.close()
 
 
 def get_support_window(
@@ -174,3 +330,18 @@ def click_on_window(
     screen_x = left + relative_x
     screen_y = top + relative_y
     pyautogui.click(screen_x, screen_y)
+
+
+_WHEEL_DELTA = 120
+"""Windows 中一格鼠标滚轮的滚动量。"""
+
+
+def scroll_on_window(
+    window: pygetwindow.Window, relative_x: int, relative_y: int, clicks: int
+) -> None:
+    """在指定窗口的客户区坐标 (x, y) 位置滚动鼠标滚轮 `clicks` 格（正数向上）"""
+    (left, top), (_right, _bottom) = _get_client_rect(window)
+    screen_x = left + relative_x
+    screen_y = top + relative_y
+    # pyautogui 在 Windows 上直接把参数作为滚动量传给系统，而不是格数
+    pyautogui.scroll(clicks * _WHEEL_DELTA, screen_x, screen_y)
@@ -1,5 +1,6 @@
 from .core import (
     get_delivery_claimer_engine_dep,
+    get_incremental_scan_store_dep,
     get_one_time_recognition_engine_dep,
     get_resolution_profile,
     get_resolution_profile_dep,
@@ -11,14 +12,21 @@ from .recognition import (
     get_abandon_status_recognizer_dep,
     get_attribute_level_recognizer_dep,
     get_attribute_recognizer_dep,
+    get_card_thumbnailer_dep,
     get_delivery_job_reward_recognizer_dep,
     get_delivery_scene_recognizer_dep,
+    get_grid_rarity_classifier_dep,
     get_lock_status_recognizer_dep,
     get_ui_scene_recognizer_dep,
 )
 from .services import (
+    get_action_plan_board_dep,
+    get_action_plan_service,
     get_audio_service,
+    get_inventory_service,
     get_log_service,
+    get_scan_checkpoint_store_dep,
+    get_scan_result_store_dep,
     get_scanner_service,
     get_screenshot_service,
     get_static_data_service,
@@ -30,6 +38,7 @@ from .settings import (
     get_user_setting_manager_at,
     get_user_setting_manager_dep,
 )
+from .warmup import get_warmup_service
 from .window import (
     get_game_window_manager,
     get_webview_window_manager,
@@ -40,19 +49,27 @@ from .window import (
 __all__ = [
     "default_user_setting_manager",
     "get_abandon_status_recognizer_dep",
+    "get_action_plan_board_dep",
+    "get_action_plan_service",
     "get_attribute_level_recognizer_dep",
     "get_attribute_recognizer_dep",
     "get_audio_service",
+    "get_card_thumbnailer_dep",
     "get_config_path_dep",
     "get_delivery_claimer_engine_dep",
     "get_delivery_job_reward_recognizer_dep",
     "get_delivery_scene_recognizer_dep",
     "get_game_window_manager",
+    "get_grid_rarity_classifier_dep",
+    "get_incremental_scan_store_dep",
+    "get_inventory_service",
     "get_lock_status_recognizer_dep",
     "get_log_service",
     "get_one_time_recognition_engine_dep",
     "get_resolution_profile",
     "get_resolution_profile_dep",
+    "get_scan_checkpoint_store_dep",
+    "get_scan_result_store_dep",
     "get_scanner_context_dep",
     "get_scanner_engine_dep",
     "get_scanner_service",
@@ -64,6 +81,7 @@ __all__ = [
     "get_ui_scene_recognizer_dep",
     "get_user_setting_manager_at",
     "get_user_setting_manager_dep",
+    "get_warmup_service",
     "get_webview_window_manager",
     "require_game_or_webview_is_active",
     "require_game_window_exists",
@@ -1,5 +1,8 @@
+from functools import lru_cache
+
 from fastapi import Depends
 
+from endfield_essence_recognizer.core.config import ServerConfig, get_server_config
 from endfield_essence_recognizer.core.delivery_claimer.engine import (
     DeliveryClaimerEngine,
 )
@@ -7,23 +10,35 @@ from endfield_essence_recognizer.core.layout.base import ResolutionProfile
 from endfield_essence_recognizer.core.layout.factory import (
     build_resolution_profile,
 )
+from endfield_essence_recognizer.core.path import get_incremental_scan_store_path
 from endfield_essence_recognizer.core.recognition import (
     AbandonStatusRecognizer,
     AttributeLevelRecognizer,
     AttributeRecognizer,
+    CardThumbnailer,
     DeliveryJobRewardRecognizer,
     DeliverySceneRecognizer,
+    GridRarityClassifier,
     LockStatusRecognizer,
     RarityRecognizer,
     UISceneRecognizer,
 )
+from endfield_essence_recognizer.core.scanner.checkpoint import ScanCheckpointStore
 from endfield_essence_recognizer.core.scanner.context import (
     ScannerContext,
 )
 from endfield_essence_recognizer.core.scanner.engine import (
     OneTimeRecognitionEngine,
+    ScanMode,
     ScannerEngine,
 )
+from endfield_essence_recognizer.core.scanner.incremental import IncrementalScanStore
+from endfield_essence_recognizer.core.scanner.paging import PagingProfile
+from endfield_essence_recognizer.core.scanner.plan import ActionPlanBoard
+from endfield_essence_recognizer.core.scanner.recapture import RecaptureProfile
+from endfield_essence_recognizer.core.scanner.result_store import ScanResultStore
+from endfield_essence_recognizer.core.scanner.settle import PanelSettleProfile
+from endfield_essence_recognizer.core.scanner.verify import ActionVerifyProfile
 from endfield_essence_recognizer.core.window import WindowManager
 from endfield_essence_recognizer.core.window.adapter import WindowActionsAdapter
 from endfield_essence_recognizer.core.window.scaling import (
@@ -38,14 +53,19 @@ from .recognition import (
     get_abandon_status_recognizer_dep,
     get_attribute_level_recognizer_dep,
     get_attribute_recognizer_dep,
+    get_card_thumbnailer_dep,
     get_delivery_job_reward_recognizer_dep,
     get_delivery_scene_recognizer_dep,
+    get_grid_rarity_classifier_dep,
     get_lock_status_recognizer_dep,
     get_rarity_recognizer_dep,
     get_ui_scene_recognizer_dep,
 )
 from .services import (
+    get_action_plan_board_dep,
     get_audio_service,
+    get_scan_checkpoint_store_dep,
+    get_scan_result_store_dep,
     get_static_game_data,
 )
 from .settings import (
@@ -89,6 +109,10 @@ def get_scanner_context_dep(
     ),
     rarity_recognizer: RarityRecognizer = Depends(get_rarity_recognizer_dep),
     ui_scene_recognizer: UISceneRecognizer = Depends(get_ui_scene_recognizer_dep),
+    grid_rarity_classifier: GridRarityClassifier = Depends(
+        get_grid_rarity_classifier_dep
+    ),
+    card_thumbnailer: CardThumbnailer = Depends(get_card_thumbnailer_dep),
     static_data: StaticGameData = Depends(get_static_game_data),
 ) -> ScannerContext:
     """
@@ -102,6 +126,20 @@ def get_scanner_context_dep(
         rarity_recognizer=rarity_recognizer,
         ui_scene_recognizer=ui_scene_recognizer,
         static_game_data=static_data,
+        grid_rarity_classifier=grid_rarity_classifier,
+        card_thumbnailer=card_thumbnailer,
+    )
+
+
+@lru_cache
+def get_incremental_scan_store_dep() -> IncrementalScanStore:
+    """
+    Get the IncrementalScanStore singleton, which keeps the results of previous scans.
+    """
+    return IncrementalScanStore(
+        "IncrementalScanStore",
+        get_card_thumbnailer_dep(),
+        persist_path=get_incremental_scan_store_path(),
     )
 
 
@@ -110,6 +148,11 @@ def get_scanner_engine_dep(
     window_manager: WindowManager = Depends(get_game_window_manager),
     user_setting_manager: UserSettingManager = Depends(get_user_setting_manager_dep),
     profile: ResolutionProfile = Depends(get_resolution_profile_dep),
+    server_config: ServerConfig = Depends(get_server_config),
+    incremental_store: IncrementalScanStore = Depends(get_incremental_scan_store_dep),
+    result_store: ScanResultStore = Depends(get_scan_result_store_dep),
+    action_plan_board: ActionPlanBoard = Depends(get_action_plan_board_dep),
+    checkpoint_store: ScanCheckpointStore = Depends(get_scan_checkpoint_store_dep),
 ) -> ScannerEngine:
     """
     Get a ScannerEngine instance with scaling middleware.
@@ -122,6 +165,27 @@ def get_scanner_engine_dep(
         window_actions=window_actions,
         user_setting_manager=user_setting_manager,
         profile=profile,
+        settle_profile=PanelSettleProfile(),
+        action_verify_profile=ActionVerifyProfile(),
+        recapture_profile=(
+            RecaptureProfile(max_frames=server_config.uncertain_recapture_frames)
+            if server_config.uncertain_recapture_frames > 0
+            else None
+        ),
+        scan_mode=(
+            ScanMode.PLANNED
+            if server_config.planned_scan
+            else ScanMode.PIPELINED
+            if server_config.pipelined_scan
+            else ScanMode.SEQUENTIAL
+        ),
+        paging_profile=PagingProfile() if server_config.multi_page_scan else None,
+        skip_empty_cells=server_config.skip_empty_cells,
+        incremental_store=incremental_store if server_config.incremental_scan else None,
+        result_store=result_store if server_config.save_scan_results else None,
+        action_plan_board=action_plan_board,
+        confirm_action_plan=server_config.confirm_action_plan,
+        checkpoint_store=checkpoint_store,
     )
 
 
@@ -1,30 +1,33 @@
-from functools import lru_cache
-
 from endfield_essence_recognizer.core.recognition import (
     AbandonStatusRecognizer,
     AttributeLevelRecognizer,
     AttributeRecognizer,
+    CardThumbnailer,
     DeliveryJobRewardRecognizer,
     DeliverySceneRecognizer,
+    GridRarityClassifier,
     LockStatusRecognizer,
     RarityRecognizer,
     UISceneRecognizer,
     prepare_abandon_status_recognizer,
     prepare_attribute_level_recognizer,
     prepare_attribute_recognizer,
+    prepare_card_thumbnailer,
     prepare_delivery_job_reward_recognizer,
     prepare_delivery_scene_recognizer,
+    prepare_grid_rarity_classifier,
     prepare_lock_status_recognizer,
     prepare_rarity_recognizer,
     prepare_ui_scene_recognizer,
 )
 from endfield_essence_recognizer.dependencies.services import get_static_game_data
+from endfield_essence_recognizer.utils.cache import locked_cache
 
 
 # Though the underlying factory functions are already cached,
-# still wrap these functions with lru_cache to show
-# singleton semantics
-@lru_cache
+# still wrap these functions with locked_cache to show
+# singleton semantics; they are also called from warm-up threads
+@locked_cache
 def get_attribute_recognizer_dep() -> AttributeRecognizer:
     """
     Get the default attribute Recognizer instance.
@@ -32,7 +35,7 @@ def get_attribute_recognizer_dep() -> AttributeRecognizer:
     return prepare_attribute_recognizer(get_static_game_data())
 
 
-@lru_cache
+@locked_cache
 def get_attribute_level_recognizer_dep() -> AttributeLevelRecognizer:
     """
     Get the default attribute level Recognizer instance.
@@ -40,7 +43,7 @@ def get_attribute_level_recognizer_dep() -> AttributeLevelRecognizer:
     return prepare_attribute_level_recognizer()
 
 
-@lru_cache
+@locked_cache
 def get_abandon_status_recognizer_dep() -> AbandonStatusRecognizer:
     """
     Get the default abandon status Recognizer instance.
@@ -48,7 +51,7 @@ def get_abandon_status_recognizer_dep() -> AbandonStatusRecognizer:
     return prepare_abandon_status_recognizer()
 
 
-@lru_cache
+@locked_cache
 def get_lock_status_recognizer_dep() -> LockStatusRecognizer:
     """
     Get the default lock status Recognizer instance.
@@ -56,7 +59,7 @@ def get_lock_status_recognizer_dep() -> LockStatusRecognizer:
     return prepare_lock_status_recognizer()
 
 
-@lru_cache
+@locked_cache
 def get_ui_scene_recognizer_dep() -> UISceneRecognizer:
     """
     Get the default UI scene Recognizer instance.
@@ -64,7 +67,7 @@ def get_ui_scene_recognizer_dep() -> UISceneRecognizer:
     return prepare_ui_scene_recognizer()
 
 
-@lru_cache
+@locked_cache
 def get_delivery_scene_recognizer_dep() -> DeliverySceneRecognizer:
     """
     Get the default delivery scene Recognizer instance.
@@ -72,7 +75,7 @@ def get_delivery_scene_recognizer_dep() -> DeliverySceneRecognizer:
     return prepare_delivery_scene_recognizer()
 
 
-@lru_cache
+@locked_cache
 def get_delivery_job_reward_recognizer_dep() -> DeliveryJobRewardRecognizer:
     """
     Get the default delivery job reward Recognizer instance.
@@ -80,9 +83,25 @@ def get_delivery_job_reward_recognizer_dep() -> DeliveryJobRewardRecognizer:
     return prepare_delivery_job_reward_recognizer()
 
 
-@lru_cache
+@locked_cache
 def get_rarity_recognizer_dep() -> RarityRecognizer:
     """
     Get the default rarity Recognizer instance.
     """
     return prepare_rarity_recognizer()
+
+
+@locked_cache
+def get_grid_rarity_classifier_dep() -> GridRarityClassifier:
+    """
+    Get the default grid rarity classifier instance.
+    """
+    return prepare_grid_rarity_classifier()
+
+
+@locked_cache
+def get_card_thumbnailer_dep() -> CardThumbnailer:
+    """
+    Get the default card thumbnailer instance.
+    """
+    return prepare_card_thumbnailer()
@@ -3,16 +3,23 @@ from functools import lru_cache
 
 from fastapi import Depends
 
+from endfield_essence_recognizer.core.path import get_scan_results_db_path
+from endfield_essence_recognizer.core.scanner.checkpoint import ScanCheckpointStore
+from endfield_essence_recognizer.core.scanner.plan import ActionPlanBoard
+from endfield_essence_recognizer.core.scanner.result_store import ScanResultStore
 from endfield_essence_recognizer.game_data.static_game_data import StaticGameData
+from endfield_essence_recognizer.services.action_plan_service import ActionPlanService
 from endfield_essence_recognizer.services.audio_service import (
     AudioService,
     build_audio_service_profile,
 )
+from endfield_essence_recognizer.services.inventory_service import InventoryService
 from endfield_essence_recognizer.services.log_service import LogService
 from endfield_essence_recognizer.services.scanner_service import ScannerService
 from endfield_essence_recognizer.services.screenshot_service import ScreenshotService
 from endfield_essence_recognizer.services.static_data_service import StaticDataService
 from endfield_essence_recognizer.services.system_service import SystemService
+from endfield_essence_recognizer.utils.cache import locked_cache
 
 from .window import get_game_window_manager
 
@@ -48,10 +55,10 @@ def get_screenshot_service() -> ScreenshotService:
     return ScreenshotService(get_game_window_manager())
 
 
-@lru_cache
+@locked_cache
 def get_static_game_data() -> StaticGameData:
     """
-    Get the StaticGameData singleton.
+    Get the StaticGameData singleton. Safe to call from the warm-up threads.
     """
     data_root = importlib.resources.files("endfield_essence_recognizer") / "data" / "v2"
     return StaticGameData(data_root)
@@ -67,3 +74,46 @@ def get_static_data_service(
     instance per request.
     """
     return StaticDataService(static_data)
+
+
+@lru_cache
+def get_scan_result_store_dep() -> ScanResultStore:
+    """
+    Get the ScanResultStore singleton, which persists the results of every scan.
+    """
+    return ScanResultStore(get_scan_results_db_path())
+
+
+def get_inventory_service(
+    store: ScanResultStore = Depends(get_scan_result_store_dep),
+) -> InventoryService:
+    """
+    Get an InventoryService instance.
+    """
+    return InventoryService(store)
+
+
+@lru_cache
+def get_action_plan_board_dep() -> ActionPlanBoard:
+    """
+    Get the ActionPlanBoard singleton, shared by the scanner and the API.
+    """
+    return ActionPlanBoard()
+
+
+def get_action_plan_service(
+    board: ActionPlanBoard = Depends(get_action_plan_board_dep),
+) -> ActionPlanService:
+    """
+    Get an ActionPlanService instance.
+    """
+    return ActionPlanService(board)
+
+
+@lru_cache
+def get_scan_checkpoint_store_dep() -> ScanCheckpointStore:
+    """
+    Get the ScanCheckpointStore singleton, which keeps the progress of the last
+    interrupted scan.
+    """
+    return ScanCheckpointStore()
@@ -0,0 +1,88 @@
+from functools import lru_cache, partial
+
+from endfield_essence_recognizer.core.layout.factory import build_resolution_profile
+from endfield_essence_recognizer.core.window import WindowManager
+from endfield_essence_recognizer.core.window.scaling import (
+    REF_HEIGHT,
+    REF_WIDTH,
+    compute_logical_size,
+)
+from endfield_essence_recognizer.exceptions import WindowNotFoundError
+from endfield_essence_recognizer.services.warmup_service import (
+    WarmupComponent,
+    WarmupService,
+)
+
+from .recognition import (
+    get_abandon_status_recognizer_dep,
+    get_attribute_level_recognizer_dep,
+    get_attribute_recognizer_dep,
+    get_card_thumbnailer_dep,
+    get_delivery_job_reward_recognizer_dep,
+    get_delivery_scene_recognizer_dep,
+    get_grid_rarity_classifier_dep,
+    get_lock_status_recognizer_dep,
+    get_rarity_recognizer_dep,
+    get_ui_scene_recognizer_dep,
+)
+from .services import get_static_game_data
+from .window import get_game_window_manager
+
+
+def warm_resolution_profile(window_manager: WindowManager) -> None:
+    """
+    Build the layout of the game window, or of the reference resolution when the game
+    is not running yet.
+
+    Runs on a warm-up thread but only reads the client size of the window; the window
+    manager is created by the caller, and its GDI capture resources are only created
+    on the first screenshot.
+    """
+    try:
+        width, height = window_manager.get_client_size()
+    except WindowNotFoundError:
+        width, height = REF_WIDTH, REF_HEIGHT
+    logical_w, logical_h, _ = compute_logical_size(width, height)
+    build_resolution_profile(logical_w, logical_h)
+
+
+@lru_cache
+def get_warmup_service() -> WarmupService:
+    """
+    Get the WarmupService singleton, which loads every recognizer, the static game
+    data and the resolution profile in the background at startup.
+
+    The app lifespan calls it first on the main thread, so the game window manager is
+    created there rather than on a warm-up thread.
+    """
+    window_manager = get_game_window_manager()
+    return WarmupService(
+        [
+            WarmupComponent("StaticGameData", get_static_game_data),
+            WarmupComponent(
+                "AttributeRecognizer",
+                get_attribute_recognizer_dep,
+                after=("StaticGameData",),
+            ),
+            WarmupComponent(
+                "AttributeLevelRecognizer", get_attribute_level_recognizer_dep
+            ),
+            WarmupComponent(
+                "AbandonStatusRecognizer", get_abandon_status_recognizer_dep
+            ),
+            WarmupComponent("LockStatusRecognizer", get_lock_status_recognizer_dep),
+            WarmupComponent("UISceneRecognizer", get_ui_scene_recognizer_dep),
+            WarmupComponent(
+                "DeliverySceneRecognizer", get_delivery_scene_recognizer_dep
+            ),
+            WarmupComponent(
+                "DeliveryJobRewardRecognizer", get_delivery_job_reward_recognizer_dep
+            ),
+            WarmupComponent("RarityRecognizer", get_rarity_recognizer_dep),
+            WarmupComponent("GridRarityClassifier", get_grid_rarity_classifier_dep),
+            WarmupComponent("CardThumbnailer", get_card_thumbnailer_dep),
+            WarmupComponent(
+                "ResolutionProfile", partial(warm_resolution_profile, window_manager)
+            ),
+        ]
+    )
@@ -11,10 +11,11 @@ from endfield_essence_recognizer.exceptions import (
     WindowNotActiveError,
     WindowNotFoundError,
 )
+from endfield_essence_recognizer.utils.cache import locked_cache
 from endfield_essence_recognizer.utils.log import logger
 
 
-@lru_cache
+@locked_cache
 def get_game_window_manager() -> WindowManager:
     """
     Get the singleton WindowManager instance for the game window.
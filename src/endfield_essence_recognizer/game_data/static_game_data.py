@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import importlib.resources
 import json
 from typing import TYPE_CHECKING
@@ -38,6 +39,9 @@ class StaticGameData:
         self._weapon_types: dict[WeaponTypeId, WeaponTypeV2] = {}
         self._rarity_colors: dict[int, str] = {}
 
+        # hash of all data files, changes whenever the game data is updated
+        self._digest = hashlib.blake2b(digest_size=16)
+
         # Index for faster lookup
 
         # map weapon_type_id to list of WeaponV2
@@ -46,41 +50,46 @@ class StaticGameData:
         # map (stat1_id, stat2_id, stat3_id) tuple to list of weapon_ids
         self._stat_tuple_to_weapon_ids: dict[StatTuple, list[WeaponId]] = {}
 
+        # weapon ids in ordinal order; bit i of a bitset below stands for weapon i
+        self._weapon_ordinals: list[WeaponId] = []
+
+        # per stat slot (attribute, secondary, skill), map stat_id to bitset of weapons
+        self._slot_stat_bits: tuple[
+            dict[StatId, int], dict[StatId, int], dict[StatId, int]
+        ] = ({}, {}, {})
+
         # Load data on initialization, not lazy
         self._load_data()
         self._index_data()
 
+    def _read_json(self, file_name: str) -> dict:
+        """Reads one JSON data file and feeds its content into the signature."""
+        data_file = self._data_root / file_name
+        with importlib.resources.as_file(data_file) as data_path:
+            text = data_path.read_text(encoding="utf-8")
+        self._digest.update(file_name.encode("utf-8"))
+        self._digest.update(text.encode("utf-8"))
+        return json.loads(text)
+
     def _load_data(self) -> None:
         """Loads all V2 JSON data files into internal dictionaries."""
         try:
             # Load Weapons
-            weapon_file = self._data_root / "Weapon.json"
-            with importlib.resources.as_file(weapon_file) as weapon_path:
-                weapon_data = json.loads(weapon_path.read_text(encoding="utf-8"))
-                for w_id, data in weapon_data.items():
-                    weapon = WeaponV2(**data)
-                    self._weapons[w_id] = weapon
+            for w_id, data in self._read_json("Weapon.json").items():
+                weapon = WeaponV2(**data)
+                self._weapons[w_id] = weapon
 
             # Load Stats
-            stat_file = self._data_root / "EssenceStat.json"
-            with importlib.resources.as_file(stat_file) as stat_path:
-                stat_data = json.loads(stat_path.read_text(encoding="utf-8"))
-                for s_id, data in stat_data.items():
-                    self._stats[s_id] = EssenceStatV2(**data)
+            for s_id, data in self._read_json("EssenceStat.json").items():
+                self._stats[s_id] = EssenceStatV2(**data)
 
             # Load Weapon Types
-            type_file = self._data_root / "WeaponType.json"
-            with importlib.resources.as_file(type_file) as type_path:
-                type_data = json.loads(type_path.read_text(encoding="utf-8"))
-                for t_id, data in type_data.items():
-                    self._weapon_types[WeaponTypeId(t_id)] = WeaponTypeV2(**data)
+            for t_id, data in self._read_json("WeaponType.json").items():
+                self._weapon_types[WeaponTypeId(t_id)] = WeaponTypeV2(**data)
 
             # Load Rarity Colors
-            rarity_file = self._data_root / "RarityColor.json"
-            with importlib.resources.as_file(rarity_file) as rarity_path:
-                rarity_data = json.loads(rarity_path.read_text(encoding="utf-8"))
-                for r_id, data in rarity_data.items():
-                    self._rarity_colors[int(r_id)] = data["color"]
+            for r_id, data in self._read_json("RarityColor.json").items():
+                self._rarity_colors[int(r_id)] = data["color"]
         except Exception as e:
             raise RuntimeError(f"Failed to load static game data V2: {e}") from e
 
@@ -95,6 +104,20 @@ class StaticGameData:
             key = (weapon.stat1_id, weapon.stat2_id, weapon.stat3_id)
             self._stat_tuple_to_weapon_ids.setdefault(key, []).append(weapon.weapon_id)
 
+        # Inverted index: per slot, stat to bitset of weapon ordinals
+        for ordinal, weapon in enumerate(self._weapons.values()):
+            self._weapon_ordinals.append(weapon.weapon_id)
+            bit = 1 << ordinal
+            slots = (weapon.stat1_id, weapon.stat2_id, weapon.stat3_id)
+            for index, stat_id in zip(self._slot_stat_bits, slots, strict=True):
+                if stat_id is not None:
+                    index[stat_id] = index.get(stat_id, 0) | bit
+
+    @property
+    def signature(self) -> str:
+        """A hash of the loaded data files, used to invalidate derived caches."""
+        return self._digest.hexdigest()
+
     def get_weapon(self, weapon_id: WeaponId) -> WeaponV2 | None:
         """Returns a WeaponV2 by its ID, or None if not found."""
         return self._weapons.get(weapon_id)
@@ -139,6 +162,72 @@ class StaticGameData:
         """
         return self._stat_tuple_to_weapon_ids.get((attr, sec, skill), [])
 
+    def stat_match_bits(
+        self,
+        attr: StatId | None = None,
+        sec: StatId | None = None,
+        skill: StatId | None = None,
+        min_matches: int = 3,
+    ) -> int:
+        """
+        Returns the bitset of weapons whose stats match at least `min_matches` of the
+        provided stats, slot by slot (stat1_id with attr, and so on).
+
+        Bit i stands for the i-th weapon of `list_weapons()`. Combine bitsets with
+        bitwise operators and convert them with `weapon_ids_of_bits`.
+
+        Raises:
+            ValueError: If `min_matches` is not between 1 and 3.
+        """
+        if not 1 <= min_matches <= 3:
+            raise ValueError(f"min_matches must be between 1 and 3, got {min_matches}")
+        a, b, c = (
+            index.get(stat_id, 0) if stat_id is not None else 0
+            for index, stat_id in zip(
+                self._slot_stat_bits, (attr, sec, skill), strict=True
+            )
+        )
+        if min_matches == 1:
+            return a | b | c
+        if min_matches == 2:
+            return (a & b) | (a & c) | (b & c)
+        return a & b & c
+
+    def weapon_ids_of_bits(self, bits: int) -> list[WeaponId]:
+        """Converts a bitset of weapon ordinals to weapon IDs, in ordinal order."""
+        weapon_ids = []
+        while bits:
+            lowest = bits & -bits
+            weapon_ids.append(self._weapon_ordinals[lowest.bit_length() - 1])
+            bits ^= lowest
+        return weapon_ids
+
+    def find_weapons_matching(
+        self,
+        attr: StatId | None = None,
+        sec: StatId | None = None,
+        skill: StatId | None = None,
+        min_matches: int = 3,
+    ) -> list[WeaponId]:
+        """
+        Returns weapon IDs whose stats match at least `min_matches` of the provided
+        stats, slot by slot. Unlike `find_weapons_by_stats`, a None stat matches
+        nothing, so e.g. min_matches=2 finds the weapons an essence misses by one stat.
+
+        Raises:
+            ValueError: If `min_matches` is not between 1 and 3.
+        """
+        return self.weapon_ids_of_bits(
+            self.stat_match_bits(attr, sec, skill, min_matches)
+        )
+
+    def find_weapons_with_stat(self, stat_id: StatId) -> list[WeaponId]:
+        """Returns IDs of all weapons that use the stat in any slot."""
+        bits = 0
+        for index in self._slot_stat_bits:
+            bits |= index.get(stat_id, 0)
+        return self.weapon_ids_of_bits(bits)
+
     def get_rarity_color(self, rarity: int) -> str:
         """Returns the hex color code for a given rarity, or white if not found."""
         return self._rarity_colors.get(rarity, "#FFFFFF")
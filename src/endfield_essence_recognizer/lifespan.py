@@ -8,7 +8,10 @@ from fastapi.staticfiles import StaticFiles
 from endfield_essence_recognizer.core.config import ServerConfig, get_server_config
 from endfield_essence_recognizer.dependencies import (
     default_user_setting_manager,
+    get_game_window_manager,
     get_log_service,
+    get_scan_result_store_dep,
+    get_warmup_service,
 )
 from endfield_essence_recognizer.hotkey_entrypoints import bind_hotkeys
 from endfield_essence_recognizer.utils.log import logger
@@ -68,6 +71,14 @@ async def lifespan(app: FastAPI):
         logger.success(f"Server configuration: {server_config.model_dump()}")
         init_mount_frontend_build(app, server_config)
         init_load_user_setting()
+        get_warmup_service().start(server_config.warmup_workers)
         log_welcome_message()
-        with bind_hotkeys(server_config):
-            yield
+        try:
+            with bind_hotkeys(server_config):
+                yield
+        finally:
+            get_warmup_service().stop()
+            get_game_window_manager().close()
+            # Only flush a store some scan has opened; never create one on shutdown
+            if get_scan_result_store_dep.cache_info().currsize:
+                get_scan_result_store_dep().flush()
@@ -0,0 +1,88 @@
+from pydantic import AliasGenerator, BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+from endfield_essence_recognizer.schemas.static_data import StatId
+
+
+class ScanSummary(BaseModel):
+    id: int = Field(description="扫描 ID")
+    started_at: float = Field(description="开始时间（Unix 时间戳）")
+    finished_at: float | None = Field(
+        default=None, description="结束时间（Unix 时间戳），未正常结束时为空"
+    )
+    completed: bool = Field(description="是否扫描了全部基质（未被中断）")
+    levels_recognized: bool = Field(
+        description="是否记录了词条等级；为 false 时等级条件不会匹配任何基质"
+    )
+    essence_count: int = Field(description="记录的基质数量")
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        alias_generator=AliasGenerator(
+            validation_alias=to_camel,
+            serialization_alias=to_camel,
+        ),
+        populate_by_name=True,
+    )
+
+
+class ScanListResponse(BaseModel):
+    scans: list[ScanSummary] = Field(description="扫描列表，按时间倒序排列")
+
+    model_config = ConfigDict(
+        alias_generator=AliasGenerator(
+            validation_alias=to_camel,
+            serialization_alias=to_camel,
+        ),
+        populate_by_name=True,
+    )
+
+
+class EssenceRecordInfo(BaseModel):
+    id: int = Field(description="记录 ID")
+    scan_id: int = Field(description="所属扫描的 ID")
+    scanned_at: float = Field(description="识别时间（Unix 时间戳）")
+    row: int = Field(description="所在行（翻页扫描时为整个库存中的行号），从 0 开始")
+    column: int = Field(description="所在列，从 0 开始")
+    stats: list[StatId | None] = Field(description="三个词条的基质 ID")
+    levels: list[int | None] = Field(description="三个词条的等级")
+    rarity: str = Field(description="稀有度标签")
+    locked: bool | None = Field(description="是否已锁定，无法确定时为空")
+    abandoned: bool | None = Field(description="是否已弃用，无法确定时为空")
+    quality: str | None = Field(
+        default=None, description="评估结果 (treasure/trash/skip)，未评估时为空"
+    )
+    matched_weapons: list[str] = Field(
+        default_factory=list, description="该基质适用的武器 ID 列表"
+    )
+    is_high_level: bool = Field(default=False, description="是否有词条达到高等级")
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        alias_generator=AliasGenerator(
+            validation_alias=to_camel,
+            serialization_alias=to_camel,
+        ),
+        populate_by_name=True,
+    )
+
+
+class EssenceRecordListResponse(BaseModel):
+    total: int = Field(description="符合条件的基质总数（不受分页影响）")
+    items: list[EssenceRecordInfo] = Field(description="当前页的基质列表")
+    scan_id: int | None = Field(
+        default=None, description="查询的扫描 ID，没有可查询的扫描时为空"
+    )
+    levels_recognized: bool | None = Field(
+        default=None,
+        description="查询的扫描是否记录了词条等级；为 false 时等级条件不会匹配任何基质，"
+        "空结果不代表没有符合等级条件的基质",
+    )
+
+    model_config = ConfigDict(
+        alias_generator=AliasGenerator(
+            validation_alias=to_camel,
+            serialization_alias=to_camel,
+        ),
+        populate_by_name=True,
+    )
@@ -1,5 +1,10 @@
 from enum import StrEnum
 
+from pydantic import AliasGenerator, BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+from endfield_essence_recognizer.schemas.static_data import StatId
+
 
 class TaskType(StrEnum):
     """表示希望 ScannerService 执行的任务类型"""
@@ -8,3 +13,44 @@ class TaskType(StrEnum):
     """扫描基质"""
     DELIVERY_CLAIM = "delivery_claim"
     """自动抢单"""
+
+
+class PlannedEssenceInfo(BaseModel):
+    row: int = Field(description="所在行（翻页扫描时为整个库存中的行号），从 0 开始")
+    column: int = Field(description="所在列，从 0 开始")
+    stats: list[StatId | None] = Field(description="三个词条的基质 ID")
+    levels: list[int | None] = Field(description="三个词条的等级")
+    quality: str = Field(description="评估结果 (treasure/trash)")
+    message: str = Field(description="评估结果说明（含颜色标签）")
+    locked_before: bool = Field(description="操作前是否已锁定")
+    abandoned_before: bool = Field(description="操作前是否已弃用")
+    locked_after: bool = Field(description="操作后是否已锁定")
+    abandoned_after: bool = Field(description="操作后是否已弃用")
+    status: str = Field(
+        description="执行结果 (pending/done/skipped/failed)，执行前为 pending"
+    )
+
+    model_config = ConfigDict(
+        alias_generator=AliasGenerator(
+            validation_alias=to_camel,
+            serialization_alias=to_camel,
+        ),
+        populate_by_name=True,
+    )
+
+
+class ActionPlanInfo(BaseModel):
+    id: int = Field(description="计划 ID")
+    created_at: float = Field(description="生成时间（Unix 时间戳）")
+    status: str = Field(
+        description="计划状态 (awaiting_confirmation/confirmed/rejected/executing/completed/interrupted)"
+    )
+    entries: list[PlannedEssenceInfo] = Field(description="需要锁定或弃用的基质")
+
+    model_config = ConfigDict(
+        alias_generator=AliasGenerator(
+            validation_alias=to_camel,
+            serialization_alias=to_camel,
+        ),
+        populate_by_name=True,
+    )
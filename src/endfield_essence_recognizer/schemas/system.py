@@ -0,0 +1,48 @@
+from enum import StrEnum
+
+from pydantic import AliasGenerator, BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+
+class ComponentStatus(StrEnum):
+    """启动预加载中单个组件的状态"""
+
+    PENDING = "pending"
+    """等待加载"""
+    LOADING = "loading"
+    """正在加载"""
+    READY = "ready"
+    """已加载"""
+    FAILED = "failed"
+    """加载失败，首次使用时会重新加载"""
+
+
+class ComponentInfo(BaseModel):
+    name: str = Field(description="组件名称")
+    status: ComponentStatus = Field(description="加载状态")
+    duration: float | None = Field(description="加载耗时（秒），尚未加载完成时为 null")
+    error: str | None = Field(description="加载失败的原因")
+
+    model_config = ConfigDict(
+        alias_generator=AliasGenerator(
+            validation_alias=to_camel,
+            serialization_alias=to_camel,
+        ),
+        populate_by_name=True,
+    )
+
+
+class ReadinessInfo(BaseModel):
+    ready: bool = Field(description="所有组件是否都已加载完成（含加载失败）")
+    elapsed: float | None = Field(
+        description="预加载开始至今（或至全部完成）的耗时（秒），未开始预加载时为 null"
+    )
+    components: list[ComponentInfo] = Field(description="各组件的加载状态")
+
+    model_config = ConfigDict(
+        alias_generator=AliasGenerator(
+            validation_alias=to_camel,
+            serialization_alias=to_camel,
+        ),
+        populate_by_name=True,
+    )
@@ -0,0 +1,69 @@
+from endfield_essence_recognizer.core.recognition import (
+    AbandonStatusLabel,
+    LockStatusLabel,
+)
+from endfield_essence_recognizer.core.scanner.plan import ActionPlanBoard, PlanEntry
+from endfield_essence_recognizer.schemas.scanner import (
+    ActionPlanInfo,
+    PlannedEssenceInfo,
+)
+
+
+class ActionPlanService:
+    """
+    Action plan service for reviewing and confirming plans of the planned scan mode.
+    """
+
+    def __init__(self, board: ActionPlanBoard):
+        self.board = board
+
+    def get_current_plan(self) -> ActionPlanInfo | None:
+        """
+        Get the most recent action plan, or None if no plan was created yet.
+        """
+        plan = self.board.current
+        if plan is None:
+            return None
+        return ActionPlanInfo(
+            id=plan.id,
+            created_at=plan.created_at,
+            status=plan.status,
+            entries=[self._to_info(entry) for entry in plan.entries],
+        )
+
+    def confirm(self, plan_id: int) -> bool:
+        """
+        Confirm the plan so that the scanner executes it.
+
+        Returns:
+            False if the plan is not the current one or is not awaiting confirmation.
+        """
+        plan = self.board.current
+        return plan is not None and plan.id == plan_id and plan.confirm()
+
+    def reject(self, plan_id: int) -> bool:
+        """
+        Reject the plan so that the scanner skips all of its actions.
+
+        Returns:
+            False if the plan is not the current one or is not awaiting confirmation.
+        """
+        plan = self.board.current
+        return plan is not None and plan.id == plan_id and plan.reject()
+
+    @staticmethod
+    def _to_info(entry: PlanEntry) -> PlannedEssenceInfo:
+        data, expected = entry.data, entry.expected
+        return PlannedEssenceInfo(
+            row=entry.row,
+            column=entry.column,
+            stats=data.stats,
+            levels=data.levels,
+            quality=entry.evaluation.quality,
+            message=entry.evaluation.log_message,
+            locked_before=data.lock_label == LockStatusLabel.LOCKED,
+            abandoned_before=data.abandon_label == AbandonStatusLabel.ABANDONED,
+            locked_after=expected.lock_label == LockStatusLabel.LOCKED,
+            abandoned_after=expected.abandon_label == AbandonStatusLabel.ABANDONED,
+            status=entry.status,
+        )
@@ -0,0 +1,98 @@
+from dataclasses import replace
+
+from endfield_essence_recognizer.core.recognition import (
+    AbandonStatusLabel,
+    LockStatusLabel,
+)
+from endfield_essence_recognizer.core.scanner.result_store import (
+    EssenceQuery,
+    ScanResultStore,
+    StoredEssence,
+)
+from endfield_essence_recognizer.schemas.inventory import (
+    EssenceRecordInfo,
+    EssenceRecordListResponse,
+    ScanListResponse,
+    ScanSummary,
+)
+
+
+class InventoryService:
+    """
+    Inventory service for querying the essences recorded by previous scans.
+    """
+
+    def __init__(self, store: ScanResultStore):
+        self.store = store
+
+    def list_scans(self, limit: int = 20) -> ScanListResponse:
+        """
+        List the most recent scans, newest first.
+        """
+        return ScanListResponse(
+            scans=[
+                ScanSummary.model_validate(scan)
+                for scan in self.store.list_scans(limit)
+            ]
+        )
+
+    def query_essences(self, query: EssenceQuery) -> EssenceRecordListResponse:
+        """
+        Query the recorded essences.
+
+        Args:
+            query: The filter conditions. Without a scan ID the latest completed scan
+                is queried.
+
+        Returns:
+            The total number of matching essences and the requested page of them,
+            ordered by their position in the inventory, together with the queried
+            scan and whether it recorded the stat levels.
+        """
+        scan_id = query.scan_id
+        if scan_id is None:
+            scan_id = self.store.latest_scan_id()
+        scan = self.store.get_scan(scan_id) if scan_id is not None else None
+        if scan is None:
+            return EssenceRecordListResponse(total=0, items=[])
+
+        total, essences = self.store.query(replace(query, scan_id=scan.id))
+        return EssenceRecordListResponse(
+            total=total,
+            items=[self._to_info(essence) for essence in essences],
+            scan_id=scan.id,
+            levels_recognized=scan.levels_recognized,
+        )
+
+    @staticmethod
+    def _to_info(essence: StoredEssence) -> EssenceRecordInfo:
+        data, evaluation = essence.data, essence.evaluation
+        return EssenceRecordInfo(
+            id=essence.id,
+            scan_id=essence.scan_id,
+            scanned_at=essence.scanned_at,
+            row=essence.row,
+            column=essence.column,
+            stats=data.stats,
+            levels=data.levels,
+            rarity=data.rarity,
+            locked=_bool_label(
+                data.lock_label, LockStatusLabel.LOCKED, LockStatusLabel.NOT_LOCKED
+            ),
+            abandoned=_bool_label(
+                data.abandon_label,
+                AbandonStatusLabel.ABANDONED,
+                AbandonStatusLabel.NOT_ABANDONED,
+            ),
+            quality=evaluation.quality if evaluation else None,
+            matched_weapons=sorted(evaluation.matched_weapons) if evaluation else [],
+            is_high_level=evaluation.is_high_level if evaluation else False,
+        )
+
+
+def _bool_label[T](label: T, true_label: T, false_label: T) -> bool | None:
+    if label == true_label:
+        return True
+    if label == false_label:
+        return False
+    return None
@@ -93,6 +93,58 @@ class StaticDataService:
 
         return WeaponListResponse(weapons=weapons)
 
+    def list_weapons_with_essence(self, essence_id: str) -> WeaponListResponse | None:
+        """
+        List weapons that use an essence (stat) in any of their three stat slots.
+
+        Args:
+            essence_id: The unique identifier for the essence (statTermId).
+
+        Returns:
+            A WeaponListResponse containing the matching weapons,
+            or None if the essence is not found.
+        """
+        if not self.data.get_stat(essence_id):
+            return None
+        return self._weapon_list(self.data.find_weapons_with_stat(essence_id))
+
+    def match_weapons(
+        self,
+        attribute_stat_id: str | None,
+        secondary_stat_id: str | None,
+        skill_stat_id: str | None,
+        min_matches: int = 3,
+    ) -> WeaponListResponse:
+        """
+        List weapons whose stats match at least `min_matches` of the given stats,
+        comparing slot by slot.
+
+        Args:
+            attribute_stat_id: The attribute stat of the essence.
+            secondary_stat_id: The secondary stat of the essence.
+            skill_stat_id: The skill stat of the essence.
+            min_matches: How many of the three stats must match (1-3).
+
+        Returns:
+            A WeaponListResponse containing the matching weapons.
+
+        Raises:
+            ValueError: If `min_matches` is not between 1 and 3.
+        """
+        return self._weapon_list(
+            self.data.find_weapons_matching(
+                attribute_stat_id, secondary_stat_id, skill_stat_id, min_matches
+            )
+        )
+
+    def _weapon_list(self, weapon_ids: list[str]) -> WeaponListResponse:
+        weapons = []
+        for weapon_id in weapon_ids:
+            weapon_info = self.get_weapon(weapon_id)
+            if weapon_info:
+                weapons.append(weapon_info)
+        return WeaponListResponse(weapons=weapons)
+
     def list_weapon_types(self) -> WeaponTypeListResponse:
         """
         List all available weapon categories (types) and their associated weapons.
@@ -0,0 +1,185 @@
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+from endfield_essence_recognizer.schemas.system import (
+    ComponentInfo,
+    ComponentStatus,
+    ReadinessInfo,
+)
+from endfield_essence_recognizer.utils.log import logger
+
+
+@dataclass(frozen=True)
+class WarmupComponent:
+    """A component loaded in the background at startup."""
+
+    name: str
+    load: Callable[[], object]
+    """Loads the component. The result is discarded; loaders fill their own caches."""
+    after: tuple[str, ...] = ()
+    """Names of components that must finish loading before this one starts."""
+
+
+@dataclass
+class _ComponentState:
+    status: ComponentStatus = ComponentStatus.PENDING
+    duration: float | None = None
+    error: str | None = None
+
+
+class WarmupService:
+    """
+    Warms up recognizers, static data and layouts on a thread pool at startup, so the
+    first hotkey press does not pay for loading them.
+
+    Readiness can be polled with `status` or followed with `subscribe`, which receives
+    a snapshot every time a component changes state.
+    """
+
+    def __init__(self, components: Sequence[WarmupComponent]) -> None:
+        self._components = list(components)
+        self._states = {c.name: _ComponentState() for c in self._components}
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._enabled = True
+        self._started_at: float | None = None
+        self._finished_at: float | None = None
+        self._subscribers: dict[
+            asyncio.Queue[ReadinessInfo], asyncio.AbstractEventLoop
+        ] = {}
+
+    def start(self, max_workers: int) -> None:
+        """
+        Start loading all components in the background. Returns immediately.
+
+        Args:
+            max_workers: Number of loader threads. 0 disables warm-up; components are
+                then loaded on first use and the service reports ready right away.
+        """
+        if self._started_at is not None or not self._enabled:
+            return
+        if max_workers <= 0:
+            self._enabled = False
+            logger.debug("已禁用启动预加载")
+            return
+
+        self._started_at = time.perf_counter()
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="warmup")
+        futures: dict[str, Future[None]] = {}
+        # Prerequisites are submitted before the components waiting for them, so a
+        # waiting worker never blocks a prerequisite that has not started yet
+        for component in self._components:
+            prerequisites = [futures[name] for name in component.after]
+            futures[component.name] = self._executor.submit(
+                self._load, component, prerequisites
+            )
+        self._executor.shutdown(wait=False)
+        logger.debug(
+            f"正在后台预加载 {len(self._components)} 个组件（{max_workers} 个线程）"
+        )
+
+    def stop(self) -> None:
+        """Cancel components that have not started loading yet."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def status(self) -> ReadinessInfo:
+        """Get a snapshot of the readiness of all components."""
+        with self._lock:
+            return self._snapshot()
+
+    def subscribe(self) -> asyncio.Queue[ReadinessInfo]:
+        """
+        Subscribe to readiness changes. Must be called from the event loop that reads
+        the returned queue; call `unsubscribe` when done.
+        """
+        queue: asyncio.Queue[ReadinessInfo] = asyncio.Queue()
+        with self._lock:
+            self._subscribers[queue] = asyncio.get_running_loop()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[ReadinessInfo]) -> None:
+        """Stop receiving readiness changes on the queue."""
+        with self._lock:
+            self._subscribers.pop(queue, None)
+
+    def _load(
+        self, component: WarmupComponent, prerequisites: list[Future[None]]
+    ) -> None:
+        for future in prerequisites:
+            # A failed prerequisite is loaded again by the component itself
+            future.exception()
+
+        self._update(component.name, status=ComponentStatus.LOADING)
+        start = time.perf_counter()
+        try:
+            component.load()
+        except Exception as e:
+            duration = time.perf_counter() - start
+            logger.warning(f"预加载 {component.name} 失败：{e}")
+            self._update(
+                component.name,
+                status=ComponentStatus.FAILED,
+                duration=duration,
+                error=str(e),
+            )
+        else:
+            duration = time.perf_counter() - start
+            logger.debug(f"已预加载 {component.name}，耗时 {duration:.3f}s")
+            self._update(
+                component.name, status=ComponentStatus.READY, duration=duration
+            )
+
+    def _update(
+        self,
+        name: str,
+        status: ComponentStatus,
+        duration: float | None = None,
+        error: str | None = None,
+    ) -> None:
+        with self._lock:
+            state = self._states[name]
+            state.status, state.duration, state.error = status, duration, error
+            just_finished = self._finished_at is None and self._all_finished()
+            if just_finished:
+                self._finished_at = time.perf_counter()
+            snapshot = self._snapshot()
+            subscribers = list(self._subscribers.items())
+
+        if just_finished:
+            logger.success(f"启动预加载已完成，耗时 {snapshot.elapsed:.3f}s")
+        for queue, loop in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, snapshot)
+            except RuntimeError:
+                # The subscriber's event loop is already closed
+                self.unsubscribe(queue)
+
+    def _all_finished(self) -> bool:
+        return all(
+            state.status in (ComponentStatus.READY, ComponentStatus.FAILED)
+            for state in self._states.values()
+        )
+
+    def _snapshot(self) -> ReadinessInfo:
+        elapsed: float | None = None
+        if self._started_at is not None:
+            end = self._finished_at or time.perf_counter()
+            elapsed = end - self._started_at
+        return ReadinessInfo(
+            ready=not self._enabled or self._all_finished(),
+            elapsed=elapsed,
+            components=[
+                ComponentInfo(
+                    name=name,
+                    status=state.status,
+                    duration=state.duration,
+                    error=state.error,
+                )
+                for name, state in self._states.items()
+            ],
+        )
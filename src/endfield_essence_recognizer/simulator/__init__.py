@@ -0,0 +1,27 @@
+"""
+Headless simulation of the game window for end-to-end tests and benchmarks.
+"""
+
+from .benchmark import ScanBenchmarkResult, run_scan_benchmark
+from .clock import VirtualClock
+from .game import SimulatedGame
+from .inventory import SimulatedEssence, generate_inventory
+from .recognizer_benchmark import (
+    CorpusFrame,
+    LatencyStats,
+    benchmark_recognizers,
+    generate_corpus,
+)
+
+__all__ = [
+    "CorpusFrame",
+    "LatencyStats",
+    "ScanBenchmarkResult",
+    "SimulatedEssence",
+    "SimulatedGame",
+    "VirtualClock",
+    "benchmark_recognizers",
+    "generate_corpus",
+    "generate_inventory",
+    "run_scan_benchmark",
+]
@@ -0,0 +1,221 @@
+"""
+End-to-end scan benchmark against the simulated game.
+
+Runs the real `ScannerEngine` (scaling wrappers, panel settle detection, recognizers
+and action logic) over a synthetic inventory and reports throughput.
+
+运行示例:
+python -m endfield_essence_recognizer.simulator.benchmark
+python -m endfield_essence_recognizer.simulator.benchmark -r 2560x1440 -r 3440x1440
+"""
+
+import argparse
+import importlib.resources
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from endfield_essence_recognizer.core.scanner.context import (
+    ScannerContext,
+    build_scanner_context,
+)
+from endfield_essence_recognizer.core.scanner.engine import ScanMode, ScannerEngine
+from endfield_essence_recognizer.core.scanner.incremental import IncrementalScanStore
+from endfield_essence_recognizer.core.scanner.paging import PagingProfile
+from endfield_essence_recognizer.core.scanner.settle import PanelSettleProfile
+from endfield_essence_recognizer.core.window.scaling import create_scaling_wrappers
+from endfield_essence_recognizer.game_data.static_game_data import StaticGameData
+from endfield_essence_recognizer.schemas.user_setting import (
+    NonFiveStarBehavior,
+    UserSetting,
+)
+from endfield_essence_recognizer.services.user_setting_manager import (
+    UserSettingManager,
+)
+from endfield_essence_recognizer.simulator.clock import VirtualClock
+from endfield_essence_recognizer.simulator.game import SimulatedGame
+from endfield_essence_recognizer.simulator.inventory import generate_inventory
+
+
+@dataclass(frozen=True)
+class ScanBenchmarkResult:
+    """一次模拟扫描的结果。"""
+
+    physical_size: tuple[int, int]
+    """模拟的物理分辨率 (宽, 高)。"""
+    essences: int
+    """扫描过的基质数量。"""
+    selections: int
+    """面板切换基质的次数；流水线模式回到之前的基质执行操作时会多于基质数量。"""
+    clicks: int
+    """引擎发出的点击次数。"""
+    wall_seconds: float
+    """实际耗时（秒），即识别与截图的计算开销。"""
+    virtual_seconds: float
+    """虚拟时钟上的等待时间（秒），即在真实游戏中需要的等待时间。"""
+
+    @property
+    def essences_per_second(self) -> float:
+        """按实际耗时与虚拟等待时间之和估算的吞吐量。"""
+        total = self.wall_seconds + self.virtual_seconds
+        return self.essences / total if total > 0 else float("inf")
+
+    def __str__(self) -> str:
+        width, height = self.physical_size
+        return (
+            f"{width}x{height}: {self.essences} essences, "
+            f"{self.selections} selections, {self.clicks} clicks, "
+            f"wall {self.wall_seconds:.3f}s, virtual {self.virtual_seconds:.3f}s, "
+            f"{self.essences_per_second:.2f} essences/s"
+        )
+
+
+def load_static_game_data() -> StaticGameData:
+    """加载包内的静态游戏数据。"""
+    return StaticGameData(
+        importlib.resources.files("endfield_essence_recognizer") / "data" / "v2"
+    )
+
+
+def run_scan_benchmark(
+    ctx: ScannerContext,
+    physical_size: tuple[int, int] = (1920, 1080),
+    seed: int = 0,
+    settle_profile: PanelSettleProfile | None = None,
+    panel_latency: float = 0.05,
+    scan_mode: ScanMode = ScanMode.SEQUENTIAL,
+    user_setting: UserSetting | None = None,
+    inventory_size: int | None = None,
+    paging_profile: PagingProfile | None = None,
+    incremental_store: IncrementalScanStore | None = None,
+) -> ScanBenchmarkResult:
+    """
+    用模拟游戏完整执行一次网格扫描并计时。
+
+    Args:
+        ctx: 扫描上下文（识别器与静态数据）。
+        physical_size: 模拟的物理分辨率 (宽, 高)。
+        seed: 生成基质库存的随机种子。
+        settle_profile: 面板稳定检测配置，为 None 时使用默认配置。
+        panel_latency: 模拟界面刷新的延迟（虚拟秒）。
+        scan_mode: 扫描引擎的执行方式。
+        user_setting: 扫描使用的用户设置，为 None 时使用默认设置。
+        inventory_size: 基质数量，为 None 时恰好填满一页网格。
+        paging_profile: 翻页扫描配置，为 None 时只扫描第一页。
+        incremental_store: 增量扫描记录，为 None 时扫描所有基质。
+            同一记录用于多次扫描时，后续扫描会跳过外观未变化的基质。
+    """
+    clock = VirtualClock()
+    if inventory_size is None:
+        inventory_size = len(SimulatedGame([], physical_size).slot_positions())
+    game = SimulatedGame(
+        generate_inventory(ctx.static_game_data, inventory_size, seed),
+        physical_size,
+        clock=clock,
+        panel_latency=panel_latency,
+    )
+    image_source, window_actions = create_scaling_wrappers(game, game)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        user_setting_manager = UserSettingManager(Path(tmp_dir) / "config.json")
+        if user_setting is not None:
+            user_setting_manager.update_from_user_setting(user_setting)
+        engine = ScannerEngine(
+            ctx=ctx,
+            image_source=image_source,
+            window_actions=window_actions,
+            user_setting_manager=user_setting_manager,
+            profile=game.profile,
+            settle_profile=settle_profile or PanelSettleProfile(),
+            scan_mode=scan_mode,
+            paging_profile=paging_profile,
+            incremental_store=incremental_store,
+        )
+        start = time.perf_counter()
+        engine.execute(threading.Event())
+        wall_seconds = time.perf_counter() - start
+
+    return ScanBenchmarkResult(
+        physical_size=physical_size,
+        essences=len(game.visited),
+        selections=game.selections,
+        clicks=game.clicks,
+        wall_seconds=wall_seconds,
+        virtual_seconds=clock.total_slept,
+    )
+
+
+def _parse_resolution(text: str) -> tuple[int, int]:
+    width, _, height = text.lower().partition("x")
+    return int(width), int(height)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="模拟游戏端到端扫描基准测试")
+    parser.add_argument(
+        "-r",
+        "--resolution",
+        action="append",
+        type=_parse_resolution,
+        help="模拟的物理分辨率，如 2560x1440，可重复指定（默认 1920x1080）",
+    )
+    parser.add_argument(
+        "--mode",
+        type=ScanMode,
+        choices=list(ScanMode),
+        default=ScanMode.SEQUENTIAL,
+        help="扫描引擎的执行方式",
+    )
+    parser.add_argument(
+        "--skip-non-five-star",
+        action="store_true",
+        help="使用“跳过非无瑕基质”设置扫描",
+    )
+    parser.add_argument(
+        "--inventory-size",
+        type=int,
+        help="基质数量，超过一页时滚动网格扫描（默认恰好填满一页）",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="在同一分辨率的多次扫描之间保留增量扫描记录（配合 --repeat 使用）",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="基质库存的随机种子")
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="每个分辨率重复扫描的次数"
+    )
+    args = parser.parse_args()
+
+    user_setting = UserSetting()
+    if args.skip_non_five_star:
+        user_setting.non_five_star_behavior = NonFiveStarBehavior.SKIP
+
+    ctx = build_scanner_context(load_static_game_data())
+    for physical_size in args.resolution or [(1920, 1080)]:
+        incremental_store = (
+            IncrementalScanStore("IncrementalScanStore", ctx.card_thumbnailer)
+            if args.incremental
+            else None
+        )
+        for _ in range(args.repeat):
+            print(
+                run_scan_benchmark(
+                    ctx,
+                    physical_size,
+                    seed=args.seed,
+                    scan_mode=args.mode,
+                    user_setting=user_setting,
+                    inventory_size=args.inventory_size,
+                    paging_profile=(
+                        PagingProfile() if args.inventory_size is not None else None
+                    ),
+                    incremental_store=incremental_store,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""
+A virtual clock so simulated scans do not actually sleep.
+"""
+
+
+class VirtualClock:
+    """
+    虚拟时钟。`sleep` 只推进虚拟时间而不真正等待。
+
+    将 `clock.sleep` 作为 sleeper 注入（例如 `WindowActionsAdapter` 的 `sleeper` 参数
+    或 `SimulatedGame`），即可在无需真实等待的情况下运行完整扫描。
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        self._now = start
+        self.total_slept = 0.0
+        """累计等待的虚拟时间（秒）。"""
+
+    @property
+    def now(self) -> float:
+        """当前虚拟时间（秒）。"""
+        return self._now
+
+    def sleep(self, seconds: float) -> None:
+        """推进虚拟时间。"""
+        if seconds < 0:
+            raise ValueError("sleep length must be non-negative")
+        self._now += seconds
+        self.total_slept += seconds
@@ -0,0 +1,474 @@
+"""
+A headless stand-in for the game window.
+
+`SimulatedGame` renders a synthetic essence inventory with the real recognition
+templates at the coordinates of the resolution profile, and reacts to clicks the way
+the game does: clicking an icon shows that essence in the info panel after a short
+latency, clicking the lock / abandon buttons toggles the corresponding state, and the
+mouse wheel scrolls the grid one row per notch. Time is
+driven by a `VirtualClock`, so scans run at full speed on any platform without a
+display.
+"""
+
+import importlib.resources
+import math
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+
+import cv2
+import numpy as np
+from cv2.typing import MatLike
+
+from endfield_essence_recognizer.core.interfaces import ImageSource, WindowActions
+from endfield_essence_recognizer.core.layout.base import Point, Region
+from endfield_essence_recognizer.core.layout.factory import build_resolution_profile
+from endfield_essence_recognizer.core.recognition import RarityLabel
+from endfield_essence_recognizer.core.window.scaling import compute_logical_size
+from endfield_essence_recognizer.simulator.clock import VirtualClock
+from endfield_essence_recognizer.simulator.inventory import SimulatedEssence
+from endfield_essence_recognizer.utils.image import (
+    load_image,
+    scope_to_slice,
+    screenshot_many_by_plan,
+    union_region,
+)
+
+BACKGROUND_BGR = (24, 24, 24)
+CARD_BGR = (56, 56, 56)
+SELECTED_CARD_BGR = (230, 230, 230)
+PANEL_BGR = (36, 36, 36)
+ACTIVE_LEVEL_ICON_VALUE = 255
+INACTIVE_LEVEL_ICON_VALUE = 80
+LEVEL_ICON_RADIUS = 3
+CARD_LEVEL_VALUE_STEP = 40
+CARD_ICON_BGR = (150, 170, 190)
+LOCKED_MARKER_BGR = (0, 200, 255)
+ABANDONED_MARKER_BGR = (40, 40, 220)
+
+RARITY_BGR: dict[RarityLabel, tuple[int, int, int]] = {
+    RarityLabel.FIVE: (3, 186, 255),
+    RarityLabel.FOUR: (250, 82, 148),
+    RarityLabel.OTHER: (160, 160, 160),
+}
+"""与稀有度识别配置一致的颜色；其他稀有度使用低饱和度的灰色。"""
+
+
+@lru_cache(maxsize=64)
+def load_template(relative_path: str, flags: int = cv2.IMREAD_COLOR) -> MatLike:
+    """读取包内的模板图片。"""
+    resource = importlib.resources.files("endfield_essence_recognizer") / relative_path
+    return load_image(resource.read_bytes(), flags)
+
+
+def _paste_centered(canvas: MatLike, image: MatLike, region: Region) -> None:
+    """将图片居中贴入 canvas 的指定区域，超出区域的部分被裁掉。"""
+    width = min(image.shape[1], region.x1 - region.x0)
+    height = min(image.shape[0], region.y1 - region.y0)
+    x0 = region.x0 + (region.x1 - region.x0 - width) // 2
+    y0 = region.y0 + (region.y1 - region.y0 - height) // 2
+    patch = image[:height, :width]
+    if patch.ndim == 2:
+        patch = cv2.cvtColor(patch, cv2.COLOR_GRAY2BGR)
+    canvas[y0 : y0 + height, x0 : x0 + width] = patch
+
+
+class SimulatedGame(ImageSource, WindowActions):
+    """
+    无界面的模拟游戏窗口，同时实现 `ImageSource` 与 `WindowActions`。
+
+    坐标均为物理分辨率下的客户区坐标，与真实窗口一致；
+    因此应像真实窗口一样通过 `create_scaling_wrappers` 接入扫描引擎。
+    """
+
+    def __init__(
+        self,
+        inventory: Sequence[SimulatedEssence],
+        physical_size: tuple[int, int] = (1920, 1080),
+        clock: VirtualClock | None = None,
+        panel_latency: float = 0.05,
+        button_latency: float = 0.0,
+        card_stats: bool = True,
+    ) -> None:
+        """
+        Args:
+            inventory: 按网格顺序（逐行）排列的基质，多于网格格数的部分需要滚动网格才会显示。
+            physical_size: 模拟的客户区物理分辨率 (宽, 高)。
+            clock: 虚拟时钟，`wait` 会推进它。默认新建一个。
+            panel_latency: 点击后界面刷新的延迟（虚拟秒）。
+            button_latency: 信息面板切换到另一个基质后，锁定/弃用按钮再过多久才绘制出来（虚拟秒）。
+            card_stats: 是否在卡片中绘制词条文字与等级。为 False 时所有卡片绘制同一个图标，
+                同一稀有度、锁定与弃用状态的卡片外观完全相同，用于模拟外观相同的不同基质。
+        """
+        self.inventory = list(inventory)
+        self.physical_size = physical_size
+        self.clock = clock if clock is not None else VirtualClock()
+        self.panel_latency = panel_latency
+        self.button_latency = button_latency
+        self.card_stats = card_stats
+
+        logical_width, logical_height, self._scale = compute_logical_size(
+            *physical_size
+        )
+        self.logical_size = (logical_width, logical_height)
+        self.profile = build_resolution_profile(logical_width, logical_height)
+
+        self.selected_index: int | None = None
+        """当前在信息面板中显示的基质序号。"""
+        self.clicks = 0
+        """收到的点击次数。"""
+        self.selections = 0
+        """信息面板切换到不同基质的次数。"""
+        self.visited: set[int] = set()
+        """在信息面板中显示过的基质序号。"""
+        self.scroll_row = 0
+        """网格第一行对应的库存行号。"""
+        self.scrolls = 0
+        """收到的滚轮操作次数。"""
+        self.dropped_button_clicks = 0
+        """接下来丢弃（不生效）的锁定/弃用按钮点击次数，用于模拟游戏没有响应的点击。"""
+
+        self._buttons_hidden = False
+        self._pending: list[tuple[float, Callable[[], None]]] = []
+        self._version = 0
+        self._background: MatLike | None = None
+        self._frame: MatLike | None = None
+        self._frame_version = -1
+
+    # WindowActions
+
+    @property
+    def target_exists(self) -> bool:
+        return True
+
+    @property
+    def target_is_active(self) -> bool:
+        return True
+
+    def restore(self) -> bool:
+        return False
+
+    def activate(self) -> bool:
+        return False
+
+    def show(self) -> bool:
+        return False
+
+    def click(self, relative_x: int, relative_y: int) -> None:
+        self.clicks += 1
+        point = Point(round(relative_x * self._scale), round(relative_y * self._scale))
+        profile = self.profile
+        on_lock = self._hit(profile.LOCK_BUTTON_ROI, point)
+        on_abandon = self._hit(profile.DEPRECATE_BUTTON_ROI, point)
+        if (on_lock or on_abandon) and self.dropped_button_clicks > 0:
+            self.dropped_button_clicks -= 1
+        elif on_lock:
+            self._schedule(self._toggle_lock)
+        elif on_abandon:
+            self._schedule(self._toggle_abandon)
+        else:
+            index = self._slot_at(point)
+            if index is not None:
+                self._schedule(lambda: self._select(index))
+
+    def scroll(self, relative_x: int, relative_y: int, clicks: int) -> None:
+        self.scrolls += 1
+        point = Point(round(relative_x * self._scale), round(relative_y * self._scale))
+        if self._hit(self._grid_region(), point):
+            self._schedule(lambda: self._scroll_by(-clicks))
+
+    def wait(self, seconds: float) -> None:
+        self.clock.sleep(seconds)
+        self._apply_due()
+
+    # ImageSource
+
+    def screenshot(self, relative_region: Region | None = None) -> MatLike:
+        frame = self._current_frame()
+        if relative_region is None:
+            return frame.copy()
+        return frame[scope_to_slice(relative_region)].copy()
+
+    def screenshot_many(self, relative_regions: Sequence[Region]) -> list[MatLike]:
+        return screenshot_many_by_plan(self, relative_regions)
+
+    def get_client_size(self) -> tuple[int, int]:
+        return self.physical_size
+
+    # Simulation
+
+    def slot_positions(self) -> list[Point]:
+        """所有网格格子的中心点（逻辑坐标，逐行排列）。"""
+        return [
+            Point(x, y)
+            for y in self.profile.essence_icon_y_list
+            for x in self.profile.essence_icon_x_list
+        ]
+
+    def _schedule(self, action: Callable[[], None]) -> None:
+        self._pending.append((self.clock.now + self.panel_latency, action))
+
+    def _apply_due(self) -> None:
+        now = self.clock.now
+        due = [entry for entry in self._pending if entry[0] <= now]
+        if not due:
+            return
+        self._pending = [entry for entry in self._pending if entry[0] > now]
+        for _due_time, action in due:
+            action()
+        self._version += 1
+
+    def add_essence(self, index: int, essence: SimulatedEssence) -> None:
+        """模拟获得新基质：插入到库存的指定位置，之后的基质依次后移。"""
+        self.inventory.insert(index, essence)
+        if self.selected_index is not None and self.selected_index >= index:
+            self.selected_index += 1
+        self._background = None
+        self._version += 1
+
+    def max_scroll_row(self) -> int:
+        """网格能滚动到的最大行号。"""
+        columns = len(self.profile.essence_icon_x_list)
+        rows = math.ceil(len(self.inventory) / columns)
+        return max(0, rows - len(self.profile.essence_icon_y_list))
+
+    def _scroll_by(self, rows: int) -> None:
+        scroll_row = min(max(self.scroll_row + rows, 0), self.max_scroll_row())
+        if scroll_row != self.scroll_row:
+            self.scroll_row = scroll_row
+            self._background = None
+
+    def _first_visible_index(self) -> int:
+        return self.scroll_row * len(self.profile.essence_icon_x_list)
+
+    def _select(self, index: int) -> None:
+        if index != self.selected_index:
+            self.selections += 1
+            if self.button_latency > 0:
+                self._buttons_hidden = True
+                self._pending.append(
+                    (self.clock.now + self.button_latency, self._show_buttons)
+                )
+        self.selected_index = index
+        self.visited.add(index)
+
+    def _show_buttons(self) -> None:
+        self._buttons_hidden = False
+
+    def _toggle_lock(self) -> None:
+        if self.selected_index is not None:
+            essence = self.inventory[self.selected_index]
+            essence.locked = not essence.locked
+            self._background = None
+
+    def _toggle_abandon(self) -> None:
+        if self.selected_index is not None:
+            essence = self.inventory[self.selected_index]
+            essence.abandoned = not essence.abandoned
+            self._background = None
+
+    @staticmethod
+    def _hit(region: Region, point: Point) -> bool:
+        return region.x0 <= point.x < region.x1 and region.y0 <= point.y < region.y1
+
+    def _card_radius(self) -> int:
+        return self.profile.ESSENCE_CARD_SIZE // 2
+
+    def _grid_region(self) -> Region:
+        radius = self._card_radius()
+        positions = self.slot_positions()
+        return union_region(
+            [
+                Region(
+                    Point(center.x - radius, center.y - radius),
+                    Point(center.x + radius, center.y + radius),
+                )
+                for center in positions
+            ]
+        )
+
+    def _slot_at(self, point: Point) -> int | None:
+        radius = self._card_radius()
+        first = self._first_visible_index()
+        for slot, center in enumerate(self.slot_positions()):
+            index = first + slot
+            if index >= len(self.inventory):
+                break
+            if abs(point.x - center.x) <= radius and abs(point.y - center.y) <= radius:
+                return index
+        return None
+
+    def _current_frame(self) -> MatLike:
+        self._apply_due()
+        if self._frame is None or self._frame_version != self._version:
+            frame = self._render_logical()
+            if self.logical_size != self.physical_size:
+                frame = cv2.resize(
+                    frame, self.physical_size, interpolation=cv2.INTER_LINEAR
+                )
+            self._frame = frame
+            self._frame_version = self._version
+        return self._frame
+
+    def _render_logical(self) -> MatLike:
+        if self._background is None:
+            self._background = self._render_background()
+        canvas = self._background.copy()
+        slot = (
+            self.selected_index - self._first_visible_index()
+            if self.selected_index is not None
+            else -1
+        )
+        if 0 <= slot < len(self.slot_positions()):
+            center = self.slot_positions()[slot]
+            radius = self._card_radius()
+            cv2.rectangle(
+                canvas,
+                (center.x - radius, center.y - radius),
+                (center.x + radius, center.y + radius),
+                SELECTED_CARD_BGR,
+                thickness=2,
+            )
+        if self.selected_index is not None:
+            self._render_panel(canvas, self.inventory[self.selected_index])
+        return canvas
+
+    def _render_background(self) -> MatLike:
+        """绘制只随滚动变化的部分：界面标题与网格中可见的基质卡片。"""
+        profile = self.profile
+        width, height = self.logical_size
+        canvas = np.empty((height, width, 3), dtype=np.uint8)
+        canvas[:] = BACKGROUND_BGR
+
+        _paste_centered(
+            canvas,
+            load_template("templates/screenshot/武器基质.png"),
+            profile.ESSENCE_UI_ROI,
+        )
+
+        radius = self._card_radius()
+        first = self._first_visible_index()
+        for slot, center in enumerate(self.slot_positions()):
+            index = first + slot
+            if index >= len(self.inventory):
+                break
+            cv2.rectangle(
+                canvas,
+                (center.x - radius, center.y - radius),
+                (center.x + radius, center.y + radius),
+                CARD_BGR,
+                thickness=-1,
+            )
+            cv2.rectangle(
+                canvas,
+                (center.x - radius, center.y + radius - 6),
+                (center.x + radius, center.y + radius),
+                RARITY_BGR[self.inventory[index].rarity],
+                thickness=-1,
+            )
+            if self.card_stats:
+                self._render_card_stats(canvas, center, self.inventory[index])
+            else:
+                cv2.circle(
+                    canvas,
+                    center,
+                    radius // 2,
+                    CARD_ICON_BGR,
+                    thickness=-1,
+                )
+            self._render_card_markers(canvas, center, self.inventory[index])
+        return canvas
+
+    def _render_card_stats(
+        self, canvas: MatLike, center: Point, essence: SimulatedEssence
+    ) -> None:
+        """在卡片中绘制缩小的词条文字与等级，使不同基质的卡片外观不同。"""
+        half = self._card_radius() * 2 // 3
+        line_height = 2 * half // len(essence.stats)
+        text_width = 2 * half * 3 // 4
+        for k, (stat_id, level) in enumerate(
+            zip(essence.stats, essence.levels, strict=True)
+        ):
+            template = load_template(
+                f"templates/generated/{stat_id}.png", cv2.IMREAD_GRAYSCALE
+            )
+            x0 = center.x - half
+            y0 = center.y - half + k * line_height
+            canvas[y0 : y0 + line_height, x0 : x0 + text_width] = cv2.cvtColor(
+                cv2.resize(
+                    template,
+                    (text_width, line_height),
+                    interpolation=cv2.INTER_AREA,
+                ),
+                cv2.COLOR_GRAY2BGR,
+            )
+            value = CARD_LEVEL_VALUE_STEP * level
+            canvas[y0 : y0 + line_height, x0 + text_width : center.x + half] = (
+                value,
+                value,
+                value,
+            )
+
+    def _render_card_markers(
+        self, canvas: MatLike, center: Point, essence: SimulatedEssence
+    ) -> None:
+        """像游戏中一样在卡片角落标记锁定与弃用状态。"""
+        half = self._card_radius() * 2 // 3
+        marker = half // 3
+        if essence.locked:
+            cv2.rectangle(
+                canvas,
+                (center.x + half - marker, center.y - half),
+                (center.x + half, center.y - half + marker),
+                LOCKED_MARKER_BGR,
+                thickness=-1,
+            )
+        if essence.abandoned:
+            cv2.rectangle(
+                canvas,
+                (center.x - half, center.y - half),
+                (center.x - half + marker, center.y - half + marker),
+                ABANDONED_MARKER_BGR,
+                thickness=-1,
+            )
+
+    def _render_panel(self, canvas: MatLike, essence: SimulatedEssence) -> None:
+        profile = self.profile
+        canvas[scope_to_slice(profile.AREA)] = PANEL_BGR
+        canvas[scope_to_slice(profile.RARITY_ROI)] = RARITY_BGR[essence.rarity]
+
+        stat_rois = (profile.STATS_0_ROI, profile.STATS_1_ROI, profile.STATS_2_ROI)
+        for roi, stat_id in zip(stat_rois, essence.stats, strict=False):
+            template = load_template(
+                f"templates/generated/{stat_id}.png", cv2.IMREAD_GRAYSCALE
+            )
+            _paste_centered(canvas, template, roi)
+
+        for points, level in zip(
+            profile.STATS_LEVEL_ICON_POINTS, essence.levels, strict=False
+        ):
+            for k, point in enumerate(points):
+                value = (
+                    ACTIVE_LEVEL_ICON_VALUE if k < level else INACTIVE_LEVEL_ICON_VALUE
+                )
+                cv2.rectangle(
+                    canvas,
+                    (point.x - LEVEL_ICON_RADIUS, point.y - LEVEL_ICON_RADIUS),
+                    (point.x + LEVEL_ICON_RADIUS, point.y + LEVEL_ICON_RADIUS),
+                    (value, value, value),
+                    thickness=-1,
+                )
+
+        if self._buttons_hidden:
+            return
+        lock_icon = "已锁定" if essence.locked else "未锁定"
+        abandon_icon = "已弃用" if essence.abandoned else "未弃用"
+        _paste_centered(
+            canvas,
+            load_template(f"templates/screenshot/{lock_icon}.png"),
+            profile.LOCK_BUTTON_ROI,
+        )
+        _paste_centered(
+            canvas,
+            load_template(f"templates/screenshot/{abandon_icon}.png"),
+            profile.DEPRECATE_BUTTON_ROI,
+        )
@@ -0,0 +1,88 @@
+"""
+Synthetic essence inventories for the simulator.
+"""
+
+import random
+from dataclasses import dataclass
+
+from endfield_essence_recognizer.core.recognition import (
+    AbandonStatusLabel,
+    LockStatusLabel,
+    RarityLabel,
+)
+from endfield_essence_recognizer.core.scanner.models import EssenceData
+from endfield_essence_recognizer.game_data.models.v2 import StatType
+from endfield_essence_recognizer.game_data.static_game_data import StaticGameData
+
+
+@dataclass
+class SimulatedEssence:
+    """模拟器中的一个基质。"""
+
+    stats: list[str]
+    """三个属性的 stat_id（主属性、次属性、技能）。"""
+    levels: list[int]
+    """三个属性的等级 (1-6)。"""
+    rarity: RarityLabel
+    """稀有度。"""
+    locked: bool = False
+    """是否已锁定。"""
+    abandoned: bool = False
+    """是否已弃用。"""
+
+    def matches(self, data: EssenceData) -> bool:
+        """识别结果是否与该基质完全一致。"""
+        lock_label = (
+            LockStatusLabel.LOCKED if self.locked else LockStatusLabel.NOT_LOCKED
+        )
+        abandon_label = (
+            AbandonStatusLabel.ABANDONED
+            if self.abandoned
+            else AbandonStatusLabel.NOT_ABANDONED
+        )
+        return (
+            data.stats == self.stats
+            and data.levels == self.levels
+            and data.rarity == self.rarity
+            and data.lock_label == lock_label
+            and data.abandon_label == abandon_label
+        )
+
+
+def generate_inventory(
+    static_game_data: StaticGameData,
+    count: int,
+    seed: int = 0,
+) -> list[SimulatedEssence]:
+    """
+    随机生成一批基质。相同的 seed 总是生成相同的结果。
+
+    Args:
+        static_game_data: 静态游戏数据，提供所有属性。
+        count: 基质数量。
+        seed: 随机种子。
+    """
+    rng = random.Random(seed)
+    stats_by_type: dict[StatType, list[str]] = {}
+    for stat in sorted(static_game_data.list_stats(), key=lambda s: s.stat_id):
+        stats_by_type.setdefault(stat.type, []).append(stat.stat_id)
+
+    inventory: list[SimulatedEssence] = []
+    for _ in range(count):
+        stats = [
+            rng.choice(stats_by_type[stat_type])
+            for stat_type in (StatType.ATTRIBUTE, StatType.SECONDARY, StatType.SKILL)
+        ]
+        inventory.append(
+            SimulatedEssence(
+                stats=stats,
+                levels=[rng.randint(1, 6) for _ in stats],
+                rarity=rng.choices(
+                    [RarityLabel.FIVE, RarityLabel.FOUR, RarityLabel.OTHER],
+                    weights=[2, 3, 5],
+                )[0],
+                locked=rng.random() < 0.2,
+                abandoned=rng.random() < 0.1,
+            )
+        )
+    return inventory
@@ -0,0 +1,379 @@
+"""
+Recognizer micro-benchmarks over a corpus of essence screenshots.
+
+The corpus is either generated with `SimulatedGame` at several resolutions (with the
+ground truth of every frame) or loaded from a directory of real screenshots. Every
+recognizer used by the scanner, as well as the whole `recognize_essence` function, is
+timed on each frame and the p50/p95 latency and throughput are written as JSON, so
+engine changes can be compared offline before they are shipped.
+
+运行示例:
+python -m endfield_essence_recognizer.simulator.recognizer_benchmark
+python -m endfield_essence_recognizer.simulator.recognizer_benchmark -r 1920x1080 -r 2560x1440 -o bench.json
+python -m endfield_essence_recognizer.simulator.recognizer_benchmark --corpus screenshots
+"""
+
+import argparse
+import dataclasses
+import json
+import platform
+import sys
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import cv2
+import numpy as np
+from cv2.typing import MatLike
+
+from endfield_essence_recognizer.core.layout.factory import build_resolution_profile
+from endfield_essence_recognizer.core.recognition import (
+    FrameContext,
+    RarityLabel,
+    RecognitionProfile,
+    TemplateRecognizer,
+    build_abandon_status_profile,
+    build_attribute_profile,
+    build_lock_status_profile,
+    build_ui_scene_profile,
+    prepare_attribute_level_recognizer,
+    prepare_rarity_recognizer,
+    prepare_recognizer,
+)
+from endfield_essence_recognizer.core.recognition.tasks.attribute_level import (
+    level_icons_region,
+)
+from endfield_essence_recognizer.core.scanner.context import ScannerContext
+from endfield_essence_recognizer.core.scanner.engine import recognize_essence
+from endfield_essence_recognizer.core.scanner.models import EssenceData
+from endfield_essence_recognizer.core.window.adapter import InMemoryImageSource
+from endfield_essence_recognizer.core.window.scaling import ScalingImageSource
+from endfield_essence_recognizer.game_data.static_game_data import StaticGameData
+from endfield_essence_recognizer.simulator.benchmark import load_static_game_data
+from endfield_essence_recognizer.simulator.game import SimulatedGame
+from endfield_essence_recognizer.simulator.inventory import (
+    SimulatedEssence,
+    generate_inventory,
+)
+from endfield_essence_recognizer.utils.image import load_image
+from endfield_essence_recognizer.utils.log import logger
+
+REPORT_FORMAT_VERSION = 1
+
+DEFAULT_RESOLUTIONS: list[tuple[int, int]] = [(1920, 1080), (2560, 1440), (3440, 1440)]
+
+
+@dataclass(frozen=True)
+class CorpusFrame:
+    """语料中的一张截图。"""
+
+    name: str
+    """截图名称，用于报告。"""
+    image: MatLike
+    """物理分辨率下的完整客户区截图 (BGR)。"""
+    truth: SimulatedEssence | None = None
+    """截图中基质的真实信息；从目录加载的截图没有。"""
+
+
+@dataclass(frozen=True)
+class LatencyStats:
+    """一组耗时样本的统计。"""
+
+    samples: int
+    p50_ms: float
+    p95_ms: float
+    mean_ms: float
+    throughput_per_s: float
+    """按平均耗时计算的每秒调用次数。"""
+
+    @classmethod
+    def from_samples(cls, seconds: Sequence[float]) -> "LatencyStats":
+        if not seconds:
+            raise ValueError("at least one sample is required")
+        values = np.asarray(seconds, dtype=np.float64) * 1000.0
+        mean = float(values.mean())
+        return cls(
+            samples=len(values),
+            p50_ms=float(np.percentile(values, 50)),
+            p95_ms=float(np.percentile(values, 95)),
+            mean_ms=mean,
+            throughput_per_s=1000.0 / mean if mean > 0 else float("inf"),
+        )
+
+
+def generate_corpus(
+    static_game_data: StaticGameData,
+    resolutions: Sequence[tuple[int, int]] = DEFAULT_RESOLUTIONS,
+    frames_per_resolution: int = 20,
+    seed: int = 0,
+) -> list[CorpusFrame]:
+    """
+    用模拟游戏生成带真实信息的截图语料。
+
+    Args:
+        static_game_data: 静态游戏数据。
+        resolutions: 物理分辨率列表 (宽, 高)。
+        frames_per_resolution: 每个分辨率生成的截图数量（不超过网格格数）。
+        seed: 随机种子。
+    """
+    corpus: list[CorpusFrame] = []
+    for width, height in resolutions:
+        game = SimulatedGame([], (width, height), panel_latency=0.0)
+        slots = game.slot_positions()
+        game.inventory = generate_inventory(static_game_data, len(slots), seed)
+        scale = width / game.logical_size[0]
+        for index in range(min(frames_per_resolution, len(slots))):
+            slot = slots[index]
+            game.click(round(slot.x * scale), round(slot.y * scale))
+            game.wait(0.0)
+            corpus.append(
+                CorpusFrame(
+                    name=f"{width}x{height}#{index}",
+                    image=game.screenshot(),
+                    truth=game.inventory[index],
+                )
+            )
+    return corpus
+
+
+def load_corpus(directory: Path, pattern: str = "*.png") -> list[CorpusFrame]:
+    """从目录加载基质界面截图作为语料（没有真实信息）。"""
+    return [
+        CorpusFrame(name=path.name, image=load_image(path))
+        for path in sorted(directory.glob(pattern))
+    ]
+
+
+def _prepare_isolated[LabelT](
+    name: str, profile: RecognitionProfile[LabelT], fingerprint_cache: bool
+) -> TemplateRecognizer[LabelT]:
+    """构造识别器；指纹缓存按需关闭，且从不读写持久化文件。"""
+    cache_profile = profile.fingerprint_cache
+    if not fingerprint_cache:
+        cache_profile = None
+    elif cache_profile is not None:
+        cache_profile = dataclasses.replace(cache_profile, persist_path=None)
+    return prepare_recognizer(
+        name, dataclasses.replace(profile, fingerprint_cache=cache_profile)
+    )
+
+
+def build_benchmark_context(
+    static_game_data: StaticGameData, fingerprint_cache: bool = False
+) -> ScannerContext:
+    """
+    构造独立于全局缓存的扫描上下文。
+
+    Args:
+        static_game_data: 静态游戏数据。
+        fingerprint_cache: 是否启用指纹缓存。默认关闭，以便测量模板匹配本身的耗时；
+            且语料中的截图往往重复，启用后测得的主要是缓存命中的耗时。
+    """
+    return ScannerContext(
+        attr_recognizer=_prepare_isolated(
+            "AttributeRecognizer",
+            build_attribute_profile(static_game_data),
+            fingerprint_cache,
+        ),
+        attr_level_recognizer=prepare_attribute_level_recognizer(),
+        abandon_status_recognizer=_prepare_isolated(
+            "AbandonStatusRecognizer", build_abandon_status_profile(), fingerprint_cache
+        ),
+        lock_status_recognizer=_prepare_isolated(
+            "LockStatusRecognizer", build_lock_status_profile(), fingerprint_cache
+        ),
+        rarity_recognizer=prepare_rarity_recognizer(),
+        ui_scene_recognizer=_prepare_isolated(
+            "UISceneRecognizer", build_ui_scene_profile(), fingerprint_cache
+        ),
+        static_game_data=static_game_data,
+    )
+
+
+def _time_call(samples: list[float], func: Callable[[], Any]) -> Any:
+    start = time.perf_counter()
+    result = func()
+    samples.append(time.perf_counter() - start)
+    return result
+
+
+def _benchmark_frame(
+    ctx: ScannerContext,
+    frame: CorpusFrame,
+    repeat: int,
+    samples: dict[str, list[float]],
+) -> EssenceData:
+    """对一张截图计时各识别器，返回最后一次 `recognize_essence` 的结果。"""
+    image_source = ScalingImageSource(InMemoryImageSource(frame.image))
+    profile = build_resolution_profile(*image_source.get_client_size())
+    level_region = level_icons_region(profile)
+    stat_rois, (level_roi, abandon_roi, lock_roi, rarity_roi, ui_roi) = (
+        image_source.screenshot_many(
+            [profile.STATS_0_ROI, profile.STATS_1_ROI, profile.STATS_2_ROI]
+        ),
+        image_source.screenshot_many(
+            [
+                level_region,
+                profile.DEPRECATE_BUTTON_ROI,
+                profile.LOCK_BUTTON_ROI,
+                profile.RARITY_ROI,
+                profile.ESSENCE_UI_ROI,
+            ]
+        ),
+    )
+
+    for _ in range(repeat):
+        for stat_roi in stat_rois:
+            _time_call(
+                samples["attribute"],
+                lambda roi=stat_roi: ctx.attr_recognizer.recognize_roi(roi),
+            )
+        _time_call(
+            samples["attribute_level"],
+            lambda: ctx.attr_level_recognizer.recognize_levels(
+                FrameContext(level_roi, origin=level_region.p0), profile
+            ),
+        )
+        _time_call(
+            samples["abandon_status"],
+            lambda: ctx.abandon_status_recognizer.recognize_roi(abandon_roi),
+        )
+        _time_call(
+            samples["lock_status"],
+            lambda: ctx.lock_status_recognizer.recognize_roi(lock_roi),
+        )
+        _time_call(
+            samples["rarity"],
+            lambda: ctx.rarity_recognizer.recognize_roi_fallback(
+                rarity_roi, fallback_label=RarityLabel.OTHER
+            ),
+        )
+        _time_call(
+            samples["ui_scene"],
+            lambda: ctx.ui_scene_recognizer.recognize_roi(ui_roi),
+        )
+        data = _time_call(
+            samples["recognize_essence"],
+            lambda: recognize_essence(image_source, ctx, profile),
+        )
+    return data
+
+
+def benchmark_recognizers(
+    ctx: ScannerContext,
+    corpus: Sequence[CorpusFrame],
+    repeat: int = 3,
+) -> dict[str, Any]:
+    """
+    对语料中的每张截图计时各识别器及 `recognize_essence`。
+
+    单个识别器的计时只包含识别本身（ROI 已预先截取并缩放到逻辑分辨率）；
+    `recognize_essence` 的计时包含从内存截图中批量截取与缩放。
+
+    Returns:
+        可直接序列化为 JSON 的报告。
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+    samples: dict[str, list[float]] = {
+        name: []
+        for name in (
+            "attribute",
+            "attribute_level",
+            "abandon_status",
+            "lock_status",
+            "rarity",
+            "ui_scene",
+            "recognize_essence",
+        )
+    }
+    checked = correct = 0
+
+    for frame in corpus:
+        data = _benchmark_frame(ctx, frame, repeat, samples)
+        if frame.truth is not None:
+            checked += 1
+            correct += frame.truth.matches(data)
+
+    return {
+        "version": REPORT_FORMAT_VERSION,
+        "environment": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "opencv": cv2.__version__,
+        },
+        "corpus": {
+            "frames": len(corpus),
+            "resolutions": sorted(
+                {f"{f.image.shape[1]}x{f.image.shape[0]}" for f in corpus}
+            ),
+            "repeat": repeat,
+        },
+        "accuracy": {
+            "checked": checked,
+            "correct": correct,
+        },
+        "results": {
+            name: dataclasses.asdict(LatencyStats.from_samples(values))
+            for name, values in samples.items()
+            if values
+        },
+    }
+
+
+def _parse_resolution(text: str) -> tuple[int, int]:
+    width, _, height = text.lower().partition("x")
+    return int(width), int(height)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="识别器微基准测试")
+    parser.add_argument(
+        "-r",
+        "--resolution",
+        action="append",
+        type=_parse_resolution,
+        help="生成语料的物理分辨率，如 2560x1440，可重复指定",
+    )
+    parser.add_argument(
+        "--frames", type=int, default=20, help="每个分辨率生成的截图数量"
+    )
+    parser.add_argument(
+        "--corpus", type=Path, help="从目录加载截图作为语料，而不是生成"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="每张截图重复计时的次数")
+    parser.add_argument("--seed", type=int, default=0, help="生成语料的随机种子")
+    parser.add_argument(
+        "--fingerprint-cache", action="store_true", help="启用识别器的指纹缓存"
+    )
+    parser.add_argument("-o", "--output", type=Path, help="JSON 报告输出路径")
+    args = parser.parse_args()
+
+    # 日志输出会显著影响计时
+    logger.disable("endfield_essence_recognizer")
+
+    static_game_data = load_static_game_data()
+    if args.corpus is not None:
+        corpus = load_corpus(args.corpus)
+    else:
+        corpus = generate_corpus(
+            static_game_data,
+            args.resolution or DEFAULT_RESOLUTIONS,
+            args.frames,
+            args.seed,
+        )
+    ctx = build_benchmark_context(static_game_data, args.fingerprint_cache)
+    report = benchmark_recognizers(ctx, corpus, args.repeat)
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output is not None:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
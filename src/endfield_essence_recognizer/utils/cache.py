@@ -0,0 +1,47 @@
+"""
+Thread-safe memoization for singletons and factories loaded in the background.
+"""
+
+import functools
+import threading
+from collections.abc import Callable
+from typing import Any, overload
+
+
+@overload
+def locked_cache[**P, R](func: Callable[P, R], /) -> Callable[P, R]: ...
+
+
+@overload
+def locked_cache[**P, R](
+    *, maxsize: int | None = None
+) -> Callable[[Callable[P, R]], Callable[P, R]]: ...
+
+
+def locked_cache(
+    func: Callable[..., Any] | None = None, /, *, maxsize: int | None = None
+) -> Any:
+    """
+    Like `functools.lru_cache`, but calls are serialized by a lock, so a result is
+    computed only once even when several threads ask for it at the same time (e.g. the
+    startup warm-up and the first hotkey press). Later callers wait for the first one.
+
+    Use it as `@locked_cache` (unbounded) or `@locked_cache(maxsize=...)`. The lock is
+    reentrant and held per function, so cached functions may call each other as long
+    as they do not depend on each other in a cycle.
+    """
+
+    def decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+        cached = functools.lru_cache(maxsize=maxsize)(func)
+        lock = threading.RLock()
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with lock:
+                return cached(*args, **kwargs)
+
+        return wrapper
+
+    if func is not None:
+        return decorate(func)
+    return decorate
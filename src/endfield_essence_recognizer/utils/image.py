@@ -5,6 +5,7 @@ Utils for image processing.
 import base64
 from collections.abc import Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import cv2
 import numpy as np
@@ -12,8 +13,19 @@ from cv2.typing import MatLike
 
 from endfield_essence_recognizer.core.layout.base import Point, Region
 
+if TYPE_CHECKING:
+    from endfield_essence_recognizer.core.interfaces import ImageSource
+
 type Slice = slice | tuple[slice, slice]
 
+CAPTURE_MERGE_SLACK = 256 * 256
+"""
+合并两个截图区域时允许多截取的像素数。
+
+一次额外的截图调用（BitBlt 及 GDI 开销）大致相当于多复制这么多像素，
+因此多截取的面积不超过此值时，合并为一次截图更划算。
+"""
+
 
 def load_image(
     image_like: str | Path | bytes | MatLike,
@@ -155,6 +167,91 @@ def region_out_of_bounds(
     )
 
 
+def region_area(region: Region) -> int:
+    """区域面积（像素数）。"""
+    return max(0, region.x1 - region.x0) * max(0, region.y1 - region.y0)
+
+
+def union_region(regions: Sequence[Region]) -> Region:
+    """返回包含所有给定区域的最小外接矩形。"""
+    if not regions:
+        raise ValueError("union_region requires at least one region")
+    return Region(
+        Point(min(r.x0 for r in regions), min(r.y0 for r in regions)),
+        Point(max(r.x1 for r in regions), max(r.y1 for r in regions)),
+    )
+
+
+def plan_capture_regions(
+    regions: Sequence[Region],
+    merge_slack: int = CAPTURE_MERGE_SLACK,
+) -> list[tuple[Region, list[int]]]:
+    """
+    为一批 ROI 规划需要实际截取的矩形。
+
+    贪心地合并两组区域：每次选择合并后多截取面积最小的一对，
+    直到任何合并都会多截取超过 `merge_slack` 个像素为止。
+
+    Args:
+        regions: 需要截取的 ROI 列表。
+        merge_slack: 合并时允许多截取的像素数。
+
+    Returns:
+        [(截取矩形, 该矩形覆盖的 ROI 下标列表), ...]
+    """
+    clusters: list[tuple[Region, list[int]]] = [
+        (region, [index]) for index, region in enumerate(regions)
+    ]
+    while len(clusters) > 1:
+        best: tuple[int, int, int, Region] | None = None
+        for i in range(len(clusters)):
+            for j in range(i + 1, len(clusters)):
+                merged = union_region([clusters[i][0], clusters[j][0]])
+                extra = (
+                    region_area(merged)
+                    - region_area(clusters[i][0])
+                    - region_area(clusters[j][0])
+                )
+                if extra <= merge_slack and (best is None or extra < best[0]):
+                    best = (extra, i, j, merged)
+        if best is None:
+            break
+        _extra, i, j, merged = best
+        members = clusters[i][1] + clusters[j][1]
+        clusters[i] = (merged, members)
+        del clusters[j]
+    return clusters
+
+
+def crop_relative(image: MatLike, region: Region, origin: Point) -> MatLike:
+    """从以 `origin` 为左上角的图像中裁剪出客户区坐标下的 `region`（视图）。"""
+    return image[
+        region.y0 - origin.y : region.y1 - origin.y,
+        region.x0 - origin.x : region.x1 - origin.x,
+    ]
+
+
+def screenshot_many_by_plan(
+    image_source: "ImageSource",
+    relative_regions: Sequence[Region],
+    merge_slack: int = CAPTURE_MERGE_SLACK,
+) -> list[MatLike]:
+    """
+    按 `plan_capture_regions` 的规划批量截取多个 ROI。
+
+    每个规划矩形只截取一次，返回的 ROI 图像均为该截图的视图（零拷贝），
+    调用方不得修改。
+    """
+    images: list[MatLike | None] = [None] * len(relative_regions)
+    for capture_region, members in plan_capture_regions(relative_regions, merge_slack):
+        captured = image_source.screenshot(capture_region)
+        for index in members:
+            images[index] = crop_relative(
+                captured, relative_regions[index], capture_region.p0
+            )
+    return images  # type: ignore[return-value]
+
+
 def mask_region(
     image: MatLike,
     region: Region,
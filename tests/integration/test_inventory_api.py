@@ -0,0 +1,100 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from endfield_essence_recognizer.core.recognition import (
+    AbandonStatusLabel,
+    LockStatusLabel,
+    RarityLabel,
+)
+from endfield_essence_recognizer.core.scanner.models import (
+    EssenceData,
+    EssenceQuality,
+    EvaluationResult,
+)
+from endfield_essence_recognizer.core.scanner.result_store import ScanResultStore
+from endfield_essence_recognizer.dependencies import get_scan_result_store_dep
+from endfield_essence_recognizer.server import app
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ScanResultStore(tmp_path / "scan_results.db")
+    scan_id = store.begin_scan()
+    for column, (quality, level) in enumerate(
+        [(EssenceQuality.TREASURE, 3), (EssenceQuality.TRASH, 1)]
+    ):
+        store.add(
+            scan_id,
+            0,
+            column,
+            EssenceData(
+                stats=["stat_a", "stat_b", "stat_c"],
+                levels=[level, 1, 1],
+                rarity=RarityLabel.FIVE,
+                abandon_label=AbandonStatusLabel.NOT_ABANDONED,
+                lock_label=LockStatusLabel.LOCKED,
+            ),
+            EvaluationResult(
+                quality=quality, log_message="msg", matched_weapons={"wpn_1"}
+            ),
+        )
+    store.finish_scan(scan_id, completed=True)
+    store.flush()
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def client(store):
+    app.dependency_overrides[get_scan_result_store_dep] = lambda: store
+    # The routes need no startup work; skipping the lifespan keeps the shared
+    # LogService from being bound to this client's event loop.
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_list_scans(client):
+    response = client.get("/api/inventory/scans")
+
+    assert response.status_code == 200
+    (scan,) = response.json()["scans"]
+    assert scan["completed"] is True
+    assert scan["levelsRecognized"] is True
+    assert scan["essenceCount"] == 2
+
+
+def test_query_treasures_for_weapon(client):
+    response = client.get(
+        "/api/inventory/essences?quality=treasure&weapon_id=wpn_1&min_attribute_level=3"
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 1
+    assert body["levelsRecognized"] is True
+    (item,) = body["items"]
+    assert item["column"] == 0
+    assert item["levels"] == [3, 1, 1]
+    assert item["locked"] is True
+    assert item["abandoned"] is False
+    assert item["matchedWeapons"] == ["wpn_1"]
+
+
+def test_level_query_over_scan_without_levels_is_flagged(client, store):
+    scan_id = store.begin_scan(levels_recognized=False)
+    store.finish_scan(scan_id, completed=True)
+    store.flush()
+
+    response = client.get("/api/inventory/essences?min_attribute_level=3")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 0
+    assert body["scanId"] == scan_id
+    assert body["levelsRecognized"] is False
+
+
+def test_query_rejects_invalid_quality(client):
+    response = client.get("/api/inventory/essences?quality=gold")
+
+    assert response.status_code == 422
@@ -4,7 +4,11 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from loguru import logger
 
-from endfield_essence_recognizer.dependencies import get_log_service
+from endfield_essence_recognizer.dependencies import (
+    get_log_service,
+    get_scan_result_store_dep,
+    get_warmup_service,
+)
 from endfield_essence_recognizer.server import app
 
 
@@ -53,3 +57,24 @@ async def test_lifespan_integration_log_service():
 
         # Verify hotkeys were unhooked
         mock_keyboard.unhook_all.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_shuts_down_after_error():
+    """
+    The shutdown steps also run when the app exits with an error, and the scan
+    result store is not created just to be flushed.
+    """
+    get_scan_result_store_dep.cache_clear()
+    warmup_service = get_warmup_service()
+
+    with (
+        patch("endfield_essence_recognizer.hotkey_entrypoints.keyboard"),
+        patch.object(warmup_service, "stop", wraps=warmup_service.stop) as stop,
+        pytest.raises(RuntimeError),
+    ):
+        async with app.router.lifespan_context(app):
+            raise RuntimeError("boom")
+
+    stop.assert_called_once()
+    assert get_scan_result_store_dep.cache_info().currsize == 0
@@ -3,7 +3,28 @@ from unittest.mock import MagicMock
 import pytest
 from fastapi.testclient import TestClient
 
+from endfield_essence_recognizer.core.layout.base import Point
+from endfield_essence_recognizer.core.recognition import (
+    AbandonStatusLabel,
+    LockStatusLabel,
+    RarityLabel,
+)
+from endfield_essence_recognizer.core.scanner.action_logic import (
+    ActionType,
+    ScannerAction,
+)
+from endfield_essence_recognizer.core.scanner.models import (
+    EssenceData,
+    EssenceQuality,
+    EvaluationResult,
+)
+from endfield_essence_recognizer.core.scanner.plan import (
+    ActionPlanBoard,
+    PlanEntry,
+    PlanStatus,
+)
 from endfield_essence_recognizer.dependencies import (
+    get_action_plan_board_dep,
     get_delivery_claimer_engine_dep,
     get_one_time_recognition_engine_dep,
     get_scanner_engine_dep,
@@ -27,7 +48,12 @@ def mock_scanner_service():
 
 
 @pytest.fixture
-def client(mock_scanner_service):
+def action_plan_board():
+    return ActionPlanBoard()
+
+
+@pytest.fixture
+def client(mock_scanner_service, action_plan_board):
     """FastAPI TestClient with overridden dependencies."""
     app.dependency_overrides[get_scanner_service] = lambda: mock_scanner_service
     # Mock engines to avoid real initialization
@@ -35,6 +61,7 @@ def client(mock_scanner_service):
     app.dependency_overrides[get_scanner_engine_dep] = lambda: MagicMock()
     app.dependency_overrides[get_one_time_recognition_engine_dep] = lambda: MagicMock()
     app.dependency_overrides[get_delivery_claimer_engine_dep] = lambda: MagicMock()
+    app.dependency_overrides[get_action_plan_board_dep] = lambda: action_plan_board
 
     # Bypass window checks
     app.dependency_overrides[require_game_window_exists] = lambda: None
@@ -67,6 +94,21 @@ def test_toggle_scanning_essence(client, mock_scanner_service):
     assert mock_scanner_service.toggle_scan.called
 
 
+def test_toggle_scanning_essence_resume(client, mock_scanner_service):
+    """Test POST /api/toggle_scanning passes the resume option to the engine."""
+    engine = MagicMock()
+    app.dependency_overrides[get_scanner_engine_dep] = lambda: engine
+    response = client.post(
+        "/api/toggle_scanning", json={"task_type": "essence", "resume": True}
+    )
+    assert response.status_code == 200
+    scanner_factory = mock_scanner_service.toggle_scan.call_args.kwargs[
+        "scanner_factory"
+    ]
+    assert scanner_factory() is engine
+    assert engine.resume is True
+
+
 def test_toggle_scanning_delivery(client, mock_scanner_service):
     """Test POST /api/toggle_scanning for delivery_claim."""
     response = client.post("/api/toggle_scanning", json={"task_type": "delivery_claim"})
@@ -78,3 +120,45 @@ def test_toggle_scanning_invalid(client):
     """Test POST /api/toggle_scanning with invalid task type."""
     response = client.post("/api/toggle_scanning", json={"task_type": "invalid"})
     assert response.status_code == 422
+
+
+def _publish_plan(board: ActionPlanBoard):
+    entry = PlanEntry(
+        row=1,
+        column=2,
+        position=Point(0, 0),
+        data=EssenceData(
+            stats=["a", "b", "c"],
+            levels=[1, 2, 3],
+            rarity=RarityLabel.FIVE,
+            abandon_label=AbandonStatusLabel.NOT_ABANDONED,
+            lock_label=LockStatusLabel.NOT_LOCKED,
+        ),
+        evaluation=EvaluationResult(quality=EssenceQuality.TRASH, log_message="msg"),
+        actions=[ScannerAction(ActionType.CLICK_ABANDON, "abandon")],
+    )
+    return board.publish([entry], confirmed=False)
+
+
+def test_get_action_plan(client, action_plan_board):
+    """Test GET /api/action_plan returns null before and the plan after a sweep."""
+    assert client.get("/api/action_plan").json() is None
+
+    plan = _publish_plan(action_plan_board)
+    body = client.get("/api/action_plan").json()
+    assert body["id"] == plan.id
+    assert body["status"] == "awaiting_confirmation"
+    (entry,) = body["entries"]
+    assert entry["abandonedBefore"] is False
+    assert entry["abandonedAfter"] is True
+    assert entry["lockedAfter"] is False
+
+
+def test_confirm_and_reject_action_plan(client, action_plan_board):
+    """Test POST /api/action_plan/{id}/confirm and /reject."""
+    plan = _publish_plan(action_plan_board)
+
+    assert client.post(f"/api/action_plan/{plan.id + 1}/confirm").status_code == 409
+    assert client.post(f"/api/action_plan/{plan.id}/confirm").status_code == 200
+    assert plan.status == PlanStatus.CONFIRMED
+    assert client.post(f"/api/action_plan/{plan.id}/reject").status_code == 409
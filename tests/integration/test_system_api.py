@@ -3,9 +3,16 @@ from unittest.mock import MagicMock
 import pytest
 from fastapi.testclient import TestClient
 
-from endfield_essence_recognizer.dependencies import get_system_service
+from endfield_essence_recognizer.dependencies import (
+    get_system_service,
+    get_warmup_service,
+)
 from endfield_essence_recognizer.server import app
 from endfield_essence_recognizer.services.system_service import SystemService
+from endfield_essence_recognizer.services.warmup_service import (
+    WarmupComponent,
+    WarmupService,
+)
 
 
 @pytest.fixture
@@ -27,3 +34,30 @@ def test_exit_endpoint(client, mock_system_service):
     response = client.post("/api/exit")
     assert response.status_code == 200
     assert mock_system_service.exit_application.called
+
+
+def test_readiness_endpoint_and_websocket(client):
+    """Test GET /api/system/ready and the /ws/system/ready readiness events."""
+    warmup_service = WarmupService([WarmupComponent("StaticGameData", lambda: None)])
+    app.dependency_overrides[get_warmup_service] = lambda: warmup_service
+
+    response = client.get("/api/system/ready")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["ready"] is False
+    assert body["components"] == [
+        {"name": "StaticGameData", "status": "pending", "duration": None, "error": None}
+    ]
+
+    with client.websocket_connect("/ws/system/ready") as websocket:
+        assert websocket.receive_json()["ready"] is False
+        warmup_service.start(max_workers=1)
+        events = [websocket.receive_json()]
+        while not events[-1]["ready"]:
+            events.append(websocket.receive_json())
+
+    assert events[0]["components"][0]["status"] == "loading"
+    component = events[-1]["components"][0]
+    assert component["status"] == "ready"
+    assert component["duration"] is not None
+    assert client.get("/api/system/ready").json()["ready"] is True
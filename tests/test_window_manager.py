@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 
 from endfield_essence_recognizer.core.layout.base import Point, Region
+from endfield_essence_recognizer.core.window import windows_utils
 from endfield_essence_recognizer.core.window.manager import WindowManager
 from endfield_essence_recognizer.exceptions import WindowNotFoundError
 
@@ -178,12 +179,185 @@ def test_screenshot(window_manager, mock_window):
         # Test without ROI
         res = window_manager.screenshot()
         assert res is mock_image
-        mock_screenshot.assert_called_with(mock_window, None)
+        mock_screenshot.assert_called_with(
+            mock_window, None, window_manager.capture_session
+        )
 
         # Test with ROI
         roi = Region(Point(0, 0), Point(10, 10))
         window_manager.screenshot(roi)
-        mock_screenshot.assert_called_with(mock_window, roi)
+        mock_screenshot.assert_called_with(
+            mock_window, roi, window_manager.capture_session
+        )
+
+
+class FakeCaptureSession:
+    def __init__(self):
+        self.scopes: list[Region] = []
+        self.closed = False
+
+    def capture(self, scope: Region) -> np.ndarray:
+        self.scopes.append(scope)
+        return np.zeros((scope.y1 - scope.y0, scope.x1 - scope.x0, 3), dtype=np.uint8)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_screenshot_reuses_capture_session(mock_window):
+    session = FakeCaptureSession()
+    window_manager = WindowManager(["Test Window"], capture_session=session)
+    client_rect = Region(Point(100, 50), Point(1380, 770))
+
+    with (
+        patch(
+            "endfield_essence_recognizer.core.window.manager.get_support_window"
+        ) as mock_get_support,
+        patch(
+            "endfield_essence_recognizer.core.window.windows_utils._get_client_rect"
+        ) as mock_client_rect,
+    ):
+        mock_get_support.return_value = mock_window
+        mock_client_rect.return_value = client_rect
+
+        full = window_manager.screenshot()
+        roi = window_manager.screenshot(Region(Point(10, 20), Point(30, 60)))
+
+    assert full.shape == (720, 1280, 3)
+    assert roi.shape == (40, 20, 3)
+    # Both captures go through the same session, in screen coordinates
+    assert session.scopes == [
+        client_rect,
+        Region(Point(110, 70), Point(130, 110)),
+    ]
+
+    window_manager.close()
+    assert session.closed is True
+
+
+class FakeGdi:
+    """
+    Records GDI calls made by GdiCaptureSession and checks the documented rules:
+    GetDIBits and DeleteObject must not see a bitmap that is selected into a DC.
+    """
+
+    SRCCOPY = 0xCC0020
+
+    def __init__(self):
+        self.calls: list[tuple] = []
+        self.dcs: list[FakeGdi.DC] = []
+        self.next_handle = 100
+
+    class Bitmap:
+        def __init__(self, gdi: "FakeGdi"):
+            self.gdi = gdi
+            self.handle = gdi.next_handle
+            gdi.next_handle += 1
+
+        def CreateCompatibleBitmap(self, _dc, width, height):
+            self.size = (width, height)
+
+        def GetHandle(self):
+            return self.handle
+
+    class DC:
+        def __init__(self, gdi: "FakeGdi", name: str):
+            self.gdi, self.name = gdi, name
+            self.selected = f"{name}-default-bitmap"
+            self.deleted = False
+            gdi.dcs.append(self)
+
+        def CreateCompatibleDC(self):
+            return FakeGdi.DC(self.gdi, "mem")
+
+        def SelectObject(self, obj):
+            self.gdi.calls.append(("SelectObject", self.name, obj))
+            previous, self.selected = self.selected, obj
+            return previous
+
+        def BitBlt(self, *_args):
+            self.gdi.calls.append(("BitBlt", self.name))
+
+        def GetSafeHdc(self):
+            return self.name
+
+        def DeleteDC(self):
+            self.gdi.calls.append(("DeleteDC", self.name))
+            self.deleted = True
+
+    def is_selected(self, handle: int) -> bool:
+        return any(
+            not dc.deleted
+            and isinstance(dc.selected, FakeGdi.Bitmap)
+            and dc.selected.handle == handle
+            for dc in self.dcs
+        )
+
+    # win32gui
+    def GetDC(self, _hwnd):
+        return 1
+
+    def ReleaseDC(self, _hwnd, _dc):
+        self.calls.append(("ReleaseDC",))
+
+    def DeleteObject(self, handle):
+        assert not self.is_selected(handle), "deleting a bitmap selected into a DC"
+        self.calls.append(("DeleteObject", handle))
+
+    # win32ui
+    def CreateDCFromHandle(self, _handle):
+        return FakeGdi.DC(self, "src")
+
+    def CreateBitmap(self):
+        return FakeGdi.Bitmap(self)
+
+    # gdi32
+    def GetDIBits(self, _hdc, handle, _start, lines, _bits, _info, _usage):
+        assert not self.is_selected(handle), "GetDIBits on a selected bitmap"
+        self.calls.append(("GetDIBits", handle))
+        return lines
+
+
+@pytest.fixture
+def fake_gdi(monkeypatch):
+    gdi = FakeGdi()
+    # Replace the Windows libraries, which are not imported off Windows
+    for name in ("win32gui", "win32ui", "win32con"):
+        monkeypatch.setattr(windows_utils, name, gdi, raising=False)
+    return gdi
+
+
+def _gdi_session(
+    gdi: FakeGdi, max_cached_sizes: int
+) -> windows_utils.GdiCaptureSession:
+    session = windows_utils.GdiCaptureSession(max_cached_sizes=max_cached_sizes)
+    session._gdi32 = gdi
+    return session
+
+
+def test_gdi_session_deselects_bitmap_before_reading_it(fake_gdi):
+    session = _gdi_session(fake_gdi, max_cached_sizes=2)
+    image = session.capture(Region(Point(10, 10), Point(30, 20)))
+    assert image.shape == (10, 20, 3)
+
+    names = [call[0] for call in fake_gdi.calls]
+    assert names == ["SelectObject", "BitBlt", "SelectObject", "GetDIBits"]
+    # The memory DC's original bitmap is selected back in
+    assert fake_gdi.calls[2][2] == "mem-default-bitmap"
+
+
+def test_gdi_session_releases_dcs_before_bitmaps(fake_gdi):
+    session = _gdi_session(fake_gdi, max_cached_sizes=1)
+    session.capture(Region(Point(0, 0), Point(20, 10)))
+    # A second size evicts the first bitmap, which must not be selected anymore
+    session.capture(Region(Point(0, 0), Point(40, 10)))
+    assert ("DeleteObject", 100) in fake_gdi.calls
+
+    fake_gdi.calls.clear()
+    session.close()
+    names = [call[0] for call in fake_gdi.calls]
+    assert names == ["DeleteDC", "DeleteDC", "ReleaseDC", "DeleteObject"]
+    assert fake_gdi.calls[-1] == ("DeleteObject", 101)
 
 
 def test_screenshot_no_window(window_manager):
@@ -0,0 +1,92 @@
+import importlib.resources
+
+import cv2
+import numpy as np
+import pytest
+
+from endfield_essence_recognizer.core.recognition.batched_matcher import (
+    BatchedTemplateMatcher,
+)
+from endfield_essence_recognizer.core.recognition.template_recognizer import (
+    RecognitionProfile,
+    TemplateMatchingMode,
+    TemplateRecognizer,
+)
+from endfield_essence_recognizer.utils.image import load_image
+
+
+def _attribute_templates() -> dict[str, list[np.ndarray]]:
+    templates_dir = (
+        importlib.resources.files("endfield_essence_recognizer") / "templates/generated"
+    )
+    templates = {}
+    for path in sorted(templates_dir.iterdir(), key=lambda p: p.name):
+        if path.name.endswith(".png"):
+            with importlib.resources.as_file(path) as file:
+                templates[path.name.removesuffix(".png")] = [
+                    load_image(file, cv2.IMREAD_GRAYSCALE)
+                ]
+    return templates
+
+
+def _make_recognizer(templates, mode: TemplateMatchingMode) -> TemplateRecognizer:
+    recognizer = TemplateRecognizer(
+        f"Test-{mode}", RecognitionProfile(templates=[], matching_mode=mode)
+    )
+    for label, images in templates.items():
+        recognizer._templates[label].extend(images)
+    return recognizer
+
+
+@pytest.mark.parametrize("index", [0, 7, 19])
+def test_batched_matches_sequential_on_attribute_templates(index):
+    templates = _attribute_templates()
+    label = list(templates)[index]
+    template = templates[label][0]
+    height, width = template.shape
+
+    rng = np.random.default_rng(index)
+    roi = rng.integers(0, 40, (height + 8, width + 32), dtype=np.uint8)
+    roi[3 : 3 + height, 11 : 11 + width] = template
+    roi = cv2.add(roi, rng.integers(0, 10, roi.shape, dtype=np.uint8))
+
+    sequential = _make_recognizer(templates, TemplateMatchingMode.SEQUENTIAL)
+    batched = _make_recognizer(templates, TemplateMatchingMode.BATCHED)
+
+    seq_label, seq_score = sequential.recognize_roi(roi)
+    bat_label, bat_score = batched.recognize_roi(roi)
+
+    assert seq_label == bat_label == label
+    assert bat_score == pytest.approx(seq_score, abs=1e-4)
+
+
+def test_batched_matcher_scores_match_opencv_per_template():
+    rng = np.random.default_rng(42)
+    templates = {
+        "a": [rng.integers(0, 256, (8, 12), dtype=np.uint8)],
+        "b": [rng.integers(0, 256, (8, 12), dtype=np.uint8)],
+        "c": [rng.integers(0, 256, (5, 20), dtype=np.uint8)],
+        # larger than the ROI: skipped, as in sequential matching
+        "d": [rng.integers(0, 256, (40, 40), dtype=np.uint8)],
+    }
+    roi = rng.integers(0, 256, (20, 30), dtype=np.uint8)
+    # flat area makes some window variances zero
+    roi[:10, :15] = 128
+
+    matcher = BatchedTemplateMatcher("Test", templates)
+    label, score = matcher.match(roi)
+
+    expected = {
+        name: cv2.minMaxLoc(cv2.matchTemplate(roi, images[0], cv2.TM_CCOEFF_NORMED))[1]
+        for name, images in templates.items()
+        if name != "d"
+    }
+    best = max(expected, key=lambda name: expected[name])
+    assert label == best
+    assert score == pytest.approx(expected[best], abs=1e-4)
+
+
+def test_batched_matcher_without_usable_templates():
+    matcher = BatchedTemplateMatcher("Test", {})
+
+    assert matcher.match(np.zeros((10, 10), dtype=np.uint8)) == (None, -1.0)
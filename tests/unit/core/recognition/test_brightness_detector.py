@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from endfield_essence_recognizer.core.layout.base import Point
+from endfield_essence_recognizer.core.recognition.brightness_detector import (
+    BrightnessDetector,
+    BrightnessDetectorProfile,
+)
+from endfield_essence_recognizer.core.recognition.tasks.attribute_level import (
+    AttributeLevelRecognizer,
+    AttributeLevelRecognizerProfile,
+)
+
+
+@pytest.mark.parametrize("radius", [0, 2, 3])
+def test_is_bright_many_matches_is_bright(radius):
+    rng = np.random.default_rng(radius)
+    gray = rng.integers(150, 256, (50, 80), dtype=np.uint8)
+    detector = BrightnessDetector(
+        "Test", BrightnessDetectorProfile(threshold=200, sample_radius=radius)
+    )
+    points = [Point(int(x), int(y)) for x, y in rng.integers(0, 80, (30, 2))]
+    # Include points on and beyond every border
+    points += [Point(0, 0), Point(79, 49), Point(-1, 10), Point(10, 50)]
+
+    means = detector.mean_brightness_many(gray, points)
+    batch = detector.is_bright_many(gray, points)
+
+    assert means.shape == (len(points),)
+    assert batch.tolist() == [detector.is_bright(gray, p) for p in points]
+
+
+def test_is_bright_many_empty():
+    detector = BrightnessDetector("Test", BrightnessDetectorProfile())
+    gray = np.zeros((10, 10), dtype=np.uint8)
+
+    assert detector.is_bright_many(gray, []).shape == (0,)
+
+
+def test_recognize_levels_stops_at_first_dark_icon():
+    recognizer = AttributeLevelRecognizer(
+        "Test",
+        AttributeLevelRecognizerProfile(
+            brightness_profile=BrightnessDetectorProfile(threshold=200, sample_radius=1)
+        ),
+    )
+
+    class Profile:
+        STATS_LEVEL_ICON_POINTS = [
+            [Point(5 + 10 * i, 5 + 10 * row) for i in range(6)] for row in range(3)
+        ]
+
+    image = np.zeros((40, 70, 3), dtype=np.uint8)
+    # row 0: +2, row 1: first icon dark then bright ones (none), row 2: +6
+    lit = {0: [0, 1, 3], 1: [1, 2, 3], 2: [0, 1, 2, 3, 4, 5]}
+    for row, icons in lit.items():
+        for i in icons:
+            y, x = 5 + 10 * row, 5 + 10 * i
+            image[y - 1 : y + 2, x - 1 : x + 2] = 255
+
+    levels = recognizer.recognize_levels(image, Profile())
+
+    assert levels == [2, None, 6]
+    assert [recognizer.recognize_level(image, k, Profile()) for k in range(3)] == levels
@@ -0,0 +1,70 @@
+import numpy as np
+
+from endfield_essence_recognizer.core.layout.base import Point
+from endfield_essence_recognizer.core.layout.factory import build_resolution_profile
+from endfield_essence_recognizer.core.recognition import (
+    CardThumbnailer,
+    CardThumbnailProfile,
+)
+from endfield_essence_recognizer.core.recognition.frame import FrameContext
+from endfield_essence_recognizer.core.recognition.tasks.grid_rarity import (
+    grid_centers,
+)
+
+CARD_SIZE = 40
+
+
+def _thumbnailer() -> CardThumbnailer:
+    return CardThumbnailer("TestCardThumbnailer", CardThumbnailProfile())
+
+
+def _draw_card(image: np.ndarray, center: Point, seed: int) -> None:
+    half = CARD_SIZE // 2
+    rng = np.random.default_rng(seed)
+    image[center.y - half : center.y + half, center.x - half : center.x + half] = (
+        rng.integers(0, 256, (CARD_SIZE, CARD_SIZE, 3), dtype=np.uint8)
+    )
+
+
+def test_empty_slots_and_distinct_cards():
+    thumbnailer = _thumbnailer()
+    image = np.full((60, 200, 3), 24, dtype=np.uint8)
+    centers = [Point(30, 30), Point(80, 30), Point(130, 30)]
+    _draw_card(image, centers[0], seed=1)
+    _draw_card(image, centers[1], seed=2)
+
+    thumbnails = thumbnailer.thumbnails(image, centers, CARD_SIZE)
+    assert thumbnails.shape == (3, 16, 16, 3)
+    assert thumbnailer.is_empty(thumbnails).tolist() == [False, False, True]
+    assert thumbnailer.matches(thumbnails[:1], thumbnails[1:2]).tolist() == [False]
+
+
+def test_selection_border_does_not_change_thumbnail():
+    thumbnailer = _thumbnailer()
+    image = np.full((60, 60, 3), 24, dtype=np.uint8)
+    _draw_card(image, Point(30, 30), seed=3)
+    before = thumbnailer.thumbnails(image, [Point(30, 30)], CARD_SIZE)
+
+    image[10:50, 10:12] = 255
+    image[10:50, 48:50] = 255
+    image[10:12, 10:50] = 255
+    image[48:50, 10:50] = 255
+    after = thumbnailer.thumbnails(image, [Point(30, 30)], CARD_SIZE)
+
+    assert thumbnailer.matches(before, after).all()
+
+
+def test_grid_region_covers_all_cards():
+    thumbnailer = _thumbnailer()
+    profile = build_resolution_profile(1920, 1080)
+    centers = grid_centers(profile)
+    image = np.full((1080, 1920, 3), 24, dtype=np.uint8)
+
+    region = thumbnailer.grid_region(profile)
+    frame = FrameContext(
+        image[region.y0 : region.y1, region.x0 : region.x1],
+        origin=Point(region.x0, region.y0),
+    )
+    thumbnails = thumbnailer.thumbnails(frame, centers, profile.ESSENCE_CARD_SIZE)
+    assert len(thumbnails) == len(centers)
+    assert thumbnailer.is_empty(thumbnails).all()
@@ -0,0 +1,115 @@
+from enum import StrEnum
+from unittest.mock import patch
+
+import numpy as np
+
+from endfield_essence_recognizer.core.recognition.fingerprint_cache import (
+    FingerprintCache,
+    FingerprintCacheProfile,
+    compute_fingerprint,
+)
+from endfield_essence_recognizer.core.recognition.template_recognizer import (
+    RecognitionProfile,
+    TemplateRecognizer,
+)
+
+
+class Label(StrEnum):
+    SQUARE = "square"
+    BAR = "bar"
+
+
+def _roi(offset: int) -> np.ndarray:
+    roi = np.zeros((16, 32), dtype=np.uint8)
+    roi[4:12, offset : offset + 8] = 255
+    return roi
+
+
+def _recognizer(profile: FingerprintCacheProfile) -> TemplateRecognizer[Label]:
+    recognizer = TemplateRecognizer(
+        "Test",
+        RecognitionProfile(templates=[], fingerprint_cache=profile),
+    )
+    square = np.zeros((10, 10), dtype=np.uint8)
+    square[1:9, 1:9] = 255
+    bar = np.zeros((10, 10), dtype=np.uint8)
+    bar[4:6, :] = 255
+    recognizer._templates[Label.SQUARE].append(square)
+    recognizer._templates[Label.BAR].append(bar)
+    # Builds the cache for the templates set up above
+    with patch("importlib.resources.as_file"):
+        recognizer.load_templates()
+    return recognizer
+
+
+def test_fingerprint_depends_on_content_and_shape():
+    assert compute_fingerprint(_roi(4)) == compute_fingerprint(_roi(4).copy())
+    assert compute_fingerprint(_roi(4)) != compute_fingerprint(_roi(12))
+    assert compute_fingerprint(_roi(4)) != compute_fingerprint(_roi(4)[:, :30])
+
+
+def test_repeated_roi_skips_template_matching():
+    recognizer = _recognizer(FingerprintCacheProfile())
+
+    with patch.object(
+        recognizer, "_match_sequential", wraps=recognizer._match_sequential
+    ) as mock_match:
+        first = recognizer.recognize_roi(_roi(4))
+        second = recognizer.recognize_roi(_roi(4))
+
+    assert first == second
+    assert first[0] == Label.SQUARE
+    assert mock_match.call_count == 1
+
+
+def test_low_confidence_results_are_not_cached():
+    cache = FingerprintCache(
+        "Test", FingerprintCacheProfile(min_score=0.9), [Label.SQUARE], "sig"
+    )
+
+    assert cache.put("a", Label.SQUARE, 0.8) is False
+    assert cache.put("b", None, 1.0) is False
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_cache_is_lru_bounded():
+    cache = FingerprintCache(
+        "Test", FingerprintCacheProfile(max_entries=2), list(Label), "sig"
+    )
+    cache.put("a", Label.SQUARE, 1.0)
+    cache.put("b", Label.BAR, 1.0)
+    assert cache.get("a") is not None  # "a" becomes most recently used
+    cache.put("c", Label.BAR, 1.0)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == (Label.SQUARE, 1.0)
+    assert cache.get("c") == (Label.BAR, 1.0)
+
+
+def test_cache_persists_between_runs(tmp_path):
+    path = tmp_path / "fingerprints" / "test.json"
+    profile = FingerprintCacheProfile(persist_path=path)
+
+    recognizer = _recognizer(profile)
+    label, score = recognizer.recognize_roi(_roi(4))
+    recognizer.save_fingerprint_cache()
+    assert path.exists()
+
+    restored = _recognizer(profile)
+    with patch.object(restored, "_match_sequential") as mock_match:
+        assert restored.recognize_roi(_roi(4)) == (label, score)
+    mock_match.assert_not_called()
+
+
+def test_cache_ignores_stale_signature(tmp_path):
+    path = tmp_path / "test.json"
+    profile = FingerprintCacheProfile(persist_path=path)
+    cache = FingerprintCache("Test", profile, list(Label), "old")
+    cache.put("a", Label.SQUARE, 1.0)
+    cache.save()
+
+    reloaded = FingerprintCache("Test", profile, list(Label), "new")
+    reloaded.load()
+
+    assert len(reloaded) == 0
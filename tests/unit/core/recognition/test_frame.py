@@ -0,0 +1,126 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from endfield_essence_recognizer.core.layout.base import Point, Region
+from endfield_essence_recognizer.core.recognition.brightness_detector import (
+    BrightnessDetectorProfile,
+)
+from endfield_essence_recognizer.core.recognition.frame import FrameContext
+from endfield_essence_recognizer.core.recognition.tasks.attribute_level import (
+    AttributeLevelRecognizer,
+    AttributeLevelRecognizerProfile,
+)
+from endfield_essence_recognizer.core.recognition.template_recognizer import (
+    RecognitionProfile,
+    TemplateRecognizer,
+)
+
+
+def _random_frame(height: int = 60, width: int = 80) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+
+
+def test_frame_context_memoizes_gray():
+    frame = FrameContext(_random_frame())
+
+    with patch(
+        "endfield_essence_recognizer.core.recognition.frame.to_gray_image",
+        wraps=lambda image: image[:, :, 0].copy(),
+    ) as mock_to_gray:
+        first = frame.gray
+        second = frame.gray
+
+    assert first is second
+    assert mock_to_gray.call_count == 1
+
+
+def test_frame_context_crop_uses_client_coordinates():
+    image = _random_frame()
+    frame = FrameContext(image, origin=Point(100, 200))
+
+    child = frame.crop(Region(Point(110, 220), Point(130, 230)))
+
+    assert child.origin == Point(110, 220)
+    assert np.array_equal(child.image, image[20:30, 10:30])
+    # Cropping the same region again returns the cached child
+    assert frame.crop(Region(Point(110, 220), Point(130, 230))) is child
+
+    with pytest.raises(ValueError):
+        frame.crop(Region(Point(90, 200), Point(130, 230)))
+
+
+def test_frame_context_crop_reuses_parent_gray():
+    image = _random_frame()
+    frame = FrameContext(image)
+    parent_gray = frame.gray
+
+    child = frame.crop(Region(Point(10, 20), Point(30, 40)))
+    with patch(
+        "endfield_essence_recognizer.core.recognition.frame.to_gray_image"
+    ) as mock_to_gray:
+        child_gray = child.gray
+
+    mock_to_gray.assert_not_called()
+    assert np.array_equal(child_gray, parent_gray[20:40, 10:30])
+
+
+def test_template_recognizer_preprocesses_frame_once():
+    calls = 0
+
+    def preprocess(image):
+        nonlocal calls
+        calls += 1
+        return image
+
+    recognizer = TemplateRecognizer(
+        "Test", RecognitionProfile(templates=[], preprocess_roi=preprocess)
+    )
+    template = np.zeros((8, 8), dtype=np.uint8)
+    template[2:6, 2:6] = 255
+    recognizer._templates["square"].append(template)
+
+    roi = np.zeros((16, 16, 3), dtype=np.uint8)
+    roi[6:10, 6:10] = 255
+    frame = FrameContext(roi)
+
+    first = recognizer.recognize_roi(frame)
+    second = recognizer.recognize_roi_fallback(frame, fallback_label="none")
+
+    assert first == second
+    assert first[0] == "square"
+    assert calls == 1
+
+
+def test_attribute_level_recognizer_shares_gray_across_stats():
+    recognizer = AttributeLevelRecognizer(
+        "Test",
+        AttributeLevelRecognizerProfile(
+            brightness_profile=BrightnessDetectorProfile(threshold=200, sample_radius=1)
+        ),
+    )
+
+    class Profile:
+        STATS_LEVEL_ICON_POINTS = [
+            [Point(505 + 10 * i, 305 + 10 * row) for i in range(6)] for row in range(3)
+        ]
+
+    # A local frame whose top-left corner is (500, 300) in client coordinates
+    image = np.zeros((40, 70, 3), dtype=np.uint8)
+    for row, level in enumerate([1, 3, 6]):
+        for i in range(level):
+            image[
+                5 + 10 * row - 1 : 5 + 10 * row + 2, 5 + 10 * i - 1 : 5 + 10 * i + 2
+            ] = 255
+    frame = FrameContext(image, origin=Point(500, 300))
+
+    with patch(
+        "endfield_essence_recognizer.core.recognition.frame.to_gray_image",
+        wraps=lambda image: image[:, :, 0].copy(),
+    ) as mock_to_gray:
+        levels = [recognizer.recognize_level(frame, k, Profile()) for k in range(3)]
+
+    assert levels == [1, 3, 6]
+    assert mock_to_gray.call_count == 1
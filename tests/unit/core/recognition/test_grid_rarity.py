@@ -0,0 +1,75 @@
+import numpy as np
+
+from endfield_essence_recognizer.core.layout.base import Point
+from endfield_essence_recognizer.core.layout.factory import build_resolution_profile
+from endfield_essence_recognizer.core.recognition import (
+    GridRarityClassifier,
+    RarityLabel,
+    build_grid_rarity_profile,
+)
+from endfield_essence_recognizer.core.recognition.frame import FrameContext
+from endfield_essence_recognizer.core.recognition.tasks.grid_rarity import (
+    grid_centers,
+)
+
+CARD_SIZE = 40
+
+
+def _classifier() -> GridRarityClassifier:
+    return GridRarityClassifier("TestGridRarity", build_grid_rarity_profile())
+
+
+def _draw_card(image: np.ndarray, center: Point, bgr: tuple[int, int, int]) -> None:
+    half = CARD_SIZE // 2
+    image[center.y - half : center.y + half, center.x - half : center.x + half] = (
+        56,
+        56,
+        56,
+    )
+    image[center.y + half - 6 : center.y + half, center.x - half : center.x + half] = (
+        bgr
+    )
+
+
+def test_classifies_every_card_in_one_pass():
+    classifier = _classifier()
+    colors = classifier.profile.colors
+    image = np.full((100, 300, 3), 24, dtype=np.uint8)
+    centers = [Point(40, 40), Point(100, 40), Point(160, 40), Point(220, 40)]
+    for center, star in zip(centers, (5, 4, 1, 6), strict=True):
+        _draw_card(image, center, colors[star])
+
+    assert classifier.classify_stars(image, centers, CARD_SIZE) == [5, 4, 1, 6]
+    assert classifier.classify(image, centers, CARD_SIZE) == [
+        RarityLabel.FIVE,
+        RarityLabel.FOUR,
+        RarityLabel.OTHER,
+        RarityLabel.OTHER,
+    ]
+
+
+def test_unknown_color_and_out_of_bounds_are_none():
+    classifier = _classifier()
+    image = np.full((100, 300, 3), 24, dtype=np.uint8)
+    _draw_card(image, Point(40, 40), (0, 0, 255))
+
+    stars = classifier.classify_stars(image, [Point(40, 40), Point(290, 90)], CARD_SIZE)
+    assert stars == [None, None]
+
+
+def test_frame_context_origin_is_applied():
+    classifier = _classifier()
+    profile = build_resolution_profile(1920, 1080)
+    centers = grid_centers(profile)
+    card_size = profile.ESSENCE_CARD_SIZE
+    image = np.full((1080, 1920, 3), 24, dtype=np.uint8)
+    half = card_size // 2
+    for center in centers:
+        image[
+            center.y + half - 6 : center.y + half, center.x - half : center.x + half
+        ] = classifier.profile.colors[5]
+
+    region = classifier.grid_region(profile)
+    crop = image[region.y0 : region.y1, region.x0 : region.x1]
+    frame = FrameContext(crop, origin=Point(region.x0, region.y0))
+    assert classifier.classify_stars(frame, centers, card_size) == [5] * len(centers)
@@ -0,0 +1,124 @@
+import dataclasses
+from enum import StrEnum
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from endfield_essence_recognizer.core.recognition.template_pack import (
+    MAGIC,
+    TemplatePack,
+    build_template_pack,
+)
+from endfield_essence_recognizer.core.recognition.template_recognizer import (
+    RecognitionProfile,
+    TemplateDescriptor,
+    TemplateRecognizer,
+)
+
+
+class Label(StrEnum):
+    SQUARE = "square"
+    BAR = "bar"
+
+
+def _invert(image: np.ndarray) -> np.ndarray:
+    return 255 - image
+
+
+def _write_png(path: Path, image: np.ndarray) -> None:
+    ok, encoded = cv2.imencode(".png", image)
+    assert ok
+    path.write_bytes(encoded.tobytes())
+
+
+@pytest.fixture
+def profile(tmp_path: Path) -> RecognitionProfile[Label]:
+    square = np.zeros((10, 10), dtype=np.uint8)
+    square[1:9, 1:9] = 255
+    bar = np.zeros((10, 13), dtype=np.uint8)
+    bar[4:6, :] = 255
+    _write_png(tmp_path / "square.png", square)
+    _write_png(tmp_path / "bar.png", bar)
+    return RecognitionProfile(
+        templates=[
+            TemplateDescriptor(path=tmp_path / "square.png", label=Label.SQUARE),
+            TemplateDescriptor(path=tmp_path / "bar.png", label=Label.BAR),
+        ],
+        preprocess_template=_invert,
+    )
+
+
+def _load(
+    profile: RecognitionProfile[Label], pack: TemplatePack | None = None
+) -> TemplateRecognizer[Label]:
+    recognizer = TemplateRecognizer("Test", profile)
+    recognizer.load_templates(pack)
+    return recognizer
+
+
+def test_pack_matches_png_loading(tmp_path: Path, profile) -> None:
+    path = tmp_path / "templates.pack"
+    assert build_template_pack(path, {"Test": profile}) == 2
+
+    pack = TemplatePack.load(path)
+    assert pack is not None
+    packed = pack.templates_for("Test", profile)
+    assert packed is not None
+    # Templates are read-only views of the memory-mapped file
+    assert all(not template.flags.writeable for _label, template in packed)
+
+    from_pack = _load(profile, pack)
+    from_png = _load(profile)
+    assert from_pack.templates_signature() == from_png.templates_signature()
+    roi = np.zeros((16, 16), dtype=np.uint8)
+    assert from_pack.recognize_roi(roi) == from_png.recognize_roi(roi)
+
+
+def test_stale_pack_falls_back_to_png(tmp_path: Path, profile) -> None:
+    path = tmp_path / "templates.pack"
+    build_template_pack(path, {"Test": profile})
+    pack = TemplatePack.load(path)
+    assert pack is not None
+    assert pack.templates_for("Other", profile) is None
+
+    # The preprocessing function changed after the pack was built
+    changed = RecognitionProfile(templates=profile.templates)
+    assert pack.templates_for("Test", changed) is None
+
+    # A template image changed after the pack was built
+    _write_png(tmp_path / "bar.png", np.full((10, 13), 255, dtype=np.uint8))
+    assert pack.templates_for("Test", profile) is None
+    recognizer = _load(profile, pack)
+    assert recognizer.templates_signature() == _load(profile).templates_signature()
+
+
+def test_pack_trusted_without_verifying_sources(tmp_path: Path, profile) -> None:
+    path = tmp_path / "templates.pack"
+    build_template_pack(path, {"Test": profile})
+    expected = _load(profile).templates_signature()
+
+    # Frozen builds do not read the template images to check the pack
+    _write_png(tmp_path / "bar.png", np.full((10, 13), 255, dtype=np.uint8))
+    pack = TemplatePack.load(path, verify_sources=False)
+    assert pack is not None
+    assert _load(profile, pack).templates_signature() == expected
+    # The template list and the preprocessing are still checked
+    assert pack.templates_for("Test", RecognitionProfile(profile.templates)) is None
+    assert (
+        pack.templates_for(
+            "Test", dataclasses.replace(profile, templates=profile.templates[:1])
+        )
+        is None
+    )
+
+
+def test_pack_of_other_format_version_is_ignored(tmp_path: Path, profile) -> None:
+    path = tmp_path / "templates.pack"
+    build_template_pack(path, {"Test": profile})
+    data = bytearray(path.read_bytes())
+    data[len(MAGIC)] += 1
+    path.write_bytes(bytes(data))
+    assert TemplatePack.load(path) is None
+    assert TemplatePack.load(tmp_path / "missing.pack") is None
@@ -7,6 +7,7 @@ from endfield_essence_recognizer.core.recognition import (
 )
 from endfield_essence_recognizer.core.scanner.action_logic import (
     ActionType,
+    apply_actions,
     decide_actions,
 )
 from endfield_essence_recognizer.core.scanner.models import (
@@ -187,3 +188,22 @@ def test_decide_actions_skip_quality(default_data, default_eval, default_setting
     actions = decide_actions(default_data, default_eval, default_settings)
     assert actions == []
     assert len(actions) == 0
+
+
+def test_apply_actions_predicts_state_after_clicks(
+    default_data, default_eval, default_settings
+):
+    """
+    Test that apply_actions toggles the labels clicked by decide_actions.
+    """
+    default_eval.quality = EssenceQuality.TRASH
+    default_settings.trash_action = Action.DEPRECATE
+    default_data.lock_label = LockStatusLabel.NOT_LOCKED
+    actions = decide_actions(default_data, default_eval, default_settings)
+
+    after = apply_actions(default_data, actions)
+    assert after.abandon_label == AbandonStatusLabel.ABANDONED
+    assert after.lock_label == LockStatusLabel.NOT_LOCKED
+    # the original data is left untouched
+    assert default_data.abandon_label == AbandonStatusLabel.NOT_ABANDONED
+    assert decide_actions(after, default_eval, default_settings) == []
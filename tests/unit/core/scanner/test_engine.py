@@ -42,6 +42,9 @@ class MockImageSource:
             w, h = self.width, self.height
         return np.zeros((h, w, 3), dtype=np.uint8)
 
+    def screenshot_many(self, relative_regions: list[Region]) -> list[np.ndarray]:
+        return [self.screenshot(region) for region in relative_regions]
+
 
 class MockWindowActions:
     def __init__(self):
@@ -87,6 +90,7 @@ def mock_scanner_context():
 
     attr_level_recognizer = MagicMock(spec=AttributeLevelRecognizer)
     attr_level_recognizer.recognize_level.return_value = 10
+    attr_level_recognizer.recognize_levels.return_value = [10, 10, 10]
 
     abandon_status_recognizer = MagicMock(spec=TemplateRecognizer)
     abandon_status_recognizer.recognize_roi_fallback.return_value = (
@@ -141,6 +145,10 @@ def mock_profile():
     profile.LOCK_BUTTON_ROI = Region(Point(1825, 270), Point(1857, 302))
     profile.LOCK_BUTTON_POS = Point(1839, 286)
     profile.DEPRECATE_BUTTON_POS = Point(1807, 284)
+    profile.RARITY_ROI = Region(Point(1468, 78), Point(1472, 82))
+    profile.STATS_LEVEL_ICON_POINTS = [
+        [Point(1503 + 17 * i, y) for i in range(6)] for y in (395, 451, 507)
+    ]
 
     # Mock just one essence icon for simplicity
     profile.essence_icon_x_list = [100]
@@ -207,16 +215,17 @@ def test_recognize_essence_screenshot_calls(mock_scanner_context, mock_profile):
     from endfield_essence_recognizer.core.scanner.engine import recognize_essence
 
     image_source = MagicMock()
-    # Mock screenshot to return a dummy image based on the profile resolution
-    image_source.screenshot.return_value = np.zeros(
-        (mock_profile.RESOLUTION[1], mock_profile.RESOLUTION[0], 3), dtype=np.uint8
-    )
+    image_source.screenshot_many.side_effect = MockImageSource().screenshot_many
     image_source.get_client_size.return_value = mock_profile.RESOLUTION
 
     recognize_essence(image_source, mock_scanner_context, mock_profile)
 
-    # It should only be called ONCE inside recognize_essence (by cache_from)
-    assert image_source.screenshot.call_count == 1
+    # All ROIs are captured in a single batched call
+    assert image_source.screenshot_many.call_count == 1
+    assert image_source.screenshot.call_count == 0
+    (regions,) = image_source.screenshot_many.call_args.args
+    assert mock_profile.STATS_0_ROI in regions
+    assert mock_profile.LOCK_BUTTON_ROI in regions
 
 
 def test_recognize_once_screenshot_calls(mock_scanner_context, mock_profile):
@@ -241,6 +250,7 @@ def test_scanner_engine_screenshot_count(
     image_source.screenshot.return_value = np.zeros(
         (mock_profile.RESOLUTION[1], mock_profile.RESOLUTION[0], 3), dtype=np.uint8
     )
+    image_source.screenshot_many.side_effect = MockImageSource().screenshot_many
     image_source.get_client_size.return_value = mock_profile.RESOLUTION
 
     window_actions = MockWindowActions()
@@ -260,5 +270,172 @@ def test_scanner_engine_screenshot_count(
     stop_event = threading.Event()
     engine.execute(stop_event)
 
-    # 1 call for check_scene + 1 call for recognize_essence
-    assert image_source.screenshot.call_count == 2
+    # 1 call for check_scene + 1 batched call for recognize_essence
+    assert image_source.screenshot.call_count == 1
+    assert image_source.screenshot_many.call_count == 1
+
+
+def test_scanner_engine_waits_for_panel_settle(
+    mock_scanner_context, mock_user_setting_manager, mock_profile
+):
+    from endfield_essence_recognizer.core.scanner.settle import PanelSettleProfile
+
+    class ChangingImageSource(MockImageSource):
+        """Panel content changes after the first capture (i.e. after the click)."""
+
+        def __init__(self):
+            super().__init__()
+            self.calls = 0
+
+        def screenshot(self, relative_region: Region | None = None) -> np.ndarray:
+            image = super().screenshot(relative_region)
+            if self.calls > 1:
+                image[:] = 255
+            self.calls += 1
+            return image
+
+    class RecordingWindowActions(MockWindowActions):
+        def __init__(self):
+            super().__init__()
+            self.waited: list[float] = []
+
+        def wait(self, seconds: float) -> None:
+            self.waited.append(seconds)
+
+    mock_profile.AREA = Region(Point(1465, 79), Point(1883, 532))
+    image_source = ChangingImageSource()
+    window_actions = RecordingWindowActions()
+
+    engine = ScannerEngine(
+        ctx=mock_scanner_context,
+        image_source=image_source,
+        window_actions=window_actions,
+        user_setting_manager=mock_user_setting_manager,
+        profile=mock_profile,
+        settle_profile=PanelSettleProfile(poll_interval=0.01, max_wait=0.3),
+    )
+    engine.execute(threading.Event())
+
+    assert window_actions.click_calls == [(100, 200)]
+    # restore/activate/show waits, then a few short settle polls instead of 0.3s
+    settle_waits = window_actions.waited[3:]
+    assert settle_waits
+    assert sum(settle_waits) < 0.3
+
+
+def test_action_click_settles_on_button_region(
+    mock_scanner_context, mock_user_setting_manager, mock_profile
+):
+    from endfield_essence_recognizer.core.scanner.action_logic import (
+        ActionType,
+        ScannerAction,
+    )
+    from endfield_essence_recognizer.core.scanner.models import EssenceData
+    from endfield_essence_recognizer.core.scanner.settle import PanelSettleProfile
+
+    class RecordingImageSource(MockImageSource):
+        def __init__(self):
+            super().__init__()
+            self.requested: list[Region | None] = []
+
+        def screenshot(self, relative_region: Region | None = None) -> np.ndarray:
+            self.requested.append(relative_region)
+            return super().screenshot(relative_region)
+
+    mock_profile.AREA = Region(Point(1465, 79), Point(1883, 532))
+    image_source = RecordingImageSource()
+    engine = ScannerEngine(
+        ctx=mock_scanner_context,
+        image_source=image_source,
+        window_actions=MockWindowActions(),
+        user_setting_manager=mock_user_setting_manager,
+        profile=mock_profile,
+        settle_profile=PanelSettleProfile(poll_interval=0.01, max_wait=0.05),
+    )
+    data = EssenceData(
+        stats=["atk", None, None],
+        levels=[None, None, None],
+        rarity=RarityLabel.FIVE,
+        abandon_label=AbandonStatusLabel.NOT_ABANDONED,
+        lock_label=LockStatusLabel.NOT_LOCKED,
+    )
+    actions = [
+        ScannerAction(ActionType.CLICK_LOCK, "locked"),
+        ScannerAction(ActionType.CLICK_ABANDON, "abandoned"),
+    ]
+
+    assert engine._execute_actions(actions, data)
+    assert set(image_source.requested) == {
+        mock_profile.LOCK_BUTTON_ROI,
+        mock_profile.DEPRECATE_BUTTON_ROI,
+    }
+
+
+def test_pipelined_scan_revisits_cell_before_acting(
+    mock_scanner_context, mock_user_setting_manager, mock_profile, monkeypatch
+):
+    from endfield_essence_recognizer.core.scanner import engine as engine_module
+    from endfield_essence_recognizer.core.scanner.action_logic import (
+        ActionType,
+        ScannerAction,
+    )
+    from endfield_essence_recognizer.core.scanner.engine import ScanMode
+
+    mock_profile.essence_icon_x_list = [100, 200, 300]
+    mock_profile.essence_icon_y_list = [200]
+
+    evaluation = MagicMock(matched_weapons=[], log_message="")
+    monkeypatch.setattr(
+        engine_module.CompiledRules, "evaluate", MagicMock(return_value=evaluation)
+    )
+    # Only the first essence needs to be locked
+    monkeypatch.setattr(
+        engine_module,
+        "decide_actions",
+        MagicMock(
+            side_effect=[[ScannerAction(ActionType.CLICK_LOCK, "locked")], [], []]
+        ),
+    )
+
+    window_actions = MockWindowActions()
+    engine = ScannerEngine(
+        ctx=mock_scanner_context,
+        image_source=MockImageSource(),
+        window_actions=window_actions,
+        user_setting_manager=mock_user_setting_manager,
+        profile=mock_profile,
+        scan_mode=ScanMode.PIPELINED,
+    )
+    engine.execute(threading.Event())
+
+    # The result of the first essence arrives after the second one was clicked
+    assert window_actions.click_calls == [
+        (100, 200),
+        (200, 200),
+        (100, 200),
+        (1839, 286),
+        (300, 200),
+    ]
+    assert mock_scanner_context.attr_recognizer.recognize_roi.call_count == 9
+
+
+def test_pipelined_scan_stop_event(
+    mock_scanner_context, mock_user_setting_manager, mock_profile
+):
+    from endfield_essence_recognizer.core.scanner.engine import ScanMode
+
+    window_actions = MockWindowActions()
+    engine = ScannerEngine(
+        ctx=mock_scanner_context,
+        image_source=MockImageSource(),
+        window_actions=window_actions,
+        user_setting_manager=mock_user_setting_manager,
+        profile=mock_profile,
+        scan_mode=ScanMode.PIPELINED,
+    )
+    stop_event = threading.Event()
+    stop_event.set()
+
+    engine.execute(stop_event)
+
+    assert window_actions.click_calls == []
@@ -7,7 +7,11 @@ from endfield_essence_recognizer.core.recognition import (
     LockStatusLabel,
     RarityLabel,
 )
-from endfield_essence_recognizer.core.scanner.evaluate import evaluate_essence
+from endfield_essence_recognizer.core.scanner.evaluate import (
+    compile_rules,
+    evaluate_essence,
+    plan_recognition,
+)
 from endfield_essence_recognizer.core.scanner.models import (
     EssenceData,
     EssenceQuality,
@@ -26,6 +30,7 @@ def mock_static_game_data():
     # Default behaviors
     mock_data.get_stat.return_value = None
     mock_data.find_weapons_by_stats.return_value = []
+    mock_data.find_weapons_matching.return_value = []
     mock_data.get_weapon.return_value = None
     mock_data.get_weapon_type.return_value = None
 
@@ -197,3 +202,85 @@ def test_evaluate_non_five_star_process(
     # Should fall through to normal evaluation (Trash in this blank case)
     assert result.quality == EssenceQuality.TRASH
     assert "养成材料" in result.log_message
+
+
+def test_plan_recognition_follows_settings(default_settings):
+    """
+    Test that levels and non-five-star stats are only recognized when used.
+    """
+    plan = plan_recognition(default_settings)
+    assert not plan.levels
+    assert plan.non_five_star_stats
+
+    default_settings.high_level_treasure_enabled = True
+    default_settings.non_five_star_behavior = NonFiveStarBehavior.SKIP
+    plan = plan_recognition(default_settings)
+    assert plan.levels
+    assert not plan.non_five_star_stats
+
+
+def test_compiled_rules_match_treasure_stats_in_any_order(
+    mock_static_game_data, default_settings, default_essence_data
+):
+    """
+    Test that compiled treasure rules match regardless of stat order and count.
+    """
+    default_settings.treasure_essence_stats = [
+        EssenceStats(attribute=f"X{k}", secondary=f"Y{k}", skill=f"Z{k}")
+        for k in range(500)
+    ] + [EssenceStats(attribute="C", secondary="A", skill="B")]
+    rules = compile_rules(default_settings, mock_static_game_data)
+
+    assert rules.evaluate(default_essence_data).quality == EssenceQuality.TREASURE
+    default_essence_data.stats = ["A", "B", "D"]
+    assert rules.evaluate(default_essence_data).quality == EssenceQuality.TRASH
+
+
+def test_compiled_rules_equal_evaluate_essence(
+    mock_static_game_data, default_settings, default_essence_data
+):
+    """
+    Test that evaluating with compiled rules gives the same result as evaluate_essence.
+    """
+    mock_static_game_data.find_weapons_by_stats.return_value = ["wpn_a", "wpn_b"]
+    default_settings.trash_weapon_ids = ["wpn_a"]
+    rules = compile_rules(default_settings, mock_static_game_data)
+
+    assert rules.evaluate(default_essence_data) == evaluate_essence(
+        default_essence_data, default_settings, mock_static_game_data
+    )
+    assert rules.evaluate(default_essence_data).matched_weapons == {"wpn_b"}
+
+
+def test_compile_rules_describes_weapons_on_demand(
+    mock_static_game_data, default_settings, default_essence_data
+):
+    """
+    Test that compiling rules does not format every weapon, and that each weapon
+    is formatted once however many essences match it.
+    """
+    mock_static_game_data.find_weapons_by_stats.return_value = ["wpn_a"]
+    rules = compile_rules(default_settings, mock_static_game_data)
+    mock_static_game_data.list_weapons.assert_not_called()
+
+    first = rules.evaluate(default_essence_data)
+    assert rules.evaluate(default_essence_data) == first
+    mock_static_game_data.get_weapon.assert_called_once_with("wpn_a")
+
+
+def test_evaluate_reports_near_miss_weapons(
+    mock_static_game_data, default_settings, default_essence_data
+):
+    """
+    Test that weapons matching two of the three stats are reported as near misses.
+    """
+    mock_static_game_data.find_weapons_matching.return_value = ["wpn_a", "wpn_b"]
+
+    result = evaluate_essence(
+        default_essence_data, default_settings, mock_static_game_data
+    )
+    assert result.quality == EssenceQuality.TRASH
+    assert result.near_miss_weapons == {"wpn_a", "wpn_b"}
+    mock_static_game_data.find_weapons_matching.assert_called_with(
+        "A", "B", "C", min_matches=2
+    )
@@ -0,0 +1,136 @@
+import importlib.resources
+
+import numpy as np
+import pytest
+
+from endfield_essence_recognizer.core.recognition import (
+    AbandonStatusLabel,
+    CardThumbnailer,
+    CardThumbnailProfile,
+    LockStatusLabel,
+    RarityLabel,
+)
+from endfield_essence_recognizer.core.scanner.incremental import (
+    IncrementalScanStore,
+    ScanRecord,
+    compute_scan_signature,
+)
+from endfield_essence_recognizer.core.scanner.models import (
+    EssenceData,
+    EssenceQuality,
+    EvaluationResult,
+)
+from endfield_essence_recognizer.game_data.static_game_data import StaticGameData
+from endfield_essence_recognizer.schemas.user_setting import Action, UserSetting
+
+
+@pytest.fixture(scope="module")
+def static_game_data():
+    return StaticGameData(
+        importlib.resources.files("endfield_essence_recognizer") / "data" / "v2"
+    )
+
+
+def _store(persist_path=None) -> IncrementalScanStore:
+    thumbnailer = CardThumbnailer("TestCardThumbnailer", CardThumbnailProfile())
+    return IncrementalScanStore("TestStore", thumbnailer, persist_path=persist_path)
+
+
+def _thumbnail(seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, (16, 16, 3), dtype=np.uint8)
+
+
+def _record(stat: str, quality: EssenceQuality = EssenceQuality.TRASH) -> ScanRecord:
+    return ScanRecord(
+        data=EssenceData(
+            stats=[stat, None, None],
+            levels=[1, None, None],
+            rarity=RarityLabel.FIVE,
+            abandon_label=AbandonStatusLabel.NOT_ABANDONED,
+            lock_label=LockStatusLabel.NOT_LOCKED,
+        ),
+        evaluation=EvaluationResult(
+            quality=quality, log_message="msg", matched_weapons={"w1"}
+        ),
+    )
+
+
+def test_lookup_returns_recorded_result():
+    store = _store()
+    store.bind("a")
+    store.record((0, 1), _thumbnail(1), 10, _record("s1"))
+
+    assert store.lookup((0, 1), _thumbnail(1), 10) == _record("s1")
+    assert store.lookup((0, 1), _thumbnail(2), 10) is None
+
+
+def test_lookup_requires_same_position_and_inventory_count():
+    store = _store()
+    store.bind("a")
+    store.record((0, 1), _thumbnail(1), 10, _record("s1"))
+
+    # an identical card elsewhere, or in an inventory that gained an essence,
+    # may be a different essence
+    assert store.lookup((0, 2), _thumbnail(1), 10) is None
+    assert store.lookup((0, 1), _thumbnail(1), 11) is None
+
+    store.record((0, 1), _thumbnail(1), 11, _record("s2"))
+    assert len(store) == 1
+    assert store.lookup((0, 1), _thumbnail(1), 11) == _record("s2")
+
+
+def test_records_without_inventory_count_wait_for_end_of_scan():
+    store = _store()
+    store.bind("a")
+    store.record((0, 0), _thumbnail(1), None, _record("s1"))
+    store.record((1, 0), _thumbnail(2), None, _record("s2"))
+    assert store.lookup((0, 0), _thumbnail(1), 10) is None
+
+    # the scan reached the end of an inventory of 10 essences
+    store.set_inventory_count(10)
+    assert store.lookup((0, 0), _thumbnail(1), 10) == _record("s1")
+
+    # records of a scan that never reached the end are dropped by the next scan
+    store.record((1, 0), _thumbnail(2), None, _record("s3"))
+    store.bind("a")
+    assert len(store) == 1
+    assert store.lookup((1, 0), _thumbnail(2), 10) is None
+
+
+def test_bind_with_new_signature_clears_records():
+    store = _store()
+    store.bind("a")
+    store.record((0, 0), _thumbnail(1), 1, _record("s1"))
+
+    store.bind("a")
+    assert len(store) == 1
+    store.bind("b")
+    assert len(store) == 0
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = tmp_path / "incremental.json"
+    store = _store(path)
+    store.bind("a")
+    store.record((2, 3), _thumbnail(1), 20, _record("s1", EssenceQuality.TREASURE))
+    store.save()
+
+    loaded = _store(path)
+    loaded.bind("a")
+    assert loaded.lookup((2, 3), _thumbnail(1), 20) == _record(
+        "s1", EssenceQuality.TREASURE
+    )
+
+    stale = _store(path)
+    stale.bind("b")
+    assert stale.lookup((2, 3), _thumbnail(1), 20) is None
+
+
+def test_scan_signature_depends_on_user_setting(static_game_data):
+    default = compute_scan_signature(UserSetting(), static_game_data)
+    changed = compute_scan_signature(
+        UserSetting(trash_action=Action.KEEP), static_game_data
+    )
+    assert default == compute_scan_signature(UserSetting(), static_game_data)
+    assert default != changed
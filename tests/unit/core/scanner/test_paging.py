@@ -0,0 +1,43 @@
+import numpy as np
+
+from endfield_essence_recognizer.core.recognition import (
+    CardThumbnailer,
+    CardThumbnailProfile,
+)
+from endfield_essence_recognizer.core.scanner.paging import find_row_overlap
+
+COLUMNS = 3
+ROWS = 4
+
+
+def _rows(first: int, count: int) -> np.ndarray:
+    """Thumbnails for inventory rows [first, first + count), one distinct card each."""
+    rng = np.random.default_rng(0)
+    inventory = rng.integers(0, 256, (20 * COLUMNS, 4, 4, 3), dtype=np.uint8)
+    return inventory[first * COLUMNS : (first + count) * COLUMNS]
+
+
+def test_find_row_overlap():
+    thumbnailer = CardThumbnailer("TestCardThumbnailer", CardThumbnailProfile())
+    previous = _rows(0, ROWS)
+
+    # scrolled by 3 rows: one row still visible
+    assert find_row_overlap(thumbnailer, previous, _rows(3, ROWS), COLUMNS) == 1
+    # clamped at the end of the inventory: scrolled by only 1 row
+    assert find_row_overlap(thumbnailer, previous, _rows(1, ROWS), COLUMNS) == 3
+    # did not scroll at all
+    assert find_row_overlap(thumbnailer, previous, _rows(0, ROWS), COLUMNS) == ROWS
+    # scrolled by more than a page
+    assert find_row_overlap(thumbnailer, previous, _rows(5, ROWS), COLUMNS) == 0
+
+
+def test_find_row_overlap_with_identical_cards():
+    thumbnailer = CardThumbnailer("TestCardThumbnailer", CardThumbnailProfile())
+    card = np.random.default_rng(1).integers(0, 256, (4, 4, 3), dtype=np.uint8)
+    page = np.broadcast_to(card, (ROWS * COLUMNS, *card.shape))
+
+    # every overlap lines up: trust the scroll distance rather than the largest one
+    assert find_row_overlap(thumbnailer, page, page, COLUMNS, expected=1) == 1
+    # without a usable expectation, underestimate rather than skip rows
+    assert find_row_overlap(thumbnailer, page, page, COLUMNS) == 1
+    assert find_row_overlap(thumbnailer, page, page, COLUMNS, expected=0) == 1
@@ -0,0 +1,85 @@
+import threading
+
+import pytest
+
+from endfield_essence_recognizer.core.layout.base import Point
+from endfield_essence_recognizer.core.recognition import (
+    AbandonStatusLabel,
+    LockStatusLabel,
+    RarityLabel,
+)
+from endfield_essence_recognizer.core.scanner.action_logic import (
+    ActionType,
+    ScannerAction,
+)
+from endfield_essence_recognizer.core.scanner.models import (
+    EssenceData,
+    EssenceQuality,
+    EvaluationResult,
+)
+from endfield_essence_recognizer.core.scanner.plan import (
+    ActionPlanBoard,
+    PlanEntry,
+    PlanStatus,
+)
+
+
+@pytest.fixture
+def entry():
+    return PlanEntry(
+        row=0,
+        column=1,
+        position=Point(100, 200),
+        data=EssenceData(
+            stats=["a", "b", "c"],
+            levels=[1, 1, 1],
+            rarity=RarityLabel.FIVE,
+            abandon_label=AbandonStatusLabel.NOT_ABANDONED,
+            lock_label=LockStatusLabel.NOT_LOCKED,
+        ),
+        evaluation=EvaluationResult(quality=EssenceQuality.TRASH, log_message="msg"),
+        actions=[ScannerAction(ActionType.CLICK_ABANDON, "abandon")],
+    )
+
+
+def test_entry_expected_state(entry):
+    assert entry.expected.abandon_label == AbandonStatusLabel.ABANDONED
+    assert entry.expected.lock_label == LockStatusLabel.NOT_LOCKED
+
+
+def test_confirm_unblocks_waiting_scanner(entry):
+    plan = ActionPlanBoard().publish([entry], confirmed=False)
+    assert plan.status == PlanStatus.AWAITING_CONFIRMATION
+
+    decision: list[bool] = []
+    waiter = threading.Thread(
+        target=lambda: decision.append(plan.wait_for_decision(threading.Event()))
+    )
+    waiter.start()
+    assert plan.confirm()
+    waiter.join(timeout=5)
+
+    assert decision == [True]
+    assert plan.status == PlanStatus.CONFIRMED
+    # a decided plan cannot be decided again
+    assert not plan.reject()
+
+
+def test_stop_event_rejects_plan(entry):
+    plan = ActionPlanBoard().publish([entry], confirmed=False)
+    stop_event = threading.Event()
+    stop_event.set()
+
+    assert not plan.wait_for_decision(stop_event, poll_interval=0.01)
+    assert plan.status == PlanStatus.REJECTED
+
+
+def test_publish_replaces_and_rejects_previous_plan(entry):
+    board = ActionPlanBoard()
+    first = board.publish([entry], confirmed=False)
+    second = board.publish([entry], confirmed=True)
+
+    assert board.current is second
+    assert second.id == first.id + 1
+    assert first.status == PlanStatus.REJECTED
+    assert second.status == PlanStatus.CONFIRMED
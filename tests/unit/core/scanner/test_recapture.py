@@ -0,0 +1,29 @@
+from endfield_essence_recognizer.core.recognition import LockStatusLabel
+from endfield_essence_recognizer.core.scanner.recapture import RecaptureStats, vote
+
+
+def test_vote_requires_enough_agreeing_frames():
+    uncertain = LockStatusLabel.MAYBE_LOCKED
+    locked = LockStatusLabel.LOCKED
+
+    assert vote([uncertain, locked], uncertain, votes=2) == uncertain
+    assert vote([locked, uncertain, locked], uncertain, votes=2) == locked
+    assert vote([uncertain, uncertain, uncertain], uncertain, votes=1) == uncertain
+
+
+def test_vote_picks_majority_label():
+    readings = [
+        LockStatusLabel.NOT_LOCKED,
+        LockStatusLabel.LOCKED,
+        LockStatusLabel.NOT_LOCKED,
+    ]
+
+    assert vote(readings, LockStatusLabel.MAYBE_LOCKED, votes=2) == (
+        LockStatusLabel.NOT_LOCKED
+    )
+
+
+def test_stats_count_failed_essences():
+    stats = RecaptureStats(essences=3, frames=7, recovered=2)
+
+    assert stats.failed == 1
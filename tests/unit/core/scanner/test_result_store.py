@@ -0,0 +1,213 @@
+import sqlite3
+
+import pytest
+
+from endfield_essence_recognizer.core.recognition import (
+    AbandonStatusLabel,
+    LockStatusLabel,
+    RarityLabel,
+)
+from endfield_essence_recognizer.core.scanner.models import (
+    EssenceData,
+    EssenceQuality,
+    EvaluationResult,
+)
+from endfield_essence_recognizer.core.scanner.result_store import (
+    EssenceQuery,
+    ScanResultStore,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ScanResultStore(tmp_path / "scan_results.db", batch_size=2)
+    yield store
+    store.close()
+
+
+def _data(
+    stats: list[str | None], levels: list[int | None], locked: bool = False
+) -> EssenceData:
+    return EssenceData(
+        stats=stats,
+        levels=levels,
+        rarity=RarityLabel.FIVE,
+        abandon_label=AbandonStatusLabel.NOT_ABANDONED,
+        lock_label=LockStatusLabel.LOCKED if locked else LockStatusLabel.NOT_LOCKED,
+    )
+
+
+def _evaluation(quality: EssenceQuality, *weapons: str) -> EvaluationResult:
+    return EvaluationResult(
+        quality=quality, log_message="msg", matched_weapons=set(weapons)
+    )
+
+
+def _ids(store: ScanResultStore, **conditions) -> list[tuple[int, int]]:
+    _total, essences = store.query(EssenceQuery(**conditions))
+    return [(essence.row, essence.column) for essence in essences]
+
+
+def test_add_and_query_roundtrip(store):
+    scan_id = store.begin_scan()
+    data = _data(["a", "b", "c"], [3, 1, 2], locked=True)
+    evaluation = _evaluation(EssenceQuality.TREASURE, "w1", "w2")
+    store.add(scan_id, 0, 1, data, evaluation)
+    store.add(scan_id, 0, 2, _data(["x", None, None], [None, None, None]), None)
+    store.finish_scan(scan_id, completed=True)
+    store.flush()
+
+    total, essences = store.query(EssenceQuery())
+    assert total == 2
+    assert essences[0].data == data
+    assert essences[0].evaluation == evaluation
+    assert (essences[0].row, essences[0].column) == (0, 1)
+    assert essences[1].evaluation is None
+
+    (scan,) = store.list_scans()
+    assert scan.id == scan_id
+    assert scan.completed
+    assert scan.finished_at is not None
+    assert scan.essence_count == 2
+
+
+def test_query_filters(store):
+    scan_id = store.begin_scan()
+    store.add(
+        scan_id,
+        0,
+        0,
+        _data(["a", "b", "c"], [3, 1, 1]),
+        _evaluation(EssenceQuality.TREASURE, "w1"),
+    )
+    store.add(
+        scan_id,
+        0,
+        1,
+        _data(["a", "d", "e"], [1, 2, 1], locked=True),
+        _evaluation(EssenceQuality.TREASURE, "w2"),
+    )
+    store.add(
+        scan_id,
+        0,
+        2,
+        _data(["f", "b", "c"], [4, 1, 1]),
+        _evaluation(EssenceQuality.TRASH, "w1"),
+    )
+    store.finish_scan(scan_id, completed=True)
+    store.flush()
+
+    assert _ids(store, weapon_id="w1") == [(0, 0), (0, 2)]
+    assert _ids(store, weapon_id="w1", quality=EssenceQuality.TREASURE) == [(0, 0)]
+    assert _ids(store, min_attribute_level=3) == [(0, 0), (0, 2)]
+    assert _ids(store, stat_id="b", min_secondary_level=1) == [(0, 0), (0, 2)]
+    assert _ids(store, locked=True) == [(0, 1)]
+    assert _ids(store, limit=1, offset=1) == [(0, 1)]
+    total, _ = store.query(EssenceQuery(limit=1))
+    assert total == 3
+
+
+def test_query_defaults_to_latest_completed_scan(store):
+    assert store.query(EssenceQuery()) == (0, [])
+
+    first = store.begin_scan()
+    store.add(first, 0, 0, _data(["a", None, None], [1, None, None]), None)
+    store.finish_scan(first, completed=True)
+    second = store.begin_scan()
+    store.add(second, 1, 0, _data(["b", None, None], [1, None, None]), None)
+    store.finish_scan(second, completed=False)
+    third = store.begin_scan()
+    store.add(third, 2, 0, _data(["c", None, None], [1, None, None]), None)
+    store.flush()
+
+    # an interrupted scan and a scan still in progress only hold part of the inventory
+    assert _ids(store) == [(0, 0)]
+    assert _ids(store, scan_id=second) == [(1, 0)]
+    assert [scan.id for scan in store.list_scans()] == [third, second, first]
+    assert store.list_scans()[1].completed is False
+
+    store.finish_scan(third, completed=True)
+    store.flush()
+    assert _ids(store) == [(2, 0)]
+
+
+def test_stat_indexes_are_scoped_to_scan(tmp_path):
+    path = tmp_path / "scan_results.db"
+    store = ScanResultStore(path)
+    assert store.list_scans() == []
+    store.close()
+    # a database created before the stat indexes were scoped to a scan
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE INDEX idx_essences_stat1 ON essences(stat1_id)")
+    connection.close()
+
+    store = ScanResultStore(path)
+    assert store.query(EssenceQuery()) == (0, [])
+    store.close()
+
+    with sqlite3.connect(path) as connection:
+        names = [
+            name
+            for (name,) in connection.execute(
+                "SELECT name FROM sqlite_master "
+                "WHERE type = 'index' AND name LIKE 'idx_essences_%stat%'"
+            )
+        ]
+        indexes = {
+            name: [
+                column
+                for _seqno, _cid, column in connection.execute(
+                    f"PRAGMA index_info({name})"
+                )
+            ]
+            for name in names
+        }
+    connection.close()
+    assert indexes == {
+        f"idx_essences_scan_stat{n}": ["scan_id", f"stat{n}_id", f"level{n}"]
+        for n in (1, 2, 3)
+    }
+
+
+def test_scans_record_whether_levels_were_recognized(store):
+    with_levels = store.begin_scan()
+    without_levels = store.begin_scan(levels_recognized=False)
+
+    assert store.get_scan(with_levels).levels_recognized is True
+    assert store.get_scan(without_levels).levels_recognized is False
+    assert store.get_scan(without_levels + 1) is None
+
+
+def test_scans_of_old_databases_have_no_levels(tmp_path):
+    path = tmp_path / "scan_results.db"
+    # a database created before scans recorded whether levels were recognized
+    with sqlite3.connect(path) as connection:
+        connection.execute(
+            "CREATE TABLE scans (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "started_at REAL NOT NULL, finished_at REAL, "
+            "completed INTEGER NOT NULL DEFAULT 0)"
+        )
+        connection.execute(
+            "INSERT INTO scans (started_at, finished_at, completed) VALUES (1, 2, 1)"
+        )
+    connection.close()
+
+    store = ScanResultStore(path)
+    (old,) = store.list_scans()
+    assert old.levels_recognized is False
+    new = store.begin_scan()
+    assert store.get_scan(new).levels_recognized is True
+    store.close()
+
+
+def test_results_survive_reopening(tmp_path):
+    path = tmp_path / "scan_results.db"
+    store = ScanResultStore(path)
+    scan_id = store.begin_scan()
+    store.add(scan_id, 2, 3, _data(["a", None, None], [2, None, None]), None)
+    store.finish_scan(scan_id, completed=True)
+    store.close()
+
+    reopened = ScanResultStore(path)
+    assert _ids(reopened) == [(2, 3)]
+    reopened.close()
@@ -0,0 +1,132 @@
+import types
+
+import numpy as np
+import pytest
+
+from endfield_essence_recognizer.core.layout.base import Point, Region
+from endfield_essence_recognizer.core.scanner import settle
+from endfield_essence_recognizer.core.scanner.settle import (
+    PanelSettleDetector,
+    PanelSettleProfile,
+)
+
+REGION = Region(Point(0, 0), Point(64, 32))
+
+
+class SequenceImageSource:
+    """Returns a scripted sequence of frames; the last frame repeats forever."""
+
+    def __init__(self, frames: list[np.ndarray]) -> None:
+        self._frames = frames
+        self.calls = 0
+
+    def screenshot(self, relative_region: Region | None = None) -> np.ndarray:
+        frame = self._frames[min(self.calls, len(self._frames) - 1)]
+        self.calls += 1
+        return frame
+
+    def get_client_size(self) -> tuple[int, int]:
+        return 64, 32
+
+
+class RecordingWindowActions:
+    def __init__(self) -> None:
+        self.waited: list[float] = []
+
+    def wait(self, seconds: float) -> None:
+        self.waited.append(seconds)
+
+
+def _frame(value: int) -> np.ndarray:
+    return np.full((32, 64, 3), value, dtype=np.uint8)
+
+
+def test_settle_returns_once_panel_changed_and_stable():
+    old, animating, new = _frame(0), _frame(100), _frame(200)
+    # baseline, then: animating, new, new, new
+    source = SequenceImageSource([old, animating, new, new, new])
+    actions = RecordingWindowActions()
+    detector = PanelSettleDetector(
+        "Test", PanelSettleProfile(poll_interval=0.01, max_wait=1.0, stable_frames=2)
+    )
+
+    baseline = detector.capture_signature(source, REGION)
+    settled = detector.wait_until_settled(source, actions, REGION, baseline)
+
+    assert settled is True
+    # changed at poll 1, still changing at poll 2, stable at polls 3 and 4
+    assert len(actions.waited) == 4
+    assert sum(actions.waited) < 1.0
+
+
+def test_settle_times_out_when_panel_never_changes():
+    source = SequenceImageSource([_frame(50)])
+    actions = RecordingWindowActions()
+    profile = PanelSettleProfile(poll_interval=0.02, max_wait=0.3)
+    detector = PanelSettleDetector("Test", profile)
+
+    baseline = detector.capture_signature(source, REGION)
+    settled = detector.wait_until_settled(source, actions, REGION, baseline)
+
+    assert settled is False
+    assert len(actions.waited) == 15
+    assert sum(actions.waited) == pytest.approx(0.3)
+
+
+def test_signature_ignores_small_noise():
+    detector = PanelSettleDetector("Test", PanelSettleProfile(diff_threshold=2.0))
+    rng = np.random.default_rng(0)
+    base = np.full((32, 64, 3), 120, dtype=np.uint8)
+    noisy = (base + rng.integers(0, 2, base.shape)).astype(np.uint8)
+
+    sig_a = detector.capture_signature(SequenceImageSource([base]), REGION)
+    sig_b = detector.capture_signature(SequenceImageSource([noisy]), REGION)
+
+    assert sig_a.shape == (4, 8)
+    assert detector.signature_distance(sig_a, sig_b) <= 2.0
+
+
+def test_settle_wait_is_bounded_by_elapsed_time(monkeypatch):
+    now = 0.0
+
+    def monotonic() -> float:
+        return now
+
+    class SlowImageSource(SequenceImageSource):
+        def screenshot(self, relative_region: Region | None = None) -> np.ndarray:
+            nonlocal now
+            now += 0.1  # capturing takes longer than the poll interval
+            return super().screenshot(relative_region)
+
+    monkeypatch.setattr(settle, "time", types.SimpleNamespace(monotonic=monotonic))
+    source = SlowImageSource([_frame(50)])
+    actions = RecordingWindowActions()
+    detector = PanelSettleDetector(
+        "Test", PanelSettleProfile(poll_interval=0.02, max_wait=0.3)
+    )
+
+    baseline = detector.capture_signature(source, REGION)
+    assert not detector.wait_until_settled(source, actions, REGION, baseline)
+    assert len(actions.waited) == 3
+
+
+def test_button_flip_is_only_visible_in_button_signature():
+    """A lock icon flip barely changes the whole panel, but clearly changes the button."""
+    panel = Region(Point(0, 0), Point(418, 453))
+    button = Region(Point(360, 191), Point(392, 223))
+    before = np.full((453, 418, 3), 40, dtype=np.uint8)
+    after = before.copy()
+    after[196:218, 365:387] = 255
+    detector = PanelSettleDetector("Test", PanelSettleProfile())
+
+    def signature(frame: np.ndarray, region: Region) -> np.ndarray:
+        crop = frame[region.y0 : region.y1, region.x0 : region.x1]
+        return detector.capture_signature(SequenceImageSource([crop]), region)
+
+    def distance(region: Region) -> float:
+        return detector.signature_distance(
+            signature(before, region), signature(after, region)
+        )
+
+    assert distance(panel) <= detector.profile.diff_threshold
+    assert distance(button) > detector.profile.diff_threshold
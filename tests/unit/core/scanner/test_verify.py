@@ -0,0 +1,134 @@
+import types
+
+import pytest
+
+from endfield_essence_recognizer.core.recognition import LockStatusLabel
+from endfield_essence_recognizer.core.scanner import verify
+from endfield_essence_recognizer.core.scanner.action_logic import ActionOutcome
+from endfield_essence_recognizer.core.scanner.verify import (
+    ActionVerifier,
+    ActionVerifyProfile,
+)
+
+LOCKED = LockStatusLabel.LOCKED
+NOT_LOCKED = LockStatusLabel.NOT_LOCKED
+MAYBE = LockStatusLabel.MAYBE_LOCKED
+
+
+class RecordingWindowActions:
+    def __init__(self) -> None:
+        self.waited: list[float] = []
+
+    def wait(self, seconds: float) -> None:
+        self.waited.append(seconds)
+
+
+class ScriptedButton:
+    """Flips its state a number of polls after each effective click."""
+
+    def __init__(self, effective_clicks: list[bool], latency: int, state) -> None:
+        self.effective_clicks = effective_clicks
+        self.latency = latency
+        self.state = state
+        self.clicks = 0
+        self._countdown: int | None = None
+
+    def click(self) -> None:
+        effective = self.effective_clicks[self.clicks]
+        self.clicks += 1
+        if effective:
+            self._countdown = self.latency
+
+    def read(self):
+        if self._countdown is not None:
+            self._countdown -= 1
+            if self._countdown <= 0:
+                self._countdown = None
+                self.state = LOCKED if self.state == NOT_LOCKED else NOT_LOCKED
+        return self.state
+
+
+def _perform(button: ScriptedButton, window_actions=None) -> ActionOutcome:
+    verifier = ActionVerifier(
+        "TestVerifier",
+        ActionVerifyProfile(poll_interval=0.02, max_wait=0.1, grace_period=0.2),
+    )
+    return verifier.perform(
+        window_actions or RecordingWindowActions(),
+        button.click,
+        button.read,
+        NOT_LOCKED,
+        LOCKED,
+    )
+
+
+def test_confirms_once_state_stays_flipped():
+    window_actions = RecordingWindowActions()
+    button = ScriptedButton([True], latency=2, state=NOT_LOCKED)
+
+    assert _perform(button, window_actions) == ActionOutcome.CONFIRMED
+    assert button.clicks == 1
+    # flipped on the second poll, confirmed by the third
+    assert sum(window_actions.waited) == pytest.approx(0.06)
+
+
+def test_single_flipped_read_is_not_enough():
+    button = ScriptedButton([False, False], latency=1, state=NOT_LOCKED)
+    reads = iter([LOCKED])
+    button.read = lambda: next(reads, NOT_LOCKED)
+
+    assert _perform(button) == ActionOutcome.FAILED
+
+
+def test_late_click_is_not_clicked_again():
+    # flips after the 0.1s deadline but within the 0.2s grace period
+    button = ScriptedButton([True, True], latency=8, state=NOT_LOCKED)
+
+    assert _perform(button) == ActionOutcome.CONFIRMED
+    assert button.clicks == 1
+    assert button.state == LOCKED
+
+
+def test_wait_is_bounded_by_elapsed_time(monkeypatch):
+    now = 0.0
+
+    def monotonic() -> float:
+        return now
+
+    monkeypatch.setattr(verify, "time", types.SimpleNamespace(monotonic=monotonic))
+    window_actions = RecordingWindowActions()
+    button = ScriptedButton([False, False], latency=1, state=NOT_LOCKED)
+    read = button.read
+
+    def slow_read():
+        nonlocal now
+        now += 0.05  # recognizing the button takes longer than the poll interval
+        return read()
+
+    button.read = slow_read
+
+    assert _perform(button, window_actions) == ActionOutcome.FAILED
+    # two clicks, each with 0.1s of polling and a 0.2s grace period
+    assert len(window_actions.waited) == 2 * (2 + 4)
+
+
+def test_retries_a_dropped_click():
+    button = ScriptedButton([False, True], latency=1, state=NOT_LOCKED)
+
+    assert _perform(button) == ActionOutcome.RETRIED
+    assert button.clicks == 2
+
+
+def test_fails_after_retries():
+    button = ScriptedButton([False, False], latency=1, state=NOT_LOCKED)
+
+    assert _perform(button) == ActionOutcome.FAILED
+    assert button.clicks == 2
+
+
+def test_does_not_retry_when_state_is_uncertain():
+    button = ScriptedButton([True], latency=1, state=NOT_LOCKED)
+    button.read = lambda: MAYBE
+
+    assert _perform(button) == ActionOutcome.FAILED
+    assert button.clicks == 1
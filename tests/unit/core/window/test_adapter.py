@@ -2,6 +2,10 @@ import numpy as np
 
 from endfield_essence_recognizer.core.layout.base import Point, Region
 from endfield_essence_recognizer.core.window.adapter import InMemoryImageSource
+from endfield_essence_recognizer.utils.image import (
+    plan_capture_regions,
+    screenshot_many_by_plan,
+)
 
 
 def test_in_memory_image_source_full_screenshot():
@@ -77,3 +81,56 @@ def test_in_memory_image_source_view_contract():
     # (Checking the contract that it IS a view, though consumers shouldn't do this)
     screenshot[0, 0] = [255, 255, 255]
     assert np.array_equal(img[0, 0], [255, 255, 255])
+
+
+def test_in_memory_image_source_screenshot_many():
+    img = np.arange(100 * 100 * 3, dtype=np.uint8).reshape((100, 100, 3))
+    source = InMemoryImageSource(img)
+    regions = [
+        Region(Point(0, 0), Point(10, 10)),
+        Region(Point(50, 60), Point(70, 90)),
+    ]
+
+    images = source.screenshot_many(regions)
+
+    assert len(images) == 2
+    assert np.array_equal(images[0], img[0:10, 0:10])
+    assert np.array_equal(images[1], img[60:90, 50:70])
+
+
+def test_plan_capture_regions_merges_nearby_and_keeps_far_apart():
+    near_a = Region(Point(1500, 350), Point(1700, 390))
+    near_b = Region(Point(1500, 410), Point(1700, 450))
+    far = Region(Point(0, 1000), Point(20, 1020))
+
+    plan = plan_capture_regions([near_a, far, near_b], merge_slack=100 * 100)
+
+    assert sorted(members for _region, members in plan) == [[0, 2], [1]]
+    merged = next(region for region, members in plan if members == [0, 2])
+    assert merged == Region(Point(1500, 350), Point(1700, 450))
+
+
+def test_screenshot_many_by_plan_captures_each_rect_once():
+    img = np.arange(200 * 300 * 3, dtype=np.uint8).reshape((200, 300, 3))
+
+    class RecordingSource(InMemoryImageSource):
+        def __init__(self, image):
+            super().__init__(image)
+            self.requested: list[Region | None] = []
+
+        def screenshot(self, relative_region: Region | None = None):
+            self.requested.append(relative_region)
+            return super().screenshot(relative_region)
+
+    source = RecordingSource(img)
+    regions = [
+        Region(Point(10, 10), Point(40, 20)),
+        Region(Point(10, 25), Point(40, 35)),
+        Region(Point(250, 150), Point(260, 160)),
+    ]
+
+    images = screenshot_many_by_plan(source, regions, merge_slack=500)
+
+    assert len(source.requested) == 2
+    for region, image in zip(regions, images, strict=True):
+        assert np.array_equal(image, img[region.y0 : region.y1, region.x0 : region.x1])
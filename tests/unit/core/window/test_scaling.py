@@ -28,8 +28,10 @@ from endfield_essence_recognizer.core.window.scaling import (
 class MockImageSource:
     def __init__(self, image: np.ndarray) -> None:
         self._image = image
+        self.requested: list[Region | None] = []
 
     def screenshot(self, relative_region: Region | None = None):
+        self.requested.append(relative_region)
         if relative_region is None:
             return self._image
         p0, p1 = relative_region.p0, relative_region.p1
@@ -43,6 +45,7 @@ class MockImageSource:
 class MockWindowActions:
     def __init__(self) -> None:
         self.clicked: list[tuple[int, int]] = []
+        self.scrolled: list[tuple[int, int, int]] = []
         self.waited: list[float] = []
         self.target_exists = True
         self.target_is_active = False
@@ -59,6 +62,9 @@ class MockWindowActions:
     def click(self, relative_x: int, relative_y: int) -> None:
         self.clicked.append((relative_x, relative_y))
 
+    def scroll(self, relative_x: int, relative_y: int, clicks: int) -> None:
+        self.scrolled.append((relative_x, relative_y, clicks))
+
     def wait(self, seconds: float) -> None:
         self.waited.append(seconds)
 
@@ -128,6 +134,142 @@ def test_scaling_image_source_full_and_region_screenshot():
     assert np.array_equal(cropped, expected)
 
 
+@pytest.mark.parametrize(
+    ("physical_width", "physical_height"),
+    [
+        (1920, 1080),
+        (2560, 1440),
+        (3840, 2160),
+        (3440, 1440),
+        (2560, 1600),
+        (3024, 1964),
+    ],
+)
+def test_scaling_image_source_roi_capture_matches_full_frame(
+    physical_width: int,
+    physical_height: int,
+):
+    """ROI captures must be pixel-identical to cropping the fully scaled frame.
+
+    Value: the ROI-local path only captures and resizes a small physical
+    rectangle; any grid misalignment would silently shift template matching
+    inputs on non-1080p clients.
+    """
+    rng = np.random.default_rng(0)
+    physical = rng.integers(
+        0, 256, (physical_height, physical_width, 3), dtype=np.uint8
+    )
+    mock = MockImageSource(physical)
+    source = ScalingImageSource(mock)
+    logical_width, logical_height = source.logical_size
+
+    interpolation = cv2.INTER_AREA if source.scale_factor < 1.0 else cv2.INTER_LINEAR
+    full_scaled = cv2.resize(
+        physical, (logical_width, logical_height), interpolation=interpolation
+    )
+
+    regions = [
+        Region(Point(logical_width - 412, 358), Point(logical_width - 220, 390)),
+        Region(Point(logical_width - 130, 270), Point(logical_width - 97, 302)),
+        Region(Point(logical_width - 455, 79), Point(logical_width - 37, 532)),
+        Region(Point(38, 66), Point(143, 106)),
+        Region(Point(0, 0), Point(10, 10)),
+        Region(
+            Point(logical_width - 10, logical_height - 10),
+            Point(logical_width, logical_height),
+        ),
+    ]
+    for region in regions:
+        mock.requested.clear()
+        cropped = source.screenshot(region)
+        expected = full_scaled[region.y0 : region.y1, region.x0 : region.x1]
+        assert np.array_equal(cropped, expected), region
+
+        # only a partial physical rectangle is captured
+        (requested,) = mock.requested
+        assert requested is not None
+
+
+def test_scaling_image_source_roi_capture_is_local():
+    """A small ROI on a 4K client captures a small physical rectangle."""
+    physical = np.zeros((2160, 3840, 3), dtype=np.uint8)
+    mock = MockImageSource(physical)
+    source = ScalingImageSource(mock)
+
+    source.screenshot(Region(Point(1508, 358), Point(1700, 390)))
+
+    (requested,) = mock.requested
+    assert requested is not None
+    width = requested.x1 - requested.x0
+    height = requested.y1 - requested.y0
+    assert width <= (1700 - 1508) * 2 + 8
+    assert height <= (390 - 358) * 2 + 8
+
+
+def test_scaling_image_source_upscaling_uses_full_frame():
+    """Upscaled (small) clients keep capturing the full frame for ROIs."""
+    physical = np.zeros((768, 1366, 3), dtype=np.uint8)
+    mock = MockImageSource(physical)
+    source = ScalingImageSource(mock)
+
+    source.screenshot(Region(Point(38, 66), Point(143, 106)))
+
+    assert mock.requested == [None]
+
+
+@pytest.mark.parametrize(
+    ("physical_width", "physical_height", "full_frames"),
+    [(2560, 1440, 0), (1366, 768, 1)],
+)
+def test_scaling_image_source_screenshot_many_counts_captures(
+    physical_width: int, physical_height: int, full_frames: int
+):
+    """Several regions never capture and resize the full frame more than once.
+
+    Value: the recognizers read a handful of ROIs per essence; a full-frame
+    capture and resize per region multiplies the cost of every scan step.
+    """
+    rng = np.random.default_rng(0)
+    physical = rng.integers(
+        0, 256, (physical_height, physical_width, 3), dtype=np.uint8
+    )
+    mock = MockImageSource(physical)
+    source = ScalingImageSource(mock)
+    logical_width, _logical_height = source.logical_size
+    regions = [
+        Region(Point(logical_width - 412, 358), Point(logical_width - 220, 390)),
+        Region(Point(logical_width - 130, 270), Point(logical_width - 97, 302)),
+        Region(Point(38, 66), Point(143, 106)),
+        Region(Point(700, 900), Point(760, 960)),
+    ]
+
+    images = source.screenshot_many(regions)
+
+    assert mock.requested.count(None) == full_frames
+    assert len(mock.requested) <= len(regions)
+    for region, image in zip(regions, images, strict=True):
+        assert np.array_equal(image, source.screenshot(region)), region
+
+
+def test_scaling_image_source_screenshot_many_shares_full_frame():
+    """Regions outside the client area share one full frame with the local path."""
+    physical = np.zeros((1440, 2560, 3), dtype=np.uint8)
+    mock = MockImageSource(physical)
+    source = ScalingImageSource(mock)
+    logical_width, logical_height = source.logical_size
+    regions = [
+        Region(Point(38, 66), Point(143, 106)),
+        Region(Point(logical_width - 10, 0), Point(logical_width + 10, 10)),
+        Region(Point(0, logical_height - 10), Point(10, logical_height + 10)),
+    ]
+
+    images = source.screenshot_many(regions)
+
+    assert mock.requested.count(None) == 1
+    assert len(mock.requested) == 2
+    assert [image.shape[:2] for image in images] == [(40, 105), (10, 10), (10, 10)]
+
+
 def test_scaling_window_actions_maps_coordinates_and_delegates():
     """Verify click coordinate back-mapping and action delegation.
 
@@ -146,6 +288,9 @@ def test_scaling_window_actions_maps_coordinates_and_delegates():
     actions.click(101, 51)
     assert base_actions.clicked == [(126, 64)]
 
+    actions.scroll(101, 51, -3)
+    assert base_actions.scrolled == [(126, 64, -3)]
+
     actions.wait(0.25)
     assert base_actions.waited == [0.25]
 
@@ -119,6 +119,27 @@ def test_find_weapons_by_stats(static_game_data):
     assert len(found) == 0
 
 
+def test_find_weapons_matching(static_game_data):
+    # weapon_1 has (stat_a, stat_b, None)
+    assert static_game_data.find_weapons_matching(
+        "stat_a", "stat_b", "stat_x", min_matches=2
+    ) == ["weapon_1"]
+    assert static_game_data.find_weapons_matching("stat_a", "stat_b", "stat_x") == []
+    # stats are compared slot by slot
+    assert (
+        static_game_data.find_weapons_matching("stat_b", "stat_a", None, min_matches=1)
+        == []
+    )
+    for min_matches in (0, 4):
+        with pytest.raises(ValueError, match="min_matches"):
+            static_game_data.find_weapons_matching("stat_a", min_matches=min_matches)
+
+
+def test_find_weapons_with_stat(static_game_data):
+    assert static_game_data.find_weapons_with_stat("stat_b") == ["weapon_1"]
+    assert static_game_data.find_weapons_with_stat("stat_x") == []
+
+
 def test_get_rarity_color(static_game_data):
     # rarity 4 should be #9452FA
     color = static_game_data.get_rarity_color(4)
@@ -126,3 +147,13 @@ def test_get_rarity_color(static_game_data):
 
     # Fallback
     assert static_game_data.get_rarity_color(99) == "#FFFFFF"
+
+
+def test_signature_changes_with_data(mock_data_root):
+    before = StaticGameData(mock_data_root).signature
+    assert StaticGameData(mock_data_root).signature == before
+
+    (mock_data_root / "RarityColor.json").write_text(
+        json.dumps({"4": {"color": "#000000"}}), encoding="utf-8"
+    )
+    assert StaticGameData(mock_data_root).signature != before
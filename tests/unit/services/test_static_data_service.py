@@ -64,3 +64,29 @@ def test_get_essence_service(service):
         StatType.SECONDARY,
         StatType.SKILL,
     ]
+
+
+def test_match_weapons_service(service, static_game_data):
+    weapon = static_game_data.list_weapons()[0]
+
+    exact = service.match_weapons(weapon.stat1_id, weapon.stat2_id, weapon.stat3_id)
+    assert weapon.weapon_id in [w.id for w in exact.weapons]
+    assert {w.id for w in exact.weapons} == set(
+        static_game_data.find_weapons_by_stats(
+            weapon.stat1_id, weapon.stat2_id, weapon.stat3_id
+        )
+    )
+
+    near_miss = service.match_weapons(
+        weapon.stat1_id, weapon.stat2_id, "no_such_stat", min_matches=2
+    )
+    assert weapon.weapon_id in [w.id for w in near_miss.weapons]
+
+
+def test_list_weapons_with_essence_service(service, static_game_data):
+    weapon = static_game_data.list_weapons()[0]
+
+    response = service.list_weapons_with_essence(weapon.stat2_id)
+    assert response is not None
+    assert weapon.weapon_id in [w.id for w in response.weapons]
+    assert service.list_weapons_with_essence("no_such_stat") is None
@@ -0,0 +1,96 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from endfield_essence_recognizer.schemas.system import ComponentStatus
+from endfield_essence_recognizer.services.warmup_service import (
+    WarmupComponent,
+    WarmupService,
+)
+
+
+def _wait_ready(service: WarmupService, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not service.status().ready:
+        assert time.monotonic() < deadline, "warm-up did not finish"
+        time.sleep(0.01)
+
+
+def test_components_load_concurrently_after_prerequisites():
+    """Independent components overlap; a component starts after its prerequisites."""
+    both_running = threading.Barrier(2, timeout=2)
+    order: list[str] = []
+
+    def load(name: str, wait: bool = False):
+        def _load() -> None:
+            if wait:
+                # Fails with BrokenBarrierError unless the other component runs too
+                both_running.wait()
+            time.sleep(0.01)
+            order.append(name)
+
+        return _load
+
+    service = WarmupService(
+        [
+            WarmupComponent("data", load("data", wait=True)),
+            WarmupComponent("recognizer", load("recognizer"), after=("data",)),
+            WarmupComponent("layout", load("layout", wait=True)),
+        ]
+    )
+    assert not service.status().ready
+    service.start(max_workers=3)
+    _wait_ready(service)
+
+    info = service.status()
+    assert [c.status for c in info.components] == [ComponentStatus.READY] * 3
+    assert all(c.duration is not None for c in info.components)
+    assert info.elapsed is not None
+    assert order.index("recognizer") > order.index("data")
+
+
+def test_failed_component_is_reported():
+    def fail() -> None:
+        raise RuntimeError("broken template")
+
+    service = WarmupService(
+        [WarmupComponent("bad", fail), WarmupComponent("good", lambda: None)]
+    )
+    service.start(max_workers=1)
+    _wait_ready(service)
+
+    bad, good = service.status().components
+    assert bad.status == ComponentStatus.FAILED
+    assert bad.error == "broken template"
+    assert good.status == ComponentStatus.READY
+
+
+def test_disabled_warmup_is_ready_without_loading():
+    loaded = threading.Event()
+    service = WarmupService([WarmupComponent("data", loaded.set)])
+    service.start(max_workers=0)
+
+    info = service.status()
+    assert info.ready
+    assert info.components[0].status == ComponentStatus.PENDING
+    assert not loaded.is_set()
+
+
+@pytest.mark.asyncio
+async def test_subscribers_receive_every_change():
+    release = threading.Event()
+    service = WarmupService([WarmupComponent("data", release.wait)])
+    queue = service.subscribe()
+    service.start(max_workers=1)
+
+    loading = await asyncio.wait_for(queue.get(), timeout=2)
+    assert loading.components[0].status == ComponentStatus.LOADING
+    assert not loading.ready
+
+    release.set()
+    ready = await asyncio.wait_for(queue.get(), timeout=2)
+    assert ready.ready
+    assert ready.components[0].status == ComponentStatus.READY
+    service.unsubscribe(queue)
@@ -0,0 +1,677 @@
+import dataclasses
+import threading
+import time
+
+import pytest
+
+from endfield_essence_recognizer.core.recognition import (
+    AbandonStatusLabel,
+    LockStatusLabel,
+    RarityLabel,
+)
+from endfield_essence_recognizer.core.scanner.checkpoint import ScanCheckpointStore
+from endfield_essence_recognizer.core.scanner.engine import (
+    ScanMode,
+    ScannerEngine,
+    recognize_essence,
+)
+from endfield_essence_recognizer.core.scanner.incremental import IncrementalScanStore
+from endfield_essence_recognizer.core.scanner.models import (
+    EssenceQuality,
+    RecognitionPlan,
+)
+from endfield_essence_recognizer.core.scanner.paging import PagingProfile
+from endfield_essence_recognizer.core.scanner.plan import ActionPlanBoard, PlanStatus
+from endfield_essence_recognizer.core.scanner.recapture import RecaptureProfile
+from endfield_essence_recognizer.core.scanner.result_store import (
+    EssenceQuery,
+    ScanResultStore,
+)
+from endfield_essence_recognizer.core.scanner.settle import PanelSettleProfile
+from endfield_essence_recognizer.core.scanner.verify import ActionVerifyProfile
+from endfield_essence_recognizer.core.window.scaling import create_scaling_wrappers
+from endfield_essence_recognizer.schemas.user_setting import (
+    Action,
+    NonFiveStarBehavior,
+)
+from endfield_essence_recognizer.services.user_setting_manager import (
+    UserSettingManager,
+)
+from endfield_essence_recognizer.simulator import (
+    SimulatedGame,
+    VirtualClock,
+    generate_inventory,
+)
+from endfield_essence_recognizer.simulator.benchmark import load_static_game_data
+from endfield_essence_recognizer.simulator.recognizer_benchmark import (
+    build_benchmark_context,
+)
+
+
+@pytest.fixture(scope="module")
+def ctx():
+    # fingerprint caches stay in memory and never touch the cache files of the repo
+    return build_benchmark_context(load_static_game_data(), fingerprint_cache=True)
+
+
+def _select(game: SimulatedGame, index: int) -> None:
+    """Click a grid slot (logical coordinates) and let the panel update."""
+    slot = game.slot_positions()[index]
+    scale = game.physical_size[0] / game.logical_size[0]
+    game.click(round(slot.x * scale), round(slot.y * scale))
+    game.wait(game.panel_latency)
+
+
+def _scroll_to_top(game: SimulatedGame) -> None:
+    """Scroll the grid back to the first row, as reopening the inventory does."""
+    slot = game.slot_positions()[0]
+    scale = game.physical_size[0] / game.logical_size[0]
+    game.scroll(round(slot.x * scale), round(slot.y * scale), game.scroll_row)
+    game.wait(game.panel_latency)
+
+
+def test_generate_inventory_is_deterministic(ctx):
+    a = generate_inventory(ctx.static_game_data, 10, seed=42)
+    b = generate_inventory(ctx.static_game_data, 10, seed=42)
+    assert a == b
+    assert all(len(essence.stats) == 3 for essence in a)
+
+
+@pytest.mark.parametrize("physical_size", [(1920, 1080), (2560, 1440), (1920, 1200)])
+def test_recognizes_rendered_essences(ctx, physical_size):
+    game = SimulatedGame([], physical_size)
+    slots = len(game.slot_positions())
+    game.inventory = generate_inventory(ctx.static_game_data, slots, seed=1)
+    image_source, _ = create_scaling_wrappers(game, game)
+
+    for index in range(0, slots, 7):
+        _select(game, index)
+        truth = game.inventory[index]
+        data = recognize_essence(image_source, ctx, game.profile)
+
+        assert data.stats == truth.stats
+        assert data.levels == truth.levels
+        assert data.rarity == truth.rarity
+        assert data.lock_label == (
+            LockStatusLabel.LOCKED if truth.locked else LockStatusLabel.NOT_LOCKED
+        )
+        assert data.abandon_label == (
+            AbandonStatusLabel.ABANDONED
+            if truth.abandoned
+            else AbandonStatusLabel.NOT_ABANDONED
+        )
+
+
+def test_recognition_plan_skips_unused_fields(ctx):
+    game = SimulatedGame(generate_inventory(ctx.static_game_data, 45, seed=7))
+    image_source, _ = create_scaling_wrappers(game, game)
+    plan = RecognitionPlan(levels=False, non_five_star_stats=False)
+
+    rarities = set()
+    for index in range(45):
+        _select(game, index)
+        truth = game.inventory[index]
+        data = recognize_essence(image_source, ctx, game.profile, plan)
+
+        rarities.add(truth.rarity)
+        assert data.rarity == truth.rarity
+        assert data.levels == [None, None, None]
+        if truth.rarity == RarityLabel.FIVE:
+            assert data.stats == truth.stats
+        else:
+            assert data.stats == [None, None, None]
+    assert len(rarities) > 1
+
+
+def test_panel_updates_after_latency(ctx):
+    game = SimulatedGame(
+        generate_inventory(ctx.static_game_data, 45, seed=0), panel_latency=0.1
+    )
+    slot = game.slot_positions()[3]
+    before = game.screenshot(game.profile.AREA)
+
+    game.click(slot.x, slot.y)
+    assert (game.screenshot(game.profile.AREA) == before).all()
+
+    game.wait(0.1)
+    assert game.selected_index == 3
+    assert not (game.screenshot(game.profile.AREA) == before).all()
+
+
+def test_lock_button_toggles_selected_essence(ctx):
+    game = SimulatedGame(generate_inventory(ctx.static_game_data, 45, seed=0))
+    _select(game, 0)
+    locked = game.inventory[0].locked
+
+    pos = game.profile.LOCK_BUTTON_POS
+    game.click(pos.x, pos.y)
+    game.wait(game.panel_latency)
+    assert game.inventory[0].locked is not locked
+
+
+def _scan(
+    ctx,
+    tmp_path,
+    game: SimulatedGame,
+    scan_mode: ScanMode,
+    non_five_star_behavior: NonFiveStarBehavior = NonFiveStarBehavior.PROCESS,
+    paging_profile: PagingProfile | None = None,
+    incremental_store: IncrementalScanStore | None = None,
+    result_store: ScanResultStore | None = None,
+    action_plan_board: ActionPlanBoard | None = None,
+    action_verify_profile: ActionVerifyProfile | None = None,
+    recapture_profile: RecaptureProfile | None = None,
+    checkpoint_store: ScanCheckpointStore | None = None,
+    resume: bool = False,
+    stop_event: threading.Event | None = None,
+    skip_empty_cells: bool = False,
+    high_level_treasure_enabled: bool = False,
+    treasure_action: Action | None = None,
+    trash_action: Action | None = None,
+) -> ScannerEngine:
+    image_source, window_actions = create_scaling_wrappers(game, game)
+    user_setting_manager = UserSettingManager(tmp_path / "config.json")
+    user_setting = user_setting_manager.get_user_setting_ref()
+    user_setting.non_five_star_behavior = non_five_star_behavior
+    user_setting.high_level_treasure_enabled = high_level_treasure_enabled
+    if treasure_action is not None:
+        user_setting.treasure_action = treasure_action
+    if trash_action is not None:
+        user_setting.trash_action = trash_action
+    engine = ScannerEngine(
+        ctx=ctx,
+        image_source=image_source,
+        window_actions=window_actions,
+        user_setting_manager=user_setting_manager,
+        profile=game.profile,
+        settle_profile=PanelSettleProfile(),
+        scan_mode=scan_mode,
+        paging_profile=paging_profile,
+        incremental_store=incremental_store,
+        result_store=result_store,
+        action_plan_board=action_plan_board,
+        confirm_action_plan=action_plan_board is not None,
+        action_verify_profile=action_verify_profile,
+        recapture_profile=recapture_profile,
+        checkpoint_store=checkpoint_store,
+        resume=resume,
+        skip_empty_cells=skip_empty_cells,
+    )
+    engine.execute(stop_event if stop_event is not None else threading.Event())
+    return engine
+
+
+def test_scanner_engine_scans_whole_grid_on_virtual_clock(ctx, tmp_path):
+    clock = VirtualClock()
+    game = SimulatedGame(
+        generate_inventory(ctx.static_game_data, 45, seed=3), clock=clock
+    )
+    _scan(ctx, tmp_path, game, ScanMode.SEQUENTIAL)
+
+    assert game.selections == 45
+    assert game.clicks >= 45
+    assert clock.total_slept > 0
+
+
+def test_pipelined_and_planned_scans_match_sequential_scan(ctx, tmp_path):
+    games = {
+        mode: SimulatedGame(generate_inventory(ctx.static_game_data, 45, seed=5))
+        for mode in ScanMode
+    }
+    for mode, game in games.items():
+        _scan(ctx, tmp_path, game, mode)
+
+    sequential = games[ScanMode.SEQUENTIAL]
+    pipelined = games[ScanMode.PIPELINED]
+    assert pipelined.visited == set(range(45))
+    assert pipelined.inventory == sequential.inventory
+    assert pipelined.inventory != generate_inventory(ctx.static_game_data, 45, seed=5)
+    planned = games[ScanMode.PLANNED]
+    assert planned.inventory == sequential.inventory
+    # only essences that need a lock / abandon click are revisited
+    assert planned.selections < 2 * 45
+
+
+def test_verified_actions_retry_dropped_clicks(ctx, tmp_path):
+    expected = SimulatedGame(generate_inventory(ctx.static_game_data, 45, seed=5))
+    _scan(ctx, tmp_path, expected, ScanMode.SEQUENTIAL)
+
+    clock = VirtualClock()
+    game = SimulatedGame(
+        generate_inventory(ctx.static_game_data, 45, seed=5), clock=clock
+    )
+    game.dropped_button_clicks = 1
+    profile = ActionVerifyProfile()
+    _scan(
+        ctx,
+        tmp_path,
+        game,
+        ScanMode.SEQUENTIAL,
+        action_verify_profile=profile,
+    )
+
+    assert game.dropped_button_clicks == 0
+    assert game.inventory == expected.inventory
+    # the dropped click costs one deadline and grace period before it is retried
+    assert clock.now <= expected.clock.now + profile.max_wait + profile.grace_period
+
+
+@pytest.mark.parametrize("scan_mode", [ScanMode.SEQUENTIAL, ScanMode.PIPELINED])
+def test_uncertain_buttons_are_recaptured(ctx, tmp_path, scan_mode):
+    expected = SimulatedGame(generate_inventory(ctx.static_game_data, 45, seed=5))
+    _scan(ctx, tmp_path, expected, ScanMode.SEQUENTIAL)
+
+    # the buttons are drawn after the rest of the panel has settled
+    game = SimulatedGame(
+        generate_inventory(ctx.static_game_data, 45, seed=5), button_latency=0.1
+    )
+    engine = _scan(ctx, tmp_path, game, scan_mode, recapture_profile=RecaptureProfile())
+
+    stats = engine.recapture_stats
+    assert stats.essences > 0
+    assert stats.failed == 0
+    assert game.inventory == expected.inventory
+
+
+@pytest.mark.parametrize("confirm", [True, False])
+def test_planned_scan_waits_for_confirmation(ctx, tmp_path, confirm):
+    original = generate_inventory(ctx.static_game_data, 45, seed=5)
+    game = SimulatedGame(generate_inventory(ctx.static_game_data, 45, seed=5))
+    board = ActionPlanBoard()
+    thread = threading.Thread(
+        target=_scan,
+        args=(ctx, tmp_path, game, ScanMode.PLANNED),
+        kwargs={"action_plan_board": board},
+    )
+    thread.start()
+    try:
+        deadline = time.monotonic() + 60
+        while board.current is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        plan = board.current
+        assert plan is not None
+        assert plan.status == PlanStatus.AWAITING_CONFIRMATION
+        # the sweep is read-only
+        assert game.inventory == original
+        assert plan.entries
+    finally:
+        if board.current is not None:
+            board.current.confirm() if confirm else board.current.reject()
+        thread.join()
+
+    if confirm:
+        assert plan.status == PlanStatus.COMPLETED
+        changed = {
+            index
+            for index, (before, after) in enumerate(
+                zip(original, game.inventory, strict=True)
+            )
+            if before != after
+        }
+        assert changed == {
+            entry.row * len(game.profile.essence_icon_x_list) + entry.column
+            for entry in plan.entries
+        }
+    else:
+        assert plan.status == PlanStatus.REJECTED
+        assert game.inventory == original
+
+
+@pytest.mark.parametrize("physical_size", [(1920, 1080), (2560, 1440)])
+def test_skip_non_five_star_only_visits_five_star_essences(
+    ctx, tmp_path, physical_size
+):
+    game = SimulatedGame([], physical_size)
+    slots = len(game.slot_positions())
+    game.inventory = generate_inventory(ctx.static_game_data, slots, seed=7)
+    _scan(ctx, tmp_path, game, ScanMode.SEQUENTIAL, NonFiveStarBehavior.SKIP)
+
+    five_star = {
+        index
+        for index, essence in enumerate(game.inventory)
+        if essence.rarity == RarityLabel.FIVE
+    }
+    assert five_star
+    assert game.visited == five_star
+
+
+@pytest.mark.parametrize("scan_mode", list(ScanMode))
+def test_scan_stops_at_first_empty_cell(ctx, tmp_path, scan_mode):
+    inventory = generate_inventory(ctx.static_game_data, 17, seed=4)
+    full = SimulatedGame(generate_inventory(ctx.static_game_data, 17, seed=4))
+    _scan(ctx, tmp_path, full, scan_mode)
+
+    game = SimulatedGame(inventory)
+    _scan(ctx, tmp_path, game, scan_mode, skip_empty_cells=True)
+
+    assert game.visited == set(range(17))
+    assert game.inventory == full.inventory
+    # the 28 empty cells are neither clicked nor waited for
+    assert game.clicks <= full.clicks - 28
+    assert game.clock.now < full.clock.now
+
+
+def test_scroll_moves_grid_by_rows(ctx):
+    game = SimulatedGame(generate_inventory(ctx.static_game_data, 60, seed=0))
+    slot = game.slot_positions()[0]
+
+    game.scroll(slot.x, slot.y, -10)
+    game.wait(game.panel_latency)
+    assert game.scroll_row == game.max_scroll_row() == 2
+
+    _select(game, 0)
+    assert game.selected_index == 18
+
+
+@pytest.mark.parametrize(
+    ("physical_size", "inventory_size", "scan_mode"),
+    [
+        ((1920, 1080), 100, ScanMode.SEQUENTIAL),
+        ((1920, 1200), 90, ScanMode.SEQUENTIAL),
+        ((1920, 1080), 30, ScanMode.SEQUENTIAL),
+        ((1920, 1080), 100, ScanMode.PIPELINED),
+    ],
+)
+def test_multi_page_scan_visits_every_essence_once(
+    ctx, tmp_path, physical_size, inventory_size, scan_mode
+):
+    game = SimulatedGame(
+        generate_inventory(ctx.static_game_data, inventory_size, seed=9),
+        physical_size,
+    )
+    _scan(ctx, tmp_path, game, scan_mode, paging_profile=PagingProfile())
+
+    assert game.visited == set(range(inventory_size))
+    if scan_mode == ScanMode.SEQUENTIAL:
+        assert game.selections == inventory_size
+
+
+@pytest.mark.parametrize("inventory_size", [70, 90])
+def test_multi_page_scan_of_look_alike_cards_visits_every_essence(
+    ctx, tmp_path, inventory_size
+):
+    # unlocked cards without stat text look the same, so every page looks the same;
+    # 90 essences fill the last row, so no empty slot marks the end of the grid
+    inventory = [
+        dataclasses.replace(essence, locked=False, abandoned=False)
+        for essence in generate_inventory(ctx.static_game_data, inventory_size, seed=9)
+    ]
+    game = SimulatedGame(inventory, card_stats=False)
+    _scan(
+        ctx,
+        tmp_path,
+        game,
+        ScanMode.SEQUENTIAL,
+        paging_profile=PagingProfile(),
+        treasure_action=Action.KEEP,
+        trash_action=Action.KEEP,
+    )
+
+    assert game.visited == set(range(inventory_size))
+    assert game.scrolls <= game.max_scroll_row() + 1
+
+
+class _StopAfterSelections(threading.Event):
+    """Behaves as set once the game has shown `selections` different essences."""
+
+    def __init__(self, game: SimulatedGame, selections: int) -> None:
+        super().__init__()
+        self._game = game
+        self._selections = selections
+
+    def is_set(self) -> bool:
+        return self._game.selections >= self._selections
+
+
+@pytest.mark.parametrize(
+    ("inventory_size", "paging_profile"), [(45, None), (70, PagingProfile())]
+)
+def test_interrupted_scan_resumes_from_checkpoint(
+    ctx, tmp_path, inventory_size, paging_profile
+):
+    expected = SimulatedGame(
+        generate_inventory(ctx.static_game_data, inventory_size, seed=5)
+    )
+    _scan(ctx, tmp_path, expected, ScanMode.SEQUENTIAL, paging_profile=paging_profile)
+
+    store = ScanCheckpointStore()
+    game = SimulatedGame(
+        generate_inventory(ctx.static_game_data, inventory_size, seed=5)
+    )
+    _scan(
+        ctx,
+        tmp_path,
+        game,
+        ScanMode.SEQUENTIAL,
+        paging_profile=paging_profile,
+        checkpoint_store=store,
+        stop_event=_StopAfterSelections(game, inventory_size - 10),
+    )
+    checkpoint = store.current
+    assert checkpoint is not None
+    done = len(checkpoint.records)
+    assert 0 < done < inventory_size
+
+    interrupted_at = game.selections
+    _scan(
+        ctx,
+        tmp_path,
+        game,
+        ScanMode.SEQUENTIAL,
+        paging_profile=paging_profile,
+        checkpoint_store=store,
+        resume=True,
+    )
+
+    assert store.current is None
+    assert game.inventory == expected.inventory
+    # finished essences are not clicked again
+    assert game.selections - interrupted_at <= inventory_size - done
+
+
+def test_resume_starts_over_when_grid_changed(ctx, tmp_path):
+    store = ScanCheckpointStore()
+    game = SimulatedGame(generate_inventory(ctx.static_game_data, 45, seed=5))
+    _scan(
+        ctx,
+        tmp_path,
+        game,
+        ScanMode.SEQUENTIAL,
+        checkpoint_store=store,
+        stop_event=_StopAfterSelections(game, 20),
+    )
+    assert store.current is not None
+
+    other = SimulatedGame(generate_inventory(ctx.static_game_data, 45, seed=6))
+    _scan(
+        ctx, tmp_path, other, ScanMode.SEQUENTIAL, checkpoint_store=store, resume=True
+    )
+
+    assert other.visited == set(range(45))
+    assert store.current is None
+
+
+def test_incremental_rescan_only_visits_changed_essences(ctx, tmp_path):
+    store = IncrementalScanStore("IncrementalScanStore", ctx.card_thumbnailer)
+    # an empty slot shows the end of the inventory, so its size is known
+    game = SimulatedGame(generate_inventory(ctx.static_game_data, 44, seed=11))
+    _scan(ctx, tmp_path, game, ScanMode.SEQUENTIAL, incremental_store=store)
+    assert game.visited == set(range(44))
+
+    # the player toggles one lock by hand between the two scans
+    _select(game, 7)
+    pos = game.profile.LOCK_BUTTON_POS
+    game.click(pos.x, pos.y)
+    game.wait(game.panel_latency)
+    game.visited.clear()
+    _scan(ctx, tmp_path, game, ScanMode.SEQUENTIAL, incremental_store=store)
+    # the cards after a changed card may have moved, so they are scanned again
+    assert game.visited == set(range(7, 44))
+
+    # changed settings invalidate all previous results
+    game.visited.clear()
+    _scan(
+        ctx,
+        tmp_path,
+        game,
+        ScanMode.SEQUENTIAL,
+        NonFiveStarBehavior.SKIP,
+        incremental_store=store,
+    )
+    assert game.visited == {
+        index
+        for index, essence in enumerate(game.inventory)
+        if essence.rarity == RarityLabel.FIVE
+    }
+
+
+def test_incremental_rescan_visits_new_look_alike_essence(ctx, tmp_path):
+    store = IncrementalScanStore("IncrementalScanStore", ctx.card_thumbnailer)
+    inventory = generate_inventory(ctx.static_game_data, 13, seed=11)
+    # without stat text, cards of the same rarity and lock / abandon state are identical
+    game = SimulatedGame(inventory[:12], card_stats=False)
+    _scan(ctx, tmp_path, game, ScanMode.SEQUENTIAL, incremental_store=store)
+    assert game.visited == set(range(12))
+
+    # identical cards of an unchanged inventory are confirmed by their positions
+    game.visited.clear()
+    _scan(ctx, tmp_path, game, ScanMode.SEQUENTIAL, incremental_store=store)
+    assert game.visited == set()
+
+    # a new essence whose card looks exactly like the only locked card
+    (original,) = [e for e in game.inventory if e.locked]
+    look_alike = dataclasses.replace(
+        original, stats=inventory[12].stats, levels=inventory[12].levels
+    )
+    game.add_essence(12, look_alike)
+    game.visited.clear()
+    _scan(ctx, tmp_path, game, ScanMode.SEQUENTIAL, incremental_store=store)
+    assert 12 in game.visited
+
+
+@pytest.mark.parametrize(
+    ("inventory_size", "paging_profile"), [(45, None), (50, PagingProfile())]
+)
+def test_incremental_rescan_visits_look_alike_essence_inserted_ahead(
+    ctx, tmp_path, inventory_size, paging_profile
+):
+    store = IncrementalScanStore("IncrementalScanStore", ctx.card_thumbnailer)
+    inventory = generate_inventory(ctx.static_game_data, inventory_size + 1, seed=11)
+    game = SimulatedGame(inventory[:inventory_size], card_stats=False)
+    _scan(
+        ctx,
+        tmp_path,
+        game,
+        ScanMode.SEQUENTIAL,
+        paging_profile=paging_profile,
+        incremental_store=store,
+    )
+    assert game.visited == set(range(inventory_size))
+
+    # a new essence whose card looks exactly like the first card shifts every card
+    # by one slot; a full first page does not show that the inventory grew
+    look_alike = dataclasses.replace(
+        game.inventory[0], stats=inventory[-1].stats, levels=inventory[-1].levels
+    )
+    game.add_essence(0, look_alike)
+    _scroll_to_top(game)
+    game.visited.clear()
+    _scan(
+        ctx,
+        tmp_path,
+        game,
+        ScanMode.SEQUENTIAL,
+        paging_profile=paging_profile,
+        incremental_store=store,
+    )
+    assert 0 in game.visited
+
+    if paging_profile is not None:
+        # once a scan reached the end of the inventory, its last page is reused
+        _scroll_to_top(game)
+        game.visited.clear()
+        _scan(
+            ctx,
+            tmp_path,
+            game,
+            ScanMode.SEQUENTIAL,
+            paging_profile=paging_profile,
+            incremental_store=store,
+        )
+        assert 0 in game.visited
+        assert inventory_size not in game.visited
+
+
+@pytest.mark.parametrize("high_level", [False, True])
+@pytest.mark.parametrize("scan_mode", [ScanMode.SEQUENTIAL, ScanMode.PIPELINED])
+def test_scan_results_are_stored_with_final_state(ctx, tmp_path, scan_mode, high_level):
+    store = ScanResultStore(tmp_path / "scan_results.db", batch_size=8)
+    game = SimulatedGame(generate_inventory(ctx.static_game_data, 45, seed=5))
+    _scan(
+        ctx,
+        tmp_path,
+        game,
+        scan_mode,
+        result_store=store,
+        high_level_treasure_enabled=high_level,
+    )
+    store.flush()
+
+    (scan,) = store.list_scans()
+    assert scan.completed
+    assert scan.levels_recognized
+    assert scan.essence_count == 45
+    total, essences = store.query(EssenceQuery())
+    assert total == 45
+    columns = len(game.profile.essence_icon_x_list)
+    for essence in essences:
+        # the stored lock / abandon state is the one after the scanner's clicks
+        truth = game.inventory[essence.row * columns + essence.column]
+        assert essence.data.stats == truth.stats
+        # levels are recorded for queries even when the settings do not read them
+        assert essence.data.levels == truth.levels
+        assert (essence.data.lock_label == LockStatusLabel.LOCKED) == truth.locked
+        assert (
+            essence.data.abandon_label == AbandonStatusLabel.ABANDONED
+        ) == truth.abandoned
+    store.close()
+
+
+def test_skipped_and_rejected_essences_are_stored_with_scanned_state(ctx, tmp_path):
+    store = ScanResultStore(tmp_path / "scan_results.db", batch_size=8)
+    original = generate_inventory(ctx.static_game_data, 45, seed=5)
+    game = SimulatedGame(generate_inventory(ctx.static_game_data, 45, seed=5))
+    board = ActionPlanBoard()
+    thread = threading.Thread(
+        target=_scan,
+        args=(ctx, tmp_path, game, ScanMode.PLANNED, NonFiveStarBehavior.SKIP),
+        kwargs={"action_plan_board": board, "result_store": store},
+    )
+    thread.start()
+    try:
+        deadline = time.monotonic() + 60
+        while board.current is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert board.current is not None
+        assert board.current.entries
+    finally:
+        if board.current is not None:
+            board.current.reject()
+        thread.join()
+    store.flush()
+
+    assert game.inventory == original
+    total, essences = store.query(EssenceQuery())
+    assert total == 45
+    columns = len(game.profile.essence_icon_x_list)
+    for essence in essences:
+        truth = original[essence.row * columns + essence.column]
+        assert essence.data.rarity == truth.rarity
+        if truth.rarity != RarityLabel.FIVE:
+            assert essence.data.stats == [None] * 3
+            assert essence.evaluation is not None
+            assert essence.evaluation.quality == EssenceQuality.SKIP
+        else:
+            assert essence.data.stats == truth.stats
+            assert (essence.data.lock_label == LockStatusLabel.LOCKED) == truth.locked
+    store.close()
@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import endfield_essence_recognizer
+
+WINDOWS_ONLY_MODULES = [
+    "keyboard",
+    "pyautogui",
+    "pygetwindow",
+    "pywintypes",
+    "win32api",
+    "win32con",
+    "win32gui",
+    "win32ui",
+    "winsound",
+]
+
+
+def _run_without_windows_modules(code: str) -> subprocess.CompletedProcess[str]:
+    """Run `code` in a fresh interpreter where importing any Windows-only module fails."""
+    prelude = (
+        "import sys\n"
+        f"for name in {WINDOWS_ONLY_MODULES!r}:\n"
+        "    sys.modules[name] = None\n"
+    )
+    src_dir = Path(endfield_essence_recognizer.__file__).parents[1]
+    # Only the package itself on the path: no stub modules for Windows libraries
+    env = {**os.environ, "PYTHONPATH": str(src_dir)}
+    return subprocess.run(
+        [sys.executable, "-c", prelude + code],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=120,
+    )
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "endfield_essence_recognizer.simulator",
+        "endfield_essence_recognizer.simulator.benchmark",
+        "endfield_essence_recognizer.core.scanner.engine",
+    ],
+)
+def test_simulator_imports_without_windows_libraries(module: str):
+    result = _run_without_windows_modules(f"import {module}")
+    assert result.returncode == 0, result.stderr
+
+
+def test_recognizer_benchmark_runs_without_windows_libraries(tmp_path: Path):
+    output = tmp_path / "bench.json"
+    result = _run_without_windows_modules(
+        "from endfield_essence_recognizer.simulator.recognizer_benchmark import main\n"
+        f"sys.argv = ['bench', '--frames', '1', '--repeat', '1', '-o', {str(output)!r}]\n"
+        "main()\n"
+    )
+    assert result.returncode == 0, result.stderr
+    assert output.exists()
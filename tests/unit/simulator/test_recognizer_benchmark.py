@@ -0,0 +1,83 @@
+import json
+
+import cv2
+import pytest
+
+from endfield_essence_recognizer.simulator import (
+    LatencyStats,
+    benchmark_recognizers,
+    generate_corpus,
+)
+from endfield_essence_recognizer.simulator.benchmark import load_static_game_data
+from endfield_essence_recognizer.simulator.recognizer_benchmark import (
+    build_benchmark_context,
+    load_corpus,
+)
+
+
+@pytest.fixture(scope="module")
+def static_game_data():
+    return load_static_game_data()
+
+
+def test_latency_stats_percentiles():
+    stats = LatencyStats.from_samples([0.001, 0.002, 0.003, 0.004, 0.010])
+
+    assert stats.samples == 5
+    assert stats.p50_ms == pytest.approx(3.0)
+    assert stats.p95_ms == pytest.approx(8.8)
+    assert stats.mean_ms == pytest.approx(4.0)
+    assert stats.throughput_per_s == pytest.approx(250.0)
+
+
+def test_latency_stats_requires_samples():
+    with pytest.raises(ValueError):
+        LatencyStats.from_samples([])
+
+
+def test_generate_corpus_covers_resolutions(static_game_data):
+    corpus = generate_corpus(
+        static_game_data, [(1920, 1080), (2560, 1440)], frames_per_resolution=2
+    )
+
+    assert [frame.image.shape[:2] for frame in corpus] == [
+        (1080, 1920),
+        (1080, 1920),
+        (1440, 2560),
+        (1440, 2560),
+    ]
+    assert all(frame.truth is not None for frame in corpus)
+
+
+def test_benchmark_report_is_json_with_all_recognizers(static_game_data):
+    corpus = generate_corpus(
+        static_game_data, [(1920, 1080), (3440, 1440)], frames_per_resolution=2
+    )
+    ctx = build_benchmark_context(static_game_data)
+
+    report = benchmark_recognizers(ctx, corpus, repeat=1)
+
+    assert set(report["results"]) == {
+        "attribute",
+        "attribute_level",
+        "abandon_status",
+        "lock_status",
+        "rarity",
+        "ui_scene",
+        "recognize_essence",
+    }
+    assert report["results"]["attribute"]["samples"] == 3 * len(corpus)
+    assert report["accuracy"] == {"checked": 4, "correct": 4}
+    assert report["corpus"]["resolutions"] == ["1920x1080", "3440x1440"]
+    json.dumps(report)
+
+
+def test_load_corpus_reads_screenshots(static_game_data, tmp_path):
+    frame = generate_corpus(static_game_data, [(1920, 1080)], 1)[0]
+    cv2.imwrite(str(tmp_path / "a.png"), frame.image)
+
+    corpus = load_corpus(tmp_path)
+
+    assert [f.name for f in corpus] == ["a.png"]
+    assert corpus[0].truth is None
+    assert corpus[0].image.shape == frame.image.shape
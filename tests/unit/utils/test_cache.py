@@ -0,0 +1,46 @@
+import threading
+import time
+
+from endfield_essence_recognizer.utils.cache import locked_cache
+
+
+def test_concurrent_first_calls_compute_once():
+    """Threads asking for the same result at the same time share one computation."""
+    calls: list[int] = []
+    start = threading.Barrier(4, timeout=2)
+
+    @locked_cache
+    def load() -> object:
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    results: list[object] = []
+
+    def worker() -> None:
+        start.wait()
+        results.append(load())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 4
+    assert all(result is results[0] for result in results)
+
+
+def test_cached_functions_may_call_each_other():
+    @locked_cache
+    def data() -> list[int]:
+        return [1, 2]
+
+    @locked_cache(maxsize=2)
+    def total(offset: int) -> int:
+        return sum(data()) + offset
+
+    assert total(0) == 3
+    assert total(1) == 4
+    assert data() is data()